@@ -0,0 +1,321 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Benchmark of the loaders, end to end, on a synthetic corpus (synth.py)
+or a folder of MARC files: auth.auths(), auth.byline(), doc.docs(),
+bnfmarc.deform(), update.py. Some options compare the paths of one stage. Results are appended to a jsonl file,
+and compared with the last run on the same corpus, to see regressions.
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# local
+import auth
+import bnfmarc
+import doc
+import givens
+import iso2709
+import synth
+import update
+
+# in the order of a build
+benches = ['auths', 'byline', 'docs', 'deform', 'update']
+# minimum calls of deform()
+deform_calls = 100000
+
+
+def records(marc_files):
+    """Count of records in files"""
+    count = 0
+    for marc_file in marc_files:
+        with open(marc_file, 'rb') as handle:
+            count += sum(1 for marc in iso2709.chunks(handle))
+    return count
+
+
+def strings():
+    """Strings to deform, place names of lieux_tout.tsv, or of synth"""
+    tsv = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lieux_tout.tsv')
+    if not os.path.isfile(tsv):
+        return synth.places + synth.publishers + synth.surnames
+    with open(tsv, 'r', encoding='utf-8') as handle:
+        next(handle) # header
+        return [line.split('\t')[0] for line in handle]
+
+
+def deform_bench(loops=3):
+    """Compare deform() paths on place names, same output, strings/s"""
+    words = strings()
+    expected = [bnfmarc._deform(s) for s in words]
+    diff = sum(1 for s, value in zip(words, expected) if bnfmarc.deform.__wrapped__(s) != value)
+    print("%d strings, %d different" % (len(words), diff))
+    ways = [
+        ('reference', lambda: [bnfmarc._deform(s) for s in words]),
+        ('no cache', lambda: [bnfmarc.deform.__wrapped__(s) for s in words]),
+        ('deform_many', lambda: bnfmarc.deform_many(words)),
+    ]
+    reference = None
+    for name, way in ways:
+        bnfmarc.deform.cache_clear()
+        start = time.perf_counter()
+        for i in range(loops):
+            way()
+        seconds = time.perf_counter() - start
+        reference = reference or seconds
+        print("%-12s %10.0f strings/s  x%.1f" % (name, loops * len(words) / seconds, reference / seconds))
+    return 1 if diff else 0
+
+
+def givens_bench(lookups=200000):
+    """Time of the lexicon load, and lookups/s of auth.gender_given()"""
+    start = time.perf_counter()
+    givens.dic = None
+    givens.load()
+    print("givens.load()  %.1f ms" % ((time.perf_counter() - start) * 1e3))
+    rng = random.Random(1)
+    names = [rng.choice(synth.given_names) for i in range(lookups)]
+    givens.gender.cache_clear()
+    start = time.perf_counter()
+    for name in synth.given_names:
+        auth.gender_given(name)
+    seconds = time.perf_counter() - start
+    print("first lookup  %6.2f µs" % (seconds / len(synth.given_names) * 1e6))
+    start = time.perf_counter()
+    for name in names:
+        auth.gender_given(name)
+    seconds = time.perf_counter() - start
+    print("lookup        %6.2f µs" % (seconds / len(names) * 1e6))
+    return 0
+
+
+def dispatch_bench(marc_file):
+    """Per record µs to route the author fields to the handlers of
+    auth.indocs(), doc.auth_links(), doc.byline(), one get_fields() by tag
+    (former code) or one bnfmarc.dispatch() walk by function"""
+    tables = [auth.indoc_tags, doc.link_tags, doc.author_tags]
+    with open(marc_file, 'rb') as handle:
+        recs = [r for r in iso2709.reader(handle, iso2709.doc_tags | iso2709.byline_tags) if r is not None]
+    noop = lambda field, type, *args: None
+    noops = [{tag: (noop, type, rank) for tag, (handler, type, rank) in table.items()} for table in tables]
+
+    start = time.perf_counter()
+    for r in recs:
+        for table in noops:
+            for tag in table:
+                for field in r.get_fields(tag):
+                    noop(field, None)
+    scans = time.perf_counter() - start
+    start = time.perf_counter()
+    for r in recs:
+        for table in noops:
+            bnfmarc.dispatch(r, table)
+    walks = time.perf_counter() - start
+    print("%d records" % len(recs))
+    print("get_fields() %6.1f µs/record" % (scans / len(recs) * 1e6))
+    print("dispatch()   %6.1f µs/record  x%.1f" % (walks / len(recs) * 1e6, scans / walks))
+    return 0
+
+
+def writes_bench(doc_files, db_dir, sizes=(1, 100, 10000)):
+    """Docs/s of the writes of doc, contrib and about rows, row by row
+    (execute, one commit, former code) or buffered by doc.flush()
+    (executemany, a commit by batch of sizes docs), rows extracted before"""
+    rows = []
+    for doc_file in doc_files:
+        with open(doc_file, 'rb') as handle:
+            batch = [(marc, 0) for marc in iso2709.chunks(handle) if marc is not None]
+        rows.extend(doc.extract(batch, os.path.basename(doc_file))[0])
+    print("%d docs" % len(rows))
+    reference = None
+    for size in (None, *sizes):
+        con = bnfmarc.connect(os.path.join(db_dir, 'writes%s.db' % (size or '')), True)
+        start = time.perf_counter()
+        if size is None:
+            name = 'execute'
+            cur = con.cursor()
+            for doc_values, contribs, abouts, auths, offset in rows:
+                cur.execute(doc.doc_sql, doc_values)
+                for values in contribs:
+                    cur.execute(doc.contrib_sql, values)
+                for values in abouts:
+                    cur.execute(doc.about_sql, values)
+            con.commit()
+        else:
+            name = 'executemany %d' % size
+            doc.con = con
+            doc.batch_size = size
+            for row in rows:
+                doc.write(row)
+            doc.flush()
+        seconds = time.perf_counter() - start
+        con.close()
+        reference = reference or seconds
+        print("%-17s %10.0f docs/s  x%.1f" % (name, len(rows) / seconds, reference / seconds))
+    return 0
+
+
+def run(marc_dir, db_file):
+    """Time each bench on the files of marc_dir, {bench: {records, seconds}}"""
+    auth_files = sorted(glob.glob(os.path.join(marc_dir, "P1486_*.UTF8")))
+    doc_files = sorted(glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")))
+    doc_files += sorted(glob.glob(os.path.join(marc_dir, "P174_*.UTF8")))
+    auth_count = records(auth_files)
+    doc_count = records(doc_files)
+    con = bnfmarc.connect(db_file, True)
+    auth.con = doc.con = update.con = con
+    results = {}
+
+    start = time.perf_counter()
+    for auth_file in auth_files:
+        auth.auths(auth_file)
+    auth.flush()
+    results['auths'] = {'records': auth_count, 'seconds': time.perf_counter() - start}
+
+    start = time.perf_counter()
+    for doc_file in doc_files:
+        auth.byline(doc_file)
+    auth.flush()
+    results['byline'] = {'records': doc_count, 'seconds': time.perf_counter() - start}
+
+    start = time.perf_counter()
+    for doc_file in doc_files:
+        doc.docs(doc_file)
+    doc.flush()
+    results['docs'] = {'records': doc_count, 'seconds': time.perf_counter() - start}
+
+    words = strings()
+    loops = max(1, deform_calls // max(1, len(words)))
+    start = time.perf_counter()
+    for i in range(loops):
+        for s in words:
+            bnfmarc.deform(s)
+    results['deform'] = {'records': loops * len(words), 'seconds': time.perf_counter() - start}
+
+    start = time.perf_counter()
+    update.derive()
+    update.doc_order()
+    update.rollup()
+    con.commit()
+    results['update'] = {'records': doc_count, 'seconds': time.perf_counter() - start}
+    con.close()
+    return results
+
+
+def commit():
+    """Short hash of the git HEAD, or None"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last(results_file, corpus):
+    """Last run on the same corpus, or None"""
+    if not os.path.isfile(results_file):
+        return None
+    found = None
+    with open(results_file, 'r', encoding='utf-8') as handle:
+        for line in handle:
+            run = json.loads(line)
+            if run['corpus'] == corpus:
+                found = run
+    return found
+
+
+def report(results, before, threshold):
+    """Print records/s of benches, and change from before, count regressions"""
+    regressions = 0
+    print("%-8s %10s %9s %12s %8s" % ('', 'records', 'seconds', 'records/s', 'change'))
+    for name in benches:
+        result = results[name]
+        speed = result['records'] / result['seconds'] if result['seconds'] else 0
+        change = ''
+        if before is not None and name in before['results']:
+            old = before['results'][name]
+            old_speed = old['records'] / old['seconds'] if old['seconds'] else 0
+            if old_speed:
+                ratio = speed / old_speed - 1
+                change = "%+.1f%%" % (ratio * 100)
+                if ratio < -threshold:
+                    change += " SLOWER"
+                    regressions += 1
+        print("%-8s %10d %9.2f %12.0f %8s" % (name, result['records'], result['seconds'], speed, change))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Benchmark the loaders on a synthetic corpus, record and compare results',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--docs', type=int, default=10000,
+    help='Number of doc records of the synthetic corpus')
+    parser.add_argument('--seed', type=int, default=1,
+    help='Seed of the synthetic corpus')
+    parser.add_argument('--corpus', metavar='DIR',
+    help='Folder of MARC files to use instead of a synthetic corpus')
+    parser.add_argument('--results', metavar='FILE',
+    default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench.jsonl'),
+    help='jsonl file of results, one run by line')
+    parser.add_argument('--threshold', type=float, default=0.1,
+    help='Slowdown ratio reported as regression, default 0.1 (10%%)')
+    parser.add_argument('--deform', action='store_true',
+    help='Only compare deform() paths on place names of lieux_tout.tsv')
+    parser.add_argument('--givens', action='store_true',
+    help='Only time the load and the lookups of the given names lexicon')
+    parser.add_argument('--dispatch', action='store_true',
+    help='Only compare get_fields() by tag and dispatch() on doc records')
+    parser.add_argument('--writes', action='store_true',
+    help='Only compare doc writes row by row (execute) and by batches (executemany)')
+    args = parser.parse_args()
+    if args.deform:
+        return deform_bench()
+    if args.givens:
+        return givens_bench()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.corpus is not None:
+            marc_dir = args.corpus
+            corpus = os.path.abspath(marc_dir)
+        else:
+            marc_dir = os.path.join(tmp_dir, 'data')
+            synth.generate(marc_dir, args.docs, seed=args.seed)
+            corpus = "synth docs=%d seed=%d" % (args.docs, args.seed)
+        if args.dispatch:
+            return dispatch_bench(sorted(glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")))[0])
+        if args.writes:
+            doc_files = sorted(glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")))
+            doc_files += sorted(glob.glob(os.path.join(marc_dir, "P174_*.UTF8")))
+            return writes_bench(doc_files, tmp_dir)
+        results = run(marc_dir, os.path.join(tmp_dir, 'bench.db'))
+    before = last(args.results, corpus)
+    regressions = report(results, before, args.threshold)
+    with open(args.results, 'a', encoding='utf-8') as handle:
+        handle.write(json.dumps({
+            'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': commit(),
+            'python': platform.python_version(),
+            'corpus': corpus,
+            'results': results,
+        }) + "\n")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
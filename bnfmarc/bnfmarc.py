@@ -5,27 +5,189 @@ MIT License https://opensource.org/licenses/mit-license.php
 Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
 """
 
+import functools
+import hashlib
 import os
+import re
 import sqlite3
+import sys
+import time
 import unicodedata
 
-def connect(cataviz_db, create=False):
-    "Connect database and create tables"
-    if os.path.isfile(cataviz_db):
-        if not create:
-            return sqlite3.connect(cataviz_db)
+# page cache for bulk load, negative = KiB, ~1 Go
+bulk_cache_size = -1000000
+# strings kept by deform(), same places, publishers and names recur
+deform_cache_size = 100000
+# ids from arks have 8 digits, bytes of a full IdSet
+ids_bytes = (10 ** 8 >> 3) + 1
+
+def connect(cataviz_db, create=False, bulk=False):
+    """Connect database and create tables.
+    bulk: load profile, no journal, no sync, big cache; if create,
+    no indexes, to build after load with indexes()"""
+    if os.path.isfile(cataviz_db) and create:
         # if create, delete old
         os.remove(cataviz_db)
+    elif os.path.isfile(cataviz_db):
+        create = False
+    else:
+        create = True
     con = sqlite3.connect(cataviz_db)
-    cur = con.cursor()
-    sql_file = os.path.join(os.path.dirname(__file__), 'cataviz.sql')
-    with open(sql_file, "r", encoding='utf-8') as h:
-        sql = h.read()
-    cur.executescript(sql)
+    if bulk:
+        # a crash during load corrupts the base, reload from scratch
+        con.execute("PRAGMA journal_mode = OFF")
+        con.execute("PRAGMA synchronous = OFF")
+        con.execute("PRAGMA cache_size = %d" % bulk_cache_size)
+        con.execute("PRAGMA temp_store = MEMORY")
+    if not create:
+        return con
+    con.executescript(sql_file('cataviz.sql'))
+    if not bulk:
+        con.executescript(sql_file('cataviz_index.sql'))
     return con
 
-# returns a normalized form lowercase with no diacritics
-def deform(s):
+def sql_file(name):
+    """Get the content of an sql file from this folder"""
+    sql_file = os.path.join(os.path.dirname(__file__), name)
+    with open(sql_file, "r", encoding='utf-8') as h:
+        return h.read()
+
+def indexes(con):
+    """Create indexes of cataviz_index.sql not yet created, report time of each"""
+    cur = con.cursor()
+    sql = sql_file('cataviz_index.sql')
+    for create in re.findall(r"^CREATE INDEX[^;]+;", sql, flags=re.MULTILINE):
+        name = re.search(r"EXISTS (\w+)", create).group(1)
+        row = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+            (name,)
+        ).fetchone()
+        if row is not None:
+            print("index %s exists" % name)
+            continue
+        start = time.perf_counter()
+        cur.execute(create)
+        con.commit()
+        print("index %s  %.1f s" % (name, time.perf_counter() - start))
+
+def manifest(con, marc_file, hashing=True):
+    """Get (size, mtime, hash) of a file if new or changed since its last load,
+    None if unchanged. Hash only if size or mtime differs, not at all
+    if not hashing (full load, hash is NULL, next change reloads the file)."""
+    name = os.path.basename(marc_file)
+    stat = os.stat(marc_file)
+    if not hashing:
+        return (stat.st_size, stat.st_mtime, None)
+    row = con.execute(
+        "SELECT size, mtime, hash FROM load_manifest WHERE file = ?",
+        (name,)
+    ).fetchone()
+    if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime:
+        return None
+    hash = file_hash(marc_file)
+    if row is not None and row[0] == stat.st_size and row[2] == hash:
+        # touched, not changed
+        con.execute("UPDATE load_manifest SET mtime = ? WHERE file = ?", (stat.st_mtime, name))
+        return None
+    return (stat.st_size, stat.st_mtime, hash)
+
+def manifest_loaded(con, marc_file, values):
+    """Record a file as loaded, values from manifest(), None if already recorded"""
+    if values is None:
+        return
+    con.execute(
+        "INSERT OR REPLACE INTO load_manifest (file, size, mtime, hash, loaded) VALUES (?, ?, ?, ?, datetime('now'))",
+        (os.path.basename(marc_file), *values)
+    )
+    con.commit()
+
+def checkpoint(con, file, offset, records, done=0):
+    """Record progress of a loader in the current transaction, commit with rows"""
+    con.execute(
+        "INSERT OR REPLACE INTO load_checkpoint (file, offset, records, done) VALUES (?, ?, ?, ?)",
+        (file, offset, records, done)
+    )
+
+def resume_point(con, marc_file):
+    """Get (offset, records) where to restart the load of a file, None if done"""
+    row = con.execute(
+        "SELECT offset, records, done FROM load_checkpoint WHERE file = ?",
+        (os.path.basename(marc_file),)
+    ).fetchone()
+    if row is None:
+        return 0, 0
+    if row[2]:
+        print("%s done" % os.path.basename(marc_file))
+        return None
+    print("%s resume at record %d" % (os.path.basename(marc_file), row[1]))
+    return row[0], row[1]
+
+def routes(tags):
+    """Compile an ordered list of (tag, handler, type) for dispatch(),
+    {tag: (handler, type, rank)}"""
+    return {tag: (handler, type, rank) for rank, (tag, handler, type) in enumerate(tags)}
+
+def dispatch(r, table, *args):
+    """Walk the fields of a record once, call handler(field, type, *args)
+    for the fields with a tag in table from routes(), tags in the order
+    of the list, fields of a tag in the order of the record,
+    as one get_fields() by tag"""
+    found = []
+    for field in r.fields:
+        entry = table.get(field.tag)
+        if entry is not None:
+            # unique position, fields never compared
+            found.append((entry[2], len(found), field, entry))
+    found.sort()
+    for rank, i, field, entry in found:
+        entry[0](field, entry[1], *args)
+
+
+class IdSet:
+    """Set of int ids as a bitmap, 1 bit by id, growing up to the max id,
+    12.5 MB for all the 8 digits ids (a dict of millions of ids, hundreds).
+    Same membership as a set: id in ids, ids.add(id), len(ids)."""
+
+    def __init__(self, ids=()):
+        self.bits = bytearray()
+        self.count = 0
+        for id in ids:
+            self.add(id)
+
+    def add(self, id):
+        byte = id >> 3
+        bits = self.bits
+        if byte >= len(bits):
+            # grow by half, in the limits of the ark ids
+            size = max(byte + 1, min(len(bits) * 3 // 2, ids_bytes))
+            bits.extend(bytes(size - len(bits)))
+        mask = 1 << (id & 7)
+        if not bits[byte] & mask:
+            bits[byte] |= mask
+            self.count += 1
+
+    def __contains__(self, id):
+        byte = id >> 3
+        return byte < len(self.bits) and self.bits[byte] & (1 << (id & 7)) != 0
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        """Memory of the bitmap"""
+        return sys.getsizeof(self.bits)
+
+
+def file_hash(path):
+    """sha1 of a file, read by blocks"""
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+def _chars(s):
+    """Chars of a deform(), before space normalization, char by char"""
     # casefold(), lowercase
     # normalize NFD, decompose letters and diacritics
     # strip diacritics and other non letters
@@ -62,5 +224,30 @@ def deform(s):
             chars.append(c)
             continue
         chars.append(c)
-    deform = " ".join(''.join(chars).split())
-    return deform
+    return ''.join(chars)
+
+
+def _deform(s):
+    """deform() without cache or translate table, for all strings"""
+    return " ".join(_chars(s).split())
+
+
+# translate table of _chars() for Latin-1 and Latin Extended-A (œ),
+# same result than on the string, no combining char in these blocks to reorder
+latin_last = '\u017f'
+latin_table = {i: _chars(chr(i)) for i in range(ord(latin_last) + 1)}
+
+
+# returns a normalized form lowercase with no diacritics
+@functools.lru_cache(maxsize=deform_cache_size)
+def deform(s):
+    # bad marc segmentation, nothing after $
+    s = s.partition('$')[0]
+    if not s or max(s) <= latin_last:
+        return " ".join(s.translate(latin_table).split())
+    return _deform(s)
+
+
+def deform_many(strings):
+    """deform() of strings, results in same order"""
+    return [deform(s) for s in strings]
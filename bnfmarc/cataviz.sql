@@ -2,6 +2,7 @@ PRAGMA encoding = 'UTF-8';
 PRAGMA page_size = 8192;
 -- do not verify contraints on loading
 PRAGMA foreign_keys = OFF;
+-- indexes are in cataviz_index.sql, to be created after a bulk load
 
 DROP TABLE IF EXISTS doc;
 CREATE TABLE doc (
@@ -20,7 +21,7 @@ CREATE TABLE doc (
     year         INTEGER,  -- publication year, 100, 210$d
     -- resp
     byline          TEXT,  -- for a bibliographic ref
-    authors      INTEGER,  -- count of author
+    authors      INTEGER,  -- count of authors, contrib of type 1 (writes)
     auth1        INTEGER,  -- id of first author
     type1        INTEGER,  -- type of first author (pers or corp)
     gender1      INTEGER,  -- gender of first author
@@ -30,9 +31,11 @@ CREATE TABLE doc (
     place           TEXT,  -- 210$a publication place 
     place_group     TEXT,  -- publication place, for grouping
     place_like      TEXT,  -- publication place, for search
+    place_canon     TEXT,  -- publication place, canonical from gazetteer (places.py)
     publisher       TEXT,  -- éditeur extrait de l’adresse éditoriale, 210$c
     publisher_group TEXT,  -- éditeur extrait de l’adresse éditoriale, 210$c
     publisher_like  TEXT,  -- éditeur extrait de l’adresse éditoriale, 210$c
+    printer         TEXT,  -- CERL id of the publisher, printer.id (cerl.py)
     format       INTEGER,  -- in-° : 8, 4, 12… 930$5, 215$a
     pages        INTEGER,  -- page count, 215$a
     -- coding
@@ -49,23 +52,6 @@ CREATE TABLE doc (
     PRIMARY KEY(id ASC)
 );
 
-CREATE INDEX doc_auth ON doc(auth1, year);
-CREATE INDEX doc_clement ON doc(year, clement);
-CREATE INDEX doc_clement2 ON doc(clement, year);
-CREATE INDEX doc_format ON doc(year, format, pages);
-CREATE INDEX doc_gender ON doc(year, gender1);
-CREATE INDEX doc_lang ON doc(year, lang);
-CREATE INDEX doc_order ON doc(year, order1);
-CREATE INDEX doc_pages ON doc(year, pages);
-CREATE INDEX doc_place ON doc(year, place_group);
-CREATE INDEX doc_place2 ON doc(place_group, year);
-CREATE INDEX doc_place3 ON doc(year, place_like);
-CREATE INDEX doc_place4 ON doc(place_like, year);
-CREATE INDEX doc_publisher ON doc(year, publisher_group);
-CREATE INDEX doc_publisher2 ON doc(publisher_group, year);
-CREATE INDEX doc_type ON doc(type1, year);
-CREATE INDEX doc_type2 ON doc(year, type1, gender1);
-
 
 CREATE TABLE contrib (
     doc         INTEGER NOT NULL,
@@ -80,10 +66,6 @@ CREATE TABLE contrib (
     PRIMARY KEY(id ASC)
 );
 
-CREATE INDEX contrib_role  ON contrib(role);
-CREATE INDEX contrib_field ON contrib(field, role);
-CREATE INDEX contrib_auth ON contrib(auth, year, type);
-CREATE INDEX contrib_doc ON contrib(doc);
 
 CREATE TABLE about (
     doc         INTEGER NOT NULL,
@@ -93,9 +75,6 @@ CREATE TABLE about (
     PRIMARY KEY(id ASC)
 );
 
-CREATE INDEX about_doc  ON about(doc);
-CREATE INDEX about_auth ON about(auth, year);
-
 
 CREATE TABLE auth (
     -- UniMARC BnF autorités
@@ -130,9 +109,112 @@ CREATE TABLE auth (
     PRIMARY KEY(id ASC)
 );
 
-CREATE INDEX auth_given ON auth(given);
-CREATE INDEX auth_name ON auth(name);
-CREATE INDEX auth_deform ON auth(deform, generation);
-CREATE INDEX auth_docs ON auth(docs DESC, deform);
-CREATE INDEX auth_doc1 ON auth(doc1, gender);
 
+CREATE TABLE printer (
+    -- CERL Thesaurus, imprintName records, printers and publishers (cerl.py)
+    -- https://data.cerl.org/thesaurus/
+    id       TEXT NOT NULL, -- CERL id, ex: cni00035050
+    name     TEXT NOT NULL, -- info/display
+    dates             TEXT, -- info/biographicalData
+    activity          TEXT, -- info/activityNote
+    place             TEXT, -- info/geographicalNote
+    url               TEXT, -- url of the record
+    PRIMARY KEY(id)
+);
+
+
+CREATE TABLE printer_variant (
+    -- name forms of a printer, headingForm and variantForm
+    printer  TEXT NOT NULL, -- printer.id
+    deform   TEXT NOT NULL, -- form deformed, to match doc.publisher_like
+    form     TEXT NOT NULL, -- form as found
+    kind              TEXT, -- heading or variant, and name attribute, ex: variant inverted
+    id             INTEGER, -- rowid auto
+    PRIMARY KEY(id ASC)
+);
+
+
+CREATE TABLE load_manifest (
+    -- input files loaded, to reload only changed files (load.py --incremental)
+    file     TEXT NOT NULL, -- file name, ex: P174_1.UTF8
+    size  INTEGER NOT NULL, -- bytes
+    mtime    REAL NOT NULL, -- modification time, seconds
+    hash              TEXT, -- sha1 of content, NULL after a full load
+    loaded   TEXT NOT NULL, -- datetime of load
+    PRIMARY KEY(file)
+);
+
+CREATE TABLE load_checkpoint (
+    -- progress of loaders, committed with rows, for --resume
+    file     TEXT NOT NULL, -- file name, ex: P174_1.UTF8
+    offset INTEGER NOT NULL, -- bytes, after the last record written
+    records INTEGER NOT NULL, -- records read before offset
+    done  INTEGER NOT NULL, -- 1 if file completed
+    PRIMARY KEY(file)
+);
+
+-- ids touched by an incremental load, for update.py --incremental
+CREATE TABLE changed_auth (
+    id          INTEGER, -- auth.id
+    PRIMARY KEY(id ASC)
+);
+
+CREATE TABLE changed_doc (
+    id          INTEGER, -- doc.id
+    PRIMARY KEY(id ASC)
+);
+
+CREATE TABLE changed_year (
+    year        INTEGER, -- years of docs and contribs changed, rollups to refresh
+    PRIMARY KEY(year ASC)
+);
+
+-- rollups for charts, counts by year and dimension, refreshed by update.py
+CREATE TABLE rollup_lang (
+    year        INTEGER,
+    lang           TEXT,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_place (
+    year        INTEGER,
+    place_group    TEXT,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_canon (
+    year        INTEGER,
+    place_canon    TEXT,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_publisher (
+    year        INTEGER,
+    publisher_group TEXT,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_format (
+    year        INTEGER,
+    format      INTEGER,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_gender (
+    year        INTEGER,
+    gender1     INTEGER,
+    type1       INTEGER,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_clement (
+    year        INTEGER,
+    clement        TEXT,
+    docs        INTEGER NOT NULL
+);
+
+CREATE TABLE rollup_contrib (
+    year        INTEGER,
+    type        INTEGER,
+    contribs    INTEGER NOT NULL
+);
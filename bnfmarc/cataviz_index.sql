@@ -0,0 +1,40 @@
+-- Indexes of cataviz tables, created after load by finalize.py,
+-- or with tables by bnfmarc.connect(create=True) if not bulk
+
+CREATE INDEX IF NOT EXISTS doc_auth ON doc(auth1, year);
+CREATE INDEX IF NOT EXISTS doc_clement ON doc(year, clement);
+CREATE INDEX IF NOT EXISTS doc_clement2 ON doc(clement, year);
+CREATE INDEX IF NOT EXISTS doc_format ON doc(year, format, pages);
+CREATE INDEX IF NOT EXISTS doc_gender ON doc(year, gender1);
+CREATE INDEX IF NOT EXISTS doc_lang ON doc(year, lang);
+CREATE INDEX IF NOT EXISTS doc_order ON doc(year, order1);
+CREATE INDEX IF NOT EXISTS doc_pages ON doc(year, pages);
+CREATE INDEX IF NOT EXISTS doc_place ON doc(year, place_group);
+CREATE INDEX IF NOT EXISTS doc_place2 ON doc(place_group, year);
+CREATE INDEX IF NOT EXISTS doc_place3 ON doc(year, place_like);
+CREATE INDEX IF NOT EXISTS doc_place4 ON doc(place_like, year);
+CREATE INDEX IF NOT EXISTS doc_place5 ON doc(place_canon, year);
+CREATE INDEX IF NOT EXISTS doc_publisher ON doc(year, publisher_group);
+CREATE INDEX IF NOT EXISTS doc_publisher2 ON doc(publisher_group, year);
+CREATE INDEX IF NOT EXISTS doc_type ON doc(type1, year);
+CREATE INDEX IF NOT EXISTS doc_type2 ON doc(year, type1, gender1);
+CREATE INDEX IF NOT EXISTS doc_file ON doc(file);
+CREATE INDEX IF NOT EXISTS doc_printer ON doc(printer, year);
+
+CREATE INDEX IF NOT EXISTS contrib_role  ON contrib(role);
+CREATE INDEX IF NOT EXISTS contrib_field ON contrib(field, role);
+CREATE INDEX IF NOT EXISTS contrib_auth ON contrib(auth, year, type);
+CREATE INDEX IF NOT EXISTS contrib_doc ON contrib(doc);
+
+CREATE INDEX IF NOT EXISTS about_doc  ON about(doc);
+CREATE INDEX IF NOT EXISTS about_auth ON about(auth, year);
+
+CREATE INDEX IF NOT EXISTS auth_given ON auth(given);
+CREATE INDEX IF NOT EXISTS auth_name ON auth(name);
+CREATE INDEX IF NOT EXISTS auth_deform ON auth(deform, generation);
+CREATE INDEX IF NOT EXISTS auth_docs ON auth(docs DESC, deform);
+CREATE INDEX IF NOT EXISTS auth_doc1 ON auth(doc1, gender);
+CREATE INDEX IF NOT EXISTS auth_file ON auth(file);
+
+CREATE INDEX IF NOT EXISTS printer_variant_deform ON printer_variant(deform, printer);
+CREATE INDEX IF NOT EXISTS printer_variant_printer ON printer_variant(printer);
@@ -0,0 +1,285 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Load printers and publishers of the CERL Thesaurus (imprintName records
+of an SRU dump) in tables printer and printer_variant (name forms deformed),
+then link doc.publisher_like to them, doc.printer.
+Data : https://data.cerl.org/thesaurus/ , sru.cerl.org, ex: data2022/_sru.xml
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+# local
+import bnfmarc
+
+# shared sqlite3 connexion
+con = None
+# rows by executemany, in one transaction
+batch_size = 10000
+# bytes read from the dump at once
+block_size = 1 << 20
+# end of an SRU record, a dump is streamed record by record
+END_OF_RECORD = b'</srw:record>'
+# namespace of CERL Thesaurus records
+ns = '{http://sru.cerl.org/ctas/dtd/1.1}'
+# values of a printer row, reused
+printer_row = {
+    'id': None,
+    'name': None,
+    'dates': None,
+    'activity': None,
+    'place': None,
+    'url': None,
+}
+printer_sql = "INSERT INTO printer (" + ", ".join([*printer_row]) + ") VALUES (" + ", ".join(["?"] * len(printer_row)) +")"
+variant_cols = ['printer', 'deform', 'form', 'kind']
+variant_sql = "INSERT INTO printer_variant (" + ", ".join(variant_cols) + ") VALUES (" + ", ".join(["?"] * len(variant_cols)) +")"
+# rows waiting for executemany, by table
+printer_rows = []
+variant_rows = []
+# counts of a load
+counts = {'records': 0, 'printers': 0, 'variants': 0, 'others': 0, 'duplicates': 0, 'repaired': 0, 'errors': 0}
+# words before a name in an imprint, ex: chez Didot, impr. de A. Sanz, de l'imprimerie de P. Didot
+imprint_words = [
+    'chez', 'apud', 'typis', 'ex officina', 'ex typographia', 'sumptibus', 'impensis', 'excudebat',
+    'imprime par', 'bei', 'verlag von', 'verlag', 'en casa de', 'presso',
+]
+# words of a trade, before a name only with a preposition, not in imprimerie nationale
+imprint_trades = ['impr', 'imprimerie', 'imprimeur', 'libr', 'librairie', 'libraire']
+imprint_of = r"(?:de la|de l|des|du|de|d|par)"
+# not a name after a trade, ex: imprimeur du roi
+imprint_titles = ['roi', 'reine', 'empereur', 'cour', 'gouvernement', 'ville', 'universite']
+imprint_re = re.compile(r"^(?:(?:de l |de la |a l |a la )?(?:(?:"
+    + "|".join(imprint_words) + r")(?: " + imprint_of + r")?|(?:"
+    + "|".join(imprint_trades) + r") " + imprint_of + r"(?= (?!(?:la |l |le )?(?:" + "|".join(imprint_titles) + r")\b))) )+")
+
+
+def chunks(handle):
+    """Generate SRU records of a dump as bytes, in constant memory"""
+    buffer = b''
+    while True:
+        block = handle.read(block_size)
+        if not block:
+            break
+        buffer += block
+        start = 0
+        while True:
+            end = buffer.find(END_OF_RECORD, start)
+            if end < 0:
+                break
+            end += len(END_OF_RECORD)
+            yield buffer[start:end]
+            start = end
+        buffer = buffer[start:]
+
+
+def record(chunk):
+    """Parse the CERL record of an SRU record, None if not found or impossible"""
+    start = chunk.find(b'<record ')
+    end = chunk.rfind(b'</record>')
+    if start < 0 or end < 0:
+        return None
+    xml = chunk[start:end + len(b'</record>')]
+    try:
+        return ET.fromstring(xml)
+    except ET.ParseError:
+        pass
+    # some text with unescaped <, ex: <geographicalNote>Griechenland <Altertum></geographicalNote>
+    try:
+        element = ET.fromstring(repair(xml))
+        counts['repaired'] += 1
+        return element
+    except ET.ParseError:
+        counts['errors'] += 1
+        return None
+
+
+def repair(xml):
+    """Escape tags never closed, not self closed, as text"""
+    xml = xml.decode('utf-8')
+    opened = set(re.findall(r"<([A-Za-z][\w:.-]*)(?:\s[^<>]*)?(?<!/)>", xml))
+    closed = set(re.findall(r"</([A-Za-z][\w:.-]*)>", xml))
+    stray = opened - closed
+    if not stray:
+        return xml
+    return re.sub(
+        r"<(" + "|".join(re.escape(name) for name in stray) + r")((?:\s[^<>]*)?)>",
+        r"&lt;\1\2&gt;",
+        xml
+    )
+
+
+def text(element, path):
+    """Stripped text of the first element at path, or None"""
+    found = element.find(path)
+    if found is None or found.text is None:
+        return None
+    return found.text.strip() or None
+
+
+def printer(element):
+    """Rows of a CERL record, (printer values, [variant values]), None if not a printer"""
+    if element.get('type') != 'imprintName':
+        return None
+    id = element.get('id')
+    for key in printer_row:
+        printer_row[key] = None
+    printer_row['id'] = id
+    printer_row['name'] = text(element, ns + 'info/' + ns + 'display')
+    printer_row['dates'] = text(element, ns + 'info/' + ns + 'biographicalData')
+    printer_row['activity'] = text(element, ns + 'info/' + ns + 'activityNote')
+    printer_row['place'] = text(element, ns + 'info/' + ns + 'geographicalNote')
+    printer_row['url'] = 'https://data.cerl.org/thesaurus/' + id
+    variants = []
+    # same deform once by printer
+    seen = set()
+    for form in element.iterfind(ns + 'nameForms/*'):
+        if form.text is None:
+            continue
+        deform = bnfmarc.deform(form.text)
+        if not deform or deform in seen:
+            continue
+        seen.add(deform)
+        kind = form.tag[len(ns):].replace('Form', '') + ' ' + form.get('name', '')
+        variants.append((id, deform, form.text.strip(), kind.strip()))
+    if printer_row['name'] is None and variants:
+        printer_row['name'] = variants[0][2]
+    if printer_row['name'] is None:
+        return None
+    return tuple(printer_row.values()), variants
+
+
+def load(sru_file):
+    """Stream an SRU dump of CERL records, write printers and their variants"""
+    print("cerl < " + sru_file)
+    start = time.perf_counter()
+    with con:
+        con.execute("DELETE FROM printer_variant")
+        con.execute("DELETE FROM printer")
+    for key in counts:
+        counts[key] = 0
+    # ids loaded, a record may be twice in a paged dump
+    seen = set()
+    with open(sru_file, 'rb') as handle:
+        for chunk in chunks(handle):
+            counts['records'] += 1
+            element = record(chunk)
+            if element is None:
+                continue
+            rows = printer(element)
+            if rows is None:
+                counts['others'] += 1
+                continue
+            if rows[0][0] in seen:
+                counts['duplicates'] += 1
+                continue
+            seen.add(rows[0][0])
+            printer_rows.append(rows[0])
+            variant_rows.extend(rows[1])
+            if len(printer_rows) >= batch_size:
+                flush()
+    flush()
+    seconds = time.perf_counter() - start
+    print("%s  %d records, %d printers, %d variants, %d others, %d duplicates, %d repaired, %d errors, %.1f s, %.0f records/s" % (
+        os.path.basename(sru_file),
+        counts['records'],
+        counts['printers'],
+        counts['variants'],
+        counts['others'],
+        counts['duplicates'],
+        counts['repaired'],
+        counts['errors'],
+        seconds,
+        counts['records'] / seconds if seconds else 0,
+    ))
+
+
+def flush():
+    """Write rows waiting"""
+    with con:
+        con.executemany(printer_sql, printer_rows)
+        con.executemany(variant_sql, variant_rows)
+    counts['printers'] += len(printer_rows)
+    counts['variants'] += len(variant_rows)
+    printer_rows.clear()
+    variant_rows.clear()
+
+
+def imprint_key(publisher_like):
+    """Name of a deformed publisher, without imprint words, ex: chez didot -> didot"""
+    if publisher_like is None:
+        return None
+    return imprint_re.sub('', publisher_like + ' ').strip() or None
+
+
+def match():
+    """Set doc.printer in one pass: distinct publishers, without imprint words,
+    joined with variants of only one printer"""
+    start = time.perf_counter()
+    con.create_function('imprint_key', 1, imprint_key, deterministic=True)
+    con.execute("DROP TABLE IF EXISTS temp.publisher_key")
+    con.execute("""CREATE TEMP TABLE publisher_key AS
+        SELECT publisher_like, imprint_key(publisher_like) AS key
+        FROM (SELECT DISTINCT publisher_like FROM doc WHERE publisher_like IS NOT NULL)""")
+    con.execute("DROP TABLE IF EXISTS temp.printer_key")
+    # a variant of more than one printer is ambiguous
+    con.execute("""CREATE TEMP TABLE printer_key AS
+        SELECT deform AS key, min(printer) AS printer
+        FROM printer_variant GROUP BY deform HAVING count(*) = 1""")
+    con.execute("CREATE INDEX temp.printer_key_key ON printer_key(key)")
+    con.execute("UPDATE doc SET printer = NULL WHERE printer IS NOT NULL")
+    cur = con.execute("""UPDATE doc SET printer = matched.printer FROM (
+            SELECT publisher_key.publisher_like, printer_key.printer
+            FROM publisher_key JOIN printer_key ON printer_key.key = publisher_key.key
+        ) AS matched WHERE doc.publisher_like = matched.publisher_like""")
+    docs = cur.rowcount
+    con.commit()
+    publishers, matched = con.execute("""SELECT count(*), count(printer_key.printer)
+        FROM publisher_key LEFT JOIN printer_key ON printer_key.key = publisher_key.key""").fetchone()
+    total = con.execute("SELECT count(publisher_like) FROM doc").fetchone()[0]
+    con.execute("DROP TABLE temp.publisher_key")
+    con.execute("DROP TABLE temp.printer_key")
+    print("doc.printer  %d publishers, %d matched, %d docs of %d (%.1f%%), %.1f s" % (
+        publishers,
+        matched,
+        docs,
+        total,
+        docs / total * 100 if total else 0,
+        time.perf_counter() - start,
+    ))
+
+
+def main() -> int:
+    global batch_size, con
+    parser = argparse.ArgumentParser(
+        description='Load printers of a CERL Thesaurus SRU dump, and link docs to them',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('cataviz_db', nargs=1,
+    help='Sqlite database, loaded')
+    parser.add_argument('sru_file', nargs='?',
+    default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data2022', '_sru.xml'),
+    help='SRU dump of CERL records, default data2022/_sru.xml')
+    parser.add_argument('--batch', type=int, default=batch_size,
+    help='Number of printers written by executemany in one transaction')
+    parser.add_argument('--match', action='store_true',
+    help='Only link docs to printers already loaded')
+    args = parser.parse_args()
+    batch_size = args.batch
+    con = bnfmarc.connect(args.cataviz_db[0])
+    if not args.match:
+        load(args.sru_file)
+    match()
+    con.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
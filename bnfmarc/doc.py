@@ -16,8 +16,14 @@ import re
 import shutil
 import sqlite3
 import sys
+import time
 # local
+import auth
 import bnfmarc
+import iso2709
+import pipeline
+import places
+import stats
 
 """ Parse document records
 https://www.bnf.fr/sites/default/files/2019-01/Unimarc%2B%28B%29_201901_conversion.pdf
@@ -27,18 +33,83 @@ https://www.bnf.fr/sites/default/files/2019-01/Unimarc%2B%28B%29_201901_conversi
 con = None
 # isolate a cursor for auth select, supposed to ease sqlite cache, not verified
 auth_cur = None
+# things for doc table population, values of a record, reused
+doc_values = {
+    'id': None,
+    'title': '',
+    'desc': None,
+
+    'byline': None,
+    'authors': None,
+    'auth1': None,
+
+    'address': None,
+    'place': None,
+    'place_group': None,
+    'place_like': None,
+    'place_canon': None,
+    'publisher': None,
+    'publisher_group': None,
+    'publisher_like': None,
+    'format': None,
+    'pages': None,
+
+    'type': None,
+    'translation': None,
+    'year': None,
+    'country': None,
+    'clement': None,
+    'clement_letter': None,
+    'lang': None,
+
+    'file': None,
+    'url': '',
+    'gallica': None,
+}
+doc_sql = "INSERT INTO doc (" + ", ".join([*doc_values]) + ") VALUES (" + ", ".join(["?"] * len(doc_values)) +")"
 # things for contrib table population
-contrib_cur = None
-contrib_cols = ['doc', 'auth', 'field', 'role']
-contrib_sql = "INSERT INTO contrib (" + ", ".join(contrib_cols) + ") VALUES (:" + ", :".join(contrib_cols) +")"
+contrib_cols = ['doc', 'auth', 'field', 'role', 'type', 'year']
+contrib_sql = "INSERT INTO contrib (" + ", ".join(contrib_cols) + ") VALUES (" + ", ".join(["?"] * len(contrib_cols)) +")"
+# type of contribution by role
+contrib_roles = {
+    1: (62, 70, 90, 330), # writes
+    2: (3, 72, 75, 80, 100, 205, 212, 220, 270, 340, 651, 710, 727, 735), # edits
+    3: (730,), # translates
+    4: (40, 440, 520, 521, 522, 523, 524, 530, 531, 532, 533, 534, 705, 760), # illustrates
+    5: (230, 233, 236, 250, 510, 721), # music
+}
+contrib_types = {role: code for code, roles in contrib_roles.items() for role in roles}
 # things for about (auth) table population
-about_cur = None
-about_cols = ['doc', 'auth']
-about_sql = "INSERT INTO about (" + ", ".join(about_cols) + ") VALUES (:" + ", :".join(about_cols) +")"
+about_cols = ['doc', 'auth', 'year']
+about_sql = "INSERT INTO about (" + ", ".join(about_cols) + ") VALUES (" + ", ".join(["?"] * len(about_cols)) +")"
+# also extract authors without authority record, for a single pass load.py
+with_auths = False
+# rows waiting for executemany, by table
+doc_rows = []
+contrib_rows = []
+about_rows = []
+# count of rows written, by table
+written = {'doc': 0, 'contrib': 0, 'about': 0}
+# count of bad records skipped
+skipped = 0
+# errors of a bad record, skipped, others stop the load
+record_errors = (ValueError, IndexError, pymarc.exceptions.PymarcException)
+# docs by executemany, in one transaction
+batch_size = 10000
+# progress of the file written, recorded with rows
+checkpoint = {'file': None, 'offset': 0, 'records': 0}
+# start files from load_checkpoint, skip completed
+resume = False
+# extraction, 0 = in the writer thread, 1 = a thread, > 1 = processes (see pipeline)
+jobs = 0
+# worker processes shared by files, see pipeline.pool()
+pool = None
 
 
 year_min = 1400
 year_max = 2020
+# before, probably error in date
+year_first = 1450
 
 
 def phys(r, doc_values):
@@ -138,6 +209,8 @@ RES FOL-T29-4
 
 
     for f in r.get_fields('930'):
+        if f['5'] is None:
+            continue
         found = re.search(r"(FR-\d{9}):(.*)", f['5'])
         if (found == None):
             # never arrive, all docs from FR(ench) BnF
@@ -152,18 +225,33 @@ def clement_format(format, doc_values):
         return
     doc_values['format'] = int(format)
 
+def author(field, type, authors, firsts):
+    """Keep the first field of a tag, and the fields with a name"""
+    if field.tag not in firsts:
+        firsts[field.tag] = field
+    # strip field without a name
+    if field['a'] is None:
+        return
+    authors.append(field)
+
+
+# (tag, handler, type) for byline(), in order, persons first
+author_tags = bnfmarc.routes([
+    ('700', author, 1),
+    ('710', author, 2),
+])
+
+
 def byline(r, doc_values):
-    """Build a normalized byline from authors """
+    """Build a normalized byline from authors, get first author"""
     authors = []
-    # strip field without a name
-    for field in r.get_fields('700'):
-        if field['a'] is None:
-            continue
-        authors.append(field)
-    for field in r.get_fields('710'):
-        if field['a'] is None:
-            continue
-        authors.append(field)
+    firsts = {}
+    bnfmarc.dispatch(r, author_tags, authors, firsts)
+    # get first author
+    if '700' in firsts and firsts['700']['3'] is not None:
+        doc_values['auth1'] = auth_id(firsts['700'])
+    elif '710' in firsts and firsts['710']['3'] is not None:
+        doc_values['auth1'] = auth_id(firsts['710'])
     count = len(authors)
     if count == 0:
         return
@@ -172,28 +260,12 @@ def byline(r, doc_values):
     elif count == 2:
         doc_values['byline'] = authors[0]['a'] + " & " + authors[1]['a']
     else:
-        doc_values['byline'] = authors[0]['a'] + ", " + authors[1]['a'] + "… (" + count + ")"
-
-
-def auth_links(r, doc_id):
-    """Write links between doc to auth"""
-    for field in r.get_fields('700'):
-        contrib(doc_id, field)
-    for field in r.get_fields('701'):
-        contrib(doc_id, field)
-    for field in r.get_fields('702'):
-        contrib(doc_id, field)
-    for field in r.get_fields('600'):
-        about(doc_id, field)
-    # corporate
-    for field in r.get_fields('710'):
-        contrib(doc_id, field)
-    for field in r.get_fields('711'):
-        contrib(doc_id, field)
-    for field in r.get_fields('712'):
-        contrib(doc_id, field)
-    for field in r.get_fields('601'):
-        about(doc_id, field)
+        doc_values['byline'] = authors[0]['a'] + ", " + authors[1]['a'] + "… (" + str(count) + ")"
+
+
+def auth_links(r, doc_id, year, contribs, abouts):
+    """Collect links between doc to auth"""
+    bnfmarc.dispatch(r, link_tags, doc_id, year, contribs, abouts)
 
 """ Old when nb <> id
 def auth_id(field):
@@ -226,8 +298,7 @@ def auth_id(field):
     id = int(field['3'][0:8])
     return id
 
-def contrib(doc_id, field):
-    global contrib_sql, contrib_cur
+def contrib(field, type, doc_id, year, contribs, abouts):
     id = auth_id(field)
     if id is None:
         return
@@ -236,20 +307,29 @@ def contrib(doc_id, field):
         role = 70
     else:
         role = int(field['4'])
-    contrib_cur.execute(
-        contrib_sql, 
-        {'doc': doc_id, 'auth': id, 'field': int(field.tag), 'role': role}
-    )
+    # same order as contrib_cols
+    contribs.append((doc_id, id, int(field.tag), role, contrib_types.get(role), year))
 
-def about(doc_id, field):
-    global about_sql, about_cur
+def about(field, type, doc_id, year, contribs, abouts):
     id = auth_id(field)
     if id is None:
         return
-    about_cur.execute(
-        about_sql, 
-        {'doc': doc_id, 'auth': id}
-    )
+    # same order as about_cols
+    abouts.append((doc_id, id, year))
+
+
+# (tag, handler, type) for auth_links(), in order of rows
+link_tags = bnfmarc.routes([
+    ('700', contrib, 1),
+    ('701', contrib, 1),
+    ('702', contrib, 1),
+    ('600', about, 1),
+    # corporate
+    ('710', contrib, 2),
+    ('711', contrib, 2),
+    ('712', contrib, 2),
+    ('601', about, 2),
+])
 
 
 
@@ -411,6 +491,7 @@ def place(r, doc_values):
         return
     doc_values['place_group'] = place
     doc_values['place_like'] = bnfmarc.deform(place)
+    doc_values['place_canon'] = places.canonical(doc_values['place_like'])
 
 
 def country(r, doc_values):
@@ -421,6 +502,9 @@ def country(r, doc_values):
 
 
 def year(r, doc_values):
+    if r['100'] is None:
+        # mandatory field, bad record, skipped
+        raise ValueError("no 100, no date")
     str = r['100'].value()[9:13]
     year = str_year(str)
     if (year != None):
@@ -463,103 +547,281 @@ def str_year(str):
         return None
 
 
-def docs(marc_file):
+def instrument():
+    """Time decoding, extractors and writes of records, for --stats"""
+    stats.instrument(iso2709, {'_record': 'decode'})
+    stats.instrument(sys.modules[__name__], {
+        'record': 'extract',
+        'flush': 'write',
+        'url': 'url',
+        'title': 'title',
+        'phys': 'phys',
+        'clement': 'clement',
+        'type': 'type',
+        'lang': 'lang',
+        'address': 'address',
+        'year': 'year',
+        'publisher': 'publisher',
+        'place': 'place',
+        'byline': 'byline',
+        'auth_links': 'auth_links',
+    })
+    stats.instrument(auth, {'indocs': 'auth.indocs'})
+
+
+def record(r, file):
+    """Extract rows from a doc record: (doc, contribs, abouts, auths)"""
+    global doc_values
+    for key in doc_values:
+        doc_values[key] = None
+    doc_values['file'] = file
+    if r['003'] is None:
+        raise ValueError("no 003, no ark")
+    doc_values['url'] = str(r['003'].value().strip())
+    # doc_values['marc'] = str(r)
+    url(r, doc_values)
+    title(r, doc_values)
+    phys(r, doc_values)
+    clement(r, doc_values)
+    type(r, doc_values)
+    lang(r, doc_values)
+    address(r, doc_values) # before "place: publisher, year."
+    year(r, doc_values)
+    publisher(r, doc_values)
+    # place after publisher, in case of more precise field
+    place(r, doc_values)
+    # and first author
+    byline(r, doc_values)
+    # probably error in date
+    if doc_values['year'] is not None and doc_values['year'] < year_first:
+        doc_values['year'] = None
+    # maybe a bug
+    if doc_values['place'] == '':
+        doc_values['place'] = None
+    # link to authors
+    doc_id = doc_values['id']
+    contribs = []
+    abouts = []
+    auth_links(r, doc_id, doc_values['year'], contribs, abouts)
+    # count of writers
+    doc_values['authors'] = sum(1 for values in contribs if values[4] == 1)
+    auths = []
+    if with_auths:
+        auths = auth.indocs(r)
+    return tuple(doc_values.values()), contribs, abouts, auths
+
+
+def extract(batch, file, auths=False, worker=False, timed=False):
+    """Extract rows from a batch of records [(marc, offset after)] of a file,
+    for the pipeline, with the times of a worker process if timed"""
+    global with_auths
+    with_auths = auths
+    tags = iso2709.doc_tags
+    if with_auths:
+        tags = tags | iso2709.byline_tags
+    # decode only the fields used
+    tags = iso2709.tags_bytes(tags)
+    if worker and timed:
+        # forked worker may be already instrumented
+        instrument()
+        stats.reset()
+    rows = []
+    skips = 0
+    for marc, offset in batch:
+        r = iso2709.decode(marc, tags)
+        if r is None: # bad record, forget
+            skips += 1
+            continue
+        try:
+            row = record(r, file)
+        except record_errors as e:
+            # bad record, do not stop a load of hours
+            print("ERROR %s at %d, %s: %s" % (file, offset, e.__class__.__name__, e))
+            skips += 1
+            continue
+        if worker:
+            # auth_cache of the worker, to not extract same author again
+            for values in row[3]:
+                auth.auth_cache.add(values[0])
+        rows.append(row + (offset,))
+    if worker and timed:
+        return rows, skips, stats.snapshot()
+    return rows, skips, None
+
+
+def write_rows(result):
+    """Write the rows of a batch from extract(), add times of a worker"""
+    global skipped
+    rows, skips, times = result
+    skipped += skips
+    for row in rows:
+        write(row)
+    if times is not None:
+        stats.merge(times)
+
+
+def write(row):
+    """Buffer the rows extracted from a record, flush by batch_size docs"""
+    doc, contribs, abouts, auths, offset = row
+    doc_rows.append(doc)
+    contrib_rows.extend(contribs)
+    about_rows.extend(abouts)
+    # auth_cache of the writer is the reference
+    for values in auths:
+        auth.add(values)
+    checkpoint['offset'] = offset
+    checkpoint['records'] += 1
+    if len(doc_rows) >= batch_size:
+        flush()
+
+
+def flush():
+    """Write buffered rows with executemany, in one transaction,
+    with the checkpoint of the file"""
     global con
-    print("doc < " + marc_file)
-    file = os.path.basename(marc_file)
-    doc_values = {
-        'title': '',
-        'desc': None,
-
-        'byline': None,
-        'auth1': None,
-
-        'address': None,
-        'place': None,
-        'place_group': None,
-        'place_like': None,
-        'publisher': None,
-        'publisher_group': None,
-        'publisher_like': None,
-        'format': None,
-        'pages': None,
-
-        'type': None,
-        'translation': None,
-        'year': None,
-        'country': None,
-        'clement': None,
-        'clement_letter': None,
-        'lang': None,
-
-        'file': None,
-        'url': '',
-        'gallica': None,
-    }
-    doc_sql = "INSERT INTO doc (" + ", ".join([*doc_values]) + ") VALUES (:" + ", :".join([*doc_values]) +")"
+    # authors before docs, a resume do not write them twice (auth_cache)
+    if auth.auth_rows:
+        auth.flush()
     cur = con.cursor()
-    with open(marc_file, 'rb') as handle:
-        reader = pymarc.MARCReader(
-            handle, 
-            to_unicode=True,
-            force_utf8=True
-        )
-        for r in reader:
-            for key in doc_values:
-                doc_values[key] = None
-            doc_values['file'] = file
-            doc_values['url'] = str(r['003'].value().strip())
-            # doc_values['marc'] = str(r)
-            url(r, doc_values)
-            title(r, doc_values)
-            phys(r, doc_values)
-            clement(r, doc_values)
-            type(r, doc_values)
-            lang(r, doc_values)
-            address(r, doc_values) # before "place: publisher, year."
-            year(r, doc_values)
-            publisher(r, doc_values)
-            # place after publisher, in case of more precise field
-            place(r, doc_values)
-            byline(r, doc_values)
-            # get first author
-            if r['700'] is not None and r['700']['3'] is not None:
-                doc_values['auth1'] = auth_id(r['700'])
-            elif r['710'] is not None and r['710']['3'] is not None:
-                doc_values['auth1'] = auth_id(r['710'])
-
-
-            # write doc record
-            cur.execute(doc_sql, doc_values)
-            doc_id = cur.lastrowid
-            # link to authors
-            auth_links(r, doc_id)
+    # commit, or rollback if error
+    with con:
+        cur.executemany(doc_sql, doc_rows)
+        cur.executemany(contrib_sql, contrib_rows)
+        cur.executemany(about_sql, about_rows)
+        if checkpoint['file'] is not None:
+            bnfmarc.checkpoint(con, checkpoint['file'], checkpoint['offset'], checkpoint['records'])
+    written['doc'] += len(doc_rows)
+    written['contrib'] += len(contrib_rows)
+    written['about'] += len(about_rows)
+    doc_rows.clear()
+    contrib_rows.clear()
+    about_rows.clear()
+
+
+def resume_point(marc_file):
+    """Get (offset, records) where to start a file, None if done"""
+    if not resume:
+        return 0, 0
+    return bnfmarc.resume_point(con, marc_file)
+
+
+def start_file(marc_file, point):
+    """Init checkpoint of a file from (offset, records)"""
+    checkpoint['file'] = os.path.basename(marc_file)
+    checkpoint['offset'] = point[0]
+    checkpoint['records'] = point[1]
+
+
+def end_file(marc_file, start, before):
+    """Flush rows, mark file done (not a sample), print throughput"""
+    throughput(marc_file, start, before)
+    with con:
+        bnfmarc.checkpoint(con, checkpoint['file'], checkpoint['offset'], checkpoint['records'], done=int(stats.sample is None))
+    checkpoint['file'] = None
+
+
+def counts():
+    """Count of rows written, by table, with auth from doc records,
+    and of records skipped"""
+    return dict(written, auth=auth.written, skipped=skipped)
+
+
+def throughput(marc_file, start, before):
+    """Print rows written and docs/s for a file"""
+    flush()
+    seconds = time.perf_counter() - start
+    after = counts()
+    docs = after['doc'] - before['doc']
+    stats.file_done(os.path.basename(marc_file), docs, seconds)
+    print("%s  %d docs, %d contribs, %d abouts, %d auths, %.1f s, %.0f docs/s" % (
+        os.path.basename(marc_file),
+        docs,
+        after['contrib'] - before['contrib'],
+        after['about'] - before['about'],
+        after['auth'] - before['auth'],
+        seconds,
+        docs / seconds if seconds else 0,
+    ))
+    if after['skipped'] > before['skipped']:
+        print("%s  %d bad records skipped" % (
+            os.path.basename(marc_file),
+            after['skipped'] - before['skipped'],
+        ))
 
 
+def docs(marc_file):
+    point = resume_point(marc_file)
+    if point is None:
+        return
+    start_file(marc_file, point)
+    print("doc < " + marc_file)
+    stats.profile_start()
+    start = time.perf_counter()
+    before = counts()
+    # compiled before workers of a file, inherited
+    places.load()
+    metrics = pipeline.run(
+        marc_file, extract, write_rows,
+        args=(os.path.basename(marc_file), with_auths, jobs > 1, stats.enabled),
+        offset=point[0], jobs=jobs, limit=stats.sample, pool=pool
+    )
+    end_file(marc_file, start, before)
+    pipeline.report(metrics)
+    stats.profile_stop('doc_' + os.path.basename(marc_file))
+
 
 def main() -> int:
-    global about_cur, con, contrib_cur, auth_cur
+    global batch_size, con, auth_cur, resume, jobs, pool
     parser = argparse.ArgumentParser(
         description='Crawl a folder of marc file to generate an sqlite base',
         formatter_class=argparse.RawTextHelpFormatter
     )
     parser.add_argument('cataviz_db', nargs=1,
     help='Sqlite database to generate')
+    parser.add_argument('-j', '--jobs', type=int, default=jobs,
+    help='Record extraction, 0 = in the writer thread, 1 = a thread, > 1 = number of worker processes')
+    parser.add_argument('--batch', type=int, default=batch_size,
+    help='Number of docs written by executemany in one transaction')
+    parser.add_argument('--bulk', action='store_true',
+    help='Bulk load profile, no journal, no sync (indexes by finalize.py)')
+    parser.add_argument('--resume', action='store_true',
+    help='Continue an interrupted load from load_checkpoint (not safe after a crash with --bulk)')
+    parser.add_argument('--stats', action='store_true',
+    help='Print time by stage and by extractor, records/s by file')
+    parser.add_argument('--stats-json', metavar='FILE',
+    help='Write the stats as json in FILE')
+    parser.add_argument('--profile', metavar='DIR',
+    help='Write a cProfile .pstats and a tracemalloc .mem.txt by file in DIR (no threads, no workers)')
+    parser.add_argument('--sample', type=int, metavar='N',
+    help='Read only the first N records of each file')
 
     args = parser.parse_args()
+    # profile in the thread of the records
+    jobs = 0 if args.profile else args.jobs
+    if args.stats or args.stats_json:
+        instrument()
+    stats.profile_dir = args.profile
+    stats.sample = args.sample
     db_file = args.cataviz_db[0]
-    con = bnfmarc.connect(db_file)
+    batch_size = args.batch
+    resume = args.resume
+    con = bnfmarc.connect(db_file, bulk=args.bulk)
     auth_cur = con.cursor()
-    contrib_cur = con.cursor()
-    about_cur = con.cursor()
     marc_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data/')
 
     # if (name.startswith('P174_') or name.startswith('P1187_')): 
-    for marc_file in glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")):
-        docs(marc_file)
-    for marc_file in glob.glob(os.path.join(marc_dir, "P174_*.UTF8")):
+    marc_files = sorted(glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")))
+    marc_files += sorted(glob.glob(os.path.join(marc_dir, "P174_*.UTF8")))
+    # compiled before workers, inherited
+    places.load()
+    pool = pipeline.pool(jobs)
+    for marc_file in marc_files:
         docs(marc_file)
-    con.commit()
+    pipeline.close(pool)
+    flush()
+    places.report(con)
+    if stats.enabled:
+        stats.summary(args.stats_json)
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Export tables of a base as columnar files, for pandas or Polars,
+Parquet (one row group by batch) or Arrow IPC stream.
+Rows are streamed by batches, memory is bounded by the row group size.
+Needs pyarrow (optional, pip install pyarrow).
+"""
+import argparse
+import os
+import sys
+import time
+
+# local
+import bnfmarc
+
+# rows by record batch, a row group in parquet
+row_group_size = 100000
+# tables exported by default
+tables = ['doc', 'auth', 'contrib']
+# text columns with few distinct values, dictionary encoded
+dictionary_columns = {'lang', 'country', 'type', 'place_group', 'place_canon', 'publisher_group', 'file'}
+# file extension by format
+extensions = {'parquet': '.parquet', 'arrow': '.arrows'}
+
+
+def arrow():
+    """Import pyarrow, or exit with a message"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        sys.exit("export needs pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def schema(con, table):
+    """Arrow schema of a table, from the declared types of its columns"""
+    pa = arrow()
+    fields = []
+    for cid, name, decl, notnull, default, pk in con.execute("PRAGMA table_info(%s)" % table):
+        decl = decl.upper()
+        if 'INT' in decl:
+            type = pa.int64()
+        elif 'REAL' in decl:
+            type = pa.float64()
+        elif name in dictionary_columns:
+            type = pa.dictionary(pa.int32(), pa.string())
+        else:
+            # TEXT, and BLOB of auth.note, written as str
+            type = pa.string()
+        fields.append(pa.field(name, type, nullable=not notnull))
+    return pa.schema(fields)
+
+
+def batches(con, table, schema, size):
+    """Generate record batches of size rows from a table, in rowid order"""
+    pa = arrow()
+    cur = con.execute("SELECT %s FROM %s ORDER BY rowid" % (
+        ", ".join(schema.names), table
+    ))
+    while True:
+        rows = cur.fetchmany(size)
+        if not rows:
+            break
+        columns = []
+        for i, values in enumerate(zip(*rows)):
+            type = schema.field(i).type
+            if pa.types.is_dictionary(type):
+                columns.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                columns.append(pa.array(values, type))
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def export(con, table, out_dir, format='parquet', size=row_group_size):
+    """Write a table in out_dir, return (rows, bytes)"""
+    pa = arrow()
+    table_schema = schema(con, table)
+    path = os.path.join(out_dir, table + extensions[format])
+    rows = 0
+    if format == 'parquet':
+        writer = pa.parquet.ParquetWriter(path, table_schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_stream(path, table_schema)
+    with writer:
+        for batch in batches(con, table, table_schema, size):
+            if format == 'parquet':
+                writer.write_batch(batch, row_group_size=size)
+            else:
+                writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows, os.path.getsize(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Export tables of a base as Parquet or Arrow files, by record batches',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('cataviz_db', nargs=1,
+    help='Sqlite database to export')
+    parser.add_argument('out_dir', nargs=1,
+    help='Folder of exported files, <table>.parquet or <table>.arrows')
+    parser.add_argument('--format', choices=[*extensions], default='parquet',
+    help='parquet (zstd), or arrow (IPC stream)')
+    parser.add_argument('--row-group', type=int, default=row_group_size,
+    help='Rows by record batch, a row group in parquet, bounds memory')
+    parser.add_argument('--tables', nargs='+', default=tables,
+    help='Tables to export, default: ' + ' '.join(tables))
+    args = parser.parse_args()
+    arrow()
+    con = bnfmarc.connect(args.cataviz_db[0])
+    os.makedirs(args.out_dir[0], exist_ok=True)
+    for table in args.tables:
+        start = time.perf_counter()
+        rows, size = export(con, table, args.out_dir[0], args.format, args.row_group)
+        seconds = time.perf_counter() - start
+        print("%s > %s  %d rows, %.1f MB, %.1f s, %.0f rows/s" % (
+            table,
+            os.path.join(args.out_dir[0], table + extensions[args.format]),
+            rows,
+            size / 1e6,
+            seconds,
+            rows / seconds if seconds else 0,
+        ))
+    con.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
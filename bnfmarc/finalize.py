@@ -0,0 +1,32 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Finalize a base loaded in bulk mode, build indexes after update
+"""
+import argparse
+import sys
+
+# local
+import bnfmarc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Build indexes of a base loaded with --bulk, after update',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('cataviz_db', nargs=1,
+    help='Sqlite database to finalize')
+    args = parser.parse_args()
+    con = bnfmarc.connect(args.cataviz_db[0])
+    bnfmarc.indexes(con)
+    con.execute("PRAGMA optimize")
+    con.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Optional full-text index of a base, built after load (and update),
+FTS5 tables doc_fts (title, desc, byline) and auth_fts (name, deform).
+Texts are indexed as bnfmarc.deform(), and queries are deformed the same
+way, so search ignores case, diacritics, ligatures and punctuation like
+auth.deform, place_like, publisher_like.
+Tables are contentless, rowid is doc.id or auth.id.
+Fuzzy lookup of authors, auth_trigram, an FTS5 trigram index of auth.deform,
+candidates share the most rare trigrams of a name, ranked by trigram similarity.
+Tables are not updated by load.py --incremental (contentless tables need
+the old texts to delete rows), load.py drops them when it changes doc or auth,
+run fts.py again after the load.
+"""
+import argparse
+import collections
+import sqlite3
+import sys
+import time
+
+# local
+import bnfmarc
+
+# texts already deformed, tokens are separated by spaces and symbols
+tokenizer = "unicode61 remove_diacritics 0"
+# tables of build(), dropped by drop()
+built = ['doc_fts', 'auth_fts', 'auth_trigram', 'auth_trigram_df']
+# (fts table, source table, indexed columns)
+tables = [
+    ('doc_fts', 'doc', ['title', 'desc', 'byline']),
+    ('auth_fts', 'auth', ['name', 'deform']),
+]
+# ids returned by a query
+limit = 100
+# fuzzy lookup, candidates for each result
+candidates = 20
+# fuzzy lookup, rarest trigrams of a name first, until this count of docs
+postings = 20000
+# fuzzy lookup, min count of trigrams of a name
+grams_min = 3
+
+
+def sql_deform(s):
+    """deform() as an sql function, NULL safe"""
+    if s is None:
+        return None
+    return bnfmarc.deform(str(s))
+
+
+def build(con):
+    """Create the fts tables from doc and auth, print time and size of each"""
+    con.create_function('deform', 1, sql_deform, deterministic=True)
+    for fts, source, columns in tables:
+        start = time.perf_counter()
+        con.execute("DROP TABLE IF EXISTS %s" % fts)
+        con.execute("CREATE VIRTUAL TABLE %s USING fts5(%s, content='', tokenize='%s')" % (
+            fts, ", ".join(columns), tokenizer
+        ))
+        cur = con.execute("INSERT INTO %s (rowid, %s) SELECT id, %s FROM %s" % (
+            fts,
+            ", ".join(columns),
+            ", ".join("deform(%s)" % column for column in columns),
+            source
+        ))
+        rows = cur.rowcount
+        # merge b-trees of the index
+        con.execute("INSERT INTO %s (%s) VALUES ('optimize')" % (fts, fts))
+        con.commit()
+        print("%s  %d rows, %.1f s, %s" % (fts, rows, time.perf_counter() - start, size(con, fts)))
+    start = time.perf_counter()
+    con.execute("DROP TABLE IF EXISTS auth_trigram")
+    # external content, deform read from auth
+    con.execute("CREATE VIRTUAL TABLE auth_trigram USING fts5(deform, content='auth', content_rowid='id', tokenize='trigram')")
+    con.execute("INSERT INTO auth_trigram (auth_trigram) VALUES ('rebuild')")
+    con.execute("INSERT INTO auth_trigram (auth_trigram) VALUES ('optimize')")
+    # count of authors by trigram, fts5vocab is too slow to query by name
+    con.execute("DROP TABLE IF EXISTS auth_trigram_df")
+    con.execute("CREATE TABLE auth_trigram_df (gram TEXT, docs INTEGER, PRIMARY KEY(gram)) WITHOUT ROWID")
+    con.execute("CREATE VIRTUAL TABLE temp.auth_trigram_vocab USING fts5vocab(main, auth_trigram, 'row')")
+    con.execute("INSERT INTO auth_trigram_df SELECT term, doc FROM temp.auth_trigram_vocab")
+    con.execute("DROP TABLE temp.auth_trigram_vocab")
+    con.commit()
+    print("auth_trigram  %.1f s, %s" % (time.perf_counter() - start, size(con, 'auth_trigram')))
+
+
+def drop(con):
+    """Drop the tables of build(), stale after a load, return names dropped"""
+    names = [row[0] for row in con.execute(
+        "SELECT name FROM sqlite_master WHERE name IN (%s)" % ", ".join("?" * len(built)),
+        built
+    )]
+    for name in names:
+        con.execute("DROP TABLE %s" % name)
+    con.commit()
+    return names
+
+
+def size(con, fts):
+    """Size of the shadow tables of an fts table, as text"""
+    try:
+        bytes = con.execute(
+            "SELECT sum(pgsize) FROM dbstat WHERE name LIKE ? || '\\_%' ESCAPE '\\'", (fts,)
+        ).fetchone()[0]
+    except sqlite3.OperationalError: # no dbstat in this sqlite
+        return "size ?"
+    return "%.1f MB" % ((bytes or 0) / 1e6)
+
+
+def match(text, prefix=False):
+    """FTS5 query of a free text, tokens of deform() as phrases, all required.
+    prefix: last token may be the start of a word"""
+    tokens = bnfmarc.deform(text).split()
+    if not tokens:
+        return None
+    # quoted, no fts syntax from the text
+    phrases = ['"%s"' % token.replace('"', '""') for token in tokens]
+    if prefix:
+        phrases[-1] += '*'
+    return " ".join(phrases)
+
+
+def query(con, text, fts='doc_fts', limit=limit, prefix=False):
+    """Ids of rows matching a free text, best bm25 rank first"""
+    expr = match(text, prefix)
+    if expr is None:
+        return []
+    cur = con.execute(
+        "SELECT rowid FROM %s WHERE %s MATCH ? ORDER BY rank LIMIT ?" % (fts, fts),
+        (expr, limit)
+    )
+    return [row[0] for row in cur]
+
+
+def docs(con, text, limit=limit, prefix=False):
+    """Ids of docs by title, desc or byline, best first"""
+    return query(con, text, 'doc_fts', limit, prefix)
+
+
+def auths(con, text, limit=limit, prefix=False):
+    """Ids of authors by name, best first"""
+    return query(con, text, 'auth_fts', limit, prefix)
+
+
+def trigrams(s):
+    """Set of trigrams of a deformed string, words padded by spaces"""
+    s = " " + s + " "
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def similarity(a, b):
+    """Trigram similarity of 2 sets of trigrams, 0 to 1 (Jaccard)"""
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def fuzzy(con, name, k=10, generation=None):
+    """Top k authors like a name, [(id, deform, generation, similarity)],
+    best first. generation: (min, max) years, or None"""
+    deform = bnfmarc.deform(name)
+    wanted = trigrams(deform)
+    grams = rare(con, wanted)
+    if not grams:
+        return []
+    # candidates, authors with most rare trigrams, counted here,
+    # faster than bm25 on thousands of rows
+    sql = "SELECT rowid FROM auth_trigram WHERE auth_trigram MATCH ?"
+    params = []
+    if generation is not None:
+        sql = """SELECT auth.id FROM auth_trigram JOIN auth ON auth.id = auth_trigram.rowid
+            WHERE auth_trigram MATCH ? AND auth.generation BETWEEN ? AND ?"""
+        params = list(generation)
+    counts = collections.Counter()
+    for gram in grams:
+        counts.update(row[0] for row in con.execute(sql, ['"%s"' % gram.replace('"', '""')] + params))
+    ids = [id for id, count in counts.most_common(k * candidates)]
+    if not ids:
+        return []
+    found = [
+        (id, text, year, similarity(wanted, trigrams(text)))
+        for id, text, year in con.execute(
+            "SELECT id, deform, generation FROM auth WHERE id IN (%s)" % ", ".join("?" * len(ids)),
+            ids
+        )
+    ]
+    found.sort(key=lambda row: (-row[3], row[0]))
+    return found[:k]
+
+
+def rare(con, wanted):
+    """Trigrams to search, padding not indexed, the rarest until postings
+    (grams_min at least), common trigrams of names would select
+    a large part of the authors"""
+    grams = [gram for gram in wanted if ' ' not in gram]
+    if not grams:
+        return []
+    docs = dict(con.execute(
+        "SELECT gram, docs FROM auth_trigram_df WHERE gram IN (%s)" % ", ".join("?" * len(grams)),
+        grams
+    ).fetchall())
+    # not indexed, no author
+    grams = sorted((gram for gram in grams if gram in docs), key=docs.get)
+    count = 0
+    for i, gram in enumerate(grams):
+        count += docs[gram]
+        if count > postings and i >= grams_min:
+            return grams[:i]
+    return grams
+
+
+def fuzzy_many(con, names, k=10, generation=None):
+    """fuzzy() of a list of names, {name: results}, same names once"""
+    results = {}
+    for name in names:
+        if name not in results:
+            results[name] = fuzzy(con, name, k, generation)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Build the full-text indexes of a base (doc_fts, auth_fts, auth_trigram), or query them',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('cataviz_db', nargs=1,
+    help='Sqlite database to index')
+    parser.add_argument('--query', metavar='TEXT',
+    help='Print ids of docs matching TEXT, instead of building')
+    parser.add_argument('--auths', action='store_true',
+    help='With --query, ids of authors')
+    parser.add_argument('--prefix', action='store_true',
+    help='With --query, last word of TEXT is a prefix')
+    parser.add_argument('--limit', type=int, default=limit,
+    help='With --query, max ids')
+    parser.add_argument('--fuzzy', metavar='NAME',
+    help='Print authors like NAME, id, deform, generation, similarity')
+    parser.add_argument('--fuzzy-file', metavar='FILE',
+    help='Match a list of names, one by line, print a tsv line by candidate')
+    parser.add_argument('-k', type=int, default=10,
+    help='With --fuzzy, candidates by name')
+    parser.add_argument('--generation', type=int, nargs=2, metavar=('MIN', 'MAX'),
+    help='With --fuzzy, only authors of generation MIN to MAX')
+    args = parser.parse_args()
+    con = bnfmarc.connect(args.cataviz_db[0])
+    if args.query is not None or args.fuzzy is not None or args.fuzzy_file is not None:
+        found = con.execute("SELECT count(*) FROM sqlite_master WHERE name IN (%s)" % ", ".join("?" * len(built)), built).fetchone()[0]
+        if found < len(built):
+            print("No full-text tables, dropped by a load? Build them: fts.py " + args.cataviz_db[0])
+            return 1
+    if args.fuzzy is not None or args.fuzzy_file is not None:
+        if args.fuzzy_file is not None:
+            with open(args.fuzzy_file, 'r', encoding='utf-8') as handle:
+                names = [line.strip() for line in handle if line.strip()]
+        else:
+            names = [args.fuzzy]
+        start = time.perf_counter()
+        results = fuzzy_many(con, names, args.k, args.generation)
+        seconds = time.perf_counter() - start
+        print("name\tid\tdeform\tgeneration\tsimilarity")
+        for name in names:
+            for id, deform, generation, score in results[name]:
+                print("%s\t%d\t%s\t%s\t%.3f" % (name, id, deform, generation, score))
+        print("%d names, %.1f ms/name" % (len(names), seconds / len(names) * 1e3), file=sys.stderr)
+        con.close()
+        return 0
+    if args.query is None:
+        build(con)
+        con.close()
+        return 0
+    fts = 'auth_fts' if args.auths else 'doc_fts'
+    start = time.perf_counter()
+    ids = query(con, args.query, fts, args.limit, args.prefix)
+    for id in ids:
+        print(id)
+    print("%s  %d ids, %.1f ms" % (match(args.query, args.prefix), len(ids), (time.perf_counter() - start) * 1e3))
+    con.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11586 +1,48 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
 
-dic = {
-  "aaliyah": 2,
-  "aapeli": 1,
-  "aapo": 1,
-  "aaren": None,
-  "aarne": 1,
-  "aarón": 1,
-  "aaron": 1,
-  "aatami": 1,
-  "aatto": 1,
-  "aatu": 1,
-  "abaddon": 1,
-  "abbán": 1,
-  "'abbas": 1,
-  "abbey": 2,
-  "abbie": 2,
-  "abby": 2,
-  "abd-al-aziz": 1,
-  "abd-allah": 1,
-  "abd-al-malik": 1,
-  "abd-al-qadir": 1,
-  "abd-al-rahman": 1,
-  "abdul": 1,
-  "abdul-aziz": 1,
-  "abdullah": 1,
-  "abdul-rahman": 1,
-  "abe": 1,
-  "abednego": 1,
-  "abegail": 2,
-  "ábel": 1,
-  "abel": 1,
-  "abelone": 2,
-  "abena": 2,
-  "abeni": 2,
-  "abhay": 1,
-  "abiah": None,
-  "abidan": 1,
-  "abidemi": 1,
-  "abiel": 1,
-  "abigail": 2,
-  "abigayle": 2,
-  "abihu": 1,
-  "abijah": None,
-  "abilene": 2,
-  "abimael": 1,
-  "abiram": 1,
-  "abisai": 1,
-  "abishag": 2,
-  "abishai": 1,
-  "abital": 2,
-  "'abla": 2,
-  "abner": 1,
-  "abraham": 1,
-  "abram": 1,
-  "absalom": 1,
-  "absolon": 1,
-  "acacia": 2,
-  "acacius": 1,
-  "acantha": 2,
-  "ace": 1,
-  "achaicus": 1,
-  "achan": 1,
-  "achieng": 2,
-  "achille": 1,
-  "achilles": 1,
-  "achim": 1,
-  "acke": 1,
-  "ada": 2,
-  "adah": 2,
-  "adair": 1,
-  "adalbert": 1,
-  "adalberto": 1,
-  "adalheid": 2,
-  "adalia": 1,
-  "ádám": 1,
-  "adam": 1,
-  "adamina": 2,
-  "adamo": 1,
-  "adán": 1,
-  "adão": 1,
-  "adara": 2,
-  "addie": 2,
-  "addison": None,
-  "addy": 2,
-  "adel": 1,
-  "adela": 2,
-  "adélaïde": 2,
-  "adelaide": 2,
-  "adèle": 2,
-  "adelheid": 2,
-  "adelia": 2,
-  "adelina": 2,
-  "adeline": 2,
-  "adelle": 2,
-  "adelmar": 1,
-  "adem": 1,
-  "aden": 1,
-  "adena": 2,
-  "adhara": 2,
-  "adhiambo": 2,
-  "adi": 2,
-  "adil": 1,
-  "adina": None,
-  "adino": 1,
-  "adisa": 1,
-  "aditya": 1,
-  "adjoa": 2,
-  "adlai": 1,
-  "adolf": 1,
-  "adolfo": 1,
-  "adolph": 1,
-  "adolphe": 1,
-  "adolphus": 1,
-  "adonai": 1,
-  "adonia": 2,
-  "adonijah": 1,
-  "adonis": 1,
-  "adora": 2,
-  "adorinda": 2,
-  "adorján": 1,
-  "adrasteia": 2,
-  "adrastos": 1,
-  "adria": 2,
-  "adriaan": 1,
-  "adrián": 1,
-  "adrian": 1,
-  "adriana": 2,
-  "adrianna": 2,
-  "adrianne": 2,
-  "adriano": 1,
-  "adrien": 1,
-  "adrienn": 2,
-  "adrienne": 2,
-  "adwoa": 2,
-  "aegle": 2,
-  "ælfwine": 1,
-  "aella": 2,
-  "ælred": 1,
-  "aemilia": 2,
-  "aeneas": 1,
-  "aengus": 1,
-  "aeolus": 1,
-  "aeron": None,
-  "aeronwen": 2,
-  "aeronwy": 2,
-  "æsc": 1,
-  "aeschylus": 1,
-  "aeson": 1,
-  "aesop": 1,
-  "æðelbert": 1,
-  "æðelfrid": 1,
-  "æðelmær": 1,
-  "æðelred": 1,
-  "æðelstan": 1,
-  "æðelþryð": 2,
-  "afanasi": 1,
-  "afanasy": 1,
-  "afanen": 2,
-  "afia": 2,
-  "afolabi": 1,
-  "afon": None,
-  "afonso": 1,
-  "afra": 2,
-  "africa": 2,
-  "afua": 2,
-  "agafya": 2,
-  "agamemnon": 1,
-  "agape": 2,
-  "agapios": 1,
-  "agata": 2,
-  "agatha": 2,
-  "agathangelos": 2,
-  "agathe": 2,
-  "agathon": 1,
-  "agaue": 2,
-  "aggie": 2,
-  "aghavni": 2,
-  "ági": 2,
-  "aglaia": 2,
-  "aglaya": 2,
-  "aglea": 2,
-  "ágnes": 2,
-  "agnès": 2,
-  "agnes": 2,
-  "agnese": 2,
-  "agnessa": 2,
-  "agneta": 2,
-  "agnethe": 2,
-  "agnieszka": 2,
-  "agostina": 2,
-  "agostinho": 1,
-  "agostino": 1,
-  "ágoston": 1,
-  "ágota": 2,
-  "agrafena": 2,
-  "agrippa": 1,
-  "agrippina": 2,
-  "agrona": 2,
-  "águeda": 2,
-  "agustín": 1,
-  "ah": None,
-  "ahab": 1,
-  "aharon": 1,
-  "ahmad": 1,
-  "ahmed": 1,
-  "ahmet": 1,
-  "ahriman": 1,
-  "ahtahkakoop": 1,
-  "ahura mazda": 1,
-  "ahuva": 2,
-  "ai": 2,
-  "aias": 1,
-  "aida": 2,
-  "aidan": None,
-  "aiden": 1,
-  "aignéis": 2,
-  "aikaterine": 2,
-  "ailbhe": None,
-  "aileas": 2,
-  "aileen": 2,
-  "ailill": 1,
-  "ailín": 1,
-  "ailís": 2,
-  "ailpein": 1,
-  "ailsa": 2,
-  "aimé": 1,
-  "aimée": 2,
-  "aimo": 1,
-  "aina": 2,
-  "aindrea": 1,
-  "aindréas": 1,
-  "aindriú": 1,
-  "áine": 2,
-  "aingeal": 2,
-  "aino": 2,
-  "ainsley": None,
-  "ainslie": None,
-  "aintzane": 2,
-  "aiolos": 1,
-  "'aisha": 2,
-  "aislin": 2,
-  "aisling": 2,
-  "aislinn": 2,
-  "aithne": 2,
-  "aitor": 1,
-  "ajax": 1,
-  "ajeet": 1,
-  "ajit": 1,
-  "ajith": 1,
-  "akakios": 1,
-  "akamu": 1,
-  "akanksha": 2,
-  "akeem": 1,
-  "akemi": 2,
-  "akhil": 1,
-  "aki": None,
-  "akiko": 2,
-  "akilah": 2,
-  "akilina": 2,
-  "akim": 1,
-  "akinyi": 2,
-  "akio": 1,
-  "akira": 1,
-  "akiva": 1,
-  "akoni": 1,
-  "akosua": 2,
-  "aksel": 1,
-  "aksinya": 2,
-  "aku": 1,
-  "akua": 2,
-  "akulina": 2,
-  "al": 1,
-  "alaba": 2,
-  "alain": 1,
-  "alaina": 2,
-  "alan": 1,
-  "alana": 2,
-  "alanis": 2,
-  "alanna": 2,
-  "alannah": 2,
-  "alannis": 2,
-  "alaois": 1,
-  "alaric": 1,
-  "alasdair": 1,
-  "alastair": 1,
-  "alastar": 1,
-  "alastríona": 2,
-  "alayna": 2,
-  "alba": 2,
-  "alban": 1,
-  "alberic": 1,
-  "albert": 1,
-  "alberta": 2,
-  "albertina": 2,
-  "albertine": 2,
-  "alberto": 1,
-  "albina": 2,
-  "albrecht": 1,
-  "alby": 1,
-  "alcaeus": 1,
-  "alcippe": 2,
-  "alcyone": 2,
-  "alden": 1,
-  "aldo": 1,
-  "aldous": 1,
-  "aldrick": 1,
-  "alea": 2,
-  "alease": 2,
-  "alec": 1,
-  "alechjo": 1,
-  "aled": 1,
-  "aleesha": 2,
-  "aleit": 2,
-  "alejandra": 2,
-  "alejandro": 1,
-  "alejo": 1,
-  "aleksandar": 1,
-  "aleksander": 1,
-  "aleksandr": 1,
-  "aleksandra": 2,
-  "aleksandrina": 2,
-  "aleksandro": 1,
-  "aleksanteri": 1,
-  "aleksei": 1,
-  "aleksi": 1,
-  "alene": 2,
-  "alenka": 2,
-  "ales": 1,
-  "alesha": 2,
-  "alessa": 2,
-  "alessandra": 2,
-  "alessandro": 1,
-  "alessia": 2,
-  "alessio": 1,
-  "aleta": 2,
-  "aletha": 2,
-  "alethea": 2,
-  "alex": None,
-  "alexa": 2,
-  "alexander": 1,
-  "alexandr": 1,
-  "alexandra": 2,
-  "alexandre": 1,
-  "alexandrea": 2,
-  "alexandria": 2,
-  "alexandrie": 2,
-  "alexandrina": 2,
-  "alexandros": 1,
-  "alexandru": 1,
-  "alexei": 1,
-  "alexej": 1,
-  "alexia": 2,
-  "alexina": 2,
-  "alexis": 2,
-  "alexis": 1,
-  "alexius": 1,
-  "alexus": 2,
-  "alf": 1,
-  "alfeo": 1,
-  "alfhild": 2,
-  "alfons": 1,
-  "alfonsina": 2,
-  "alfonso": 1,
-  "alfréd": 1,
-  "alfred": 1,
-  "alfreda": 2,
-  "alfredo": 1,
-  "alfsigr": 2,
-  "algar": 1,
-  "alger": 1,
-  "algernon": 1,
-  "ali": 1,
-  "alia": 2,
-  "aliah": 2,
-  "alice": 2,
-  "alicia": 2,
-  "alida": 2,
-  "aliisa": 2,
-  "alin": 1,
-  "alina": 2,
-  "aline": 2,
-  "alis": 2,
-  "alisa": 2,
-  "alisha": 2,
-  "alisia": 2,
-  "alison": None,
-  "alissa": 2,
-  "alistair": 1,
-  "alister": 1,
-  "alisya": 2,
-  "alix": None,
-  "aliyah": 2,
-  "aliz": 2,
-  "aliza": 2,
-  "allan": 1,
-  "allannah": 2,
-  "allegra": 2,
-  "allegria": 2,
-  "allen": 1,
-  "allie": 2,
-  "allison": 2,
-  "allon": 1,
-  "ally": 2,
-  "allycia": 2,
-  "allyn": 1,
-  "allyson": 2,
-  "alma": 2,
-  "almas": 2,
-  "almira": 2,
-  "almudena": 2,
-  "alodia": 2,
-  "alois": 1,
-  "aloisia": 2,
-  "aloisio": 1,
-  "alojz": 1,
-  "alon": 1,
-  "alondra": 2,
-  "alonso": 1,
-  "alonzo": 1,
-  "aloysius": 1,
-  "alp": 1,
-  "alpertti": 1,
-  "alpha": None,
-  "alphaeus": 1,
-  "alphonse": 1,
-  "alphonsine": 2,
-  "alphonso": 1,
-  "alphonsus": 1,
-  "alphonzo": 1,
-  "alpin": 1,
-  "alta": 2,
-  "altan": 1,
-  "alte": 2,
-  "alter": 1,
-  "althea": 2,
-  "alton": 1,
-  "aludra": 2,
-  "alun": 1,
-  "alva": 1,
-  "alvah": 1,
-  "alvar": 1,
-  "álvaro": 1,
-  "alvena": 2,
-  "alvilda": 2,
-  "alvin": 1,
-  "alvina": 2,
-  "alvis": 1,
-  "alwilda": 2,
-  "alwyn": 1,
-  "alya": 2,
-  "alyce": 2,
-  "alyona": 2,
-  "alys": 2,
-  "alysha": 2,
-  "alyson": 2,
-  "alyssa": 2,
-  "alyssia": 2,
-  "alyusha": 1,
-  "alyx": 2,
-  "alzbeta": 2,
-  "ama": 2,
-  "amabel": 2,
-  "amada": 2,
-  "amadeo": 1,
-  "amadeus": 1,
-  "amadi": 2,
-  "amadi": 1,
-  "amal": None,
-  "amal": 1,
-  "amala": 2,
-  "amália": 2,
-  "amalia": 2,
-  "amalric": 1,
-  "amalthea": 2,
-  "amanda": 2,
-  "amandine": 2,
-  "amando": 1,
-  "amani": 2,
-  "amar": 1,
-  "amara": 2,
-  "amaranta": 2,
-  "amarante": 2,
-  "amardad": 1,
-  "amariah": 1,
-  "amaryllis": 2,
-  "amaterasu": 2,
-  "amato": 1,
-  "amaury": 1,
-  "amaya": 2,
-  "amber": 2,
-  "ambra": 2,
-  "ambre": 2,
-  "ambrogino": 1,
-  "ambrogio": 1,
-  "ambroise": 1,
-  "ambrose": 1,
-  "ambrosia": 2,
-  "ambrosine": 2,
-  "ambrosio": 1,
-  "ambrus": 1,
-  "amedea": 2,
-  "amédée": 1,
-  "amedeo": 1,
-  "amedeus": 1,
-  "amélia": 2,
-  "amelia": 2,
-  "amélie": 2,
-  "amen": 1,
-  "amenhotep": 1,
-  "america": 2,
-  "americo": 1,
-  "amerigo": 1,
-  "amethyst": 2,
-  "amhlaidh": 1,
-  "amhlaoibh": 1,
-  "ami": 2,
-  "amias": 1,
-  "amice": 2,
-  "amie": 2,
-  "amika": 2,
-  "amilcar": 1,
-  "amilia": 2,
-  "amin": 1,
-  "amina": 2,
-  "aminda": 2,
-  "aminta": 2,
-  "amir": 1,
-  "amira": 2,
-  "amita": 2,
-  "amittai": 1,
-  "amity": 2,
-  "ammiel": 1,
-  "ammon": 1,
-  "amon": 1,
-  "amos": 1,
-  "amparo": 2,
-  "amrit": None,
-  "amrita": 2,
-  "amy": 2,
-  "amyas": 1,
-  "amynta": 2,
-  "an": None,
-  "ana": 2,
-  "anacleto": 1,
-  "anacletus": 1,
-  "anahid": 2,
-  "anahita": 2,
-  "anaïs": 2,
-  "anaitis": 2,
-  "anakin": 1,
-  "anakoni": 1,
-  "anan": 1,
-  "anand": 1,
-  "ananda": 2,
-  "anani": 1,
-  "ananias": 1,
-  "ananta": 1,
-  "ananth": 1,
-  "anantha": 1,
-  "anargyros": 1,
-  "anaru": 1,
-  "anas": 1,
-  "anass": 1,
-  "anastacia": 2,
-  "anastas": 1,
-  "anastasia": 2,
-  "anastasie": 2,
-  "anastasio": 1,
-  "anastasios": 1,
-  "anastasius": 1,
-  "anasztáz": 1,
-  "anasztázia": 2,
-  "anat": 2,
-  "anath": 2,
-  "anath": 1,
-  "anatole": 1,
-  "anatoli": 1,
-  "anatolius": 1,
-  "anatoly": 1,
-  "anatu": 2,
-  "anaxagoras": 1,
-  "anca": 2,
-  "anchjo": 1,
-  "andela": 2,
-  "ander": 1,
-  "anders": 1,
-  "anderson": 1,
-  "andor": 1,
-  "andra": 2,
-  "andrás": 1,
-  "andras": 1,
-  "andraste": 2,
-  "andré": 1,
-  "andrea": 2,
-  "andrea": 1,
-  "andreas": 1,
-  "andrée": 2,
-  "andreea": 2,
-  "andrei": 1,
-  "andreia": 2,
-  "andrej": 1,
-  "andreja": 2,
-  "andrés": 1,
-  "andreu": 1,
-  "andrew": 1,
-  "andriana": 2,
-  "andries": 1,
-  "andrija": 1,
-  "andrina": 2,
-  "andris": 1,
-  "andriy": 1,
-  "andro": 1,
-  "androcles": 1,
-  "andromache": 2,
-  "andromeda": 2,
-  "andronikos": 1,
-  "andrzej": 1,
-  "andy": 1,
-  "ane": 2,
-  "aneirin": 1,
-  "anelie": 2,
-  "anemone": 2,
-  "aneurin": 1,
-  "anfisa": 2,
-  "angel": None,
-  "ángela": 2,
-  "angela": 2,
-  "angèle": 2,
-  "angelia": 2,
-  "angelica": 2,
-  "angelika": 2,
-  "angelina": 2,
-  "angeline": 2,
-  "angelique": 2,
-  "angelita": 2,
-  "angelle": 2,
-  "angelo": 1,
-  "angelos": 1,
-  "angerona": 2,
-  "angharad": 2,
-  "angie": 2,
-  "angus": 1,
-  "angyalka": 2,
-  "ania": 2,
-  "anibal": 1,
-  "anica": 2,
-  "anicetus": 1,
-  "aniela": 2,
-  "anika": 2,
-  "aniketos": 1,
-  "anikó": 2,
-  "anima": 2,
-  "aniruddha": 1,
-  "anisa": 2,
-  "anise": 2,
-  "anisim": 1,
-  "anita": 2,
-  "anja": 2,
-  "anjali": 2,
-  "anjelica": 2,
-  "anka": 2,
-  "anke": 2,
-  "ankur": 1,
-  "ann": 2,
-  "anna": 2,
-  "annabel": 2,
-  "annabella": 2,
-  "annabelle": 2,
-  "annalisa": 2,
-  "annas": 1,
-  "anne": 2,
-  "anneka": 2,
-  "anneke": 2,
-  "anneli": 2,
-  "annelie": 2,
-  "anneliese": 2,
-  "annelise": 2,
-  "annemarie": 2,
-  "annetta": 2,
-  "annette": 2,
-  "annice": 2,
-  "annick": 2,
-  "annie": 2,
-  "anniina": 2,
-  "annika": 2,
-  "annikki": 2,
-  "annis": 2,
-  "annmarie": 2,
-  "annunciata": 2,
-  "annunziata": 2,
-  "annuska": 2,
-  "anona": 2,
-  "anouk": 2,
-  "anoush": 2,
-  "anouska": 2,
-  "anraí": 1,
-  "ansel": 1,
-  "anselm": 1,
-  "anselma": 2,
-  "anselme": 1,
-  "anselmo": 1,
-  "ansgar": 1,
-  "anshel": 1,
-  "anson": 1,
-  "antal": 1,
-  "antanas": 1,
-  "ante": 1,
-  "antero": 1,
-  "anthea": 2,
-  "anthony": 1,
-  "antigone": 2,
-  "antigonus": 1,
-  "antiope": 2,
-  "antipater": 1,
-  "antje": 2,
-  "anto": 1,
-  "antoine": 1,
-  "antoinette": 2,
-  "anton": 1,
-  "antonella": 2,
-  "antonello": 1,
-  "antonette": 2,
-  "antoni": 1,
-  "antonia": 2,
-  "antonie": 2,
-  "antonietta": 2,
-  "antonija": 2,
-  "antonina": 2,
-  "antonino": 1,
-  "antonio": 1,
-  "antonius": 1,
-  "antono": 1,
-  "antony": 1,
-  "antti": 1,
-  "antun": 1,
-  "antwan": 1,
-  "anubis": 1,
-  "anunciación": 2,
-  "anupam": 1,
-  "anushka": 2,
-  "anwar": 1,
-  "anwen": 2,
-  "anwer": 1,
-  "anya": 2,
-  "aodh": 1,
-  "aodhán": 1,
-  "aoibheann": 2,
-  "aoibhín": 2,
-  "aoide": 2,
-  "aoife": 2,
-  "aonghas": 1,
-  "aonghus": 1,
-  "aphra": 2,
-  "aphrodisia": 2,
-  "aphrodisios": 1,
-  "aphrodite": 2,
-  "apikalia": 2,
-  "apolinar": 1,
-  "apollinaire": 1,
-  "apollinaris": 1,
-  "apollinariya": 2,
-  "apolline": 2,
-  "apollo": 1,
-  "apollodoros": 1,
-  "apollonia": 2,
-  "apollonios": 1,
-  "apolonija": 2,
-  "apostolis": 1,
-  "apostolos": 1,
-  "apphia": 2,
-  "appius": 1,
-  "april": 2,
-  "aquila": 1,
-  "arabella": 2,
-  "araceli": 2,
-  "aracelis": 2,
-  "aracely": 2,
-  "arachne": 2,
-  "aragorn": 1,
-  "araminta": 2,
-  "aran": 2,
-  "aranka": 2,
-  "aranrhod": 2,
-  "arantxa": 2,
-  "aras": 1,
-  "arata": 1,
-  "aravinda": 1,
-  "arcadia": 2,
-  "arcangelo": 1,
-  "arcelia": 2,
-  "archelaus": 1,
-  "archibald": 1,
-  "archie": 1,
-  "archimedes": 1,
-  "archippos": 1,
-  "ardal": 1,
-  "ardashir": 1,
-  "arden": 1,
-  "ardghal": 1,
-  "arduino": 1,
-  "areli": 1,
-  "ares": 1,
-  "aretha": 2,
-  "arethusa": 2,
-  "arevig": 2,
-  "argus": 1,
-  "argyris": 1,
-  "argyros": 1,
-  "ari": 1,
-  "aria": 2,
-  "ariadne": 2,
-  "ariana": 2,
-  "ariane": 2,
-  "arianna": 2,
-  "arianne": 2,
-  "arianrhod": 2,
-  "aric": 1,
-  "ariel": None,
-  "ariella": 2,
-  "arielle": 2,
-  "arienne": 2,
-  "aries": 1,
-  "arik": 1,
-  "arina": 2,
-  "arisha": 2,
-  "arista": 2,
-  "aristide": 1,
-  "aristides": 1,
-  "aristocles": 1,
-  "aristodemos": 1,
-  "aristomache": 2,
-  "ariston": 1,
-  "aristophanes": 1,
-  "aristotle": 1,
-  "arisu": 2,
-  "arisztid": 1,
-  "arjan": 1,
-  "arjun": 1,
-  "arjuna": 1,
-  "arkadi": 1,
-  "arkadios": 1,
-  "arkady": 1,
-  "arkell": 1,
-  "arleen": 2,
-  "arlen": 1,
-  "arlene": 2,
-  "arlette": 2,
-  "arlie": None,
-  "arline": 2,
-  "armand": 1,
-  "armando": 1,
-  "armel": 1,
-  "armelle": 2,
-  "armin": 1,
-  "armo": 1,
-  "arn": 1,
-  "arnaldo": 1,
-  "arnau": 1,
-  "arnaud": 1,
-  "arnaude": 2,
-  "arndt": 1,
-  "arne": 1,
-  "arnie": 1,
-  "arnold": 1,
-  "aroha": 2,
-  "aroldo": 1,
-  "áron": 1,
-  "aron": 1,
-  "árpád": 1,
-  "arrigo": 1,
-  "arron": 1,
-  "arsen": 1,
-  "arseni": 1,
-  "arsenios": 1,
-  "art": 1,
-  "artair": 1,
-  "artemidoros": 1,
-  "artemis": 2,
-  "artemisia": 2,
-  "artemisios": 1,
-  "arthur": 1,
-  "arttu": 1,
-  "artturi": 1,
-  "artúr": 1,
-  "artur": 1,
-  "arturo": 1,
-  "arundhati": 2,
-  "arvel": 1,
-  "arvid": 1,
-  "arvo": 1,
-  "arwen": 2,
-  "aryana": 2,
-  "arzu": 2,
-  "åsa": 2,
-  "asa": 1,
-  "as'ad": 1,
-  "asad": 1,
-  "asaf": 1,
-  "asaph": 1,
-  "asbjörn": 1,
-  "ásdís": 2,
-  "asdrubal": 1,
-  "aseem": 1,
-  "asenath": 2,
-  "ash": None,
-  "asha": 2,
-  "ashanti": 2,
-  "asher": 1,
-  "asherah": 2,
-  "ashlee": 2,
-  "ashleigh": 2,
-  "ashley": None,
-  "ashlie": 2,
-  "ashling": 2,
-  "ashlyn": 2,
-  "ashlynn": 2,
-  "ashok": 1,
-  "ashoka": 1,
-  "ashtad": 1,
-  "ashton": None,
-  "ashtoreth": 2,
-  "asia": None,
-  "asim": 1,
-  "asklepiades": 1,
-  "asklepios": 1,
-  "aslaug": 2,
-  "asli": 2,
-  "aslög": 2,
-  "asløg": 2,
-  "asma": 2,
-  "aspasia": 2,
-  "aspen": 2,
-  "assumpció": 2,
-  "assumpta": 2,
-  "assunta": 2,
-  "asta": 2,
-  "astaroth": 2,
-  "astarte": 2,
-  "astor": 1,
-  "astra": 2,
-  "astraea": 2,
-  "astrid": 2,
-  "astrithr": 2,
-  "astrophel": 1,
-  "asunción": 2,
-  "asya": 2,
-  "ata": 1,
-  "atalanta": 2,
-  "atallah": 1,
-  "atara": 2,
-  "atarah": 2,
-  "ataullah": 1,
-  "atefeh": 2,
-  "athanas": 1,
-  "athanasia": 2,
-  "athanasios": 1,
-  "athanasius": 1,
-  "athelstan": 1,
-  "athena": 2,
-  "athenias": 2,
-  "atieno": 2,
-  "atílio": 1,
-  "atilio": 1,
-  "atiya": 2,
-  "atlas": 1,
-  "atticus": 1,
-  "attila": 1,
-  "attilio": 1,
-  "auberon": 1,
-  "aubree": 2,
-  "aubrey": None,
-  "aude": 2,
-  "audie": 2,
-  "audley": 1,
-  "audra": 2,
-  "audrea": 2,
-  "audrey": 2,
-  "august": 1,
-  "augusta": 2,
-  "auguste": 1,
-  "augustijn": 1,
-  "augustin": 1,
-  "augustine": 1,
-  "augusto": 1,
-  "augusts": 1,
-  "augustus": 1,
-  "aukusti": 1,
-  "aulay": 1,
-  "aulus": 1,
-  "aune": 2,
-  "aura": 2,
-  "aurangzeb": 1,
-  "aurel": 1,
-  "aurèle": 1,
-  "aurelia": 2,
-  "aureliano": 1,
-  "aurélie": 2,
-  "aurelien": 1,
-  "aurelio": 1,
-  "aurelius": 1,
-  "aureole": 2,
-  "aurora": 2,
-  "aurore": 2,
-  "ausra": 2,
-  "austen": 1,
-  "austin": 1,
-  "austyn": None,
-  "autumn": None,
-  "ava": 2,
-  "avalon": 2,
-  "avdotya": 2,
-  "avedis": 1,
-  "avelina": 2,
-  "aveline": 2,
-  "averill": None,
-  "avery": None,
-  "avi": 1,
-  "avia": 2,
-  "avice": 2,
-  "avidan": 1,
-  "avila": 2,
-  "aviram": 1,
-  "avis": 2,
-  "avishai": 1,
-  "avitus": 1,
-  "aviv": 1,
-  "aviva": 2,
-  "avner": 1,
-  "avra": 2,
-  "avraham": 1,
-  "avram": 1,
-  "avril": 2,
-  "avrum": 1,
-  "awotwi": None,
-  "awstin": 1,
-  "axel": 1,
-  "axelle": 2,
-  "aya": 2,
-  "ayala": 2,
-  "aydin": 1,
-  "ayelet": 2,
-  "ayesha": 2,
-  "aygül": 2,
-  "ayishah": 2,
-  "ayla": 2,
-  "aylmer": 1,
-  "ayn": 2,
-  "ayo": 2,
-  "ayomide": 2,
-  "aysel": 2,
-  "aysun": 2,
-  "azalea": 2,
-  "azarel": 1,
-  "azaria": 1,
-  "azariah": 1,
-  "azarias": 1,
-  "azeneth": 2,
-  "'aziz": 1,
-  "aziz": 1,
-  "azrael": 1,
-  "azubah": 2,
-  "azucena": 2,
-  "azuolas": 1,
-  "azura": 2,
-  "azure": 2,
-  "baako": None,
-  "baal": 1,
-  "babajide": 1,
-  "babak": 1,
-  "babar": 1,
-  "babatunde": 1,
-  "baber": 1,
-  "babette": 2,
-  "babirye": 2,
-  "babs": 2,
-  "babur": 1,
-  "bacchus": 1,
-  "badr": None,
-  "baha": 1,
-  "bahiga": 2,
-  "bahij": 1,
-  "bahija": 2,
-  "bahiyya": 2,
-  "bahman": 1,
-  "bahram": 1,
-  "bai": 1,
-  "baila": 2,
-  "bailee": 2,
-  "bailey": None,
-  "báirbre": 2,
-  "bakr": 1,
-  "bala": None,
-  "balázs": 1,
-  "baldassare": 1,
-  "balder": 1,
-  "baldev": 1,
-  "baldo": 1,
-  "baldomero": 1,
-  "baldric": 1,
-  "baldur": 1,
-  "baldwin": 1,
-  "balfour": 1,
-  "bálint": 1,
-  "baltasar": 1,
-  "baltazar": 1,
-  "balthasar": 1,
-  "balthazar": 1,
-  "bambi": 2,
-  "bandi": 1,
-  "banu": 2,
-  "bao": 1,
-  "baptist": 1,
-  "baptiste": 1,
-  "baqir": 1,
-  "barabal": 2,
-  "barak": 1,
-  "barakat": 1,
-  "barb": 2,
-  "bárbara": 2,
-  "barbara": 2,
-  "barbie": 2,
-  "barbora": 2,
-  "barbra": 2,
-  "barbro": 2,
-  "barclay": 1,
-  "baris": 1,
-  "barlaam": 1,
-  "barna": 1,
-  "barnabás": 1,
-  "barnabas": 1,
-  "barnabé": 1,
-  "barnaby": 1,
-  "barney": 1,
-  "barra": 1,
-  "barret": 1,
-  "barrett": 1,
-  "barrie": 1,
-  "barry": 1,
-  "bart": 1,
-  "bartal": 1,
-  "bartel": 1,
-  "barthélémy": 1,
-  "bartholomaus": 1,
-  "bartholomew": 1,
-  "bartlomiej": 1,
-  "bartolomé": 1,
-  "bartolomeo": 1,
-  "bartosz": 1,
-  "baruch": 1,
-  "bas": 1,
-  "basajaun": 1,
-  "basant": 1,
-  "basemath": 2,
-  "bashe": 2,
-  "bashemath": 2,
-  "basia": 2,
-  "basil": 1,
-  "basile": 1,
-  "basilio": 1,
-  "basim": 1,
-  "basma": 2,
-  "basmath": 2,
-  "bassam": 1,
-  "bassem": 1,
-  "bastiaan": 1,
-  "bastian": 1,
-  "bastien": 1,
-  "basu": 1,
-  "basya": 2,
-  "bathsheba": 2,
-  "battista": 1,
-  "batya": 2,
-  "batyah": 2,
-  "baudouin": 1,
-  "bautista": 1,
-  "baylee": 2,
-  "bea": 2,
-  "bearach": 1,
-  "beáta": 2,
-  "beata": 2,
-  "beate": 2,
-  "beathag": 2,
-  "beathan": 1,
-  "béatrice": 2,
-  "beatrice": 2,
-  "beatriu": 2,
-  "beatrix": 2,
-  "beatriz": 2,
-  "beau": 1,
-  "beaumont": 1,
-  "beauregard": 1,
-  "beavis": 1,
-  "bébhinn": 2,
-  "bébhionn": 2,
-  "bébinn": 2,
-  "becca": 2,
-  "becka": 2,
-  "beckah": 2,
-  "becky": 2,
-  "bede": 1,
-  "bedelia": 2,
-  "bedivere": 1,
-  "bedrich": 1,
-  "bedros": 1,
-  "bedwyr": 1,
-  "bee": 2,
-  "beelzebub": 1,
-  "behnam": 1,
-  "behram": 1,
-  "behruz": 1,
-  "béibhinn": 2,
-  "beileag": 2,
-  "beitris": 2,
-  "bekki": 2,
-  "béla": 1,
-  "belenus": 1,
-  "belgin": 2,
-  "beli": 1,
-  "belinda": 2,
-  "bella": 2,
-  "belle": 2,
-  "bellona": 2,
-  "belphoebe": 2,
-  "ben": 1,
-  "benaiah": 1,
-  "bence": 1,
-  "bendiks": 1,
-  "bendt": 1,
-  "benedek": 1,
-  "benedetta": 2,
-  "benedetto": 1,
-  "benedict": 1,
-  "benedicta": 2,
-  "bénédicte": 2,
-  "benedikt": 1,
-  "benedikta": 2,
-  "benedikte": 2,
-  "benedita": 2,
-  "benedito": 1,
-  "benesh": 1,
-  "bengt": 1,
-  "bengta": 2,
-  "beniamino": 1,
-  "benigna": 2,
-  "benigno": 1,
-  "benita": 2,
-  "benito": 1,
-  "benjamín": 1,
-  "benjamin": 1,
-  "benjamine": 2,
-  "benjy": 1,
-  "bennett": 1,
-  "bennie": 1,
-  "benno": 1,
-  "benny": 1,
-  "benoit": 1,
-  "benoît": 1,
-  "benoite": 2,
-  "benson": 1,
-  "bent": 1,
-  "bente": 2,
-  "bentley": 1,
-  "bento": 1,
-  "benton": 1,
-  "benvenuto": 1,
-  "beowulf": 1,
-  "beppe": 1,
-  "ber": 1,
-  "berach": 1,
-  "berenice": 2,
-  "bergliot": 2,
-  "bergljot": 2,
-  "berit": 2,
-  "berjouhi": 2,
-  "berk": 1,
-  "berkant": 1,
-  "berker": 1,
-  "berlin": 2,
-  "berna": 2,
-  "bernadett": 2,
-  "bernadette": 2,
-  "bernadine": 2,
-  "bernard": 1,
-  "bernardetta": 2,
-  "bernardine": 2,
-  "bernardino": 1,
-  "bernardo": 1,
-  "bernát": 1,
-  "bernat": 1,
-  "bernd": 1,
-  "bernetta": 2,
-  "bernhard": 1,
-  "bernice": 2,
-  "bernie": 1,
-  "berniece": 2,
-  "bernt": 1,
-  "berry": 2,
-  "berry": 1,
-  "bert": 1,
-  "berta": 2,
-  "bertalan": 1,
-  "bertha": 2,
-  "berthe": 2,
-  "berthold": 1,
-  "bertie": None,
-  "bertina": 2,
-  "bertók": 1,
-  "bertoldo": 1,
-  "bertram": 1,
-  "bertrand": 1,
-  "bertrando": 1,
-  "berwyn": 1,
-  "beryl": 2,
-  "bess": 2,
-  "bessie": 2,
-  "beth": 2,
-  "bethan": 2,
-  "bethania": 2,
-  "bethany": 2,
-  "bethel": 2,
-  "bethney": 2,
-  "bethuel": 1,
-  "betrys": 2,
-  "betsy": 2,
-  "bette": 2,
-  "bettie": 2,
-  "bettina": 2,
-  "bettino": 1,
-  "betty": 2,
-  "bettye": 2,
-  "beulah": 2,
-  "bevan": 1,
-  "beverley": 2,
-  "beverly": 2,
-  "bevin": 2,
-  "bevis": 1,
-  "beylke": 2,
-  "bhaltair": 1,
-  "bharat": 1,
-  "bhaskar": 1,
-  "bhàtair": 1,
-  "biaggio": 1,
-  "biagino": 1,
-  "biagio": 1,
-  "bianca": 2,
-  "bibiana": 2,
-  "bice": 2,
-  "bich": 2,
-  "biddy": 2,
-  "bidelia": 2,
-  "bienvenida": 2,
-  "bijay": 1,
-  "bijoy": 1,
-  "bile": 1,
-  "bilge": 2,
-  "bilhah": 2,
-  "bill": 1,
-  "billie": None,
-  "billy": 1,
-  "bindy": 2,
-  "bine": 2,
-  "binh": 1,
-  "binyamin": 1,
-  "birger": 1,
-  "birgit": 2,
-  "birgitta": 2,
-  "bithiah": 2,
-  "bjarne": 1,
-  "bjoern": 1,
-  "björn": 1,
-  "bjorne": 1,
-  "blaanid": 2,
-  "blaine": 1,
-  "blair": None,
-  "blaise": 1,
-  "bláithín": 2,
-  "blake": 1,
-  "blanca": 2,
-  "blanch": 2,
-  "blanche": 2,
-  "blanid": 2,
-  "bláthnaid": 2,
-  "bláthnat": 2,
-  "blaze": 1,
-  "blazej": 1,
-  "blejan": 2,
-  "blodeuwedd": 2,
-  "blodeuyn": 2,
-  "blodwen": 2,
-  "blondie": 2,
-  "blossom": 2,
-  "bluma": 2,
-  "blythe": 1,
-  "bo": 1,
-  "boadicea": 2,
-  "boaz": 1,
-  "bob": 1,
-  "bobbi": None,
-  "bobbie": None,
-  "bobby": None,
-  "bodil": 2,
-  "bogdan": 1,
-  "bogdana": 2,
-  "boghos": 1,
-  "bogumil": 1,
-  "boguslaw": 1,
-  "bohdan": 1,
-  "bohumir": 1,
-  "bohuslav": 1,
-  "bohuslava": 2,
-  "boipelo": None,
-  "boitumelo": 2,
-  "bojan": 1,
-  "bojana": 2,
-  "bolanle": 2,
-  "boldizsár": 1,
-  "bolek": 1,
-  "boleslav": 1,
-  "boleslava": 2,
-  "boleslaw": 1,
-  "boleslawa": 2,
-  "bolivar": 1,
-  "bonaventure": 1,
-  "boniface": 1,
-  "bonifacio": 1,
-  "bonifaz": 1,
-  "bonita": 2,
-  "bonnie": 2,
-  "booker": 1,
-  "bopha": 2,
-  "bora": 1,
-  "borbála": 2,
-  "borghild": 2,
-  "boris": 1,
-  "borislav": 1,
-  "börje": 1,
-  "borya": 1,
-  "bosede": 1,
-  "bosmat": 2,
-  "botros": 1,
-  "botum": 2,
-  "boudicca": 2,
-  "boulos": 1,
-  "boutros": 1,
-  "boyce": 1,
-  "boyd": 1,
-  "bozidar": 1,
-  "bözsi": 2,
-  "bozydar": 1,
-  "brack": 1,
-  "brad": 1,
-  "braden": 1,
-  "bradford": 1,
-  "bradley": 1,
-  "brady": None,
-  "braeden": 1,
-  "braelyn": 2,
-  "brahma": 1,
-  "braiden": 1,
-  "braidy": None,
-  "braith": None,
-  "bram": 1,
-  "bran": 1,
-  "brand": 1,
-  "branda": 2,
-  "brande": 2,
-  "branden": 1,
-  "brandi": 2,
-  "brandie": 2,
-  "brandon": 1,
-  "brandt": 1,
-  "brandy": 2,
-  "branimir": 1,
-  "branislav": 1,
-  "branislava": 2,
-  "branka": 2,
-  "branko": 1,
-  "brannon": 1,
-  "brant": 1,
-  "branwen": 2,
-  "bras": 1,
-  "bratumil": 1,
-  "brava": 2,
-  "braxton": 1,
-  "brayden": 1,
-  "breana": 2,
-  "breandán": 1,
-  "breann": 2,
-  "breanna": 2,
-  "breanne": 2,
-  "breda": 2,
-  "breindel": 2,
-  "brenda": 2,
-  "brendan": 1,
-  "brenden": 1,
-  "brendon": 1,
-  "brenna": 2,
-  "brennan": 1,
-  "brennus": 1,
-  "brent": 1,
-  "bret": 1,
-  "brett": 1,
-  "briallen": 2,
-  "brian": 1,
-  "briana": 2,
-  "brianna": 2,
-  "brianne": 2,
-  "briar": None,
-  "brice": 1,
-  "bríd": 2,
-  "bride": 2,
-  "bridger": 1,
-  "bridget": 2,
-  "bridgette": 2,
-  "bridie": 2,
-  "brielle": 2,
-  "brigham": 1,
-  "brighid": 2,
-  "brigid": 2,
-  "brigida": 2,
-  "brigit": 2,
-  "brigitta": 2,
-  "brigitte": 2,
-  "brin": 1,
-  "briony": 2,
-  "briscoe": 1,
-  "bristol": 1,
-  "britney": 2,
-  "britt": 2,
-  "britta": 2,
-  "brittani": 2,
-  "brittany": 2,
-  "brittney": 2,
-  "britton": 1,
-  "brock": 1,
-  "brodie": 1,
-  "brody": 1,
-  "brogan": None,
-  "bron": 2,
-  "brónach": 2,
-  "bronagh": 2,
-  "bronislav": 1,
-  "bronislava": 2,
-  "bronislaw": 1,
-  "bronislawa": 2,
-  "bronte": 1,
-  "bronwen": 2,
-  "bronwyn": 2,
-  "brook": None,
-  "brooke": None,
-  "brooklyn": 2,
-  "brooks": 1,
-  "bruce": 1,
-  "bruna": 2,
-  "brunella": 2,
-  "brunette": 2,
-  "brunhilde": 2,
-  "bruno": 1,
-  "brutus": 1,
-  "bryan": 1,
-  "bryana": 2,
-  "bryanna": 2,
-  "bryant": 1,
-  "bryce": 1,
-  "bryn": None,
-  "brynja": 2,
-  "brynmor": 1,
-  "brynn": None,
-  "brynne": 2,
-  "bryony": 2,
-  "bryson": 1,
-  "buck": 1,
-  "bud": 1,
-  "buddy": 1,
-  "budur": 2,
-  "buffy": 2,
-  "bulus": 1,
-  "bulut": 1,
-  "burcu": 2,
-  "burgundy": 2,
-  "burkhard": 1,
-  "burt": 1,
-  "burton": 1,
-  "buster": 1,
-  "buz": 1,
-  "byelobog": 1,
-  "byrne": 1,
-  "byron": 1,
-  "bysshe": 1,
-  "cäcilia": 2,
-  "cade": 1,
-  "cadell": 1,
-  "caden": 1,
-  "cadence": None,
-  "cadeyrn": 1,
-  "cadfael": 1,
-  "cadfan": 1,
-  "cadi": 2,
-  "cadoc": 1,
-  "cadogan": 1,
-  "cadwalader": 1,
-  "cadwgawn": 1,
-  "caecilia": 2,
-  "caedmon": 1,
-  "caelestis": 1,
-  "caelie": 2,
-  "caerwyn": 1,
-  "caesar": 1,
-  "caetano": 1,
-  "caetlin": 2,
-  "cahal": 1,
-  "cahir": 1,
-  "cai": 1,
-  "cailean": 1,
-  "caileigh": 2,
-  "cailin": 2,
-  "cain": 1,
-  "cainan": 1,
-  "cairbre": 1,
-  "cairo": 1,
-  "caitlin": 2,
-  "caitlyn": 2,
-  "caitria": 2,
-  "caitríona": 2,
-  "caitrìona": 2,
-  "caius": 1,
-  "cajsa": 2,
-  "cal": 1,
-  "calanthe": 2,
-  "calanthia": 2,
-  "calbhach": 1,
-  "caleb": 1,
-  "caleigh": 2,
-  "caligula": 1,
-  "calista": 2,
-  "calisto": 2,
-  "calix": 1,
-  "calla": 2,
-  "callahan": 1,
-  "callias": 1,
-  "callie": 2,
-  "calliope": 2,
-  "callista": 2,
-  "callisto": 2,
-  "callisto": 1,
-  "callistus": 1,
-  "callum": 1,
-  "calogera": 2,
-  "calogero": 1,
-  "calum": 1,
-  "calvagh": 1,
-  "calvin": 1,
-  "calvino": 1,
-  "calypso": 2,
-  "cambria": 2,
-  "camden": 1,
-  "camelia": 2,
-  "camellia": 2,
-  "cameron": None,
-  "camilla": 2,
-  "camille": None,
-  "camillo": 1,
-  "camillus": 1,
-  "camilo": 1,
-  "cammie": 2,
-  "campbell": 1,
-  "camron": 1,
-  "camryn": 2,
-  "can": 1,
-  "canan": 2,
-  "candace": 2,
-  "cande": 2,
-  "candela": 2,
-  "candelaria": 2,
-  "candelario": 1,
-  "candelas": 2,
-  "candi": 2,
-  "candice": 2,
-  "candida": 2,
-  "candis": 2,
-  "candy": 2,
-  "canute": 1,
-  "caoilainn": 2,
-  "caoilfhionn": 2,
-  "caoimhe": 2,
-  "caoimhín": 1,
-  "caolan": 1,
-  "caprice": 2,
-  "capricia": 2,
-  "caprina": 2,
-  "cara": 2,
-  "caradoc": 1,
-  "caradog": 1,
-  "caramia": 2,
-  "caratacus": 1,
-  "carbrey": 1,
-  "carbry": 1,
-  "cardea": 2,
-  "careen": 2,
-  "caren": 2,
-  "carey": None,
-  "cari": 2,
-  "caridad": 2,
-  "carin": 2,
-  "carina": 2,
-  "carine": 2,
-  "caris": 2,
-  "carissa": 2,
-  "carita": 2,
-  "carl": 1,
-  "carla": 2,
-  "carlene": 2,
-  "carles": 1,
-  "carley": 2,
-  "carlie": 2,
-  "carlisa": 2,
-  "carlisle": 1,
-  "carlito": 1,
-  "carlitos": 1,
-  "carlo": 1,
-  "carlos": 1,
-  "carlotta": 2,
-  "carlton": 1,
-  "carly": 2,
-  "carlyle": 1,
-  "carlyn": 2,
-  "carmel": 2,
-  "carmela": 2,
-  "carmelita": 2,
-  "carmella": 2,
-  "carmelo": 1,
-  "carmen": 2,
-  "carmi": 1,
-  "carmina": 2,
-  "carmine": 1,
-  "carmo": 2,
-  "carol": None,
-  "carola": 2,
-  "carole": 2,
-  "carolina": 2,
-  "caroline": 2,
-  "carolus": 1,
-  "carolyn": 2,
-  "caron": 2,
-  "carpus": 1,
-  "carran": 1,
-  "carreen": 2,
-  "carrie": 2,
-  "carrol": 1,
-  "carroll": 1,
-  "carry": 2,
-  "carson": None,
-  "carsten": 1,
-  "carter": 1,
-  "carwyn": 1,
-  "cary": None,
-  "caryl": 2,
-  "caryn": 2,
-  "carys": 2,
-  "casey": None,
-  "casimir": 1,
-  "casimiro": 1,
-  "caspar": 1,
-  "casper": 1,
-  "cass": 2,
-  "cassandra": 2,
-  "cassarah": 2,
-  "cassia": 2,
-  "cassian": 1,
-  "cassidy": None,
-  "cassie": 2,
-  "cassiopea": 2,
-  "cassiopeia": 2,
-  "cassius": 1,
-  "castor": 1,
-  "catahecassa": 1,
-  "cätälin": 1,
-  "catalina": 2,
-  "catarina": 2,
-  "cate": 2,
-  "caterina": 2,
-  "cathair": 1,
-  "cathal": 1,
-  "cathán": 1,
-  "cathaoir": 1,
-  "catharine": 2,
-  "catherina": 2,
-  "catherine": 2,
-  "cathleen": 2,
-  "cathryn": 2,
-  "cathy": 2,
-  "catina": 2,
-  "catrin": 2,
-  "catrina": 2,
-  "catriona": 2,
-  "cayetano": 1,
-  "cayley": 2,
-  "ceallach": 1,
-  "ceallagh": 1,
-  "ceara": 2,
-  "cearbhall": 1,
-  "cearra": 2,
-  "cebrián": 1,
-  "cecelia": 2,
-  "cecil": 1,
-  "cécile": 2,
-  "cecília": 2,
-  "cecilia": 2,
-  "cecilija": 2,
-  "cecilio": 1,
-  "cecily": 2,
-  "cedar": 2,
-  "cedric": 1,
-  "cees": 1,
-  "ceinwen": 2,
-  "celandine": 2,
-  "céleste": 2,
-  "celeste": 2,
-  "célestin": 1,
-  "celestina": 2,
-  "célestine": 2,
-  "celestine": 1,
-  "celestino": 1,
-  "célia": 2,
-  "celia": 2,
-  "celina": 2,
-  "céline": 2,
-  "celino": 1,
-  "celio": 1,
-  "celso": 1,
-  "celyn": 1,
-  "cenek": 1,
-  "cephalus": 1,
-  "cephas": 1,
-  "cepheus": 1,
-  "cerberus": 1,
-  "ceren": 2,
-  "ceres": 2,
-  "ceri": None,
-  "ceridwen": 2,
-  "cerise": 2,
-  "cernunnos": 1,
-  "cerridwyn": 2,
-  "cerys": 2,
-  "cesaire": 1,
-  "césar": 1,
-  "cesare": 1,
-  "cezar": 1,
-  "chad": 1,
-  "chadwick": 1,
-  "chaim": 1,
-  "chalchiuhticue": 2,
-  "chalice": 2,
-  "chanah": 2,
-  "chance": None,
-  "chanda": None,
-  "chandan": 1,
-  "chandana": None,
-  "chander": 1,
-  "chandler": 1,
-  "chandra": None,
-  "chandrakant": 1,
-  "chandrakanta": 2,
-  "chanel": 2,
-  "chang": 1,
-  "chania": 2,
-  "channah": 2,
-  "channing": 1,
-  "chantal": 2,
-  "chanté": 2,
-  "chantel": 2,
-  "chantelle": 2,
-  "chao": 1,
-  "chara": 2,
-  "charalampos": 1,
-  "charis": 2,
-  "charissa": 2,
-  "charita": 2,
-  "charity": 2,
-  "charla": 2,
-  "charlene": 2,
-  "charles": 1,
-  "charley": None,
-  "charlie": None,
-  "charline": 2,
-  "charlot": 1,
-  "charlotta": 2,
-  "charlotte": 2,
-  "charlton": 1,
-  "charmaine": 2,
-  "charmian": 2,
-  "charna": 2,
-  "charnette": 2,
-  "charo": 2,
-  "chas": 1,
-  "chase": 1,
-  "chasity": 2,
-  "chastity": 2,
-  "chatzkel": 1,
-  "chau": 2,
-  "chauncey": 1,
-  "chava": 2,
-  "chaya": 2,
-  "chayim": 1,
-  "chaz": 1,
-  "che": 1,
-  "chelle": 2,
-  "chelo": 2,
-  "chelsea": 2,
-  "chelsey": 2,
-  "chelsie": 2,
-  "chenaniah": 1,
-  "chenda": 2,
-  "cheng": 1,
-  "cher": 2,
-  "cherette": 2,
-  "cheri": 2,
-  "cherice": 2,
-  "cherie": 2,
-  "cherilyn": 2,
-  "cherise": 2,
-  "cherish": 2,
-  "chernobog": 1,
-  "cherokee": None,
-  "cherry": 2,
-  "cheryl": 2,
-  "chesed": 2,
-  "chesley": 1,
-  "chester": 1,
-  "chet": 1,
-  "chetana": 1,
-  "chevonne": 2,
-  "cheyanne": 2,
-  "cheyenne": None,
-  "chi": 2,
-  "chiara": 2,
-  "chiarina": 2,
-  "chibuzo": None,
-  "chiela": 2,
-  "chika": 2,
-  "chikako": 2,
-  "chile": 1,
-  "chin": None,
-  "china": 2,
-  "chip": 1,
-  "chita": 2,
-  "chiumbo": 1,
-  "chizoba": None,
-  "chloé": 2,
-  "chloe": 2,
-  "chloris": 2,
-  "chonsie": 2,
-  "chris": None,
-  "chrissie": 2,
-  "chrissy": 2,
-  "christ": 1,
-  "christa": 2,
-  "christabel": 2,
-  "christabella": 2,
-  "christabelle": 2,
-  "christal": 2,
-  "christelle": 2,
-  "christen": 2,
-  "christer": 1,
-  "christi": 2,
-  "christiaan": 1,
-  "christian": 1,
-  "christiana": 2,
-  "christiane": 2,
-  "christianne": 2,
-  "christie": 2,
-  "christin": 2,
-  "christina": 2,
-  "christine": 2,
-  "christmas": 1,
-  "christobel": 2,
-  "christoffer": 1,
-  "christoph": 1,
-  "christophe": 1,
-  "christopher": 1,
-  "christos": 1,
-  "christy": 2,
-  "chrysanta": 2,
-  "chrysanthe": 2,
-  "chrysanthos": 1,
-  "chryseis": 2,
-  "chryssa": 2,
-  "chrystal": 2,
-  "chucho": 1,
-  "chuck": 1,
-  "chun": None,
-  "chus": 1,
-  "chylan": 1,
-  "chyna": 2,
-  "cian": 1,
-  "cianán": 1,
-  "ciannait": 2,
-  "ciara": 2,
-  "ciaran": 1,
-  "cibor": 1,
-  "cicely": 2,
-  "cicero": 1,
-  "ciel": 2,
-  "ciera": 2,
-  "cierra": 2,
-  "cili": 2,
-  "cilka": 2,
-  "cilla": 2,
-  "cillian": 1,
-  "cillín": 1,
-  "cináed": 1,
-  "cinderella": 2,
-  "cindra": 2,
-  "cindy": 2,
-  "cinzia": 2,
-  "cionaodh": 1,
-  "ciprian": 1,
-  "cipriano": 1,
-  "circe": 2,
-  "ciriaco": 1,
-  "ciril": 1,
-  "cirillo": 1,
-  "cirino": 1,
-  "ciro": 1,
-  "cissy": 2,
-  "citlali": None,
-  "claire": 2,
-  "clancy": 1,
-  "clara": 2,
-  "clare": 2,
-  "clarence": 1,
-  "clarette": 2,
-  "claribel": 2,
-  "clarice": 2,
-  "clarinda": 2,
-  "clarissa": 2,
-  "clarisse": 2,
-  "clarity": 2,
-  "clark": 1,
-  "claud": 1,
-  "claude": None,
-  "claudette": 2,
-  "claudia": 2,
-  "claudine": 2,
-  "claudio": 1,
-  "claudiu": 1,
-  "claudius": 1,
-  "claus": 1,
-  "clay": 1,
-  "clayton": 1,
-  "cledwyn": 1,
-  "cleena": 2,
-  "cleisthenes": 1,
-  "clelia": 2,
-  "clem": 1,
-  "clematis": 2,
-  "clémence": 2,
-  "clemency": 2,
-  "clemens": 1,
-  "clément": 1,
-  "clement": 1,
-  "clemente": 1,
-  "clementina": 2,
-  "clementine": 2,
-  "cleo": 2,
-  "cleon": 1,
-  "cleopatra": 2,
-  "cletes": 1,
-  "cletis": 1,
-  "cleto": 1,
-  "cletus": 1,
-  "cleve": 1,
-  "cleveland": 1,
-  "cliff": 1,
-  "clifford": 1,
-  "clifton": 1,
-  "clint": 1,
-  "clinton": 1,
-  "clio": 2,
-  "clíodhna": 2,
-  "clíona": 2,
-  "clitus": 1,
-  "clive": 1,
-  "clodagh": 2,
-  "clothilde": 2,
-  "clotilda": 2,
-  "clover": 2,
-  "clovia": 2,
-  "clovis": 1,
-  "clyde": None,
-  "clytemnestra": 2,
-  "clytia": 2,
-  "cnaeus": 1,
-  "cnut": 1,
-  "coby": 1,
-  "codie": None,
-  "cody": 1,
-  "coilean": 1,
-  "coinneach": 1,
-  "cokkie": 2,
-  "colbert": 1,
-  "colby": 1,
-  "cole": 1,
-  "coleen": 2,
-  "coleman": 1,
-  "colene": 2,
-  "colette": 2,
-  "colin": 1,
-  "coline": 2,
-  "colleen": 2,
-  "collin": 1,
-  "collyn": 2,
-  "colm": 1,
-  "colmán": 1,
-  "colombain": 1,
-  "colombe": None,
-  "colombina": 2,
-  "colten": 1,
-  "colton": 1,
-  "colum": 1,
-  "columba": 1,
-  "columban": 1,
-  "columbano": 1,
-  "columbine": 2,
-  "columbo": 1,
-  "comfort": 2,
-  "comgal": 1,
-  "comgan": 1,
-  "comhghall": 1,
-  "comhghán": 1,
-  "conall": 1,
-  "conan": 1,
-  "concepción": 2,
-  "concepta": 2,
-  "concetta": 2,
-  "concetto": 1,
-  "concha": 2,
-  "conchita": 2,
-  "conchobhar": 1,
-  "concordia": 2,
-  "confucius": 1,
-  "conleth": 1,
-  "conn": 1,
-  "connell": 1,
-  "conner": 1,
-  "connie": 2,
-  "connor": 1,
-  "conor": 1,
-  "conrad": 1,
-  "conrado": 1,
-  "consolata": 2,
-  "constance": 2,
-  "constancia": 2,
-  "constant": 1,
-  "constanta": 2,
-  "constantia": 2,
-  "constantijn": 1,
-  "constantin": 1,
-  "constantina": 2,
-  "constantine": 1,
-  "constanza": 2,
-  "consuela": 2,
-  "consuelo": 2,
-  "consus": 1,
-  "conway": 1,
-  "cooper": 1,
-  "coos": 1,
-  "cora": 2,
-  "coral": 2,
-  "coralie": 2,
-  "corbin": 1,
-  "cordelia": 2,
-  "cordell": 1,
-  "cordula": 2,
-  "coreen": 2,
-  "corentin": 1,
-  "coretta": 2,
-  "corey": 1,
-  "coriander": 2,
-  "corie": 1,
-  "corin": 1,
-  "corina": 2,
-  "corine": 2,
-  "corinna": 2,
-  "corinne": 2,
-  "cormac": 1,
-  "cormag": 1,
-  "cornel": 1,
-  "cornelia": 2,
-  "cornélio": 1,
-  "cornelis": 1,
-  "corneliu": 1,
-  "cornelius": 1,
-  "cornell": 1,
-  "corona": 2,
-  "corrado": 1,
-  "corrie": 2,
-  "corrine": 2,
-  "cort": 1,
-  "cortney": None,
-  "cory": 1,
-  "corynn": 2,
-  "cosette": 2,
-  "cosima": 2,
-  "cosimo": 1,
-  "coskun": 1,
-  "cosma": 2,
-  "cosmin": 1,
-  "cosmina": 2,
-  "cosmo": 1,
-  "costantino": 1,
-  "costanzo": 1,
-  "costel": 1,
-  "costica": 1,
-  "coty": 1,
-  "courtney": None,
-  "cowal": 1,
-  "cowessess": 1,
-  "craig": 1,
-  "crawford": 1,
-  "cree": 1,
-  "creighton": 1,
-  "crescentia": 2,
-  "crescentius": 1,
-  "crescenzo": 1,
-  "cressida": 2,
-  "crina": 2,
-  "crispian": 1,
-  "crispin": 1,
-  "cristal": 2,
-  "cristen": 2,
-  "cristi": 1,
-  "cristián": 1,
-  "cristian": 1,
-  "cristiana": 2,
-  "cristiano": 1,
-  "cristina": 2,
-  "cristobal": 1,
-  "cristoforo": 1,
-  "cristóvão": 1,
-  "crocetta": 2,
-  "crocifissa": 2,
-  "crofton": 1,
-  "cronus": 1,
-  "cruz": 2,
-  "cruzita": 2,
-  "crystal": 2,
-  "crystin": 2,
-  "csaba": 1,
-  "csilla": 2,
-  "ctibor": 1,
-  "cuán": 1,
-  "cuauhtemoc": 1,
-  "cuc": 2,
-  "cuchulainn": 1,
-  "culhwch": 1,
-  "cullen": 1,
-  "cunégonde": 2,
-  "cunobelinus": 1,
-  "cupid": 1,
-  "curro": 1,
-  "curt": 1,
-  "curtis": 1,
-  "cuthbert": 1,
-  "cy": 1,
-  "cyan": 2,
-  "cybele": 2,
-  "cybill": 2,
-  "cymbeline": 1,
-  "cymone": 2,
-  "cyndi": 2,
-  "cyneburga": 2,
-  "cynefrið": 1,
-  "cynthia": 2,
-  "cyprian": 1,
-  "cyra": 2,
-  "cyrano": 1,
-  "cyriaca": 2,
-  "cyriacus": 1,
-  "cyril": 1,
-  "cyrilla": 2,
-  "cyrille": None,
-  "cyrus": 1,
-  "cystenian": 1,
-  "czcibor": 1,
-  "czenzi": 2,
-  "czeslaw": 1,
-  "da": 1,
-  "dacre": 1,
-  "dada": 2,
-  "daedalus": 1,
-  "daffodil": 2,
-  "dafne": 2,
-  "dafydd": 1,
-  "dag": 1,
-  "dagda": 1,
-  "dagfinn": 1,
-  "dagmar": 2,
-  "dagny": 2,
-  "dagrun": 2,
-  "dahlia": 2,
-  "dai": 1,
-  "dàibhidh": 1,
-  "daichi": 1,
-  "daina": 2,
-  "dáire": 1,
-  "dáiríne": 2,
-  "daisy": 2,
-  "daithí": 1,
-  "daividh": 1,
-  "dakarai": 2,
-  "dakota": None,
-  "dalal": 2,
-  "dale": None,
-  "daley": 1,
-  "dalia": 2,
-  "dalibor": 1,
-  "dallas": 1,
-  "dalton": 1,
-  "daly": 1,
-  "dalya": 2,
-  "damaris": 2,
-  "damayanti": 2,
-  "damhnait": 2,
-  "damian": 1,
-  "damiana": 2,
-  "damiano": 1,
-  "damien": 1,
-  "damion": 1,
-  "damodar": 1,
-  "damon": 1,
-  "dan": 1,
-  "dana": None,
-  "dana": 2,
-  "danaë": 2,
-  "danail": 1,
-  "dand": 1,
-  "dane": 1,
-  "danette": 2,
-  "dania": 2,
-  "danica": 2,
-  "dániel": 1,
-  "daniel": 1,
-  "daniela": 2,
-  "danièle": 2,
-  "daniele": 1,
-  "daniella": 2,
-  "danielle": 2,
-  "daniil": 1,
-  "danika": 2,
-  "danilo": 1,
-  "danita": 2,
-  "dannie": 1,
-  "danny": 1,
-  "dante": 1,
-  "danut": 1,
-  "danuta": 2,
-  "danya": 2,
-  "daphne": 2,
-  "dara": 1,
-  "dara": 2,
-  "dara": None,
-  "darach": 1,
-  "darby": None,
-  "darcey": 2,
-  "darcy": None,
-  "darden": 1,
-  "dareia": 2,
-  "darell": 1,
-  "daren": 1,
-  "daria": 2,
-  "darian": None,
-  "dariea": 2,
-  "darien": None,
-  "darin": 1,
-  "darina": 2,
-  "dario": 1,
-  "darius": 1,
-  "darja": 2,
-  "darla": 2,
-  "darleen": 2,
-  "darlene": 2,
-  "darnell": 1,
-  "darrel": 1,
-  "darrell": 1,
-  "darren": 1,
-  "darrin": 1,
-  "darryl": 1,
-  "darwin": 1,
-  "darya": 2,
-  "daryl": 1,
-  "dassah": 2,
-  "daud": 1,
-  "dave": 1,
-  "davena": 2,
-  "daveth": 1,
-  "davey": 1,
-  "dávid": 1,
-  "david": 1,
-  "davida": 2,
-  "davide": 1,
-  "davie": 1,
-  "davin": 1,
-  "davina": 2,
-  "davinia": 2,
-  "davis": 1,
-  "davy": 1,
-  "dawid": 1,
-  "dawn": 2,
-  "dawson": 1,
-  "dawud": 1,
-  "dax": 1,
-  "dayaram": 1,
-  "dayna": 2,
-  "dayo": 2,
-  "dayton": 1,
-  "dazbog": 1,
-  "dazhdbog": 1,
-  "dean": 1,
-  "deana": 2,
-  "deandre": 1,
-  "deangelo": 1,
-  "deanna": 2,
-  "deanne": 2,
-  "dearbháil": 2,
-  "deasún": 1,
-  "deb": 2,
-  "debbi": 2,
-  "debbie": 2,
-  "debby": 2,
-  "debdan": 1,
-  "debora": 2,
-  "deborah": 2,
-  "debra": 2,
-  "decebal": 1,
-  "decima": 2,
-  "decimus": 1,
-  "declan": 1,
-  "dee": None,
-  "deeann": 2,
-  "deemer": 1,
-  "deena": 2,
-  "deepak": 1,
-  "deepali": 2,
-  "deforest": 1,
-  "deforrest": 1,
-  "deidra": 2,
-  "deidre": 2,
-  "deimos": 1,
-  "deiniol": 1,
-  "deirbhile": 2,
-  "deirdre": 2,
-  "deitra": 2,
-  "deja": 2,
-  "delaiah": 1,
-  "delaney": None,
-  "delbert": 1,
-  "delfina": 2,
-  "delia": 2,
-  "delice": 2,
-  "delicia": 2,
-  "delilah": 2,
-  "dell": 1,
-  "della": 2,
-  "delma": 2,
-  "delmar": 1,
-  "delora": 2,
-  "delores": 2,
-  "deloris": 2,
-  "delphia": 2,
-  "delphina": 2,
-  "delphine": 2,
-  "delphinia": 2,
-  "delroy": 1,
-  "delshad": 1,
-  "delta": 2,
-  "delwyn": None,
-  "delyth": 2,
-  "dema": 2,
-  "demelza": 2,
-  "demeter": 1,
-  "demeter": 2,
-  "demetria": 2,
-  "demetrio": 1,
-  "demetrios": 1,
-  "demetrius": 1,
-  "demi": 2,
-  "democritus": 1,
-  "demon": 1,
-  "demosthenes": 1,
-  "demostrate": 2,
-  "demyan": 1,
-  "den": 1,
-  "dena": 2,
-  "dene": 1,
-  "dénes": 1,
-  "denholm": 1,
-  "denice": 2,
-  "deniece": 2,
-  "denis": 1,
-  "denisa": 2,
-  "denise": 2,
-  "deniz": None,
-  "dennis": 1,
-  "denny": 1,
-  "denton": 1,
-  "denver": 1,
-  "denys": 1,
-  "denzel": 1,
-  "denzil": 1,
-  "deo": 1,
-  "deodan": 1,
-  "deòiridh": 2,
-  "deon": 1,
-  "deonne": 1,
-  "deòrsa": 1,
-  "derby": 1,
-  "derek": 1,
-  "derick": 1,
-  "dermid": 1,
-  "dermot": 1,
-  "derren": 1,
-  "derrick": 1,
-  "derry": 1,
-  "derval": 2,
-  "dervila": 2,
-  "dervla": 2,
-  "derya": None,
-  "deryck": 1,
-  "deryn": 2,
-  "desdemona": 2,
-  "deshaun": 1,
-  "deshawn": 1,
-  "desi": 1,
-  "desiderio": 1,
-  "désiré": 1,
-  "désirée": 2,
-  "desislav": 1,
-  "desislava": 2,
-  "desmond": 1,
-  "despina": 2,
-  "despoina": 2,
-  "desta": 2,
-  "destinee": 2,
-  "destiny": 2,
-  "desya": 1,
-  "detlef": 1,
-  "detta": 1,
-  "dev": 1,
-  "devan": 1,
-  "devdan": 1,
-  "devdas": 1,
-  "deven": 1,
-  "devereux": 1,
-  "devi": 2,
-  "devika": 2,
-  "devin": 1,
-  "devnet": 2,
-  "devon": None,
-  "dewayne": 1,
-  "dewey": 1,
-  "dewi": 1,
-  "dexter": 1,
-  "dezi": 1,
-  "dezirinda": 2,
-  "dezsõ": 1,
-  "dhananjay": 1,
-  "diamantina": 2,
-  "diamond": 2,
-  "diana": 2,
-  "diane": 2,
-  "diann": 2,
-  "dianna": 2,
-  "dianne": 2,
-  "diarmad": 1,
-  "diarmaid": 1,
-  "diarmuid": 1,
-  "dick": 1,
-  "didi": 1,
-  "didier": 1,
-  "dido": 2,
-  "diederick": 1,
-  "diederik": 1,
-  "diego": 1,
-  "dierk": 1,
-  "dieter": 1,
-  "dietfried": 1,
-  "diethelm": 1,
-  "dietlinde": 2,
-  "dietmar": 1,
-  "dietrich": 1,
-  "dieudonné": 1,
-  "dieudonnée": 2,
-  "digby": 1,
-  "diggory": 1,
-  "dijana": 2,
-  "dikeledi": 2,
-  "dilbert": 1,
-  "dilip": 1,
-  "dillon": 1,
-  "dilshad": 1,
-  "dilwen": 2,
-  "dilwyn": 1,
-  "dilys": 2,
-  "dima": 1,
-  "dima": 2,
-  "dimitar": 1,
-  "dimitri": 1,
-  "dina": 2,
-  "dinah": 2,
-  "dinesh": 1,
-  "dinh": 1,
-  "dinis": 1,
-  "dino": 1,
-  "diodore": 1,
-  "diodorus": 1,
-  "diodotus": 1,
-  "diogenes": 1,
-  "diogo": 1,
-  "diokles": 1,
-  "diomedes": 1,
-  "dion": 1,
-  "dione": 2,
-  "dionisio": 1,
-  "dionne": 2,
-  "dionysios": 1,
-  "dionysius": 1,
-  "dionysodoros": 1,
-  "dionysos": 1,
-  "dionysus": 1,
-  "dipak": 1,
-  "dipali": 2,
-  "direnç": 1,
-  "dirk": 1,
-  "disgleirio": None,
-  "divina": 2,
-  "divya": 2,
-  "dixie": 2,
-  "diya": 1,
-  "djamila": 2,
-  "dmitri": 1,
-  "dmitrii": 1,
-  "dmitriy": 1,
-  "dmitry": 1,
-  "dobrogost": 1,
-  "dobromil": 1,
-  "dodie": 2,
-  "doina": 2,
-  "doireann": 2,
-  "dollie": 2,
-  "dolly": 2,
-  "dolores": 2,
-  "dolph": 1,
-  "dom": 1,
-  "domen": 1,
-  "domenica": 2,
-  "domenico": 1,
-  "domhnall": 1,
-  "dominga": 2,
-  "domingo": 1,
-  "domingos": 1,
-  "dominic": 1,
-  "dominica": 2,
-  "dominick": 1,
-  "dominik": 1,
-  "dominika": 2,
-  "dominique": None,
-  "domitilla": 2,
-  "domonkos": 1,
-  "don": 1,
-  "dona": 2,
-  "donagh": 1,
-  "donal": 1,
-  "donald": 1,
-  "donalda": 2,
-  "donaldina": 2,
-  "donar": 1,
-  "donát": 1,
-  "donat": 1,
-  "donata": 2,
-  "donatella": 2,
-  "donatello": 1,
-  "donatien": 1,
-  "donatienne": 2,
-  "donato": 1,
-  "donella": 2,
-  "donelle": 2,
-  "dong": 1,
-  "donna": 2,
-  "donnchadh": 1,
-  "donnie": 1,
-  "donny": 1,
-  "donovan": 1,
-  "dóra": 2,
-  "dora": 2,
-  "doran": 1,
-  "dorcas": 2,
-  "dorean": 2,
-  "doreen": 2,
-  "dores": 2,
-  "dorete": 2,
-  "doretta": 2,
-  "dorian": 1,
-  "doriane": 2,
-  "doriano": 1,
-  "dorika": 2,
-  "dorinda": 2,
-  "doris": 2,
-  "dorit": 2,
-  "dorita": 2,
-  "dorofei": 1,
-  "doron": 1,
-  "dorota": 2,
-  "dorotea": 2,
-  "dorotéia": 2,
-  "dorothea": 2,
-  "dorothée": 2,
-  "dorotheos": 1,
-  "dorothy": 2,
-  "dorottya": 2,
-  "dorris": 2,
-  "dortha": 2,
-  "dorthy": 2,
-  "doru": 1,
-  "dory": 2,
-  "dosia": 2,
-  "dot": 2,
-  "dottie": 2,
-  "dotty": 2,
-  "doug": 1,
-  "dougal": 1,
-  "douglas": 1,
-  "dov": 1,
-  "dovid": 1,
-  "doyle": 1,
-  "draco": 1,
-  "dragan": 1,
-  "dragana": 2,
-  "dragica": 2,
-  "dragomir": 1,
-  "dragos": 1,
-  "drake": 1,
-  "draven": 1,
-  "dreda": 2,
-  "drew": 1,
-  "drina": 2,
-  "driscoll": 1,
-  "driskoll": 1,
-  "drogo": 1,
-  "drummond": 1,
-  "drusilla": 2,
-  "drystan": 1,
-  "dua": 2,
-  "duana": 2,
-  "duane": 1,
-  "duarte": 1,
-  "dubaku": None,
-  "dubhghall": 1,
-  "dubhghlas": 1,
-  "duc": 1,
-  "duci": 2,
-  "dudel": 1,
-  "dudley": 1,
-  "duff": 1,
-  "dugald": 1,
-  "duha": 2,
-  "duilio": 1,
-  "duke": 1,
-  "dulcibella": 2,
-  "dulcie": 2,
-  "duleep": 1,
-  "dumitru": 1,
-  "duncan": 1,
-  "dung": 1,
-  "dunja": 2,
-  "dunstan": 1,
-  "dunya": 2,
-  "dunyasha": 2,
-  "duong": 1,
-  "durand": 1,
-  "durga": 2,
-  "durward": 1,
-  "dusan": 1,
-  "dustin": 1,
-  "dusty": None,
-  "duygu": 1,
-  "dvorah": 2,
-  "dwayne": 1,
-  "dwight": 1,
-  "dwyn": 1,
-  "dyan": 2,
-  "dylan": 1,
-  "dylis": 2,
-  "dymphna": 2,
-  "dympna": 2,
-  "éabha": 2,
-  "eachann": 1,
-  "eadan": 2,
-  "éadaoin": 2,
-  "eadbhárd": 1,
-  "eadburga": 2,
-  "eadwig": 1,
-  "ealasaid": 2,
-  "ealdgyð": 2,
-  "ealisaid": 2,
-  "eallair": 1,
-  "eamon": 1,
-  "éamonn": 1,
-  "ean": 1,
-  "eanraig": 1,
-  "earl": 1,
-  "earle": 1,
-  "earleen": 2,
-  "earlene": 2,
-  "earline": 2,
-  "earnest": 1,
-  "earnestine": 2,
-  "eartha": 2,
-  "easter": None,
-  "eavan": 2,
-  "ebba": 2,
-  "ebbe": 1,
-  "eben": 1,
-  "ebenezer": 1,
-  "eber": 1,
-  "eberardo": 1,
-  "eberhard": 1,
-  "ebert": 1,
-  "ebony": 2,
-  "ebrahim": 1,
-  "ecaterina": 2,
-  "ece": 2,
-  "echo": 2,
-  "eckbert": 1,
-  "eckehard": 1,
-  "eckhard": 1,
-  "ed": 1,
-  "edan": 1,
-  "edana": 2,
-  "edda": 2,
-  "eddie": None,
-  "eddy": 1,
-  "edelmira": 2,
-  "eden": 2,
-  "edgar": 1,
-  "edgard": 1,
-  "edgardo": 1,
-  "edie": 2,
-  "edina": 2,
-  "edison": 1,
-  "edit": 2,
-  "edita": 2,
-  "edite": 2,
-  "édith": 2,
-  "edith": 2,
-  "edmé": 2,
-  "edmond": 1,
-  "edmonda": 2,
-  "edmondo": 1,
-  "edmund": 1,
-  "edmundo": 1,
-  "edna": 2,
-  "edoardo": 1,
-  "edom": 1,
-  "edouard": 1,
-  "édouard": 1,
-  "edric": 1,
-  "edsel": 1,
-  "eduard": 1,
-  "eduarda": 2,
-  "eduardo": 1,
-  "edurne": 2,
-  "edvard": 1,
-  "edvige": 2,
-  "edward": 1,
-  "edweena": 2,
-  "edwena": 2,
-  "edwige": 2,
-  "edwin": 1,
-  "edwina": 2,
-  "edwyn": 1,
-  "edwyna": 2,
-  "edyta": 2,
-  "edytha": 2,
-  "edythe": 2,
-  "eerikki": 1,
-  "eero": 1,
-  "eetu": 1,
-  "eeva": 2,
-  "effie": 2,
-  "efigênia": 2,
-  "efisio": 1,
-  "efraim": 1,
-  "efraín": 1,
-  "efstathios": 1,
-  "efua": 2,
-  "egbert": 1,
-  "egidio": 1,
-  "egil": 1,
-  "eglantine": 2,
-  "egon": 1,
-  "ehud": 1,
-  "éibhear": 1,
-  "éibhir": 1,
-  "eibhlín": 2,
-  "eideard": 1,
-  "eidel": 2,
-  "eileen": 2,
-  "eilert": 1,
-  "eilidh": 2,
-  "eilís": 2,
-  "eilish": 2,
-  "eiluned": 2,
-  "eilwen": 2,
-  "éimhín": 1,
-  "eimhir": 2,
-  "einar": 1,
-  "einion": 1,
-  "einrí": 1,
-  "eira": 2,
-  "eiran": 1,
-  "eireann": 2,
-  "eireen": 2,
-  "eirene": 2,
-  "eirian": 2,
-  "eirik": 1,
-  "eirlys": 2,
-  "eirwen": 2,
-  "eitan": 1,
-  "eithne": 2,
-  "ekaterina": 2,
-  "ekewaka": 1,
-  "ekin": 2,
-  "ekkehardt": 1,
-  "ekua": 2,
-  "ekwueme": 1,
-  "eladio": 1,
-  "elain": 2,
-  "elaine": 2,
-  "elario": 1,
-  "elba": 2,
-  "elbert": 1,
-  "elda": 2,
-  "elder": 1,
-  "eldon": 1,
-  "eldred": 1,
-  "eldreda": 2,
-  "elea": 2,
-  "eleanor": 2,
-  "eleanora": 2,
-  "eleanore": 2,
-  "eleazar": 1,
-  "electra": 2,
-  "eleftheria": 2,
-  "eleftherios": 1,
-  "elek": 1,
-  "elen": 2,
-  "elena": 2,
-  "elene": 2,
-  "eleni": 2,
-  "elenora": 2,
-  "eleonoora": 2,
-  "eleonor": 2,
-  "eleonora": 2,
-  "eléonore": 2,
-  "eleonore": 2,
-  "eleri": 2,
-  "elettra": 2,
-  "eleuterio": 1,
-  "eleutherius": 1,
-  "elfa": 2,
-  "elfleda": 2,
-  "elfreda": 2,
-  "elfrida": 2,
-  "elfriede": 2,
-  "eli": 1,
-  "elia": 1,
-  "elian": 1,
-  "eliana": 2,
-  "éliane": 2,
-  "elias": 1,
-  "elicia": 2,
-  "elidi": 2,
-  "élie": 1,
-  "eliezer": 1,
-  "eligia": 2,
-  "eligio": 1,
-  "elihu": 1,
-  "eliina": 2,
-  "eliisa": 2,
-  "elijah": 1,
-  "elikapeka": 2,
-  "elin": 2,
-  "elina": 2,
-  "elinor": 2,
-  "eliot": 1,
-  "eliott": 1,
-  "eliphalet": 1,
-  "eliphelet": 1,
-  "elisa": 2,
-  "elisabet": 2,
-  "elisabeta": 2,
-  "elisabeth": 2,
-  "élisabeth": 2,
-  "elisabetta": 2,
-  "elisavet": 2,
-  "elisaveta": 2,
-  "élise": 2,
-  "elise": 2,
-  "eliseo": 1,
-  "elisha": 1,
-  "elisheba": 2,
-  "elisheva": 2,
-  "elissa": 2,
-  "elisud": 1,
-  "elita": 2,
-  "eliud": 1,
-  "eliyahu": 1,
-  "eliza": 2,
-  "elizabeta": 2,
-  "elizabeth": 2,
-  "elizaveta": 2,
-  "elkan": 1,
-  "elkanah": 1,
-  "elke": 2,
-  "ella": 2,
-  "ellar": 1,
-  "elle": 2,
-  "ellen": 2,
-  "ellery": None,
-  "elli": 2,
-  "ellie": 2,
-  "elliot": 1,
-  "elliott": 1,
-  "ellis": 1,
-  "elly": 2,
-  "elma": 2,
-  "elmas": 2,
-  "elmer": 1,
-  "elmira": 2,
-  "elmo": 1,
-  "elnathan": 1,
-  "elnora": 2,
-  "elodia": 2,
-  "élodie": 2,
-  "elof": 1,
-  "eloi": 1,
-  "eloisa": 2,
-  "éloise": 2,
-  "eloise": 2,
-  "elouise": 2,
-  "elov": 1,
-  "eloy": 1,
-  "elpida": 2,
-  "elpidio": 1,
-  "elpidius": 1,
-  "elpis": 2,
-  "elric": 1,
-  "elrond": 1,
-  "elroy": 1,
-  "elsa": 2,
-  "elsabeth": 2,
-  "elsdon": 1,
-  "else": 2,
-  "elsie": 2,
-  "elspet": 2,
-  "elspeth": 2,
-  "elton": 1,
-  "eluf": 1,
-  "eluned": 2,
-  "elva": 2,
-  "elvin": 1,
-  "elvina": 2,
-  "elvira": 2,
-  "elvis": 1,
-  "elwin": 1,
-  "elwood": 1,
-  "elwyn": 1,
-  "ely": 1,
-  "elyse": 2,
-  "elysia": 2,
-  "elzbieta": 2,
-  "em": 2,
-  "emánuel": 1,
-  "emanuel": 1,
-  "emanuele": 1,
-  "emel": 2,
-  "emelie": 2,
-  "emelina": 2,
-  "emeline": 2,
-  "emely": 2,
-  "emer": 2,
-  "emerald": 2,
-  "emeric": 1,
-  "emerson": 1,
-  "emery": 1,
-  "emi": 2,
-  "emidio": 1,
-  "emil": 1,
-  "emile": 1,
-  "émile": 1,
-  "emilee": 2,
-  "emilia": 2,
-  "emilian": 1,
-  "emiliana": 2,
-  "emiliano": 1,
-  "émilie": 2,
-  "emilie": 2,
-  "émilien": 1,
-  "emilio": 1,
-  "emily": 2,
-  "emine": 2,
-  "emlyn": 1,
-  "emma": 2,
-  "emmaline": 2,
-  "emmanouil": 1,
-  "emmanuel": 1,
-  "emmanuelle": 2,
-  "emmeline": 2,
-  "emmerich": 1,
-  "emmerson": 1,
-  "emmet": 1,
-  "emmett": 1,
-  "emmie": 2,
-  "emmy": 2,
-  "emory": 1,
-  "emrys": 1,
-  "emyr": 1,
-  "ena": 2,
-  "encarnacion": 2,
-  "endre": 1,
-  "enéas": 1,
-  "enfys": None,
-  "engel": 1,
-  "engelbert": 1,
-  "engin": 1,
-  "enid": 2,
-  "eniola": 1,
-  "enitan": 1,
-  "ennio": 1,
-  "ennis": None,
-  "enoch": 1,
-  "enok": 1,
-  "enola": 2,
-  "enos": 1,
-  "enosh": 1,
-  "enric": 1,
-  "enrica": 2,
-  "enrico": 1,
-  "enrique": 1,
-  "enu": None,
-  "enya": 2,
-  "enyo": 2,
-  "enzo": 1,
-  "eoforhild": 2,
-  "eoghan": 1,
-  "eoin": 1,
-  "eos": 2,
-  "eowyn": 2,
-  "epaphras": 1,
-  "epaphroditos": 1,
-  "ephraim": 1,
-  "epifanio": 1,
-  "epiktetos": 1,
-  "epiphany": 2,
-  "epona": 2,
-  "eppie": 2,
-  "era": 2,
-  "eran": 1,
-  "erasmus": 1,
-  "erastus": 1,
-  "erato": 2,
-  "ercole": 1,
-  "ercwlff": 1,
-  "erdem": 1,
-  "erdmann": 1,
-  "erebus": 1,
-  "eren": 1,
-  "erez": 1,
-  "erhard": 1,
-  "eric": 1,
-  "éric": 1,
-  "erica": 2,
-  "érica": 2,
-  "erich": 1,
-  "erick": 1,
-  "ericka": 2,
-  "éricka": 2,
-  "erik": 1,
-  "erika": 2,
-  "erin": 2,
-  "eris": 2,
-  "erishkigal": 2,
-  "erkki": 1,
-  "erland": 1,
-  "erle": 1,
-  "erlend": 1,
-  "erma": 2,
-  "ermanno": 1,
-  "ermenegilde": 1,
-  "ermenegildo": 1,
-  "ermentraud": 2,
-  "ermentraude": 2,
-  "ermete": 2,
-  "ermintrude": 2,
-  "ermolai": 1,
-  "ermtraud": 2,
-  "ern": 1,
-  "erna": 2,
-  "ernest": 1,
-  "ernesta": 2,
-  "ernestine": 2,
-  "ernesto": 1,
-  "ernie": 1,
-  "ernõ": 1,
-  "ernst": 1,
-  "eros": 1,
-  "errol": 1,
-  "erskine": 1,
-  "ervin": 1,
-  "ervins": 1,
-  "erwan": 1,
-  "erwin": 1,
-  "erykah": 2,
-  "eryn": 2,
-  "erzsébet": 2,
-  "erzsi": 2,
-  "esa": 1,
-  "esaias": 1,
-  "esau": 1,
-  "esdras": 1,
-  "eseld": 2,
-  "eser": None,
-  "eshe": 2,
-  "esi": 2,
-  "esin": 2,
-  "esmail": 1,
-  "esmaralda": 2,
-  "esmé": None,
-  "esmée": 2,
-  "esmeralda": 2,
-  "esmond": 1,
-  "esmund": 1,
-  "esperanta": 2,
-  "esperanza": 2,
-  "espiridion": 1,
-  "essa": 2,
-  "essence": 2,
-  "essie": 2,
-  "esta": 2,
-  "estachio": 1,
-  "estavan": 1,
-  "estéban": 1,
-  "estee": 2,
-  "estefanía": 2,
-  "estela": 2,
-  "estella": 2,
-  "estelle": 2,
-  "ester": 2,
-  "esteri": 2,
-  "estevão": 1,
-  "estève": 1,
-  "esteve": 1,
-  "esther": 2,
-  "estrella": 2,
-  "esyllt": 2,
-  "eszter": 2,
-  "eszti": 2,
-  "étaín": 2,
-  "etel": 2,
-  "etelka": 2,
-  "ethalyn": 2,
-  "ethan": 1,
-  "ethel": 2,
-  "ethelbert": 1,
-  "etheldreda": 2,
-  "ethelinda": 2,
-  "ethelred": 1,
-  "ethna": 2,
-  "ethne": 2,
-  "etienne": 1,
-  "étienne": 1,
-  "etna": 2,
-  "etta": 2,
-  "ettie": 2,
-  "ettore": 1,
-  "etzel": 1,
-  "euan": 1,
-  "euclid": 1,
-  "eudocia": 2,
-  "eudora": 2,
-  "eudoxia": 2,
-  "eufemia": 2,
-  "eugen": 1,
-  "eugène": 1,
-  "eugene": 1,
-  "eugênia": 2,
-  "eugenia": 2,
-  "eugénie": 2,
-  "eugênio": 1,
-  "eugenio": 1,
-  "eula": 2,
-  "eulalia": 2,
-  "eulalie": 2,
-  "eulia": 2,
-  "eumelia": 2,
-  "eunice": 2,
-  "euphemia": 2,
-  "euphranor": 1,
-  "euphrosyne": 2,
-  "euripides": 1,
-  "eurydice": 2,
-  "eusebio": 1,
-  "eusebios": 1,
-  "eusebius": 1,
-  "eustace": 1,
-  "eustache": 1,
-  "eustacia": 2,
-  "eustaquio": 1,
-  "eustathios": 1,
-  "euterpe": 2,
-  "euthalia": 2,
-  "euthymius": 1,
-  "eutropia": 2,
-  "eutropio": 1,
-  "eutropius": 1,
-  "eutychius": 1,
-  "eutychos": 1,
-  "éva": 2,
-  "eva": 2,
-  "evadne": 2,
-  "evaline": 2,
-  "evalyn": 2,
-  "evan": 1,
-  "evander": 1,
-  "evangelina": 2,
-  "evangeline": 2,
-  "evangelos": 1,
-  "évariste": 1,
-  "evaristo": 1,
-  "evaristus": 1,
-  "evdokia": 2,
-  "evdokiya": 2,
-  "eve": 2,
-  "eveleen": 2,
-  "eveliina": 2,
-  "evelina": 2,
-  "eveline": 2,
-  "evelyne": 2,
-  "éveline": 2,
-  "évelyne": 2,
-  "evelyn": 2,
-  "everard": 1,
-  "everett": 1,
-  "everette": None,
-  "everild": 2,
-  "everitt": 1,
-  "evert": 1,
-  "evette": 2,
-  "evfemia": 2,
-  "evfrosyne": 2,
-  "evgeni": 1,
-  "evgenia": 2,
-  "evgeniya": 2,
-  "evgeny": 1,
-  "evie": 2,
-  "évike": 2,
-  "evita": 2,
-  "evonne": 2,
-  "evpraksiya": 2,
-  "evrard": 1,
-  "evron": 1,
-  "evstathios": 1,
-  "evthalia": 2,
-  "ewa": 2,
-  "ewald": 1,
-  "ewan": 1,
-  "ewart": 1,
-  "ewen": 1,
-  "ezar": 1,
-  "ezekiel": 1,
-  "ezra": 1,
-  "eztebe": 1,
-  "faas": 1,
-  "fabia": 2,
-  "fábián": 1,
-  "fabian": 1,
-  "fabiana": 2,
-  "fabiano": 1,
-  "fabien": 1,
-  "fabienne": 2,
-  "fabio": 1,
-  "fabiola": 2,
-  "fabius": 1,
-  "fabó": 1,
-  "fabrice": 1,
-  "fabricio": 1,
-  "fabrizia": 2,
-  "fabrizio": 1,
-  "fachtna": 1,
-  "faddei": 1,
-  "fadi": 1,
-  "fadia": 2,
-  "fadil": 1,
-  "fadila": 2,
-  "fadl": 1,
-  "fae": 2,
-  "fáelán": 1,
-  "fahd": 1,
-  "fahim": 1,
-  "fahima": 2,
-  "fahmida": 2,
-  "faiga": 2,
-  "faigel": 2,
-  "fairuza": 2,
-  "faith": 2,
-  "faithe": 2,
-  "faivish": 1,
-  "faizel": 1,
-  "fajra": 2,
-  "fakhri": 1,
-  "fakhriyya": 2,
-  "falk": 1,
-  "fancy": 2,
-  "fane": 1,
-  "fannie": 2,
-  "fanny": 2,
-  "faolán": 1,
-  "farag": 1,
-  "farah": 2,
-  "faraj": 1,
-  "faramond": 1,
-  "fardoos": 2,
-  "fareed": 1,
-  "farid": 1,
-  "farida": 2,
-  "fariha": 2,
-  "faris": 1,
-  "farley": 1,
-  "faron": 1,
-  "farooq": 1,
-  "farouk": 1,
-  "farquhar": 1,
-  "farrah": 2,
-  "farran": 1,
-  "farrell": 1,
-  "faruq": 1,
-  "fastred": 1,
-  "fathi": 1,
-  "fathiyya": 2,
-  "fatima": 2,
-  "fatin": 2,
-  "fatma": 2,
-  "fauna": 2,
-  "faunus": 1,
-  "fausta": 2,
-  "faustina": 2,
-  "faustine": 2,
-  "fausto": 1,
-  "faustus": 1,
-  "fawn": 2,
-  "fawzi": 1,
-  "fawziyya": 2,
-  "fay": 2,
-  "faye": 2,
-  "fayiz": 1,
-  "fayruz": 2,
-  "faysal": 1,
-  "fayvel": 1,
-  "fayza": 2,
-  "fearchar": 1,
-  "feardorcha": 1,
-  "fearghal": 1,
-  "fearghas": 1,
-  "fechín": 1,
-  "fedele": 1,
-  "fedelma": 2,
-  "federica": 2,
-  "federico": 1,
-  "federigo": 1,
-  "fedora": 2,
-  "fedot": 1,
-  "fedya": 1,
-  "feichín": 1,
-  "feidhelm": 2,
-  "feidhlim": 1,
-  "feidhlimidh": 1,
-  "feige": 2,
-  "feivel": 1,
-  "felice": 1,
-  "felicia": 2,
-  "feliciana": 2,
-  "feliciano": 1,
-  "felicidad": 2,
-  "felicidade": 2,
-  "félicie": 2,
-  "felicie": 2,
-  "felicien": 1,
-  "felicienne": 2,
-  "felìcita": 2,
-  "felicity": 2,
-  "felim": 1,
-  "felina": 2,
-  "felipa": 2,
-  "felipe": 1,
-  "feliu": 1,
-  "félix": 1,
-  "felix": 1,
-  "femi": 1,
-  "femie": 2,
-  "femke": 2,
-  "fenella": 2,
-  "fenton": 1,
-  "feodor": 1,
-  "feodora": 2,
-  "feofilakt": 1,
-  "ferapont": 1,
-  "ferdie": 1,
-  "ferdinand": 1,
-  "ferdinanda": 2,
-  "ferdinando": 1,
-  "ferdy": 1,
-  "ferenc": 1,
-  "fergal": 1,
-  "fergie": None,
-  "fergus": 1,
-  "feri": 1,
-  "ferko": 1,
-  "fermin": 1,
-  "fern": 2,
-  "fernand": 1,
-  "fernanda": 2,
-  "fernande": 2,
-  "fernando": 1,
-  "fernão": 1,
-  "ferne": 2,
-  "feroze": 1,
-  "ferran": 1,
-  "ferrer": 1,
-  "ferruccio": 1,
-  "fester": 1,
-  "festus": 1,
-  "ffion": 2,
-  "ffraid": 2,
-  "fiachna": 1,
-  "fiachra": 1,
-  "fiacre": 1,
-  "fiammetta": 2,
-  "fidan": 2,
-  "fidda": 2,
-  "fidel": 1,
-  "fidelia": 2,
-  "fidelis": 1,
-  "fidelma": 2,
-  "fido": 1,
-  "fiera": 2,
-  "fife": 1,
-  "fifi": 2,
-  "fihr": 1,
-  "fikri": 1,
-  "fikriyya": 2,
-  "filander": 1,
-  "filat": 1,
-  "filbert": 1,
-  "filep": 1,
-  "filib": 1,
-  "filibert": 1,
-  "filiberto": 1,
-  "filip": 1,
-  "filipa": 2,
-  "filipe": 1,
-  "filippo": 1,
-  "fillin": 1,
-  "filomena": 2,
-  "fina": 2,
-  "finbar": 1,
-  "findlay": 1,
-  "finella": 2,
-  "fingal": 1,
-  "fingall": 1,
-  "finlay": 1,
-  "finley": 1,
-  "finn": 1,
-  "finnbar": 1,
-  "finnegan": 1,
-  "finnén": 1,
-  "finnguala": 2,
-  "finnian": 1,
-  "finola": 2,
-  "fintan": 1,
-  "fion": 1,
-  "fíona": 2,
-  "fiona": 2,
-  "fionn": 1,
-  "fionnbharr": 1,
-  "fionnghall": 1,
-  "fionnghuala": 2,
-  "fionnlagh": 1,
-  "fionntán": 1,
-  "fionnuala": 2,
-  "fionola": 2,
-  "fioralba": 2,
-  "fiorella": 2,
-  "fiorenza": 2,
-  "fiorenzo": 1,
-  "firdaus": 1,
-  "firdos": 1,
-  "firenze": 2,
-  "firmin": 1,
-  "firmino": 1,
-  "firoz": 1,
-  "fishel": 1,
-  "fishke": 1,
-  "fitz": 1,
-  "fitzroy": 1,
-  "fizza": 2,
-  "flaithrí": 1,
-  "flann": None,
-  "flannan": None,
-  "flavia": 2,
-  "flavian": 1,
-  "flavie": 2,
-  "flavio": 1,
-  "flavius": 1,
-  "flemming": 1,
-  "fletcher": 1,
-  "fleur": 2,
-  "fleuretta": 2,
-  "flick": 2,
-  "flip": 1,
-  "flo": 2,
-  "floella": 2,
-  "flora": 2,
-  "florence": 2,
-  "florencio": 1,
-  "florentin": 1,
-  "florentina": 2,
-  "floretta": 2,
-  "florette": 2,
-  "florian": 1,
-  "floriana": 2,
-  "florianne": 2,
-  "floriano": 1,
-  "florin": 1,
-  "florinda": 2,
-  "florine": 2,
-  "floris": 1,
-  "florrie": 2,
-  "florry": 1,
-  "flossie": 2,
-  "flower": 2,
-  "floyd": 1,
-  "flurry": 1,
-  "foka": 1,
-  "folami": 1,
-  "folant": 1,
-  "folke": 1,
-  "foma": 1,
-  "fonsie": 1,
-  "forbes": 1,
-  "ford": 1,
-  "forest": 1,
-  "forrest": 1,
-  "fortunata": 2,
-  "fortunato": 1,
-  "fortune": 2,
-  "foster": 1,
-  "fotis": 1,
-  "fouad": 1,
-  "fox": 1,
-  "fran": 2,
-  "franc": 1,
-  "franca": 2,
-  "france": 1,
-  "francene": 2,
-  "frances": 2,
-  "francesca": 2,
-  "francesco": 1,
-  "franci": 2,
-  "francine": 2,
-  "francis": 1,
-  "francisca": 2,
-  "francisco": 1,
-  "franciscus": 1,
-  "franciska": 2,
-  "franck": 1,
-  "franco": 1,
-  "françois": 1,
-  "françoise": 2,
-  "frang": 1,
-  "frangag": 2,
-  "frank": 1,
-  "frankie": None,
-  "franklin": 1,
-  "franklyn": 1,
-  "frannie": 2,
-  "frans": 1,
-  "franseza": 2,
-  "frantisek": 1,
-  "frantiska": 2,
-  "franz": 1,
-  "franziska": 2,
-  "fraser": 1,
-  "frauke": 2,
-  "fravardin": 1,
-  "frazier": 1,
-  "frea": 2,
-  "fred": 1,
-  "freda": 2,
-  "freddie": None,
-  "freddy": 1,
-  "frédéric": 1,
-  "frederica": 2,
-  "frederick": 1,
-  "frederico": 1,
-  "frederik": 1,
-  "frederikke": 2,
-  "frédérique": 2,
-  "fredo": 1,
-  "fredrick": 1,
-  "fredrik": 1,
-  "freek": 1,
-  "freeman": 1,
-  "freja": 2,
-  "frey": 1,
-  "freya": 2,
-  "freyde": 2,
-  "freyr": 1,
-  "frida": 2,
-  "frideswide": 2,
-  "fridrik": 1,
-  "fridtjof": 1,
-  "frieda": 2,
-  "friede": 2,
-  "friedemann": 1,
-  "friederike": 2,
-  "friedhelm": 1,
-  "friedhold": 1,
-  "friedrich": 1,
-  "frigg": 2,
-  "frigyes": 1,
-  "fríða": 2,
-  "friðrika": 2,
-  "fritjof": 1,
-  "fritz": 1,
-  "fritzi": 2,
-  "frode": 1,
-  "fruma": 2,
-  "fryderyk": 1,
-  "fu": 1,
-  "fuad": 1,
-  "fulbert": 1,
-  "fulgencio": 1,
-  "fulgenzio": 1,
-  "fulk": 1,
-  "fulke": 1,
-  "fülöp": 1,
-  "fulton": 1,
-  "fulvia": 2,
-  "fulvio": 1,
-  "fyfe": 1,
-  "fyodor": 1,
-  "gabby": None,
-  "gabe": 1,
-  "gabi": 1,
-  "gabino": 1,
-  "gabir": 1,
-  "gábor": 1,
-  "gabr": 1,
-  "gábriel": 1,
-  "gabriel": 1,
-  "gabriela": 2,
-  "gabriele": 2,
-  "gabriele": 1,
-  "gabriella": 2,
-  "gabrielle": 2,
-  "gad": 1,
-  "gadar": 2,
-  "gae": 2,
-  "gaea": 2,
-  "gaenor": 2,
-  "gaétan": 1,
-  "gaetana": 2,
-  "gaetane": 2,
-  "gaetano": 1,
-  "gafar": 1,
-  "gage": 1,
-  "gaia": 2,
-  "gail": None,
-  "gaila": 2,
-  "gaius": 1,
-  "gaja": 2,
-  "gal": 2,
-  "gala": 2,
-  "galadriel": 2,
-  "galahad": 1,
-  "galal": 1,
-  "gale": None,
-  "galen": 1,
-  "galia": 2,
-  "galila": 2,
-  "galina": 2,
-  "gall": 1,
-  "gallagher": 1,
-  "gallus": 1,
-  "galya": 2,
-  "gamal": None,
-  "gamaliel": 1,
-  "gamil": 1,
-  "gamila": 2,
-  "ganesh": 1,
-  "ganesha": 1,
-  "garbhán": 1,
-  "gardenia": 2,
-  "gareth": 1,
-  "garey": 1,
-  "garfield": 1,
-  "garland": 1,
-  "garnet": None,
-  "garnette": 2,
-  "garret": 1,
-  "garrett": 1,
-  "garrick": 1,
-  "garry": 1,
-  "garsha": 1,
-  "garth": 1,
-  "garvan": 1,
-  "gary": 1,
-  "gáspár": 1,
-  "gaspar": 1,
-  "gaspard": 1,
-  "gaspare": 1,
-  "gasparo": 1,
-  "gasper": 1,
-  "gaston": 1,
-  "gathbiyya": 2,
-  "gauhar": 2,
-  "gauri": 2,
-  "gautam": 1,
-  "gautama": 1,
-  "gautier": 1,
-  "gavin": 1,
-  "gavino": 1,
-  "gavrel": 1,
-  "gavriil": 1,
-  "gavril": 1,
-  "gawahir": 2,
-  "gawain": 1,
-  "gawdat": 1,
-  "gawel": 1,
-  "gay": 2,
-  "gaye": 2,
-  "gayelord": 1,
-  "gayla": 2,
-  "gayle": None,
-  "gaylord": 1,
-  "gaynor": 2,
-  "gazbiyya": 2,
-  "gazsi": 1,
-  "gbemisola": 2,
-  "gearalt": 1,
-  "gearóid": 1,
-  "gebbert": 1,
-  "gebhard": 1,
-  "geena": 2,
-  "geert": 1,
-  "geffrey": 1,
-  "gellért": 1,
-  "geltrude": 2,
-  "gemariah": 1,
-  "gemini": 1,
-  "gemma": 2,
-  "gena": 2,
-  "gene": 1,
-  "genesis": 2,
-  "genette": 2,
-  "geneva": 2,
-  "geneviève": 2,
-  "genevra": 2,
-  "genghis": 1,
-  "genie": 2,
-  "genista": 2,
-  "gennadi": 1,
-  "gennadius": 1,
-  "gennadiy": 1,
-  "gennady": 1,
-  "gennaro": 1,
-  "genoveffa": 2,
-  "genoveva": 2,
-  "geoff": 1,
-  "geoffrey": 1,
-  "geoffroi": 1,
-  "geordie": 1,
-  "georg": 1,
-  "george": 1,
-  "georgene": 2,
-  "georges": 1,
-  "georgeta": 2,
-  "georgette": 2,
-  "georgi": 1,
-  "georgia": 2,
-  "georgiana": 2,
-  "georgie": None,
-  "georgina": 2,
-  "georgine": 2,
-  "georgios": 1,
-  "georgiy": 1,
-  "georgo": 1,
-  "geraint": 1,
-  "gérald": 1,
-  "gerald": 1,
-  "geraldine": 2,
-  "geraldo": 1,
-  "gerallt": 1,
-  "gérard": 1,
-  "gerard": 1,
-  "gerardo": 1,
-  "gerasim": 1,
-  "gerasimos": 1,
-  "géraud": 1,
-  "gerben": 1,
-  "gerd": 2,
-  "gerda": 2,
-  "gereon": 1,
-  "gerfried": 1,
-  "gergely": 1,
-  "gergõ": 1,
-  "gerhard": 1,
-  "gerhardt": 1,
-  "gerhold": 1,
-  "gerlach": 1,
-  "gerlinde": 2,
-  "germain": 1,
-  "germaine": 2,
-  "german": 1,
-  "germano": 1,
-  "gernot": 1,
-  "gerolamo": 1,
-  "gerolt": 1,
-  "geronimo": 1,
-  "gerontius": 1,
-  "gerrard": 1,
-  "gerrit": 1,
-  "gerry": None,
-  "gershom": 1,
-  "gershon": 1,
-  "gert": 1,
-  "gertie": 2,
-  "gertraud": 2,
-  "gertrúd": 2,
-  "gertrud": 2,
-  "gertrude": 2,
-  "gertrudes": 2,
-  "gertrudis": 2,
-  "gertruida": 2,
-  "gervais": 1,
-  "gervaise": 1,
-  "gervaise": 2,
-  "gervas": 1,
-  "gervase": 1,
-  "gervasio": 1,
-  "gervasius": 1,
-  "gerwulf": 1,
-  "gethin": 1,
-  "gethsemane": 2,
-  "géza": 1,
-  "ghada": 2,
-  "ghadir": 2,
-  "ghalib": 1,
-  "ghaliya": 2,
-  "ghassan": 1,
-  "ghayth": 1,
-  "gheorghe": 1,
-  "ghislain": 1,
-  "ghislaine": 2,
-  "ghufran": 2,
-  "gia": 2,
-  "giachetta": 2,
-  "giacinta": 2,
-  "giacinto": 1,
-  "giacobbe": 1,
-  "giacomo": 1,
-  "giada": 2,
-  "giambattista": 1,
-  "giampaolo": 1,
-  "giampiero": 1,
-  "giancarlo": 1,
-  "gianfranco": 1,
-  "gianluca": 1,
-  "gianluigi": 1,
-  "gianmarco": 1,
-  "gianmaria": 1,
-  "gianna": 2,
-  "gianni": 1,
-  "giannino": 1,
-  "gianpaolo": 1,
-  "gianpiero": 1,
-  "gib": 1,
-  "gideon": 1,
-  "giedre": 2,
-  "giedrius": 1,
-  "giffard": 1,
-  "gigi": 2,
-  "gijs": 1,
-  "gijsbert": 1,
-  "gil": 1,
-  "gilad": 1,
-  "gilah": 2,
-  "gilbert": 1,
-  "gilberta": 2,
-  "gilberte": 2,
-  "gilbertine": 2,
-  "gilberto": 1,
-  "gilchrist": 1,
-  "gilda": 2,
-  "giles": 1,
-  "gill": 1,
-  "gilles": 1,
-  "gillespie": 1,
-  "gillian": 2,
-  "gillis": 1,
-  "gilroy": 1,
-  "gina": 2,
-  "ginette": 2,
-  "ginevra": 2,
-  "ginger": 2,
-  "ginnie": 2,
-  "ginny": 2,
-  "gino": 1,
-  "gintaras": 1,
-  "gintare": 2,
-  "gioacchino": 1,
-  "gioachino": 1,
-  "gioconda": 2,
-  "giordano": 1,
-  "giorgia": 2,
-  "giorgina": 2,
-  "giorgino": 1,
-  "giorgio": 1,
-  "giosetta": 2,
-  "giosuè": 1,
-  "giovanna": 2,
-  "giovannetta": 2,
-  "giovanni": 1,
-  "giraldo": 1,
-  "girish": 1,
-  "girolamo": 1,
-  "gisa": 2,
-  "gisbert": 1,
-  "gisela": 2,
-  "gisèle": 2,
-  "gisella": 2,
-  "giselle": 2,
-  "gisselle": 2,
-  "gita": 2,
-  "githa": 2,
-  "gitta": 2,
-  "gittan": 2,
-  "gittel": 2,
-  "giuditta": 2,
-  "giulia": 2,
-  "giuliana": 2,
-  "giuliano": 1,
-  "giulietta": 2,
-  "giulio": 1,
-  "giuseppe": 1,
-  "giuseppina": 2,
-  "giustina": 2,
-  "giustino": 1,
-  "gizella": 2,
-  "gizi": 2,
-  "gjergj": 1,
-  "gjon": 1,
-  "gjord": 1,
-  "gjurd": 1,
-  "gladwin": 1,
-  "gladwyn": 1,
-  "gladys": 2,
-  "glanville": 1,
-  "glaucio": 1,
-  "glaw": None,
-  "gleb": 1,
-  "glen": 1,
-  "glenda": 2,
-  "glendower": 1,
-  "glenice": 2,
-  "glenn": 1,
-  "glenna": 2,
-  "glenys": 2,
-  "gloria": 2,
-  "glorinda": 2,
-  "glory": 2,
-  "glukel": 2,
-  "glykeria": 2,
-  "glyn": 1,
-  "glyndwr": 1,
-  "glynis": 2,
-  "glynn": 1,
-  "gnaeus": 1,
-  "gobán": 1,
-  "gobind": 1,
-  "gobinet": 2,
-  "gobnait": 2,
-  "gobnata": 2,
-  "gobnet": 2,
-  "goddard": 1,
-  "godelieve": 1,
-  "godfrey": 1,
-  "godfried": 1,
-  "godiva": 2,
-  "godofredo": 1,
-  "godric": 1,
-  "godwin": 1,
-  "goffredo": 1,
-  "gofraidh": 1,
-  "goibniu": 1,
-  "göker": 1,
-  "golda": 2,
-  "goldie": 2,
-  "goliath": 1,
-  "gomer": 1,
-  "gonca": 2,
-  "gonçalo": 1,
-  "gonzalo": 1,
-  "goodwin": 1,
-  "gopal": 1,
-  "goraidh": 1,
-  "göran": 1,
-  "goran": 1,
-  "gord": 1,
-  "gordana": 2,
-  "gorden": 1,
-  "gordon": 1,
-  "gore": 1,
-  "goretti": 2,
-  "gorka": 1,
-  "gormlaith": 2,
-  "goro": 1,
-  "goronwy": 1,
-  "gosse": 1,
-  "gösta": 1,
-  "gotam": 1,
-  "gottfrid": 1,
-  "gottfried": 1,
-  "gotthard": 1,
-  "gotthilf": 1,
-  "gotthold": 1,
-  "gottlieb": 1,
-  "gottschalk": 1,
-  "govad": 1,
-  "govannon": 1,
-  "govind": 1,
-  "gowri": 2,
-  "goyathlay": 1,
-  "graça": 2,
-  "grace": 2,
-  "gracia": 2,
-  "graciano": 1,
-  "gracie": 2,
-  "graciela": 2,
-  "gracilia": 2,
-  "gracja": 2,
-  "grady": 1,
-  "graeme": 1,
-  "graham": 1,
-  "grahame": 1,
-  "gráinne": 2,
-  "grania": 2,
-  "grant": 1,
-  "granville": 1,
-  "granya": 2,
-  "gratia": 2,
-  "gratian": 1,
-  "gratien": 1,
-  "grazia": 2,
-  "graziana": 2,
-  "graziano": 1,
-  "graziella": 2,
-  "grazyna": 2,
-  "gréagóir": 1,
-  "greer": None,
-  "greet": 2,
-  "greetje": 2,
-  "greg": 1,
-  "greger": 1,
-  "gregers": 1,
-  "gregg": 1,
-  "grégoire": 1,
-  "gregor": 1,
-  "gregorio": 1,
-  "gregorios": 1,
-  "gregory": 1,
-  "greig": 1,
-  "grenville": 1,
-  "gresham": 1,
-  "greta": 2,
-  "gretchen": 2,
-  "grete": 2,
-  "gretel": 2,
-  "grethe": 2,
-  "gretta": 2,
-  "grgur": 1,
-  "grid": 2,
-  "grier": 1,
-  "griffin": 1,
-  "griffith": 1,
-  "grigor": 1,
-  "grigore": 1,
-  "grigori": 1,
-  "grigory": 1,
-  "griogair": 1,
-  "griselda": 2,
-  "grisha": 1,
-  "grizel": 2,
-  "gro": 2,
-  "gronw": 1,
-  "grosvenor": 1,
-  "grover": 1,
-  "gruffud": 1,
-  "gruffudd": 1,
-  "gruffydd": 1,
-  "grusha": 2,
-  "grwn": 1,
-  "gry": 2,
-  "grzegorz": 1,
-  "guadalupe": None,
-  "gualter": 1,
-  "gualtiero": 1,
-  "guda": 1,
-  "gudrun": 2,
-  "guendolen": 2,
-  "guenevere": 2,
-  "guerino": 1,
-  "guglielmo": 1,
-  "guido": 1,
-  "guifré": 1,
-  "guilherme": 1,
-  "guillaume": 1,
-  "guillem": 1,
-  "guillermo": 1,
-  "guinevere": 2,
-  "guiomar": None,
-  "guiscard": 1,
-  "gül": 2,
-  "gul": 2,
-  "gülbahar": 2,
-  "gulbahar": 2,
-  "gülistan": 2,
-  "gulistan": 2,
-  "gull": 2,
-  "gulzar": None,
-  "gunda": 2,
-  "gundula": 2,
-  "gunhild": 2,
-  "gunhilda": 2,
-  "gunilla": 2,
-  "gunnar": 1,
-  "gunne": 1,
-  "gunnhild": 2,
-  "gunnvor": 2,
-  "günter": 1,
-  "gunter": 1,
-  "günther": 1,
-  "gunther": 1,
-  "guntram": 1,
-  "gunvor": 2,
-  "gus": 1,
-  "gussie": 2,
-  "gusta": 2,
-  "gustaf": 1,
-  "gustav": 1,
-  "gustave": 1,
-  "gustavo": 1,
-  "gusztáv": 1,
-  "guðrún": 2,
-  "guto": 1,
-  "gutxi": 1,
-  "guy": 1,
-  "gwallter": 1,
-  "gwandoya": 1,
-  "gwawr": 2,
-  "gwen": 2,
-  "gwenaelle": 2,
-  "gwenda": 2,
-  "gwendolen": 2,
-  "gwendoline": 2,
-  "gwendolyn": 2,
-  "gweneth": 2,
-  "gwenevere": 2,
-  "gwenfrewi": 2,
-  "gwenllian": 2,
-  "gwenneth": 2,
-  "gwenyth": 2,
-  "gwil": 1,
-  "gwilherm": 1,
-  "gwilim": 1,
-  "gwillym": 1,
-  "gwilym": 1,
-  "gwladus": 2,
-  "gwrtheyrn": 1,
-  "gwyn": 1,
-  "gwynedd": None,
-  "gwyneira": 2,
-  "gwyneth": 2,
-  "gwynfor": 1,
-  "gwynn": 1,
-  "gwythyr": 1,
-  "gyles": 1,
-  "gyneth": 2,
-  "gyöngyi": 2,
-  "györgy": 1,
-  "györgyi": 2,
-  "györgyike": 2,
-  "gyözö": 1,
-  "gypsy": 2,
-  "gytha": 2,
-  "gyula": 1,
-  "gyuri": 1,
-  "haakon": 1,
-  "habacuc": 1,
-  "habakkuk": 1,
-  "habib": 1,
-  "habiba": 2,
-  "hachiro": 1,
-  "hadar": None,
-  "hadassah": 2,
-  "hades": 1,
-  "hadewych": 2,
-  "hadi": 1,
-  "hadil": 2,
-  "hadjara": 2,
-  "hadley": None,
-  "hadrian": 1,
-  "hadrianus": 1,
-  "hadya": 2,
-  "hadyn": 1,
-  "hafeez": 1,
-  "hafiz": 1,
-  "hafsa": 2,
-  "hafsah": 2,
-  "hafza": 2,
-  "hagan": 1,
-  "hagar": 2,
-  "hagen": 1,
-  "haggai": 1,
-  "hagir": 2,
-  "hagop": 1,
-  "hai": 1,
-  "haidar": 1,
-  "haidee": 2,
-  "haider": 1,
-  "haifa": 2,
-  "hailee": 2,
-  "hailey": 2,
-  "hajar": 2,
-  "hajna": 2,
-  "hajnal": 2,
-  "hajnalka": 2,
-  "hákan": 1,
-  "håkan": 1,
-  "hakan": 1,
-  "hakeem": 1,
-  "hakim": 1,
-  "håkon": 1,
-  "hal": 1,
-  "hala": 2,
-  "halcyon": 2,
-  "halcyone": 2,
-  "haldor": 1,
-  "hale": 1,
-  "haleigh": 2,
-  "haley": 2,
-  "halina": 2,
-  "hall": 1,
-  "hallam": 1,
-  "halldór": 1,
-  "halldor": 1,
-  "halldóra": 2,
-  "halle": 2,
-  "halle": 1,
-  "hallie": 2,
-  "hallvard": 1,
-  "halstein": 1,
-  "halsten": 1,
-  "halvar": 1,
-  "halvard": 1,
-  "halvdan": 1,
-  "halvor": 1,
-  "ham": 1,
-  "hamid": 1,
-  "hamilcar": 1,
-  "hamilton": 1,
-  "hamish": 1,
-  "hamlet": 1,
-  "hammond": 1,
-  "hamnet": 1,
-  "hamo": 1,
-  "hamon": 1,
-  "hampus": 1,
-  "hamza": 1,
-  "hana": 2,
-  "hanaa": 2,
-  "hanan": 2,
-  "hananiah": 1,
-  "hande": 2,
-  "hani": 1,
-  "hania": 2,
-  "haniyya": 2,
-  "hank": 1,
-  "hanke": 1,
-  "hanna": 2,
-  "hannah": 2,
-  "hanne": 2,
-  "hannelore": 2,
-  "hannes": 1,
-  "hannibal": 1,
-  "hannu": 1,
-  "hans": 1,
-  "happy": None,
-  "harald": 1,
-  "haraldur": 1,
-  "harding": 1,
-  "hardy": 1,
-  "hari": 1,
-  "harinder": 1,
-  "harish": 1,
-  "harith": 1,
-  "harlan": 1,
-  "harland": 1,
-  "harley": None,
-  "harmon": 1,
-  "harmonia": 2,
-  "harmonie": 2,
-  "harmony": 2,
-  "harold": 1,
-  "haroun": 1,
-  "harper": None,
-  "harriet": 2,
-  "harriett": 2,
-  "harrietta": 2,
-  "harriette": 2,
-  "harris": 1,
-  "harrison": 1,
-  "harry": 1,
-  "hartley": None,
-  "hartmann": 1,
-  "hartmut": 1,
-  "hartwig": 1,
-  "hartwin": 1,
-  "haruko": 2,
-  "harun": 1,
-  "harve": 1,
-  "harvey": 1,
-  "harvie": 1,
-  "hasan": 1,
-  "hasdrubal": 1,
-  "hashim": 1,
-  "hasim": 1,
-  "haskel": 1,
-  "hassan": 1,
-  "hathor": 2,
-  "hatim": 1,
-  "hattie": 2,
-  "hatty": 2,
-  "haukea": 2,
-  "haul": 1,
-  "hava": 2,
-  "håvard": 1,
-  "havel": 1,
-  "haven": 2,
-  "havilah": None,
-  "havva": 2,
-  "haydee": 2,
-  "hayden": 1,
-  "hayder": 1,
-  "haydn": 1,
-  "hayfa": 2,
-  "haylee": 2,
-  "hayleigh": 2,
-  "hayley": 2,
-  "haylie": 2,
-  "haytham": 1,
-  "haywood": 1,
-  "hazael": 1,
-  "hazan": 2,
-  "haze": 2,
-  "hazel": 2,
-  "headley": 1,
-  "heath": 1,
-  "heather": 2,
-  "heaven": 2,
-  "hebe": 2,
-  "hebel": 1,
-  "heber": 1,
-  "hecate": 2,
-  "heck": 1,
-  "heckie": 1,
-  "hector": 1,
-  "hedda": 2,
-  "heddwyn": 1,
-  "hedley": 1,
-  "hedvig": 2,
-  "hedwig": 2,
-  "hedy": 2,
-  "hege": 2,
-  "heida": 2,
-  "heidi": 2,
-  "heidrun": 2,
-  "heike": 2,
-  "heikki": 1,
-  "heiko": 1,
-  "heilwig": 2,
-  "heilyn": 1,
-  "heiner": 1,
-  "heino": 1,
-  "heinrich": 1,
-  "heinz": 1,
-  "heitor": 1,
-  "helah": 2,
-  "helder": 1,
-  "heledd": 2,
-  "helen": 2,
-  "helena": 2,
-  "hélène": 2,
-  "helene": 2,
-  "helfried": 1,
-  "helga": 2,
-  "helge": 1,
-  "heliodoro": 1,
-  "helios": 1,
-  "hellä": 2,
-  "hella": 2,
-  "helladius": 1,
-  "hellen": 2,
-  "helma": 2,
-  "helmfrid": 1,
-  "helmfried": 1,
-  "helmi": 2,
-  "helmine": 2,
-  "helmut": 1,
-  "helmuth": 1,
-  "héloïse": 2,
-  "hemi": 1,
-  "hemming": 1,
-  "hena": 2,
-  "henda": 2,
-  "hendel": 2,
-  "henderson": 1,
-  "hendrik": 1,
-  "heng": 1,
-  "hengist": 1,
-  "henk": 1,
-  "hennie": 2,
-  "henning": 1,
-  "henri": 1,
-  "henrietta": 2,
-  "henriette": 2,
-  "henrik": 1,
-  "henrike": 2,
-  "henrique": 1,
-  "henry": 1,
-  "henryk": 1,
-  "henye": 2,
-  "hephaestus": 1,
-  "hephzibah": 2,
-  "hepsie": 2,
-  "hepzibah": 2,
-  "hera": 2,
-  "heracleitus": 1,
-  "herakleides": 1,
-  "herakles": 1,
-  "herb": 1,
-  "herbert": 1,
-  "herberto": 1,
-  "herbie": 1,
-  "hercule": 1,
-  "hercules": 1,
-  "hereward": 1,
-  "heribert": 1,
-  "heriberto": 1,
-  "herk": 1,
-  "herleif": 1,
-  "herman": 1,
-  "hermann": 1,
-  "hermanni": 1,
-  "hermenegildo": 1,
-  "hermes": 1,
-  "hermia": 2,
-  "hermine": 2,
-  "hermione": 2,
-  "hermogenes": 1,
-  "hermokrates": 1,
-  "hermolaos": 1,
-  "hernán": 1,
-  "hernando": 1,
-  "hero": 2,
-  "herod": 1,
-  "herodion": 1,
-  "herodotus": 1,
-  "heron": 1,
-  "herschel": 1,
-  "hersh": 1,
-  "hershel": 1,
-  "hervé": 1,
-  "hervey": 1,
-  "heshel": 1,
-  "hesiod": 1,
-  "hester": 2,
-  "hestia": 2,
-  "hettie": 2,
-  "heulog": None,
-  "heulwen": 2,
-  "hewie": 1,
-  "heydar": 1,
-  "hezekiah": 1,
-  "hiawatha": 1,
-  "hiba": 2,
-  "hideaki": 1,
-  "hieronymus": 1,
-  "higini": 1,
-  "hikari": 2,
-  "hikaru": 1,
-  "hikmat": None,
-  "hilaire": 1,
-  "hilaria": 2,
-  "hilary": None,
-  "hilbert": 1,
-  "hilda": 2,
-  "hilde": 2,
-  "hildebrand": 1,
-  "hildegard": 2,
-  "hildegarde": 2,
-  "hildur": 2,
-  "hillary": None,
-  "hillel": 1,
-  "hillevi": 2,
-  "hiltraud": 2,
-  "hiltrud": 2,
-  "hiltrude": 2,
-  "hind": 2,
-  "hinrich": 1,
-  "hinrik": 1,
-  "hipolito": 1,
-  "hippocrates": 1,
-  "hippolyta": 2,
-  "hippolyte": None,
-  "hippolytos": 1,
-  "hiram": 1,
-  "hiroko": 2,
-  "hiroshi": 1,
-  "hirsh": 1,
-  "hisein": 1,
-  "hisham": 1,
-  "hitomi": 2,
-  "hizkiah": 1,
-  "hjalmar": 1,
-  "hjördis": 2,
-  "hjörtur": 1,
-  "hoa": 2,
-  "hodel": 2,
-  "hohepa": 1,
-  "hokolesqua": 1,
-  "holden": 1,
-  "holger": 1,
-  "hollie": 2,
-  "hollis": None,
-  "holly": 2,
-  "homer": 1,
-  "honey": 2,
-  "hòng": 2,
-  "honor": 2,
-  "honora": 2,
-  "honorata": 2,
-  "honoratus": 1,
-  "honoré": 1,
-  "honoria": 2,
-  "honorine": 2,
-  "honorius": 1,
-  "honour": 2,
-  "hooda": 2,
-  "hopcyn": 1,
-  "hope": 2,
-  "hopkin": 1,
-  "horace": 1,
-  "horacio": 1,
-  "horatia": 2,
-  "horatio": 1,
-  "horatius": 1,
-  "hormazd": 1,
-  "hormazed": 1,
-  "horsa": 1,
-  "horst": 1,
-  "hortense": 2,
-  "hortensia": 2,
-  "horus": 1,
-  "hosanna": None,
-  "hosannah": None,
-  "hosea": 1,
-  "hoshi": 2,
-  "hosni": 1,
-  "hotaka": 1,
-  "hotaru": 2,
-  "houda": 2,
-  "hourig": 2,
-  "houssam": 1,
-  "hovhannes": 1,
-  "hovsep": 1,
-  "howard": 1,
-  "howell": 1,
-  "howie": 1,
-  "hoyt": 1,
-  "hrafn": 1,
-  "hristina": 2,
-  "hrodohaidis": 2,
-  "hrothgar": 1,
-  "huan": None,
-  "huang": None,
-  "hubert": 1,
-  "hubrecht": 1,
-  "huda": 2,
-  "hudes": 2,
-  "hudson": 1,
-  "huey": 1,
-  "huffie": 1,
-  "hugh": 1,
-  "hughie": 1,
-  "hugo": 1,
-  "hugues": 1,
-  "huguette": 1,
-  "hulda": 2,
-  "huldah": 2,
-  "humbert": 1,
-  "humphrey": 1,
-  "humphry": 1,
-  "hùng": 1,
-  "hunter": None,
-  "huo": None,
-  "hùong": 2,
-  "huppert": 1,
-  "hupprecht": 1,
-  "husain": 1,
-  "husam": 1,
-  "husayn": 1,
-  "husni": 1,
-  "hussain": 1,
-  "hussein": 1,
-  "huw": 1,
-  "hyacinth": None,
-  "hyacintha": 2,
-  "hyacinthe": 2,
-  "hyam": 1,
-  "hyder": 1,
-  "hyginus": 1,
-  "hylda": 2,
-  "hyledd": 2,
-  "hyman": 1,
-  "hymie": 1,
-  "hypatia": 2,
-  "hyram": 1,
-  "hyun": 2,
-  "hywel": 1,
-  "iacchus": 1,
-  "iagan": 1,
-  "iago": 1,
-  "iain": 1,
-  "iakopa": 1,
-  "ian": 1,
-  "iancu": 1,
-  "iantha": 2,
-  "ianthe": 2,
-  "ianthina": 2,
-  "ianto": 1,
-  "iarfhlaith": 1,
-  "iarlaith": 1,
-  "iason": 1,
-  "ib": 1,
-  "ibbie": 2,
-  "ibolya": 2,
-  "ibraheem": 1,
-  "ibrahim": 1,
-  "ibtihaj": 2,
-  "ibtisam": 2,
-  "icarus": 1,
-  "ichabod": 1,
-  "ichiro": 1,
-  "ida": 2,
-  "idan": 1,
-  "íde": 2,
-  "idelle": 2,
-  "idesta": 2,
-  "idetta": 2,
-  "idonea": 2,
-  "idony": 2,
-  "idowu": 1,
-  "idoya": 2,
-  "idril": 2,
-  "idris": 1,
-  "idunn": 2,
-  "idwal": 1,
-  "iefan": 1,
-  "iekika": 2,
-  "iestyn": 1,
-  "ieuan": 1,
-  "ifan": 1,
-  "ife": 2,
-  "ige": 2,
-  "ignaas": 1,
-  "ignác": 1,
-  "ignace": 1,
-  "ignacio": 1,
-  "ignacy": 1,
-  "ignacz": 1,
-  "ignasi": 1,
-  "ignatius": 1,
-  "ignatz": 1,
-  "ignazio": 1,
-  "igor": 1,
-  "ihab": None,
-  "ihsan": None,
-  "iida": 2,
-  "iikka": 1,
-  "iisakki": 1,
-  "ikaia": 1,
-  "ikaika": 1,
-  "ike": 1,
-  "ikraam": 2,
-  "ila": 2,
-  "ilan": 1,
-  "ilana": 2,
-  "ilar": 1,
-  "ilari": 1,
-  "ilaria": 2,
-  "ilario": 1,
-  "ilbert": 1,
-  "ildikó": 2,
-  "ilean": 2,
-  "ileana": 2,
-  "ileen": 2,
-  "ilene": 2,
-  "ili": 2,
-  "ilia": 1,
-  "ilie": 1,
-  "ilinca": 2,
-  "ilka": 2,
-  "ilker": 1,
-  "íllés": 1,
-  "illtyd": 1,
-  "ilma": 2,
-  "ilona": 2,
-  "ilonka": 2,
-  "ilsa": 2,
-  "ilse": 2,
-  "ilya": 1,
-  "ima": 2,
-  "imaculada": 2,
-  "imad": 1,
-  "imam": 1,
-  "imamu": 1,
-  "iman": 2,
-  "imani": 2,
-  "imelda": 2,
-  "imen": 2,
-  "imhotep": 1,
-  "imke": 2,
-  "imma": 2,
-  "immacolata": 2,
-  "immaculata": 2,
-  "immanuel": 1,
-  "imogen": 2,
-  "imogene": 2,
-  "imre": 1,
-  "imrus": 1,
-  "ina": 2,
-  "inácio": 1,
-  "iñaki": 1,
-  "in'am": 2,
-  "inbar": 2,
-  "inderjit": None,
-  "inderpal": 1,
-  "india": 2,
-  "indiana": None,
-  "indigo": None,
-  "indira": 2,
-  "indra": 1,
-  "indrajit": None,
-  "indrani": 2,
-  "indy": None,
-  "inés": 2,
-  "inès": 2,
-  "inês": 2,
-  "inez": 2,
-  "ing": 1,
-  "inga": 2,
-  "inge": None,
-  "ingeborg": 2,
-  "ingegärd": 2,
-  "ingegerd": 2,
-  "ingemar": 1,
-  "inger": 2,
-  "inglebert": 1,
-  "ingmar": 1,
-  "ingolf": 1,
-  "ingram": 1,
-  "ingrid": 2,
-  "ingvar": 1,
-  "ingvarr": 1,
-  "inigo": 1,
-  "inka": 2,
-  "inkeri": 2,
-  "inmaculada": 2,
-  "innes": None,
-  "innocent": 1,
-  "innocenzo": 1,
-  "innokenti": 1,
-  "inocencio": 1,
-  "into": 1,
-  "io": 2,
-  "ioan": 1,
-  "ioana": 2,
-  "ioann": 1,
-  "ioanna": 2,
-  "ioannes": 1,
-  "ioannis": 1,
-  "iokua": 1,
-  "iola": 2,
-  "iolana": 2,
-  "iolanthe": 2,
-  "iole": 2,
-  "iolo": 1,
-  "iolyn": 1,
-  "íomhar": 1,
-  "iomhar": 1,
-  "ion": 1,
-  "iona": 2,
-  "ionatán": 1,
-  "ione": 2,
-  "ionel": 1,
-  "ionela": 2,
-  "ionut": 1,
-  "iorwerth": 1,
-  "iosif": 1,
-  "ipati": 1,
-  "ippolit": 1,
-  "ippolito": 1,
-  "iqbal": 1,
-  "ira": 1,
-  "ireland": 2,
-  "irén": 2,
-  "irena": 2,
-  "iréné": 1,
-  "irène": 2,
-  "irene": 2,
-  "irénée": 2,
-  "ireneus": 1,
-  "ireneusz": 1,
-  "irina": 2,
-  "irinei": 1,
-  "iris": 2,
-  "irit": 2,
-  "irja": 2,
-  "irma": 2,
-  "irmak": 2,
-  "irmgard": 2,
-  "irmhild": 2,
-  "irmtraud": 2,
-  "irmtrud": 2,
-  "irmuska": 2,
-  "irvin": 1,
-  "irvine": 1,
-  "irving": 1,
-  "irwin": 1,
-  "isa": None,
-  "isaac": 1,
-  "isabel": 2,
-  "isabell": 2,
-  "isabella": 2,
-  "isabelle": 2,
-  "isador": 1,
-  "isadora": 2,
-  "isadore": 1,
-  "isaia": 1,
-  "isaiah": 1,
-  "isaias": 1,
-  "isak": 1,
-  "'isam": 1,
-  "isamu": 1,
-  "isandro": 1,
-  "isaura": 2,
-  "isbel": 2,
-  "iseabail": 2,
-  "isebella": 2,
-  "iser": 1,
-  "iseult": 2,
-  "isha": None,
-  "ishbel": 2,
-  "ishmael": 1,
-  "ishmerai": 1,
-  "ishtar": 2,
-  "isiah": 1,
-  "isibéal": 2,
-  "isidor": 1,
-  "isidora": 2,
-  "isidore": 1,
-  "isidoro": 1,
-  "isis": 2,
-  "iskender": 1,
-  "isla": 2,
-  "islay": 1,
-  "isleen": 2,
-  "islwyn": 1,
-  "ismael": 1,
-  "isma'il": 1,
-  "'ismat": None,
-  "ismene": 2,
-  "isobel": 2,
-  "isocrates": 1,
-  "isolda": 2,
-  "isolde": 2,
-  "isra": 2,
-  "israel": 1,
-  "issa": 1,
-  "issac": 1,
-  "issachar": 1,
-  "issur": 1,
-  "issy": 1,
-  "istván": 1,
-  "ita": 2,
-  "itala": 2,
-  "italo": 1,
-  "italus": 1,
-  "itamar": 1,
-  "ithamar": 1,
-  "ithel": 1,
-  "i'tidal": 2,
-  "itzhak": 1,
-  "itziar": 2,
-  "iúile": 2,
-  "iulia": 2,
-  "iulian": 1,
-  "iuliana": 2,
-  "iva": 2,
-  "ivah": 2,
-  "ivan": 1,
-  "ivana": 2,
-  "ivanka": 2,
-  "ivanna": 2,
-  "ivar": 1,
-  "ives": 1,
-  "ivette": 2,
-  "ivo": 1,
-  "ivonette": 2,
-  "ivonne": 2,
-  "ivor": 1,
-  "ivory": 2,
-  "ivy": 2,
-  "iwan": 1,
-  "iwo": 1,
-  "iwona": 2,
-  "ixchel": 2,
-  "iyov": 1,
-  "izaak": 1,
-  "izabela": 2,
-  "izabella": 2,
-  "izdihar": 2,
-  "izolda": 2,
-  "izsák": 1,
-  "izumi": 2,
-  "izz-al-din": 1,
-  "izz-ed-din": 1,
-  "izzy": 1,
-  "jaakko": 1,
-  "jaan": 1,
-  "jaana": 2,
-  "jaap": 1,
-  "jabbar": 1,
-  "jabez": 1,
-  "jabin": 1,
-  "jabir": 1,
-  "jabr": 1,
-  "jabril": 1,
-  "jacaline": 2,
-  "jacek": 1,
-  "jacenty": 1,
-  "jachin": 1,
-  "jacinda": 2,
-  "jacinta": 2,
-  "jacinth": 2,
-  "jacintha": 2,
-  "jacinthe": 2,
-  "jacinto": 1,
-  "jack": 1,
-  "jackalyn": 2,
-  "jacki": 2,
-  "jackie": None,
-  "jacklyn": 2,
-  "jackson": 1,
-  "jaclyn": 2,
-  "jacob": 1,
-  "jacoba": 2,
-  "jacobina": 2,
-  "jacobine": 2,
-  "jacobo": 1,
-  "jacobus": 1,
-  "jacopo": 1,
-  "jacqueline": 2,
-  "jacquelyn": 2,
-  "jacques": 1,
-  "jacquetta": 2,
-  "jacquette": 2,
-  "jacqui": 2,
-  "jada": 2,
-  "jade": 2,
-  "jaden": None,
-  "jadon": 1,
-  "jadranka": 2,
-  "jadranko": 1,
-  "jadwiga": 2,
-  "jadyn": None,
-  "jadzia": 2,
-  "jael": 2,
-  "jafar": 1,
-  "jafet": 1,
-  "jaffar": 1,
-  "jaffe": 2,
-  "jaffer": 1,
-  "jagannath": 1,
-  "jagdish": 1,
-  "jagjit": 1,
-  "jago": 1,
-  "jagoda": 2,
-  "jahan": 1,
-  "jahangir": 1,
-  "jahel": 2,
-  "jahleel": 1,
-  "jahzeel": 1,
-  "jai": 1,
-  "jaiden": None,
-  "jaidev": 1,
-  "jaime": 2,
-  "jaime": 1,
-  "jair": 1,
-  "jairus": 1,
-  "jaka": 1,
-  "jakab": 1,
-  "jake": 1,
-  "jakki": 2,
-  "jákob": 1,
-  "jakob": 1,
-  "jakov": 1,
-  "jakub": 1,
-  "jalal": 1,
-  "jalen": 1,
-  "jalila": 2,
-  "jalmari": 1,
-  "jalo": 1,
-  "jamaal": 1,
-  "jamaar": 1,
-  "jamal": None,
-  "jamar": 1,
-  "jameel": 1,
-  "jameela": 2,
-  "james": 1,
-  "jamesina": 2,
-  "jamey": 1,
-  "jami": 2,
-  "jamie": 2,
-  "jamie": 1,
-  "jamil": 1,
-  "jamila": 2,
-  "jamin": 1,
-  "jamison": 1,
-  "jamshad": 1,
-  "jamshed": 1,
-  "jamsheed": 1,
-  "jan": 2,
-  "jan": 1,
-  "jana": 2,
-  "janae": 2,
-  "janan": 2,
-  "jancis": 2,
-  "jancsi": 1,
-  "jane": 2,
-  "janecek": 1,
-  "janek": 1,
-  "janeka": 2,
-  "janel": 2,
-  "janele": 2,
-  "janella": 2,
-  "janelle": 2,
-  "janene": 2,
-  "janessa": 2,
-  "janet": 2,
-  "janetta": 2,
-  "janette": 2,
-  "janey": 2,
-  "janez": 1,
-  "jani": 1,
-  "janice": 2,
-  "janie": 2,
-  "janika": 1,
-  "janina": 2,
-  "janine": 2,
-  "janis": 1,
-  "janis": 2,
-  "janna": 2,
-  "jannah": 2,
-  "janne": 1,
-  "janne": 2,
-  "janneke": 2,
-  "jannick": 1,
-  "jannike": 2,
-  "jannine": 2,
-  "jános": 1,
-  "janus": 1,
-  "janusz": 1,
-  "japeth": 1,
-  "japheth": 1,
-  "jaqueline": 2,
-  "jaquelyn": 2,
-  "jared": 1,
-  "jarek": 1,
-  "jareth": 1,
-  "jari": 1,
-  "jarka": 2,
-  "jarl": 1,
-  "jarlath": 1,
-  "jarmila": 2,
-  "jarod": 1,
-  "jarogniew": 1,
-  "jaromil": 1,
-  "jaromir": 1,
-  "jaron": None,
-  "jaropelk": 1,
-  "jaroslav": 1,
-  "jaroslaw": 1,
-  "jaroslawa": 2,
-  "jarred": 1,
-  "jarrett": 1,
-  "jarrod": 1,
-  "jarvis": 1,
-  "jasmin": 2,
-  "jasmine": 2,
-  "jasmyn": 2,
-  "jason": 1,
-  "jasper": 1,
-  "jaswinder": 2,
-  "jathbiyya": 2,
-  "jathibiyya": 2,
-  "jaume": 1,
-  "jaumet": 1,
-  "johna": None,
-  "javan": 1,
-  "javed": 1,
-  "javier": 1,
-  "javor": 1,
-  "jawahir": 2,
-  "jawdat": 1,
-  "jaxon": 1,
-  "jay": 1,
-  "jaya": 2,
-  "jayant": 1,
-  "jayanti": 2,
-  "jaycob": 1,
-  "jayda": 2,
-  "jayde": 2,
-  "jayden": None,
-  "jaydon": 1,
-  "jaye": 1,
-  "jayel": 2,
-  "jayla": 2,
-  "jaylee": 2,
-  "jaylen": 1,
-  "jaylin": 1,
-  "jaylon": 1,
-  "jayma": 2,
-  "jayme": 2,
-  "jaymes": 1,
-  "jayna": 2,
-  "jayne": 2,
-  "jaynie": 2,
-  "jayson": 1,
-  "jaywant": 1,
-  "jazmin": 2,
-  "jazmine": 2,
-  "jean": 1,
-  "jeana": 2,
-  "jean-baptiste": 1,
-  "jeane": 2,
-  "jeanette": 2,
-  "jeanie": 2,
-  "jeanine": 2,
-  "jean-marie": 1,
-  "jeanna": 2,
-  "jeanne": 2,
-  "jeannette": 2,
-  "jeannie": 2,
-  "jeannine": 2,
-  "jeannot": 1,
-  "jeb": 1,
-  "jed": 1,
-  "jedidah": 2,
-  "jedidiah": 1,
-  "jedrzej": 1,
-  "jeetendra": 1,
-  "jeff": 1,
-  "jefferson": 1,
-  "jeffery": 1,
-  "jeffrey": 1,
-  "jeffry": 1,
-  "jehan": 1,
-  "jehiel": 1,
-  "jehoash": 1,
-  "jehoshaphat": 1,
-  "jehovah": 1,
-  "jehu": 1,
-  "jekaterina": 2,
-  "jelani": 1,
-  "jelena": 2,
-  "jelka": 2,
-  "jem": 1,
-  "jemima": 2,
-  "jemma": 2,
-  "jemmy": 1,
-  "jen": 2,
-  "jena": 2,
-  "jenae": 2,
-  "jenaro": 1,
-  "jenci": 1,
-  "jenelle": 2,
-  "jenessa": 2,
-  "jeni": 2,
-  "jenifer": 2,
-  "jenn": 2,
-  "jenna": 2,
-  "jenni": 2,
-  "jennie": 2,
-  "jennifer": 2,
-  "jenny": 2,
-  "jenõ": 1,
-  "jens": 1,
-  "jep": 1,
-  "jephtha": 1,
-  "jephthah": 1,
-  "jepson": 1,
-  "jeptha": 1,
-  "jera": 2,
-  "jerald": 1,
-  "jere": 1,
-  "jeremiah": 1,
-  "jeremias": 1,
-  "jérémie": 1,
-  "jeremiel": 1,
-  "jeremy": 1,
-  "jeri": 2,
-  "jericho": 1,
-  "jerk": 1,
-  "jerker": 1,
-  "jermaine": 1,
-  "jernej": 1,
-  "jeroen": 1,
-  "jerold": 1,
-  "jérôme": 1,
-  "jerome": 1,
-  "jerónimo": 1,
-  "jerrard": 1,
-  "jerri": 2,
-  "jerrie": 2,
-  "jerrod": 1,
-  "jerrold": 1,
-  "jerry": None,
-  "jerusha": 2,
-  "jervis": 1,
-  "jerzy": 1,
-  "jesper": 1,
-  "jess": None,
-  "jessalyn": 2,
-  "jessamine": 2,
-  "jessamyn": 2,
-  "jesse": 1,
-  "jessenia": 2,
-  "jessi": 2,
-  "jessica": 2,
-  "jessie": 2,
-  "jessie": None,
-  "jessika": 2,
-  "jessye": 2,
-  "jesús": 1,
-  "jesus": 1,
-  "jesusa": 2,
-  "jethro": 1,
-  "jetta": 2,
-  "jeunesse": 2,
-  "jewel": 2,
-  "jewell": 2,
-  "jezebel": 2,
-  "jia": 2,
-  "jiang": None,
-  "jill": 2,
-  "jillian": 2,
-  "jillie": 2,
-  "jilly": 2,
-  "jim": 1,
-  "jimena": 2,
-  "jimi": 1,
-  "jimmie": None,
-  "jimmy": 1,
-  "jin": None,
-  "jinan": None,
-  "jindrich": 1,
-  "jing": None,
-  "jin-ho": 1,
-  "jinny": 2,
-  "jirair": 1,
-  "jirí": 1,
-  "jiro": 1,
-  "jitender": 1,
-  "jitendra": 1,
-  "jitinder": 1,
-  "jo": None,
-  "joab": 1,
-  "joachim": 1,
-  "joakim": 1,
-  "joan": 2,
-  "joan": 1,
-  "joana": 2,
-  "joandra": 2,
-  "joann": 2,
-  "joanna": 2,
-  "joanne": 2,
-  "joannes": 1,
-  "joão": 1,
-  "joaquim": 1,
-  "joaquima": 2,
-  "joaquin": 1,
-  "joaquín": 1,
-  "joash": 1,
-  "job": 1,
-  "jobeth": 2,
-  "joby": 1,
-  "jocasta": 2,
-  "jocelin": 2,
-  "joceline": 2,
-  "jocelyn": None,
-  "jocelyne": 2,
-  "jochem": 1,
-  "jochen": 1,
-  "jochim": 1,
-  "jochjo": 1,
-  "jock": 1,
-  "jockie": 1,
-  "jocky": 1,
-  "jocosa": 2,
-  "jodene": 2,
-  "jodi": 2,
-  "jodie": 2,
-  "jody": None,
-  "joe": 1,
-  "joël": 1,
-  "joel": 1,
-  "joelle": 2,
-  "joëlle": 2,
-  "joep": 1,
-  "joetta": 2,
-  "joey": 1,
-  "johan": 1,
-  "johana": 2,
-  "jóhann": 1,
-  "johann": 1,
-  "jóhanna": 2,
-  "johanna": 2,
-  "johanne": 2,
-  "johanneke": 2,
-  "jóhannes": 1,
-  "johannes": 1,
-  "johano": 1,
-  "johar": 1,
-  "john": 1,
-  "johnathan": 1,
-  "johnathon": 1,
-  "johnie": 1,
-  "johnnie": None,
-  "johnny": 1,
-  "joi": 2,
-  "joisse": 2,
-  "jokum": 1,
-  "jolán": 2,
-  "jolana": 2,
-  "jolanda": 2,
-  "jolánka": 2,
-  "jolanta": 2,
-  "joleen": 2,
-  "jolene": 2,
-  "jolie": 2,
-  "jolyon": 1,
-  "jón": 1,
-  "jon": 1,
-  "jóna": 2,
-  "jonah": 1,
-  "jónas": 1,
-  "jonas": 1,
-  "jónatan": 1,
-  "jonatan": 1,
-  "jonathan": 1,
-  "jonathon": 1,
-  "jonelle": 2,
-  "jonette": 2,
-  "joni": 1,
-  "joni": 2,
-  "jonie": 2,
-  "jonna": 2,
-  "jonny": 1,
-  "jonquil": 2,
-  "jonty": 1,
-  "jools": None,
-  "joona": 1,
-  "joonas": 1,
-  "joop": 1,
-  "joord": 1,
-  "joos": 1,
-  "jooseppi": 1,
-  "joost": 1,
-  "jöran": 1,
-  "jorck": 1,
-  "jordaan": 1,
-  "jordan": None,
-  "jordana": 2,
-  "jordi": 1,
-  "jordon": 1,
-  "jordyn": 2,
-  "jörg": 1,
-  "jorge": 1,
-  "jörgen": 1,
-  "jørgen": 1,
-  "jorie": 2,
-  "joris": 1,
-  "jorma": 1,
-  "jørn": 1,
-  "jory": 1,
-  "jos": 1,
-  "joscelin": 2,
-  "josceline": 2,
-  "josé": 1,
-  "josée": 2,
-  "josef": 1,
-  "josefa": 2,
-  "josefina": 2,
-  "joselyn": 2,
-  "josep": 1,
-  "joseph": 1,
-  "josepha": 2,
-  "josèphe": 2,
-  "josephina": 2,
-  "joséphine": 2,
-  "josephine": 2,
-  "joses": 1,
-  "josette": 2,
-  "josh": 1,
-  "joshawa": 1,
-  "joshua": 1,
-  "josiah": 1,
-  "josiane": 2,
-  "josias": 1,
-  "josie": 2,
-  "josif": 1,
-  "josip": 1,
-  "jóska": 1,
-  "joss": 2,
-  "josslyn": 2,
-  "josue": 1,
-  "jotham": 1,
-  "jouko": 1,
-  "jouni": 1,
-  "jourdain": 1,
-  "jovan": 1,
-  "jovana": 2,
-  "jovanka": 2,
-  "jove": 1,
-  "jovita": 2,
-  "jowan": 1,
-  "jowita": 2,
-  "joy": 2,
-  "joyce": None,
-  "joye": 2,
-  "jozafat": 1,
-  "joze": 1,
-  "jozef": 1,
-  "jozefa": 2,
-  "jozefo": 1,
-  "jozo": 1,
-  "józsef": 1,
-  "józsi": 1,
-  "józsua": 1,
-  "jozua": 1,
-  "ju": 2,
-  "juan": 1,
-  "juana": 2,
-  "juanita": 2,
-  "juanito": 1,
-  "jubal": 1,
-  "juda": 1,
-  "judah": 1,
-  "judas": 1,
-  "judd": 1,
-  "jude": 1,
-  "judi": 2,
-  "judie": 2,
-  "judit": 2,
-  "judita": 2,
-  "judite": 2,
-  "judith": 2,
-  "judy": 2,
-  "judyta": 2,
-  "juha": 1,
-  "juhana": 1,
-  "juhani": 1,
-  "juho": 1,
-  "jukka": 1,
-  "jules": 1,
-  "juli": 2,
-  "júlia": 2,
-  "julia": 2,
-  "julián": 1,
-  "julian": 1,
-  "juliana": 2,
-  "juliane": 2,
-  "julianna": 2,
-  "julianne": 2,
-  "julie": 2,
-  "julien": 1,
-  "julienne": 2,
-  "juliet": 2,
-  "juliette": 2,
-  "julija": 2,
-  "julio": 1,
-  "juliska": 2,
-  "julitta": 2,
-  "julius": 1,
-  "juliusz": 1,
-  "july": 2,
-  "julyan": 1,
-  "jumaane": 1,
-  "jumana": 2,
-  "jumanah": 2,
-  "june": 2,
-  "jung": None,
-  "junior": 1,
-  "juniper": 2,
-  "junko": 2,
-  "juno": 2,
-  "juozas": 1,
-  "jupiter": 1,
-  "juraj": 1,
-  "jure": 1,
-  "jürgen": 1,
-  "jurgis": 1,
-  "jurij": 1,
-  "juro": 1,
-  "jussi": 1,
-  "juste": 1,
-  "justice": None,
-  "justin": 1,
-  "justina": 2,
-  "justine": 2,
-  "justus": 1,
-  "justy": None,
-  "justyn": 1,
-  "justyna": 2,
-  "jutta": 2,
-  "jutte": 2,
-  "juturna": 2,
-  "juuso": 1,
-  "juvela": 2,
-  "juvenal": 1,
-  "juventas": 2,
-  "jyoti": 2,
-  "jyotsana": 2,
-  "jyotsna": 2,
-  "jytte": 2,
-  "kaapo": 1,
-  "kaapro": 1,
-  "kaarina": 2,
-  "kaarle": 1,
-  "kaarlo": 1,
-  "kacper": 1,
-  "kade": 1,
-  "kaden": 1,
-  "kader": 1,
-  "kae": 2,
-  "kaelea": 2,
-  "kaelee": 2,
-  "kaety": 2,
-  "kagiso": 2,
-  "kai": None,
-  "kai": 1,
-  "kaia": 2,
-  "kaija": 2,
-  "kaila": 2,
-  "kailash": None,
-  "kailee": 2,
-  "kailey": 2,
-  "kailyn": 2,
-  "kaimana": 1,
-  "kaisa": 2,
-  "kaiser": 1,
-  "kaitlin": 2,
-  "kaitlyn": 2,
-  "kaitlynn": 2,
-  "kaj": 1,
-  "kajetan": 1,
-  "kajsa": 2,
-  "kakalina": 2,
-  "kala": 2,
-  "kalani": None,
-  "kalea": 2,
-  "kaleb": 1,
-  "kaleigh": 2,
-  "kaleo": 1,
-  "kaley": 2,
-  "kali": 2,
-  "kalidas": 1,
-  "kalla": 2,
-  "kalle": 1,
-  "kallias": 1,
-  "kallikrates": 1,
-  "kalliope": 2,
-  "kallisto": 2,
-  "kallistrate": 2,
-  "kálmán": 1,
-  "kalpana": 2,
-  "kalyan": 1,
-  "kalyani": 2,
-  "kalyn": 2,
-  "kalypso": 2,
-  "kalysta": 2,
-  "kam": 1,
-  "kama": 1,
-  "kamal": 1,
-  "kamala": 2,
-  "kamaria": 2,
-  "kameron": 1,
-  "kamil": 1,
-  "kamila": 2,
-  "kamilla": 2,
-  "kamryn": 2,
-  "kandajha": 2,
-  "kane": 1,
-  "kaneonuskatew": 1,
-  "kanta": 2,
-  "kanti": 2,
-  "kanya": 2,
-  "kaolin": 1,
-  "kapel": 1,
-  "kapil": 1,
-  "kapila": 1,
-  "kara": 2,
-  "karam": None,
-  "karan": 1,
-  "karaugh": 2,
-  "karcsi": 1,
-  "kareem": 1,
-  "karel": 1,
-  "karen": 2,
-  "karena": 2,
-  "karenza": 2,
-  "karesinda": 2,
-  "kari": 1,
-  "kari": 2,
-  "karim": 1,
-  "karima": 2,
-  "karin": 2,
-  "karina": 2,
-  "karine": 2,
-  "karissa": 2,
-  "karita": 2,
-  "karl": 1,
-  "karla": 2,
-  "karlene": 2,
-  "karly": 2,
-  "karol": 1,
-  "karola": 2,
-  "karoliina": 2,
-  "karolina": 2,
-  "karoline": 2,
-  "karolis": 1,
-  "károly": 1,
-  "karolyn": 2,
-  "karp": 1,
-  "karrie": 2,
-  "karsten": 1,
-  "karyn": 2,
-  "karyna": 2,
-  "kasandra": 2,
-  "kasey": None,
-  "kasi": 1,
-  "kasia": 2,
-  "kasimir": 1,
-  "kasimira": 2,
-  "kaspar": 1,
-  "kasper": 1,
-  "kassandra": 2,
-  "kassia": 2,
-  "kassidy": None,
-  "kassy": 2,
-  "kat": 2,
-  "kata": 2,
-  "katalin": 2,
-  "katana": 2,
-  "katariina": 2,
-  "katarin": 2,
-  "katarina": 2,
-  "katarine": 2,
-  "katarzyna": 2,
-  "katashi": 1,
-  "kate": 2,
-  "katee": 2,
-  "katelin": 2,
-  "katelyn": 2,
-  "katelynn": 2,
-  "katerina": 2,
-  "katey": 2,
-  "katharina": 2,
-  "katharine": 2,
-  "käthe": 2,
-  "katherina": 2,
-  "katherine": 2,
-  "kathi": 2,
-  "kathie": 2,
-  "kathleen": 2,
-  "kathlyn": 2,
-  "kathrin": 2,
-  "kathryn": 2,
-  "kathy": 2,
-  "katica": 2,
-  "katida": 2,
-  "katie": 2,
-  "katina": 2,
-  "katinka": 2,
-  "katja": 2,
-  "katlego": None,
-  "katlyn": 2,
-  "kato": 1,
-  "katri": 2,
-  "katrien": 2,
-  "katrijn": 2,
-  "katrina": 2,
-  "katrine": 2,
-  "katriona": 2,
-  "katsu": 1,
-  "katsuo": 1,
-  "katsuro": 1,
-  "katy": 2,
-  "katya": 2,
-  "kausalya": 2,
-  "kaveri": 2,
-  "kawacatoose": 1,
-  "kay": 2,
-  "kay": 1,
-  "kaycee": 2,
-  "kaye": 2,
-  "kayetan": 1,
-  "kayla": 2,
-  "kayleah": 2,
-  "kaylee": 2,
-  "kayleen": 2,
-  "kayleigh": 2,
-  "kayley": 2,
-  "kaylie": 2,
-  "kaylin": 2,
-  "kayly": 2,
-  "kaylyn": 2,
-  "kaylynn": 2,
-  "kayode": 1,
-  "kazia": 2,
-  "kazimeras": 1,
-  "kazimiera": 2,
-  "kazimierz": 1,
-  "kazimir": 1,
-  "kázmér": 1,
-  "kazuki": 1,
-  "kazuko": 2,
-  "kazuo": 1,
-  "kean": 1,
-  "keane": 1,
-  "keanu": 1,
-  "keara": 2,
-  "keaton": 1,
-  "keefe": 1,
-  "keegan": 1,
-  "keelan": None,
-  "keeleigh": 2,
-  "keeley": 2,
-  "keelin": 2,
-  "keely": 2,
-  "keenan": 1,
-  "kees": 1,
-  "kegan": 1,
-  "keighley": 2,
-  "keiko": 2,
-  "keir": 1,
-  "keira": 2,
-  "keisha": 2,
-  "keith": 1,
-  "keitha": 2,
-  "keithia": 2,
-  "kekepania": 2,
-  "kekoa": 1,
-  "kelan": 1,
-  "kelcey": None,
-  "keld": 1,
-  "kelda": 2,
-  "kelebek": 2,
-  "kelemen": 1,
-  "kelia": 2,
-  "kelleigh": 2,
-  "kelley": 2,
-  "kelli": 2,
-  "kellie": 2,
-  "kelly": None,
-  "kelsey": None,
-  "kelsi": 2,
-  "kelsie": 2,
-  "kelvin": 1,
-  "kemp": 1,
-  "ken": 1,
-  "kenan": 1,
-  "kenaniah": 1,
-  "kendal": 1,
-  "kendall": None,
-  "kendra": 2,
-  "kendrick": 1,
-  "kenelm": 1,
-  "ken'ichi": 1,
-  "kenina": 2,
-  "kenith": 1,
-  "kenji": 1,
-  "kenna": 2,
-  "kennard": 1,
-  "kennedy": None,
-  "kennet": 1,
-  "kenneth": 1,
-  "kennith": 1,
-  "kenny": 1,
-  "kenrick": 1,
-  "kenshin": 1,
-  "kent": 1,
-  "kenta": 1,
-  "kentigern": 1,
-  "kenton": 1,
-  "kenya": None,
-  "kenyon": 1,
-  "keoni": 1,
-  "keren": 2,
-  "kerena": 2,
-  "keren-happuch": 2,
-  "kerensa": 2,
-  "kerenza": 2,
-  "keri": 2,
-  "kermit": 1,
-  "kerneels": 1,
-  "kerr": 1,
-  "kerri": 2,
-  "kerrie": None,
-  "kerry": None,
-  "kerstin": 2,
-  "kerttu": 2,
-  "keshaun": 1,
-  "keshawn": 1,
-  "keshet": None,
-  "keshia": 2,
-  "kester": 1,
-  "kestrel": 2,
-  "kettil": 1,
-  "keturah": 2,
-  "kevan": 1,
-  "kevin": 1,
-  "kevork": 1,
-  "keysha": 2,
-  "kezia": 2,
-  "keziah": 2,
-  "kgosi": 1,
-  "khadiga": 2,
-  "khadija": 2,
-  "khajag": 1,
-  "khaleel": 1,
-  "khalid": 1,
-  "khalida": 2,
-  "khalifa": 1,
-  "khalil": 1,
-  "khalilah": 2,
-  "khaliq": 1,
-  "khamisi": 1,
-  "khara": 2,
-  "khatijah": 2,
-  "khayrat": 1,
-  "khayri": 1,
-  "khayriyya": 2,
-  "khayyam": 1,
-  "khloe": 2,
-  "khordad": 1,
-  "khorshed": None,
-  "khurshid": None,
-  "khwaja": 1,
-  "kian": 1,
-  "kiana": 2,
-  "kiara": 2,
-  "kiaran": 1,
-  "kiarra": 2,
-  "kibwe": 1,
-  "kichiro": 1,
-  "kiefer": 1,
-  "kielo": 2,
-  "kiera": 2,
-  "kieran": 1,
-  "kieron": 1,
-  "kierra": 2,
-  "kiersten": 2,
-  "kiku": 2,
-  "kiley": 2,
-  "kilian": 1,
-  "kilie": 2,
-  "killian": 1,
-  "kim": 1,
-  "kim": 2,
-  "kimball": 1,
-  "kimberlee": 2,
-  "kimberleigh": 2,
-  "kimberley": None,
-  "kimberly": 2,
-  "kimiko": 2,
-  "kimmy": 2,
-  "kimo": 1,
-  "kin": 2,
-  "kinborough": 2,
-  "king": 1,
-  "kinga": 2,
-  "kinge": 2,
-  "kingsley": None,
-  "kip": 1,
-  "kipling": 1,
-  "kira": 2,
-  "kirabo": None,
-  "kiran": 1,
-  "kirby": 1,
-  "kiri": 2,
-  "kiril": 1,
-  "kirill": 1,
-  "kirk": 1,
-  "kirsa": 2,
-  "kirsi": 2,
-  "kirsteen": 2,
-  "kirsten": 2,
-  "kirstie": 2,
-  "kirstin": 2,
-  "kirsty": 2,
-  "kisecawchuck": 1,
-  "kisha": 2,
-  "kishan": 1,
-  "kishen": 1,
-  "kishore": 1,
-  "kishori": 2,
-  "kistna": 1,
-  "kit": None,
-  "kitty": 2,
-  "kiyoko": 2,
-  "kiyoshi": 1,
-  "kizzie": 2,
-  "kizzy": 2,
-  "kjeld": 1,
-  "kjell": 1,
-  "kjellfrid": 2,
-  "kjerstin": 2,
-  "kjetil": 1,
-  "klaas": 1,
-  "klaes": 1,
-  "klára": 2,
-  "klara": 2,
-  "klaudia": 2,
-  "klaus": 1,
-  "klava": 2,
-  "klavdija": 2,
-  "klavdiya": 2,
-  "kleitos": 1,
-  "klemen": 1,
-  "klemens": 1,
-  "klementyna": 2,
-  "kliment": 1,
-  "klio": 2,
-  "klotild": 2,
-  "klytië": 2,
-  "knud": 1,
-  "knut": 1,
-  "knute": 1,
-  "kobe": 1,
-  "kobina": 1,
-  "kodey": 1,
-  "kody": 1,
-  "koen": 1,
-  "koenraad": 1,
-  "kofi": 1,
-  "kohaku": 2,
-  "kohar": 2,
-  "kohinoor": 2,
-  "kojo": 1,
-  "kolab": 2,
-  "kolby": 1,
-  "kole": 1,
-  "kolleen": 2,
-  "kolman": 1,
-  "kolour": 2,
-  "kolya": 1,
-  "kondrat": 1,
-  "konnor": 1,
-  "konrád": 1,
-  "konrad": 1,
-  "konstantin": 1,
-  "konstantinos": 1,
-  "konstantyn": 1,
-  "koos": 1,
-  "koppel": 1,
-  "kora": 2,
-  "korbin": 1,
-  "korbinian": 1,
-  "körbl": 1,
-  "korë": 2,
-  "korey": 1,
-  "korina": 2,
-  "korinna": 2,
-  "kornél": 1,
-  "kornel": 1,
-  "kornélia": 2,
-  "kornelia": 2,
-  "korrine": 2,
-  "kort": 1,
-  "kortney": None,
-  "kory": 1,
-  "kostandin": 1,
-  "kostya": 1,
-  "kourtney": None,
-  "kreindel": 2,
-  "kresten": 1,
-  "kreszentia": 2,
-  "kreszenz": 2,
-  "kriemhild": 2,
-  "kriemhilde": 2,
-  "krikor": 1,
-  "krimhilde": 2,
-  "kris": None,
-  "krishna": 1,
-  "krista": 2,
-  "kristal": 2,
-  "kristaps": 1,
-  "kristeen": 2,
-  "kristel": 2,
-  "kristen": 2,
-  "kristen": 1,
-  "krister": 1,
-  "kristi": 2,
-  "kristia": 2,
-  "kristian": None,
-  "kristie": 2,
-  "kristiina": 2,
-  "kristin": 2,
-  "kristina": 2,
-  "kristine": 2,
-  "kristján": 1,
-  "kristjan": 1,
-  "kristjana": 2,
-  "kristóf": 1,
-  "kristoffer": 1,
-  "kristopher": 1,
-  "kristy": 2,
-  "kristyna": 2,
-  "krisztián": 1,
-  "krisztina": 2,
-  "krysia": 2,
-  "krystal": 2,
-  "krystina": 2,
-  "krystine": 2,
-  "krystle": 2,
-  "krystof": 1,
-  "krystyn": 1,
-  "krystyna": 2,
-  "krzys": 1,
-  "krzysztof": 1,
-  "ksawery": 1,
-  "ksenia": 2,
-  "ksenija": 2,
-  "kseniya": 2,
-  "kshitij": 2,
-  "kuba": 1,
-  "kudret": 1,
-  "kukka": 2,
-  "kumar": 1,
-  "kumari": 2,
-  "kumiko": 2,
-  "kun": 1,
-  "kunal": 1,
-  "kunegunda": 2,
-  "kunibert": 1,
-  "kunigonde": 2,
-  "kunigunde": 2,
-  "kuno": 1,
-  "kunthea": 2,
-  "kunto": 2,
-  "kuro": 1,
-  "kurt": 1,
-  "kurtis": 1,
-  "kustaa": 1,
-  "kuzma": 1,
-  "kwabena": 1,
-  "kwadwo": 1,
-  "kwaku": 1,
-  "kwame": 1,
-  "kwasi": 1,
-  "kweku": 1,
-  "kwesi": 1,
-  "kyla": 2,
-  "kyle": None,
-  "kylee": 2,
-  "kyleigh": 2,
-  "kyler": None,
-  "kylie": 2,
-  "kyllikki": 2,
-  "kym": 2,
-  "kynaston": 1,
-  "kyösti": 1,
-  "kyra": 2,
-  "kyran": 1,
-  "kyriake": 2,
-  "kyriaki": 2,
-  "kyriakos": 1,
-  "kyros": 1,
-  "kyung-soon": 2,
-  "laban": 1,
-  "labhrainn": 1,
-  "labhrás": 1,
-  "lacey": None,
-  "lachie": 1,
-  "lachina": 2,
-  "lachlan": 1,
-  "lachtna": 1,
-  "lacy": None,
-  "ladislao": 1,
-  "ladislas": 1,
-  "ladislaus": 1,
-  "ladislav": 1,
-  "ladonna": 2,
-  "laelia": 2,
-  "lærke": 2,
-  "laetitia": 2,
-  "lagina": 2,
-  "lahja": 2,
-  "laia": 2,
-  "laila": 2,
-  "laima": 2,
-  "laird": 1,
-  "lajos": 1,
-  "lake": 1,
-  "lakeisha": 2,
-  "lakeshia": 2,
-  "lakisha": 2,
-  "lakshman": 1,
-  "lakshmi": 2,
-  "lal": 1,
-  "lala": 2,
-  "lalage": 2,
-  "lalawethika": 1,
-  "laleh": 2,
-  "lalit": 2,
-  "lalita": 2,
-  "lalla": 2,
-  "lallie": 2,
-  "lally": 2,
-  "lalo": 1,
-  "lambert": 1,
-  "lamech": 1,
-  "lamis": 2,
-  "lammert": 1,
-  "lamont": 1,
-  "lamprecht": 1,
-  "lamya": 2,
-  "lan": 2,
-  "lana": 2,
-  "lance": 1,
-  "lancelot": 1,
-  "landon": 1,
-  "lane": 1,
-  "lanford": 1,
-  "lành": 1,
-  "lani": 2,
-  "lanny": 1,
-  "lanty": 1,
-  "lanzo": 1,
-  "laocadia": 2,
-  "laoise": 2,
-  "lára": 2,
-  "lara": 2,
-  "laraine": 2,
-  "lareyna": 2,
-  "lari": 2,
-  "larisa": 2,
-  "larissa": 2,
-  "lark": 2,
-  "larkin": 1,
-  "larrie": 1,
-  "larry": 1,
-  "lars": 1,
-  "lárus": 1,
-  "laryn": 2,
-  "lashawn": None,
-  "lashonda": 2,
-  "lasse": 1,
-  "lassi": 1,
-  "lászló": 1,
-  "lata": 2,
-  "latanya": 2,
-  "latasha": 2,
-  "lateefah": 2,
-  "latif": 1,
-  "latifa": 2,
-  "latifah": 2,
-  "latisha": 2,
-  "latonya": 2,
-  "latoya": 2,
-  "launce": 1,
-  "launo": 1,
-  "laura": 2,
-  "lauraine": 2,
-  "laure": 2,
-  "laureen": 2,
-  "laurel": 2,
-  "laurelle": 2,
-  "lauren": 2,
-  "laurena": 2,
-  "laurence": 2,
-  "laurencia": 2,
-  "laurenço": 1,
-  "laurene": 2,
-  "laurens": 1,
-  "laurent": 1,
-  "laurentia": 2,
-  "laurentine": 2,
-  "laurentiu": 1,
-  "laurentius": 1,
-  "lauressa": 2,
-  "lauretta": 2,
-  "laurette": 2,
-  "lauri": 1,
-  "laurie": 2,
-  "laurinda": 2,
-  "laurine": 2,
-  "laurissa": 2,
-  "laurita": 2,
-  "laurits": 1,
-  "lauritz": 1,
-  "lauro": 1,
-  "lauryn": 2,
-  "lavena": 2,
-  "lavender": 2,
-  "lavern": None,
-  "laverna": 2,
-  "laverne": None,
-  "lavina": 2,
-  "lavinia": 2,
-  "lavone": 2,
-  "lavonne": 2,
-  "lavra": 2,
-  "lavrenti": 1,
-  "lavrentios": 1,
-  "lawahiz": 2,
-  "lawanda": 2,
-  "lawrence": 1,
-  "lawrie": 2,
-  "lawson": 1,
-  "laxman": 1,
-  "laxmi": 2,
-  "layla": 2,
-  "layton": 1,
-  "laz": 1,
-  "lázár": 1,
-  "lazar": 1,
-  "lazare": 1,
-  "lazarus": 1,
-  "lazer": 1,
-  "lazzaro": 1,
-  "léa": 2,
-  "lea": 2,
-  "leachlainn": 1,
-  "leah": 2,
-  "léan": 2,
-  "leander": 1,
-  "leandra": 2,
-  "léandre": 1,
-  "leandro": 1,
-  "leann": 2,
-  "leanna": 2,
-  "leanne": 2,
-  "leanora": 2,
-  "leatrice": 2,
-  "leberecht": 1,
-  "lech": 1,
-  "lecia": 2,
-  "leda": 2,
-  "lee": None,
-  "leeann": 2,
-  "leeba": 2,
-  "leela": 2,
-  "leesa": 2,
-  "leevi": 1,
-  "lefteris": 1,
-  "legolas": 1,
-  "lehi": 1,
-  "leia": 2,
-  "leif": 1,
-  "leigh": 2,
-  "leighton": None,
-  "leila": 2,
-  "leilah": 2,
-  "leilani": 2,
-  "leith": 1,
-  "lela": 2,
-  "leland": 1,
-  "lelia": 2,
-  "lemmy": 1,
-  "lemoine": 1,
-  "lempi": 2,
-  "lemuel": 1,
-  "len": 1,
-  "lena": 2,
-  "lenard": 1,
-  "lene": 2,
-  "leni": 2,
-  "lennard": 1,
-  "lennart": 1,
-  "lennie": 1,
-  "lennon": 1,
-  "lennox": 1,
-  "lenny": 1,
-  "lenora": 2,
-  "lenore": 2,
-  "lenox": 1,
-  "lenuta": 2,
-  "lenz": 1,
-  "leo": 1,
-  "léo": 1,
-  "leocadia": 2,
-  "leocadio": 1,
-  "leofric": 1,
-  "leofwine": 1,
-  "leokadia": 2,
-  "leola": 2,
-  "leolin": 1,
-  "léon": 1,
-  "leon": 1,
-  "leona": 2,
-  "léonard": 1,
-  "leonard": 1,
-  "leonardo": 1,
-  "léonce": 1,
-  "leoncio": 1,
-  "leone": 2,
-  "leone": 1,
-  "leonhard": 1,
-  "leonid": 1,
-  "leonidas": 1,
-  "léonie": 2,
-  "leonius": 1,
-  "léonne": 2,
-  "leonor": 2,
-  "leonora": 2,
-  "leonore": 2,
-  "leonti": 1,
-  "leontina": 2,
-  "léontine": 2,
-  "leontius": 1,
-  "leonty": 1,
-  "leontyne": 2,
-  "leonzio": 1,
-  "léopold": 1,
-  "leopold": 1,
-  "leopoldo": 1,
-  "leos": 1,
-  "leroi": 1,
-  "leroy": 1,
-  "les": 1,
-  "lesedi": 2,
-  "lesia": 2,
-  "lesleigh": 2,
-  "lesley": None,
-  "leslie": None,
-  "lesly": None,
-  "lessie": 2,
-  "lester": 1,
-  "leszek": 1,
-  "leta": 2,
-  "letha": 2,
-  "leticia": 2,
-  "letitia": 2,
-  "letizia": 2,
-  "leto": 2,
-  "lettice": 2,
-  "lettie": 2,
-  "letty": 2,
-  "lev": 1,
-  "levent": 1,
-  "levi": 1,
-  "levon": 1,
-  "lew": 1,
-  "lewella": 2,
-  "lewin": 1,
-  "lewis": 1,
-  "lex": 1,
-  "lexa": 2,
-  "lexi": 2,
-  "lexia": 2,
-  "lexie": 2,
-  "lexine": 2,
-  "lexus": 2,
-  "lexy": 2,
-  "leyton": 1,
-  "li": None,
-  "lia": 2,
-  "líadan": 2,
-  "liam": 1,
-  "liana": 2,
-  "liane": 2,
-  "lianne": 2,
-  "libby": 2,
-  "liber": 1,
-  "liberatore": 1,
-  "liberius": 1,
-  "liberty": 2,
-  "libitina": 2,
-  "libor": 1,
-  "liboria": 2,
-  "liborio": 1,
-  "lida": 2,
-  "liddy": 2,
-  "lidia": 2,
-  "lidiya": 2,
-  "lieber": 1,
-  "lien": 2,
-  "liesa": 2,
-  "liesbeth": 2,
-  "liese": 2,
-  "liesel": 2,
-  "lieselotte": 2,
-  "liesje": 2,
-  "liesl": 2,
-  "ligeia": 2,
-  "ligia": 2,
-  "liisa": 2,
-  "lijsbeth": 2,
-  "lila": 2,
-  "lilac": 2,
-  "lilavati": 2,
-  "líle": 2,
-  "lileas": 2,
-  "lili": 2,
-  "lilia": 2,
-  "lilian": 2,
-  "liliana": 2,
-  "liliane": 2,
-  "lilias": 2,
-  "lilith": 2,
-  "lilja": 2,
-  "lillian": 2,
-  "lillias": 2,
-  "lillie": 2,
-  "lilly": 2,
-  "lilo": 2,
-  "lily": 2,
-  "lim": None,
-  "lin": None,
-  "lina": 2,
-  "linas": 1,
-  "lincoln": 1,
-  "linda": 2,
-  "linden": 2,
-  "lindon": 1,
-  "lindsay": None,
-  "lindsey": None,
-  "lindsie": None,
-  "lindy": 2,
-  "linette": 2,
-  "linford": 1,
-  "ling": 2,
-  "linh": 2,
-  "linnaea": 2,
-  "linnéa": 2,
-  "linnet": 2,
-  "linnette": 2,
-  "linnie": 2,
-  "linos": 1,
-  "linsay": None,
-  "linsey": None,
-  "linton": 1,
-  "linus": 1,
-  "linwood": 1,
-  "linzi": 2,
-  "lionel": 1,
-  "lior": None,
-  "liouba": 2,
-  "lir": 1,
-  "liron": None,
-  "lis": 2,
-  "lisa": 2,
-  "lisanne": 2,
-  "lisbet": 2,
-  "lisbeth": 2,
-  "lise": 2,
-  "lisette": 2,
-  "lisha": 2,
-  "lissa": 2,
-  "lita": 2,
-  "liv": 2,
-  "livia": 2,
-  "liviana": 2,
-  "livio": 1,
-  "liviu": 1,
-  "livius": 1,
-  "livvy": 2,
-  "livy": 1,
-  "liz": 2,
-  "liza": 2,
-  "lizaveta": 2,
-  "lizbeth": 2,
-  "lizette": 2,
-  "lizolet": 2,
-  "lizzie": 2,
-  "lizzy": 2,
-  "ljubomir": 1,
-  "lleu": 1,
-  "lleulu": 2,
-  "llew": 1,
-  "llewella": 2,
-  "llewellyn": 1,
-  "llewelyn": 1,
-  "llora": 2,
-  "llorenç": 1,
-  "lloyd": 1,
-  "lluc": 1,
-  "lluis": 1,
-  "llyr": 1,
-  "llywellyn": 1,
-  "llywelyn": 1,
-  "lochan": 1,
-  "lochlainn": 1,
-  "lochlann": 1,
-  "lockie": 1,
-  "lodewijk": 1,
-  "lodovico": 1,
-  "logan": None,
-  "loic": 1,
-  "loïc": 1,
-  "lois": 2,
-  "loki": 1,
-  "lola": 2,
-  "lolicia": 2,
-  "lolita": 2,
-  "lomán": 1,
-  "lommán": 1,
-  "lon": 1,
-  "lonán": 1,
-  "london": None,
-  "lone": 2,
-  "lonnie": 1,
-  "lonny": 1,
-  "lope": 1,
-  "lora": 2,
-  "loraine": 2,
-  "lorainne": 2,
-  "lóránd": 1,
-  "lóránt": 1,
-  "lorayne": 2,
-  "lorcán": 1,
-  "lorccán": 1,
-  "lore": 2,
-  "loredana": 2,
-  "loreen": 2,
-  "lorelei": 2,
-  "lorelle": 2,
-  "loren": None,
-  "lorena": 2,
-  "lorencio": 1,
-  "lorene": 2,
-  "lorens": 1,
-  "lorenz": 1,
-  "lorenza": 2,
-  "lorenzo": 1,
-  "loreto": 2,
-  "loretta": 2,
-  "lorette": 2,
-  "lori": 2,
-  "lorie": 2,
-  "lorin": 1,
-  "lõrinc": 1,
-  "lorinda": 2,
-  "loris": 2,
-  "lorita": 2,
-  "lorn": 1,
-  "lorna": 2,
-  "lorne": 1,
-  "lorraine": 2,
-  "lorri": 2,
-  "lorrie": 2,
-  "lorrin": 1,
-  "lothair": 1,
-  "lothaire": 1,
-  "lothar": 1,
-  "lothario": 1,
-  "lotta": 2,
-  "lotte": 2,
-  "lottie": 2,
-  "lotus": 2,
-  "lou": None,
-  "louella": 2,
-  "louie": 1,
-  "louis": 1,
-  "louisa": 2,
-  "louise": 2,
-  "louiza": 2,
-  "loup": 1,
-  "lourdes": 2,
-  "love": 2,
-  "lovel": 1,
-  "lovell": 1,
-  "loviisa": 2,
-  "lovisa": 2,
-  "lovise": 2,
-  "lowell": 1,
-  "lowri": 2,
-  "loyd": 1,
-  "luana": 2,
-  "luann": 2,
-  "luanna": 2,
-  "luanne": 2,
-  "luba": 2,
-  "luben": 1,
-  "lubna": 2,
-  "lubomierz": 1,
-  "lubomir": 1,
-  "luc": 1,
-  "luca": 2,
-  "luca": 1,
-  "lúcás": 1,
-  "lucas": 1,
-  "lucasta": 2,
-  "luce": 2,
-  "lucetta": 2,
-  "luchjo": 1,
-  "lúcia": 2,
-  "lucía": 2,
-  "lucia": 2,
-  "lucian": 1,
-  "luciana": 2,
-  "luciano": 1,
-  "lucie": 2,
-  "lucien": 1,
-  "lucienne": 2,
-  "lucifer": 1,
-  "lucile": 2,
-  "lucilla": 2,
-  "lucille": 2,
-  "lucina": 2,
-  "lucinda": 2,
-  "lucinde": 2,
-  "lucine": 2,
-  "lucio": 1,
-  "lucius": 1,
-  "lucjan": 1,
-  "lucky": 1,
-  "lucrece": 2,
-  "lucretia": 2,
-  "lucrezia": 2,
-  "lucy": 2,
-  "ludger": 1,
-  "ludmila": 2,
-  "ludmilla": 2,
-  "ludo": 1,
-  "ludovic": 1,
-  "ludovica": 2,
-  "ludoviko": 1,
-  "ludvig": 1,
-  "ludvik": 1,
-  "ludwig": 1,
-  "ludwik": 1,
-  "luella": 2,
-  "lugh": 1,
-  "lughaidh": 1,
-  "lugus": 1,
-  "luigi": 1,
-  "luigina": 2,
-  "luigino": 1,
-  "luis": 1,
-  "luisa": 2,
-  "luise": 2,
-  "luíseach": 2,
-  "luitgard": 2,
-  "luitger": 1,
-  "luitpold": 1,
-  "luiz": 1,
-  "lujayn": 2,
-  "lujza": 2,
-  "luka": 1,
-  "lukács": 1,
-  "lukas": 1,
-  "luke": 1,
-  "luksa": 2,
-  "lula": 2,
-  "lulu": 2,
-  "luminita": 2,
-  "lumusi": 2,
-  "luna": 2,
-  "luned": 2,
-  "lunete": 2,
-  "lupe": 2,
-  "lupita": 2,
-  "lurdes": 2,
-  "lure": 2,
-  "lutfi": 1,
-  "lutgard": 2,
-  "lutgardis": 2,
-  "luther": 1,
-  "lúðvík": 1,
-  "lutz": 1,
-  "luuk": 1,
-  "luukas": 1,
-  "luvenia": 2,
-  "luvinia": 2,
-  "lux": 2,
-  "luz": 2,
-  "luzia": 2,
-  "lyall": None,
-  "lycurgus": 1,
-  "lyda": 2,
-  "lydia": 2,
-  "lydie": 2,
-  "lyle": 1,
-  "lyn": 2,
-  "lynda": 2,
-  "lyndi": 2,
-  "lyndon": 1,
-  "lyndsay": None,
-  "lyndsea": 2,
-  "lyndsey": None,
-  "lynette": 2,
-  "lynn": None,
-  "lynna": 2,
-  "lynne": None,
-  "lynnette": 2,
-  "lynsay": 2,
-  "lynsey": 2,
-  "lynton": 1,
-  "lynwood": 1,
-  "lyov": 1,
-  "lyra": 2,
-  "lyric": 2,
-  "lysander": 1,
-  "lysandra": 2,
-  "lysette": 2,
-  "lysimachus": 1,
-  "lysistrata": 2,
-  "lyssa": 2,
-  "lyuba": 2,
-  "lyubov": 2,
-  "lyudmila": 2,
-  "lyudmyla": 2,
-  "lyydia": 2,
-  "lyyti": 2,
-  "maaike": 2,
-  "maaria": 2,
-  "maarit": 2,
-  "maarja": 2,
-  "maarten": 1,
-  "maartje": 2,
-  "maas": 1,
-  "maata": 2,
-  "mabel": 2,
-  "mabella": 2,
-  "mabelle": 2,
-  "mable": 2,
-  "mabon": 1,
-  "macarena": 2,
-  "macaria": 2,
-  "macario": 1,
-  "macey": None,
-  "machteld": 2,
-  "macie": None,
-  "maciej": 1,
-  "mack": 1,
-  "mackenzie": None,
-  "macsen": 1,
-  "macy": None,
-  "madai": 1,
-  "madailéin": 2,
-  "madalena": 2,
-  "madalyn": 2,
-  "mädchen": 2,
-  "maddalena": 2,
-  "maddison": 2,
-  "madelaine": 2,
-  "madeleine": 2,
-  "madelina": 2,
-  "madeline": 2,
-  "madelyn": 2,
-  "madge": 2,
-  "madhav": 1,
-  "madhavi": 2,
-  "madhu": 2,
-  "madhukar": 1,
-  "madhur": 2,
-  "madison": None,
-  "madisyn": 2,
-  "madlyn": 2,
-  "madoc": 1,
-  "madog": 1,
-  "madoline": 2,
-  "madonna": 2,
-  "mads": 1,
-  "madyson": 2,
-  "mae": 2,
-  "maegan": 2,
-  "maeja": 2,
-  "maeleachlainn": 1,
-  "maeva": 2,
-  "maeve": 2,
-  "mafalda": 2,
-  "magali": 2,
-  "magalie": 2,
-  "magda": 2,
-  "magdalen": 2,
-  "magdalena": 2,
-  "magdalene": 2,
-  "magdalone": 2,
-  "magdolna": 2,
-  "maggie": 2,
-  "magnhild": 2,
-  "magnolia": 2,
-  "magnus": 1,
-  "maha": 2,
-  "mahala": 2,
-  "mahalah": 1,
-  "mahalath": 2,
-  "mahali": 1,
-  "mahalia": 2,
-  "mahatma": 1,
-  "mahavir": 1,
-  "mahendra": 1,
-  "mahin": 2,
-  "mahinder": 1,
-  "mahlah": None,
-  "mahli": 1,
-  "mahmood": 1,
-  "mahmud": 1,
-  "mahomet": 1,
-  "mahon": 1,
-  "mahvash": 2,
-  "mai": 2,
-  "maia": 2,
-  "maighread": 2,
-  "maija": 2,
-  "maike": 2,
-  "maile": 2,
-  "mainchín": 1,
-  "mainio": 1,
-  "mair": 2,
-  "máire": 2,
-  "mairéad": 2,
-  "mairead": 2,
-  "mairenn": 2,
-  "màiri": 2,
-  "máirín": 2,
-  "mairtín": 1,
-  "mairwen": 2,
-  "maisie": 2,
-  "maite": 2,
-  "maitiú": 1,
-  "maitland": 1,
-  "maja": 2,
-  "major": 1,
-  "makaio": 1,
-  "makari": 1,
-  "makayla": 2,
-  "makeda": 2,
-  "makenna": 2,
-  "makenzie": 2,
-  "makram": 1,
-  "maksim": 1,
-  "maksimilian": 1,
-  "mala": 2,
-  "malachi": 1,
-  "malachy": 1,
-  "malaika": 2,
-  "malak": None,
-  "malakai": 1,
-  "malamis": 1,
-  "malandra": 2,
-  "malati": 2,
-  "malcolm": 1,
-  "malcom": 1,
-  "maldwyn": 1,
-  "maleah": 2,
-  "maleko": 1,
-  "malene": 2,
-  "malgorzata": 2,
-  "malia": 2,
-  "malie": 2,
-  "malik": 1,
-  "malika": 2,
-  "malin": 2,
-  "malina": 2,
-  "malinda": 2,
-  "malka": 2,
-  "mallaidh": 2,
-  "mallory": None,
-  "mallt": 2,
-  "malone": 1,
-  "malvina": 2,
-  "malvolio": 1,
-  "mamie": 2,
-  "manasseh": 1,
-  "manasses": 1,
-  "mandeep": 1,
-  "mandi": 2,
-  "mandy": 2,
-  "manel": 1,
-  "manfred": 1,
-  "manfredo": 1,
-  "manfried": 1,
-  "mani": 1,
-  "manish": 1,
-  "manjula": 2,
-  "manjusha": 2,
-  "manley": 1,
-  "manlio": 1,
-  "mannix": 1,
-  "manny": 1,
-  "manoel": 1,
-  "manola": 2,
-  "manolo": 1,
-  "manon": 2,
-  "mansel": 1,
-  "mansoor": 1,
-  "mansur": 1,
-  "manu": 1,
-  "manuel": 1,
-  "manuela": 2,
-  "manus": 1,
-  "manya": 2,
-  "maoilios": 1,
-  "maquinna": 1,
-  "mara": 2,
-  "marajha": 2,
-  "maral": 2,
-  "maralyn": 2,
-  "marc": 1,
-  "marcel": 1,
-  "marcela": 2,
-  "marceli": 1,
-  "marcelina": 2,
-  "marceline": 2,
-  "marcelino": 1,
-  "marcella": 2,
-  "marcelle": 2,
-  "marcellette": 2,
-  "marcellin": 1,
-  "marcelline": 2,
-  "marcellino": 1,
-  "marcello": 1,
-  "marcellus": 1,
-  "marcelo": 1,
-  "marci": 2,
-  "marcia": 2,
-  "marcie": 2,
-  "marcin": 1,
-  "marcio": 1,
-  "marco": 1,
-  "marcos": 1,
-  "marcus": 1,
-  "marcy": 2,
-  "marduk": 1,
-  "mared": 2,
-  "maredudd": 1,
-  "mareike": 2,
-  "marek": 1,
-  "maresol": 2,
-  "marfa": 2,
-  "margaid": 2,
-  "marganita": 2,
-  "margaret": 2,
-  "margaréta": 2,
-  "margareta": 2,
-  "margarete": 2,
-  "margarethe": 2,
-  "margaretta": 2,
-  "margarid": 2,
-  "margarida": 2,
-  "margarita": 2,
-  "margaux": 2,
-  "marge": 2,
-  "marged": 2,
-  "margery": 2,
-  "margh": 1,
-  "margherita": 2,
-  "margie": 2,
-  "margit": 2,
-  "margo": 2,
-  "margot": 2,
-  "margrét": 2,
-  "margrethe": 2,
-  "marguerite": 2,
-  "mari": 2,
-  "mária": 2,
-  "maría": 2,
-  "maria": 2,
-  "mariabella": 2,
-  "mariah": 2,
-  "mariam": 2,
-  "mariamne": 2,
-  "marian": 1,
-  "marian": 2,
-  "mariana": 2,
-  "mariangela": 2,
-  "marianna": 2,
-  "marianne": 2,
-  "mariano": 1,
-  "marianus": 1,
-  "maribel": 2,
-  "marica": 2,
-  "marie": 2,
-  "marieke": 2,
-  "mariel": 2,
-  "mariele": 2,
-  "mariella": 2,
-  "marielle": 2,
-  "marietta": 2,
-  "mariette": 2,
-  "marigold": 2,
-  "marija": 2,
-  "marijan": 1,
-  "marijana": 2,
-  "marijke": 2,
-  "marijona": 2,
-  "marijse": 2,
-  "marika": 2,
-  "mariko": 2,
-  "marilena": 2,
-  "marilene": 2,
-  "marilou": 2,
-  "marilyn": 2,
-  "marilynn": 2,
-  "marin": 1,
-  "marina": 2,
-  "marinda": 2,
-  "marine": 2,
-  "marino": 1,
-  "marinus": 1,
-  "mario": 1,
-  "marion": 1,
-  "marion": 2,
-  "maris": 2,
-  "marisa": 2,
-  "marise": 2,
-  "maryse": 2,
-  "mariska": 2,
-  "marisol": 2,
-  "marissa": 2,
-  "marit": 2,
-  "marita": 2,
-  "maritza": 2,
-  "marius": 1,
-  "mariusz": 1,
-  "mariya": 2,
-  "marja": 2,
-  "marjaana": 2,
-  "marjan": 2,
-  "marjani": 2,
-  "marje": 2,
-  "marjeta": 2,
-  "marjolaine": 2,
-  "marjorie": 2,
-  "marjory": 2,
-  "márk": 1,
-  "mark": 1,
-  "markéta": 2,
-  "marketta": 2,
-  "markku": 1,
-  "marko": 1,
-  "markus": 1,
-  "marla": 2,
-  "marlee": 2,
-  "marlen": 1,
-  "marlena": 2,
-  "marlene": 2,
-  "marley": None,
-  "marlin": 1,
-  "marlon": 1,
-  "marlowe": 1,
-  "marly": 1,
-  "marlyn": 2,
-  "marmaduke": 1,
-  "marna": 2,
-  "marni": 2,
-  "marnie": 2,
-  "marquis": 1,
-  "marquise": 1,
-  "marquita": 2,
-  "mars": 1,
-  "marsaili": 2,
-  "marsha": 2,
-  "marshal": 1,
-  "marshall": 1,
-  "marshan": 2,
-  "márta": 2,
-  "märta": 2,
-  "marta": 2,
-  "mårten": 1,
-  "marten": 1,
-  "martha": 2,
-  "marthe": 2,
-  "martie": 1,
-  "martijn": 1,
-  "martín": 1,
-  "martin": 1,
-  "martina": 2,
-  "martine": 2,
-  "martinho": 1,
-  "martino": 1,
-  "martirio": 2,
-  "martita": 2,
-  "márton": 1,
-  "martta": 2,
-  "martti": 1,
-  "mártuska": 2,
-  "marty": 1,
-  "martyn": 1,
-  "martyna": 2,
-  "marva": 2,
-  "marvin": 1,
-  "marvyn": 1,
-  "marwa": 2,
-  "mary": 2,
-  "marya": 2,
-  "maryam": 2,
-  "maryann": 2,
-  "maryanne": 2,
-  "marylou": 2,
-  "marylyn": 2,
-  "maryvonne": 2,
-  "marzena": 2,
-  "marzio": 1,
-  "masego": 2,
-  "masha": 2,
-  "mason": 1,
-  "masood": 1,
-  "massimiliano": 1,
-  "massimo": 1,
-  "masterman": 1,
-  "mas'ud": 1,
-  "masuyo": 1,
-  "mat": 1,
-  "máté": 1,
-  "matej": 1,
-  "mateja": 2,
-  "mateo": 1,
-  "mateus": 1,
-  "mateusz": 1,
-  "matheus": 1,
-  "mathew": 1,
-  "mathias": 1,
-  "mathieu": 1,
-  "mathilda": 2,
-  "mathilde": 2,
-  "mathis": 1,
-  "mathúin": 1,
-  "matias": 1,
-  "matija": 1,
-  "matild": 2,
-  "matilda": 2,
-  "matilde": 2,
-  "matjaz": 1,
-  "matleena": 2,
-  "matrona": 2,
-  "matryona": 2,
-  "mats": 1,
-  "matt": 1,
-  "matteo": 1,
-  "matthew": 1,
-  "matthias": 1,
-  "matthieu": 1,
-  "matti": 1,
-  "mattia": 1,
-  "mattie": None,
-  "mattithyahu": 1,
-  "matty": 1,
-  "matvei": 1,
-  "mátyás": 1,
-  "matylda": 2,
-  "maud": 2,
-  "maude": 2,
-  "maudie": 2,
-  "mauno": 1,
-  "maura": 2,
-  "maureen": 2,
-  "maurene": 2,
-  "mauri": 1,
-  "maurice": 1,
-  "mauricio": 1,
-  "maurine": 2,
-  "maurizio": 1,
-  "mauro": 1,
-  "maurus": 1,
-  "mave": 2,
-  "maverick": 1,
-  "mavis": 2,
-  "mavourneen": 2,
-  "mavreena": 2,
-  "max": 1,
-  "maxene": 2,
-  "maxim": 1,
-  "maxime": 1,
-  "maximiano": 1,
-  "maximilian": 1,
-  "maximilien": 1,
-  "maximilienne": 2,
-  "maximillian": 1,
-  "maximino": 1,
-  "maximo": 1,
-  "maximus": 1,
-  "maxine": 2,
-  "maxwell": 1,
-  "may": 2,
-  "maya": 2,
-  "maybelle": 2,
-  "maybelline": 2,
-  "mayim": 2,
-  "mayme": 2,
-  "maynard": 1,
-  "maynerd": 1,
-  "mayra": 2,
-  "mayson": 1,
-  "mayte": 2,
-  "mazin": 1,
-  "mckayla": 2,
-  "mckenna": 2,
-  "mckenzie": None,
-  "méabh": 2,
-  "meadhbh": 2,
-  "meadow": 2,
-  "meagan": 2,
-  "meaghan": 2,
-  "meallán": 1,
-  "meave": 2,
-  "meaveen": 2,
-  "mechteld": 2,
-  "mechtilde": 2,
-  "medb": 2,
-  "medea": 2,
-  "media": 2,
-  "medusa": 2,
-  "meena": 2,
-  "meera": 2,
-  "mefodi": 1,
-  "meg": 2,
-  "megan": 2,
-  "meghan": 2,
-  "mehalia": 2,
-  "mehetabel": 2,
-  "mehitabel": 2,
-  "mehmed": 1,
-  "mehmet": 1,
-  "mehmud": 1,
-  "mehrdad": 1,
-  "mei": 2,
-  "meical": 1,
-  "meike": 2,
-  "meinard": 1,
-  "meinhard": 1,
-  "meinir": 2,
-  "meinrad": 1,
-  "meinwen": 2,
-  "meir": 1,
-  "meirion": 1,
-  "meiriona": 2,
-  "mel": None,
-  "melaina": 2,
-  "melania": 2,
-  "mélanie": 2,
-  "melanie": 2,
-  "melany": 2,
-  "melba": 2,
-  "melchior": 1,
-  "melchiorre": 1,
-  "melchor": 1,
-  "mele": 2,
-  "melek": 2,
-  "melek": 1,
-  "melesina": 2,
-  "melete": 2,
-  "melia": 2,
-  "melicent": 2,
-  "melina": 2,
-  "melinda": 2,
-  "meliora": 2,
-  "melisa": 2,
-  "mélissa": 2,
-  "melissa": 2,
-  "melita": 2,
-  "melitta": 2,
-  "mellan": 1,
-  "melle": 2,
-  "mellony": 2,
-  "melody": 2,
-  "melor": 1,
-  "melpomene": 2,
-  "melva": 2,
-  "melville": 1,
-  "melvin": 1,
-  "melvyn": 1,
-  "melyssa": 2,
-  "menachem": 1,
-  "menahem": 1,
-  "menashe": 1,
-  "mendel": 1,
-  "menelaus": 1,
-  "menes": 1,
-  "menno": 1,
-  "menuha": 2,
-  "meraud": 2,
-  "mercedes": 2,
-  "mercia": 2,
-  "mercury": 1,
-  "mercy": 2,
-  "meredith": None,
-  "mererid": 2,
-  "merete": 2,
-  "merfyn": 1,
-  "merideth": 2,
-  "meriel": 2,
-  "merilyn": 2,
-  "merita": 2,
-  "meriwether": None,
-  "merla": 2,
-  "merle": None,
-  "merletta": 2,
-  "merlin": 1,
-  "merlyn": None,
-  "merrick": 1,
-  "merrill": None,
-  "merrilyn": 2,
-  "merrion": 1,
-  "merritt": None,
-  "merry": 2,
-  "merten": 1,
-  "merton": 1,
-  "merv": 1,
-  "mervin": 1,
-  "mervyn": 1,
-  "meryem": 2,
-  "meryl": 2,
-  "meshach": 1,
-  "meshulam": 1,
-  "meshullam": 1,
-  "meta": 2,
-  "methoataske": 2,
-  "methodius": 1,
-  "methuselah": 1,
-  "metin": 1,
-  "metody": 1,
-  "mette": 2,
-  "meuric": 1,
-  "meurig": 1,
-  "meyer": 1,
-  "mhairi": 2,
-  "mia": 2,
-  "mica": 2,
-  "micaela": 2,
-  "micah": 1,
-  "micaiah": None,
-  "micajah": 1,
-  "michaël": 1,
-  "michael": 1,
-  "michaela": 2,
-  "michal": 2,
-  "michal": 1,
-  "michalina": 2,
-  "michayla": 2,
-  "mícheál": 1,
-  "mìcheal": 1,
-  "micheal": 1,
-  "micheil": 1,
-  "michel": 1,
-  "michela": 2,
-  "michelangela": 2,
-  "michelangelo": 1,
-  "michèle": 2,
-  "michele": 1,
-  "michelina": 2,
-  "micheline": 2,
-  "michelle": 2,
-  "michelyne": 2,
-  "michi": 2,
-  "michiel": 1,
-  "michiko": 2,
-  "michjo": 1,
-  "mick": 1,
-  "mickey": 1,
-  "mictlantecuhtli": 1,
-  "midas": 1,
-  "midge": 2,
-  "midori": 2,
-  "mieczyslaw": 1,
-  "mieke": 2,
-  "miela": 2,
-  "mieszko": 1,
-  "mignon": 2,
-  "miguel": 1,
-  "miguela": 2,
-  "miha": 1,
-  "mihael": 1,
-  "mihaela": 2,
-  "mihai": 1,
-  "mihaita": 1,
-  "mihajlo": 1,
-  "mihály": 1,
-  "mihammad": 1,
-  "mihangel": 1,
-  "mihhaelo": 1,
-  "miia": 2,
-  "miina": 2,
-  "mika": 1,
-  "mikael": 1,
-  "mikaela": 2,
-  "mikala": 1,
-  "mikayla": 2,
-  "mike": 1,
-  "mikel": 1,
-  "mikelo": 1,
-  "mikhail": 1,
-  "mikhaila": 2,
-  "mikhailo": 1,
-  "miki": 2,
-  "mikkel": 1,
-  "mikko": 1,
-  "miklós": 1,
-  "mikolaj": 1,
-  "mikolás": 1,
-  "miksa": 1,
-  "mikula": 1,
-  "mikulás": 1,
-  "mila": 2,
-  "milada": 2,
-  "milagros": 2,
-  "milan": 1,
-  "milana": 2,
-  "milburga": 2,
-  "milburn": 1,
-  "mildred": 2,
-  "milena": 2,
-  "miles": 1,
-  "milford": 1,
-  "millard": 1,
-  "millicent": 2,
-  "millie": 2,
-  "milo": 1,
-  "milogost": 1,
-  "milos": 1,
-  "miloslav": 1,
-  "miloslava": 2,
-  "miloslaw": 1,
-  "milosz": 1,
-  "miltiades": 1,
-  "milton": 1,
-  "mimi": 2,
-  "mina": 2,
-  "minako": 2,
-  "mindy": 2,
-  "minerva": 2,
-  "ming": None,
-  "minh": 1,
-  "minna": 2,
-  "minnie": 2,
-  "minoru": 1,
-  "minta": 2,
-  "minty": 2,
-  "miquel": 1,
-  "mira": 2,
-  "mirabella": 2,
-  "mirabelle": 2,
-  "miracle": 2,
-  "miranda": 2,
-  "mircea": 1,
-  "mireia": 2,
-  "mireille": 2,
-  "mireio": 2,
-  "mirela": 2,
-  "mirele": 2,
-  "mirella": 2,
-  "mirembe": 2,
-  "miren": 2,
-  "miriam": 2,
-  "mirinda": 2,
-  "mirja": 2,
-  "mirjam": 2,
-  "mirjami": 2,
-  "mirko": 1,
-  "mirna": 2,
-  "miroslav": 1,
-  "miroslava": 2,
-  "miroslaw": 1,
-  "miroslawa": 2,
-  "miruna": 2,
-  "mirza": 1,
-  "misha": None,
-  "misi": 1,
-  "mis'id": 1,
-  "miska": 1,
-  "missie": 2,
-  "misti": 2,
-  "misty": 2,
-  "mitch": 1,
-  "mitchell": 1,
-  "mithra": 1,
-  "mitica": 1,
-  "mitsuko": 2,
-  "mitxel": 1,
-  "mitya": 1,
-  "mitzi": 2,
-  "miyako": 2,
-  "mnason": 1,
-  "mneme": 2,
-  "mo": None,
-  "moa": 2,
-  "moana": None,
-  "modest": 1,
-  "modesta": 2,
-  "modeste": 1,
-  "modestine": 1,
-  "modesto": 1,
-  "modestus": 1,
-  "modesty": 2,
-  "modya": 1,
-  "mogens": 1,
-  "mohamed": 1,
-  "mohammad": 1,
-  "mohammed": 1,
-  "mohan": 1,
-  "mohana": 2,
-  "mohandas": 1,
-  "mohinder": 1,
-  "mohini": 2,
-  "moira": 2,
-  "moirrey": 2,
-  "moisés": 1,
-  "moishe": 1,
-  "mojisola": 2,
-  "mokosh": 2,
-  "mollie": 2,
-  "molly": 2,
-  "mona": 2,
-  "monat": 2,
-  "monday": 2,
-  "monet": 1,
-  "mongkut": 1,
-  "mónica": 2,
-  "monica": 2,
-  "monifa": 2,
-  "mónika": 2,
-  "monika": 2,
-  "monique": 2,
-  "monna": 2,
-  "monroe": 1,
-  "monserrat": 2,
-  "monta": 2,
-  "montague": 1,
-  "montana": 2,
-  "monte": 1,
-  "montgomery": 1,
-  "montserrat": 2,
-  "monty": 1,
-  "mór": 2,
-  "mora": 2,
-  "morag": 2,
-  "morana": 2,
-  "moray": 1,
-  "morcant": 2,
-  "mordecai": 1,
-  "mordechai": 1,
-  "mordikai": 1,
-  "moreen": 2,
-  "morgaine": 2,
-  "morgan": None,
-  "morgana": 2,
-  "morgane": 2,
-  "moriah": 2,
-  "móric": 1,
-  "moricz": 1,
-  "moriko": 2,
-  "moritz": 1,
-  "morley": 1,
-  "morna": 2,
-  "morpheus": 1,
-  "morrigan": 2,
-  "mórríghan": 2,
-  "morris": 1,
-  "mort": 1,
-  "morten": 1,
-  "mortimer": 1,
-  "morton": 1,
-  "morty": 1,
-  "morven": 2,
-  "morwenna": 2,
-  "mose": 1,
-  "moses": 1,
-  "moshe": 1,
-  "mosi": 1,
-  "moss": 1,
-  "mostafa": 1,
-  "mostyn": 1,
-  "motel": 1,
-  "motke": 1,
-  "motya": None,
-  "moyna": 2,
-  "moyra": 2,
-  "mózes": 1,
-  "mozes": 1,
-  "mscislaw": 1,
-  "mstislav": 1,
-  "mu": None,
-  "muadhnait": 2,
-  "müge": 2,
-  "muhammad": 1,
-  "muhammed": 1,
-  "muhsin": 1,
-  "muhsina": 2,
-  "muir": 1,
-  "muireadhach": 1,
-  "muireall": 2,
-  "muireann": 2,
-  "muirenn": 2,
-  "muirgen": 2,
-  "muirgheal": 2,
-  "muirín": 2,
-  "muiris": 1,
-  "muirne": 2,
-  "mukesh": 1,
-  "mukhtar": 1,
-  "mukul": 1,
-  "muna": 2,
-  "munashe": None,
-  "mungo": 1,
-  "munir": 1,
-  "munira": 2,
-  "munro": 1,
-  "munroe": 1,
-  "murali": 1,
-  "murchadh": 1,
-  "murdag": 2,
-  "murdo": 1,
-  "murdoch": 1,
-  "muriel": 2,
-  "murphy": None,
-  "murray": 1,
-  "murrough": 1,
-  "murtagh": 1,
-  "musa": 1,
-  "mus'ad": 1,
-  "muscowequan": 1,
-  "mustafa": 1,
-  "mustapha": 1,
-  "mu'tasim": 1,
-  "mwanajuma": 2,
-  "mya": 2,
-  "myf": 2,
-  "myfanwy": 2,
-  "myghal": 1,
-  "mykhailo": 1,
-  "mykhaylo": 1,
-  "mykola": 1,
-  "mykolas": 1,
-  "myles": 1,
-  "myra": 2,
-  "myranda": 2,
-  "myrddin": 1,
-  "myriam": 2,
-  "myrna": 2,
-  "myron": 1,
-  "myrrine": 2,
-  "myrtie": 2,
-  "myrtle": 2,
-  "mysie": 2,
-  "naamah": 2,
-  "nabil": 1,
-  "nacho": 1,
-  "nacio": 1,
-  "nada": 2,
-  "nadejda": 2,
-  "nader": 1,
-  "nadezhda": 2,
-  "nadia": 2,
-  "nadim": 1,
-  "nadine": 2,
-  "nadir": 1,
-  "nadira": 2,
-  "nadja": 2,
-  "nadra": 2,
-  "nadya": 2,
-  "nadzeija": 2,
-  "nagendra": 1,
-  "nagi": 1,
-  "nagib": 1,
-  "nahal": 2,
-  "naheed": 2,
-  "nahor": 1,
-  "nahum": 1,
-  "nail": 1,
-  "naila": 2,
-  "na'im": 1,
-  "na'ima": 2,
-  "nainsí": 2,
-  "naitik": 1,
-  "naji": 1,
-  "najib": 1,
-  "nakato": 2,
-  "nalani": 2,
-  "naldo": 1,
-  "nan": 2,
-  "nana": 2,
-  "nanaea": 2,
-  "nanaia": 2,
-  "nanashi": None,
-  "nancy": 2,
-  "nanda": 1,
-  "nandag": 2,
-  "nándor": 1,
-  "nandy": 1,
-  "nanette": 2,
-  "nanna": 2,
-  "nannie": 2,
-  "nanook": 1,
-  "nanuk": 1,
-  "naoise": 1,
-  "naoko": 2,
-  "naomh": 2,
-  "naomhán": 1,
-  "naomi": 2,
-  "naphtali": 1,
-  "napier": 1,
-  "napoléon": 1,
-  "narayan": 1,
-  "narca": 2,
-  "narcisa": 2,
-  "narciso": 1,
-  "narcissa": 2,
-  "narcisse": 1,
-  "narcissus": 1,
-  "narelle": 2,
-  "narendra": 1,
-  "narinder": 1,
-  "nasim": 2,
-  "nasir": 1,
-  "nasira": 2,
-  "nastasia": 2,
-  "nastya": 2,
-  "nat": 1,
-  "natale": 2,
-  "natalee": 2,
-  "natália": 2,
-  "natalia": 2,
-  "natalie": 2,
-  "natalya": 2,
-  "natan": 1,
-  "natanaele": 1,
-  "natasa": 2,
-  "natasha": 2,
-  "nathalie": 2,
-  "nathan": 1,
-  "nathanael": 1,
-  "nathaniel": 1,
-  "natille": 2,
-  "natsuko": 2,
-  "natsumi": 2,
-  "naum": 1,
-  "nava": 2,
-  "naveed": 1,
-  "naveen": 1,
-  "navid": 1,
-  "nawal": 2,
-  "nawra": 2,
-  "nayeli": 2,
-  "nazaire": 1,
-  "nazario": 1,
-  "ndidi": None,
-  "nea": 2,
-  "neacel": 1,
-  "neal": 1,
-  "neasa": 2,
-  "neassa": 2,
-  "neculai": 1,
-  "ned": 1,
-  "neelam": None,
-  "neely": 1,
-  "nefertari": 2,
-  "nefertiti": 2,
-  "nehemiah": 1,
-  "neifion": 1,
-  "neil": 1,
-  "neilina": 2,
-  "neirin": 1,
-  "nekane": 2,
-  "nekoda": 1,
-  "nelda": 2,
-  "nell": 2,
-  "nelle": 2,
-  "nellie": 2,
-  "nelly": 2,
-  "nels": 1,
-  "nelson": 1,
-  "nelu": 1,
-  "nemesis": 2,
-  "nena": 2,
-  "neo": None,
-  "neoptolemus": 1,
-  "nephele": 2,
-  "neptune": 1,
-  "nereida": 2,
-  "nereus": 1,
-  "nereza": 2,
-  "nergis": 2,
-  "neriah": 2,
-  "nerida": 2,
-  "nerina": 2,
-  "nerio": 1,
-  "nerissa": 2,
-  "nero": 1,
-  "nerys": 2,
-  "nessa": 2,
-  "nesta": 2,
-  "nestor": 1,
-  "nestore": 1,
-  "nethaniah": 1,
-  "netta": 2,
-  "nettie": 2,
-  "netuno": 1,
-  "neus": 2,
-  "neva": 2,
-  "nevada": None,
-  "nevaeh": 2,
-  "nevan": 1,
-  "neve": 2,
-  "neves": 2,
-  "nevil": 1,
-  "neville": 1,
-  "nevio": 1,
-  "newt": 1,
-  "newton": 1,
-  "neza": 2,
-  "ngai": 1,
-  "ngaio": 2,
-  "ngaire": 2,
-  "ngoc": 2,
-  "ngozi": None,
-  "nguyen": 1,
-  "nguyet": 2,
-  "nhung": None,
-  "nia": 2,
-  "niall": 1,
-  "niamh": 2,
-  "nibori": 1,
-  "nic": 1,
-  "niccolò": 1,
-  "nichjo": 1,
-  "nichol": 1,
-  "nicholas": 1,
-  "nichole": 2,
-  "nick": 1,
-  "nickolas": 1,
-  "nickolaus": 1,
-  "nicky": None,
-  "nico": 1,
-  "nicodème": 1,
-  "nicodemo": 1,
-  "nicodemus": 1,
-  "nicol": 1,
-  "nicola": 2,
-  "nicola": 1,
-  "nicolae": 1,
-  "nicolao": 1,
-  "nicolaos": 1,
-  "nicolás": 1,
-  "nicolas": 1,
-  "nicolasa": 2,
-  "nicolau": 1,
-  "nicole": 2,
-  "nicoleta": 2,
-  "nicoletta": 2,
-  "nicolette": 2,
-  "nicolina": 2,
-  "nicolò": 1,
-  "nicomedo": 1,
-  "nicostrato": 1,
-  "nicu": 1,
-  "nicusor": 1,
-  "niels": 1,
-  "nieve": 2,
-  "nieves": 2,
-  "nigel": 1,
-  "nigelia": 2,
-  "nigella": 2,
-  "niilo": 1,
-  "nikandros": 1,
-  "nike": 2,
-  "nikephoros": None,
-  "nikias": 1,
-  "nikifor": 1,
-  "nikita": 1,
-  "nikki": 2,
-  "nikkole": 2,
-  "niklas": 1,
-  "niklaus": 1,
-  "niko": 1,
-  "nikodemos": 1,
-  "nikodim": 1,
-  "nikola": 1,
-  "nikolaas": 1,
-  "nikolai": 1,
-  "nikolao": 1,
-  "nikolaos": 1,
-  "nikolas": 1,
-  "nikolaus": 1,
-  "nikole": 2,
-  "nikoleta": 2,
-  "nikolett": 2,
-  "nikolina": 2,
-  "nikomachos": 1,
-  "nikomedes": 1,
-  "nikon": 1,
-  "nikostratos": 1,
-  "nila": 2,
-  "niles": 1,
-  "nilofer": 2,
-  "niloofar": 2,
-  "nils": 1,
-  "nimbus": 1,
-  "nina": 2,
-  "ninel": 2,
-  "ninette": 2,
-  "ning": None,
-  "ninian": 1,
-  "nino": 1,
-  "ninon": 2,
-  "nioclás": 1,
-  "nir": 1,
-  "nirvana": 2,
-  "nishant": 1,
-  "nissa": 2,
-  "nita": 2,
-  "niu": 2,
-  "nivek": 1,
-  "niven": 1,
-  "nizar": 1,
-  "nkechi": 2,
-  "nkosana": 1,
-  "nkosazana": 2,
-  "nkruma": None,
-  "nnamdi": 1,
-  "noa": 2,
-  "noach": 1,
-  "noah": 2,
-  "noah": 1,
-  "noak": 1,
-  "noam": 1,
-  "noble": 1,
-  "nobu": 1,
-  "noé": 1,
-  "noel": 1,
-  "noël": 1,
-  "noelani": 2,
-  "noele": 2,
-  "noelene": 2,
-  "noella": 2,
-  "noelle": 2,
-  "noëlle": 2,
-  "noemi": 2,
-  "noémie": 2,
-  "noga": 2,
-  "nohemi": 2,
-  "nóirín": 2,
-  "nola": 2,
-  "nolan": 1,
-  "nolene": 2,
-  "noll": 1,
-  "nomusa": 2,
-  "nona": 2,
-  "nonie": 2,
-  "noor": None,
-  "noora": 2,
-  "nora": 2,
-  "norah": 2,
-  "norbert": 1,
-  "noreen": 2,
-  "norene": 2,
-  "nori": 1,
-  "norina": 2,
-  "norm": 1,
-  "norma": 2,
-  "norman": 1,
-  "normand": 1,
-  "normina": 2,
-  "norris": 1,
-  "norton": 1,
-  "norwood": 1,
-  "nova": 2,
-  "novia": 2,
-  "novio": 1,
-  "nowell": 1,
-  "nsia": None,
-  "nsonowa": None,
-  "nuada": 1,
-  "nuadha": 1,
-  "nuala": 2,
-  "nudd": 1,
-  "nuha": 2,
-  "nuno": 1,
-  "nunzia": 2,
-  "nunziatina": 2,
-  "nunzio": 1,
-  "nuo": 2,
-  "nur": None,
-  "nura": 2,
-  "nuray": 2,
-  "núria": 2,
-  "nyah": 2,
-  "nyala": 2,
-  "nydia": 2,
-  "nye": 1,
-  "nyree": 2,
-  "nyssa": 2,
-  "nyx": 2,
-  "oana": 2,
-  "obadiah": 1,
-  "obed": 1,
-  "oberon": 1,
-  "obi": 1,
-  "ocean": None,
-  "océane": 2,
-  "ochieng": 1,
-  "octavia": 2,
-  "octavian": 1,
-  "octavio": 1,
-  "octavius": 1,
-  "odalis": None,
-  "odalys": 2,
-  "odd": 1,
-  "oddmund": 1,
-  "odelia": 2,
-  "odell": 1,
-  "odessa": 2,
-  "odetta": 2,
-  "odette": 2,
-  "odharnait": 2,
-  "odhiambo": 1,
-  "odhrán": 1,
-  "ödi": 1,
-  "odila": 2,
-  "odile": 2,
-  "odilon": 1,
-  "odin": 1,
-  "odo": 1,
-  "odoacer": 1,
-  "ödön": 1,
-  "odovacar": 1,
-  "odran": 1,
-  "odysseus": 1,
-  "oedipus": 1,
-  "óengus": 1,
-  "ofélia": 2,
-  "ofelia": 2,
-  "ofer": 1,
-  "ofra": 2,
-  "ofydd": 1,
-  "ogden": 1,
-  "oighrig": 2,
-  "oisín": 1,
-  "oiva": 1,
-  "oksana": 2,
-  "ola": 1,
-  "olabode": 1,
-  "olaf": 1,
-  "olalla": 2,
-  "olamide": 2,
-  "olanrewaju": 1,
-  "olav": 1,
-  "olavi": 1,
-  "olayinka": 2,
-  "oldrich": 1,
-  "ole": 1,
-  "oleg": 1,
-  "olek": 1,
-  "oleksander": 1,
-  "olena": 2,
-  "olga": 2,
-  "oli": 1,
-  "olimpia": 2,
-  "olive": 2,
-  "oliver": 1,
-  "olivette": 2,
-  "olivia": 2,
-  "olivie": 2,
-  "olivier": 1,
-  "olle": 1,
-  "olli": 1,
-  "ollie": None,
-  "olof": 1,
-  "olov": 1,
-  "olufemi": 1,
-  "olufunmilayo": 2,
-  "olufunmilola": 2,
-  "olujimi": 1,
-  "olukayode": 1,
-  "olumide": 1,
-  "oluwafunmilayo": 2,
-  "oluwasegun": 1,
-  "oluwaseun": 1,
-  "oluwaseyi": None,
-  "oluwatoyin": None,
-  "oluwayemisi": 2,
-  "olwen": 2,
-  "olwin": 2,
-  "olwyn": 2,
-  "olya": 2,
-  "olympe": 2,
-  "olympia": 2,
-  "olyvia": 2,
-  "om": 1,
-  "omar": 1,
-  "omega": 1,
-  "ömer": 1,
-  "omid": None,
-  "omolara": 2,
-  "omri": 1,
-  "ona": 2,
-  "ondrej": 1,
-  "oneida": 2,
-  "onesime": 1,
-  "onesimus": 1,
-  "onesiphorus": 1,
-  "oni": 2,
-  "onisim": 1,
-  "onni": 1,
-  "onora": 2,
-  "onur": 1,
-  "oona": 2,
-  "oonagh": 2,
-  "opal": 2,
-  "opaline": 2,
-  "opeyemi": 1,
-  "ophelia": 2,
-  "ophiuchus": 1,
-  "ophrah": None,
-  "oprah": 2,
-  "ora": None,
-  "orabela": 2,
-  "orah": 2,
-  "oral": 1,
-  "oralee": 2,
-  "oralie": 2,
-  "oran": 1,
-  "orazio": 1,
-  "orbán": 1,
-  "orel": 1,
-  "oren": 1,
-  "orestes": 1,
-  "orfeo": 1,
-  "órfhlaith": 2,
-  "oriana": 2,
-  "oriane": 2,
-  "orianne": 2,
-  "orinda": 2,
-  "orinthia": 2,
-  "orion": 1,
-  "örjan": 1,
-  "orla": 2,
-  "orlagh": 2,
-  "órlaith": 2,
-  "orlando": 1,
-  "orli": 2,
-  "orly": 2,
-  "ormerod": 1,
-  "ormond": 1,
-  "ormonda": 2,
-  "ormonde": 1,
-  "orna": 2,
-  "ornat": 2,
-  "ornella": 2,
-  "orpa": 2,
-  "orpah": 2,
-  "orpha": 2,
-  "orpheus": 1,
-  "orrell": 1,
-  "orrin": 1,
-  "orsina": 2,
-  "orsino": 1,
-  "orso": 1,
-  "orsolya": 2,
-  "orson": 1,
-  "orval": 1,
-  "orvar": 1,
-  "orville": 1,
-  "orvokki": 2,
-  "osama": 1,
-  "osamu": 1,
-  "osanne": None,
-  "osbert": 1,
-  "osborn": 1,
-  "osborne": 1,
-  "osbourne": 1,
-  "oscar": 1,
-  "osheen": 1,
-  "osip": 1,
-  "osiris": 1,
-  "óskar": 1,
-  "oskar": 1,
-  "oskari": 1,
-  "osman": 1,
-  "osmond": 1,
-  "osmund": 1,
-  "ossia": 2,
-  "ossian": 1,
-  "osvaldo": 1,
-  "oswald": 1,
-  "oswin": 1,
-  "oszkár": 1,
-  "otakar": 1,
-  "otávio": 1,
-  "othello": 1,
-  "othniel": 1,
-  "otho": 1,
-  "otieno": 1,
-  "otis": 1,
-  "otokar": 1,
-  "otso": 1,
-  "ottavia": 2,
-  "ottaviano": 1,
-  "ottavio": 1,
-  "otthild": 2,
-  "ottila": 2,
-  "ottilie": 2,
-  "ottó": 1,
-  "otto": 1,
-  "ottokar": 1,
-  "ottoline": 2,
-  "ouida": 2,
-  "ourania": 2,
-  "ouranos": 1,
-  "ovadia": 1,
-  "ove": 1,
-  "oved": 1,
-  "ovid": 1,
-  "ovidiu": 1,
-  "owain": 1,
-  "owen": 1,
-  "owena": 2,
-  "oxana": 2,
-  "oz": 1,
-  "ozan": 1,
-  "ozanne": None,
-  "özgür": None,
-  "özlem": 2,
-  "ozzie": 1,
-  "ozzy": 1,
-  "paaie": 2,
-  "paavali": 1,
-  "paavo": 1,
-  "pablo": 1,
-  "pace": 1,
-  "pacey": 1,
-  "pachjo": 1,
-  "pacifica": 2,
-  "paco": 1,
-  "paddy": 1,
-  "paden": 1,
-  "paderau": None,
-  "padma": None,
-  "padmavati": 2,
-  "padmini": 2,
-  "pádraig": 1,
-  "pàdraig": 1,
-  "pàdraigín": 2,
-  "padrig": 1,
-  "page": 2,
-  "paget": 2,
-  "paige": 2,
-  "paise": 1,
-  "paki": 1,
-  "pakpao": 2,
-  "pál": 1,
-  "pàl": 1,
-  "pål": 1,
-  "pála": 2,
-  "páll": 1,
-  "pallas": 2,
-  "pallu": 1,
-  "palmer": 1,
-  "palmira": 2,
-  "palmiro": 1,
-  "paloma": 2,
-  "pam": 2,
-  "pamela": 2,
-  "pamelia": 2,
-  "pamella": 2,
-  "pamila": 2,
-  "pamphilos": 1,
-  "panagiota": 2,
-  "panagiotis": 1,
-  "panayiotis": 1,
-  "pancho": 1,
-  "pancras": 1,
-  "pancrazio": 1,
-  "panda": 2,
-  "pandora": 2,
-  "panfilo": 1,
-  "pankrati": 1,
-  "pankratios": 1,
-  "pankraz": 1,
-  "panni": 2,
-  "pansy": 2,
-  "pantaleon": 1,
-  "pantaleone": 1,
-  "panther": 1,
-  "pantheras": 1,
-  "paola": 2,
-  "paolina": 2,
-  "paolino": 1,
-  "paolo": 1,
-  "papak": 1,
-  "papillion": 1,
-  "paramonos": 1,
-  "paraskeve": 2,
-  "paride": 1,
-  "paris": 1,
-  "parisa": 2,
-  "parker": None,
-  "parnel": 2,
-  "parris": 1,
-  "parry": 1,
-  "parsifal": 1,
-  "parth": 1,
-  "parthalan": 1,
-  "parthenia": 2,
-  "parthenope": 2,
-  "parvaiz": 1,
-  "parvanah": 2,
-  "parvati": 2,
-  "parveen": 2,
-  "parvin": 2,
-  "parwiz": 1,
-  "pascal": 1,
-  "pascale": 2,
-  "pascaline": 2,
-  "paschal": 1,
-  "pasco": 1,
-  "pascual": 1,
-  "pascuala": 2,
-  "pasha": 1,
-  "pasquale": 1,
-  "pasqualina": 2,
-  "pasqualino": 1,
-  "pat": None,
-  "patience": 2,
-  "patrice": 1,
-  "patricia": 2,
-  "patricio": 1,
-  "patrick": 1,
-  "patrik": 1,
-  "patrizia": 2,
-  "patrizio": 1,
-  "patroclus": 1,
-  "patrycja": 2,
-  "patryk": 1,
-  "patsy": None,
-  "patti": 2,
-  "pattie": 2,
-  "patton": 1,
-  "patty": 2,
-  "patxi": 1,
-  "patya": 1,
-  "pau": 1,
-  "paul": 1,
-  "paula": 2,
-  "paule": 2,
-  "pauleen": 2,
-  "paulene": 2,
-  "pauletta": 2,
-  "paulette": 2,
-  "pauli": 1,
-  "pauliina": 2,
-  "paulina": 2,
-  "pauline": 2,
-  "paulino": 1,
-  "paulo": 1,
-  "pavao": 1,
-  "pavel": 1,
-  "pavlo": 1,
-  "pavlos": 1,
-  "pawel": 1,
-  "pax": 2,
-  "payton": None,
-  "peace": 2,
-  "peadar": 1,
-  "pearce": 1,
-  "pearl": 2,
-  "pearle": 2,
-  "pearlie": 2,
-  "peder": 1,
-  "pedr": 1,
-  "pedro": 1,
-  "peers": 1,
-  "peg": 2,
-  "pegasus": 1,
-  "peggie": 2,
-  "peggy": 2,
-  "peigi": 2,
-  "pekka": 1,
-  "pelageya": 2,
-  "pelagia": 2,
-  "pelagius": 1,
-  "pellegrino": 1,
-  "pembe": 2,
-  "pen": 2,
-  "pene": 2,
-  "pénélope": 2,
-  "penelope": 2,
-  "peni": 1,
-  "peninnah": 2,
-  "penny": 2,
-  "pentti": 1,
-  "peony": 2,
-  "pepca": 2,
-  "pepe": 1,
-  "pepita": 2,
-  "pepito": 1,
-  "peppi": 2,
-  "per": 1,
-  "perce": 1,
-  "perceval": 1,
-  "percival": 1,
-  "percy": 1,
-  "perdita": 2,
-  "pere": 1,
-  "peregrine": 1,
-  "perele": 2,
-  "pericles": 1,
-  "perla": 2,
-  "perle": 2,
-  "perlie": 2,
-  "pernel": 2,
-  "pernilla": 2,
-  "pernille": 2,
-  "pero": 1,
-  "peronel": 2,
-  "peronelle": 2,
-  "perpetua": 2,
-  "perrine": 2,
-  "perry": 1,
-  "persephone": 2,
-  "perseus": 1,
-  "persis": 2,
-  "pertti": 1,
-  "perttu": 1,
-  "perun": 1,
-  "peta": 2,
-  "petar": 1,
-  "pete": 1,
-  "péter": 1,
-  "peter": 1,
-  "petera": 1,
-  "peterkin": 1,
-  "peti": 1,
-  "petia": 2,
-  "petr": 1,
-  "petra": 2,
-  "petranella": 2,
-  "petras": 1,
-  "petre": 1,
-  "petri": 1,
-  "petrica": 1,
-  "petrina": 2,
-  "petro": 1,
-  "petrona": 2,
-  "petronel": 2,
-  "petronella": 2,
-  "petros": 1,
-  "petru": 1,
-  "petter": 1,
-  "petteri": 1,
-  "petula": 2,
-  "petunia": 2,
-  "pétur": 1,
-  "petya": 1,
-  "peyton": None,
-  "phaedra": 2,
-  "phaedrus": 1,
-  "pharamond": 1,
-  "phebe": 2,
-  "phelan": 1,
-  "phelim": 1,
-  "phemie": 2,
-  "pheobe": 2,
-  "phil": 1,
-  "philadelphia": 2,
-  "philander": 1,
-  "philbert": 1,
-  "phile": 2,
-  "philemon": 1,
-  "philibert": 1,
-  "philip": 1,
-  "philipa": 2,
-  "philipp": 1,
-  "philippa": 2,
-  "philippe": 1,
-  "philippina": 2,
-  "philippine": 2,
-  "philis": 2,
-  "phillida": 2,
-  "phillip": 1,
-  "phillipa": 2,
-  "phillis": 2,
-  "philo": 1,
-  "philokrates": 1,
-  "philomel": 2,
-  "philomela": 2,
-  "philomena": 2,
-  "philon": 1,
-  "philotheos": 1,
-  "phineas": 1,
-  "phinehas": 1,
-  "phirun": 1,
-  "phobos": 1,
-  "phocas": 1,
-  "phoebe": 2,
-  "phoebus": 1,
-  "phoenix": None,
-  "photine": 2,
-  "photios": 1,
-  "phrixus": 1,
-  "phuong": 2,
-  "phyliss": 2,
-  "phyllida": 2,
-  "phyllis": 2,
-  "pia": 2,
-  "piaras": 1,
-  "pich": None,
-  "piedad": 2,
-  "piera": 2,
-  "pierce": 1,
-  "pierina": 2,
-  "piero": 1,
-  "pierre": 1,
-  "pierrette": 2,
-  "pierrick": 1,
-  "piers": 1,
-  "piet": 1,
-  "pietari": 1,
-  "pieter": 1,
-  "pietrina": 2,
-  "pietro": 1,
-  "pietronella": 2,
-  "piety": 2,
-  "piia": 2,
-  "pika": 1,
-  "pilar": 2,
-  "pili": 2,
-  "pilib": 1,
-  "pilvi": 2,
-  "pinchas": 1,
-  "ping": None,
-  "pino": 1,
-  "piotr": 1,
-  "pip": 1,
-  "piper": None,
-  "pippa": 2,
-  "pipra": 2,
-  "piri": 2,
-  "piritta": 2,
-  "pirjo": 2,
-  "pirkko": 2,
-  "piroska": 2,
-  "pista": 1,
-  "pisti": 1,
-  "pitambar": 1,
-  "pius": 1,
-  "placid": 1,
-  "placida": 2,
-  "placide": 2,
-  "placido": 1,
-  "plamen": 1,
-  "plato": 1,
-  "platon": 1,
-  "pleasance": 2,
-  "pluto": 1,
-  "pocahontas": 2,
-  "pól": 1,
-  "pòl": 1,
-  "poldi": 1,
-  "poldie": 1,
-  "polina": 2,
-  "pollie": 2,
-  "pollux": 1,
-  "polly": 2,
-  "pollyanna": 2,
-  "polona": 2,
-  "polycarp": 1,
-  "polydeukes": 1,
-  "polyhymnia": 2,
-  "polyxena": 2,
-  "pompeo": 1,
-  "pompey": 1,
-  "pompiliu": 1,
-  "poncio": 1,
-  "pons": 1,
-  "pontius": 1,
-  "pontus": 1,
-  "ponzio": 1,
-  "poornima": 2,
-  "poppy": 2,
-  "porfirio": 1,
-  "porsche": 2,
-  "porter": 1,
-  "portia": 2,
-  "poseidon": 1,
-  "posie": 2,
-  "posy": 2,
-  "poul": 1,
-  "prabhakar": 1,
-  "prabhu": 1,
-  "prabodh": 1,
-  "pradeep": 1,
-  "praise": 2,
-  "prakash": 1,
-  "pramod": 1,
-  "pran": 1,
-  "pranay": 1,
-  "pranciskis": 1,
-  "prasad": 1,
-  "pratap": 1,
-  "pratibha": 2,
-  "pratima": 2,
-  "praxis": 1,
-  "praxiteles": 1,
-  "preben": 1,
-  "precious": 1,
-  "preeti": 2,
-  "prem": 1,
-  "prema": 2,
-  "preston": 1,
-  "priam": 1,
-  "price": 1,
-  "primitiva": 2,
-  "primo": 1,
-  "primrose": 2,
-  "primula": 2,
-  "prince": 1,
-  "princess": 2,
-  "pris": 2,
-  "prisca": 2,
-  "priscilla": 2,
-  "prissy": 2,
-  "priya": 2,
-  "prometheus": 1,
-  "proserpina": 2,
-  "proserpine": 2,
-  "prosper": 1,
-  "prospero": 1,
-  "proteus": 1,
-  "pru": 2,
-  "prudence": 2,
-  "prudencio": 1,
-  "prudentius": 1,
-  "prudenzio": 1,
-  "prue": 2,
-  "prunella": 2,
-  "pryce": 1,
-  "pryderi": 1,
-  "przemek": 1,
-  "przemo": 1,
-  "przemyslaw": 1,
-  "psyche": 2,
-  "ptah": 1,
-  "ptolema": 2,
-  "ptolemy": 1,
-  "publius": 1,
-  "purdie": 2,
-  "purushottam": 1,
-  "pushpa": 2,
-  "pyotr": 1,
-  "pyrrhus": 1,
-  "pyry": 2,
-  "pythagoras": 1,
-  "qadir": 1,
-  "qasim": 1,
-  "qiana": 2,
-  "qing": 2,
-  "qiu": None,
-  "quan": 1,
-  "quanah": 1,
-  "quang": 1,
-  "quanna": 2,
-  "queen": 2,
-  "queenie": 2,
-  "quentin": 1,
-  "quetzalcoatl": 1,
-  "quiana": 2,
-  "quianna": 2,
-  "quim": 1,
-  "quin": 1,
-  "quincey": 1,
-  "quincy": 1,
-  "quinlan": 1,
-  "quinn": 1,
-  "quintella": 2,
-  "quintin": 1,
-  "quinton": 1,
-  "quintus": 1,
-  "quique": 1,
-  "quirino": 1,
-  "quirinus": 1,
-  "qusay": 1,
-  "quy": None,
-  "quyen": 2,
-  "ra": 1,
-  "raakel": 2,
-  "raanan": 1,
-  "rab": 1,
-  "rabab": 2,
-  "raban": 1,
-  "rabbie": 1,
-  "rabindra": 1,
-  "rachael": 2,
-  "racheal": 2,
-  "rachel": 2,
-  "rachele": 2,
-  "rachelle": 2,
-  "rachid": 1,
-  "rachyl": 2,
-  "raclaw": 1,
-  "racquel": 2,
-  "ra'd": 1,
-  "rada": 2,
-  "radcliff": 1,
-  "radclyffe": None,
-  "radek": 1,
-  "radha": 2,
-  "radim": 1,
-  "radimir": 1,
-  "radko": 1,
-  "radmilo": 1,
-  "radomil": 1,
-  "radomila": 2,
-  "radomir": 1,
-  "radomira": 2,
-  "radoslav": 1,
-  "radoslava": 2,
-  "radoslaw": 1,
-  "radoslawa": 2,
-  "radovan": 1,
-  "radu": 1,
-  "radulf": 1,
-  "radzimierz": 1,
-  "rae": None,
-  "raeburn": 1,
-  "raelene": 2,
-  "raelyn": 2,
-  "rafa": 1,
-  "rafael": 1,
-  "rafaela": 2,
-  "rafal": 1,
-  "rafe": 1,
-  "raffaele": 1,
-  "raffaella": 2,
-  "raffaello": 1,
-  "rafiq": 1,
-  "rafiqa": 2,
-  "raghnaid": 2,
-  "raghnailt": 2,
-  "raghnall": 1,
-  "raghu": 1,
-  "ragna": 2,
-  "ragnar": 1,
-  "ragnborg": 2,
-  "ragnfrid": 2,
-  "ragnheiður": 2,
-  "ragnhild": 2,
-  "ragnhildur": 2,
-  "ragnvald": 1,
-  "raguel": 1,
-  "rahab": 2,
-  "rahat": None,
-  "raheem": 1,
-  "rahim": 1,
-  "rahul": 1,
-  "raibeart": 1,
-  "ráichéal": 2,
-  "raiden": 1,
-  "raimonda": 2,
-  "raimondo": 1,
-  "raimund": 1,
-  "raimunde": 2,
-  "raimundo": 1,
-  "rain": 2,
-  "raina": 2,
-  "rainard": 1,
-  "raine": 2,
-  "rainer": 1,
-  "rainerio": 1,
-  "rainier": 1,
-  "raisa": 2,
-  "raisel": 2,
-  "raj": 1,
-  "raja": 2,
-  "rajani": 2,
-  "rajender": 1,
-  "rajendra": 1,
-  "rajesh": 1,
-  "rajinder": 1,
-  "rajiv": 1,
-  "rajneesh": 1,
-  "rajnish": 1,
-  "rajya": 2,
-  "rakel": 2,
-  "rakesh": 1,
-  "raleigh": 1,
-  "ralf": 1,
-  "ralph": 1,
-  "ralphie": 1,
-  "ralphina": 2,
-  "raluca": 2,
-  "ram": 1,
-  "rama": 1,
-  "ramachander": 1,
-  "ramachandra": 1,
-  "ramakrishna": 1,
-  "rameses": 1,
-  "ramesh": 1,
-  "rameshwar": 1,
-  "ramiro": 1,
-  "ramla": 2,
-  "ramón": 1,
-  "ramon": 1,
-  "ramona": 2,
-  "ramsay": 1,
-  "ramses": 1,
-  "ramsey": 1,
-  "ran": 2,
-  "rana": 2,
-  "ranald": 1,
-  "randa": 2,
-  "randal": 1,
-  "randall": 1,
-  "randell": 1,
-  "randi": 2,
-  "randolf": 1,
-  "randolph": 1,
-  "randy": None,
-  "rani": 2,
-  "raniero": 1,
-  "ranj": 1,
-  "ranjeet": 1,
-  "ranjit": 1,
-  "ransu": 1,
-  "ranulf": 1,
-  "ranulph": 1,
-  "ranya": 2,
-  "raoul": 1,
-  "raphaël": 1,
-  "raphael": 1,
-  "raphaela": 2,
-  "raquel": 2,
-  "raschelle": 2,
-  "rasha": 2,
-  "rashad": 1,
-  "rasheed": 1,
-  "rashid": 1,
-  "rashida": 2,
-  "rashmi": 2,
-  "rashne": 1,
-  "rasmus": 1,
-  "rastus": 1,
-  "ratan": 1,
-  "rathnait": 2,
-  "rati": 2,
-  "ratnam": 1,
-  "rauha": 2,
-  "raul": 1,
-  "rava": 2,
-  "raven": None,
-  "ravenna": 2,
-  "ravi": 1,
-  "ravindra": 1,
-  "rawiya": 2,
-  "rawya": 2,
-  "ray": 1,
-  "raya": 2,
-  "raymond": 1,
-  "raymonde": 2,
-  "raymund": 1,
-  "raymundo": 1,
-  "rayna": 2,
-  "raynard": 1,
-  "rayner": 1,
-  "raza": 1,
-  "razvan": 1,
-  "re": 1,
-  "read": 1,
-  "reagan": None,
-  "reah": 2,
-  "réamann": 1,
-  "reanna": 2,
-  "reannon": 2,
-  "rearden": 1,
-  "reba": 2,
-  "rebeca": 2,
-  "rébecca": 2,
-  "rebecca": 2,
-  "rebeccah": 2,
-  "rebeccanne": 2,
-  "rebecka": 2,
-  "rebeckah": 2,
-  "rebeka": 2,
-  "rebekah": 2,
-  "rebekka": 2,
-  "red": 1,
-  "redd": 1,
-  "redmond": 1,
-  "redmund": 1,
-  "reece": 1,
-  "reed": 1,
-  "reena": 2,
-  "reene": 2,
-  "reenie": 2,
-  "rees": 1,
-  "reese": 1,
-  "reeta": 2,
-  "reetta": 2,
-  "reg": 1,
-  "regan": 2,
-  "regana": 2,
-  "regena": 2,
-  "reggie": 1,
-  "regina": 2,
-  "reginald": 1,
-  "régine": 2,
-  "régis": 1,
-  "regula": 2,
-  "rei": 2,
-  "reid": 1,
-  "reijo": 1,
-  "reimund": 1,
-  "rein": 1,
-  "reina": 2,
-  "reinaldo": 1,
-  "reine": 2,
-  "reiner": 1,
-  "reinhard": 1,
-  "reinhilde": 2,
-  "reinhold": 1,
-  "rembrandt": 1,
-  "remedios": 2,
-  "remei": 2,
-  "rémi": 1,
-  "remiel": 1,
-  "remigio": 1,
-  "remo": 1,
-  "remus": 1,
-  "rémy": 1,
-  "ren": 2,
-  "rena": 2,
-  "renae": 2,
-  "renard": 1,
-  "renáta": 2,
-  "renata": 2,
-  "renate": 2,
-  "renato": 1,
-  "renatus": 1,
-  "renaud": 1,
-  "rené": 1,
-  "renée": 2,
-  "renie": 2,
-  "renita": 2,
-  "renzo": 1,
-  "retha": 2,
-  "reto": 1,
-  "reuben": 1,
-  "reuel": 1,
-  "reut": 2,
-  "reuven": 1,
-  "reva": 2,
-  "rex": 1,
-  "rexana": 2,
-  "rexanne": 2,
-  "reynaldo": 1,
-  "reynard": 1,
-  "reynaud": 1,
-  "reynold": 1,
-  "rhamantus": 2,
-  "rhbeen": 1,
-  "rhea": 2,
-  "rheanna": 2,
-  "rheinallt": 1,
-  "rhett": 1,
-  "rhetta": 2,
-  "rhian": 2,
-  "rhianna": 2,
-  "rhiannon": 2,
-  "rhianon": 2,
-  "rhianu": 2,
-  "rhisiart": 1,
-  "rhoda": 2,
-  "rhodri": 1,
-  "rhona": 2,
-  "rhonda": 2,
-  "rhonwen": 2,
-  "rhosyn": 2,
-  "rhydderch": 1,
-  "rhys": 1,
-  "ria": 2,
-  "rian": 1,
-  "riannon": 2,
-  "riaz": 1,
-  "rica": 2,
-  "ricarda": 2,
-  "ricardo": 1,
-  "riccarda": 2,
-  "riccardo": 1,
-  "rich": 1,
-  "richárd": 1,
-  "richard": 1,
-  "richardine": 2,
-  "richelle": 2,
-  "richendra": 2,
-  "richie": 1,
-  "richmal": 2,
-  "rick": 1,
-  "rickena": 2,
-  "rickey": 1,
-  "rickie": 1,
-  "ricky": 1,
-  "rico": 1,
-  "ridley": 1,
-  "rigby": 1,
-  "rigel": 1,
-  "ríghnach": 2,
-  "riikka": 2,
-  "riitta": 2,
-  "rik": 1,
-  "rika": 2,
-  "rikárd": 1,
-  "rikard": 1,
-  "rike": 2,
-  "rikhard": 1,
-  "rikke": 2,
-  "rikki": 2,
-  "riku": 1,
-  "riley": None,
-  "rilla": 2,
-  "rim": 2,
-  "rina": 2,
-  "rinaldo": 1,
-  "rino": 1,
-  "rio": 1,
-  "ríoghnach": 2,
-  "ríona": 2,
-  "ríonach": 2,
-  "riordan": 1,
-  "risteárd": 1,
-  "risto": 1,
-  "rita": 2,
-  "ritchie": 1,
-  "river": None,
-  "rivka": 2,
-  "rizwan": 1,
-  "roald": 1,
-  "roar": 1,
-  "rob": 1,
-  "robbie": None,
-  "robby": None,
-  "robena": 2,
-  "róbert": 1,
-  "robert": 1,
-  "roberta": 2,
-  "robertina": 2,
-  "roberto": 1,
-  "robi": 1,
-  "robin": None,
-  "robina": 2,
-  "robyn": 2,
-  "robynne": 2,
-  "roc": 1,
-  "rocco": 1,
-  "roch": 1,
-  "rochelle": 2,
-  "rocío": 2,
-  "rocky": 1,
-  "rod": 1,
-  "roddy": 1,
-  "roderic": 1,
-  "roderick": 1,
-  "rodge": 1,
-  "rodger": 1,
-  "rodica": 2,
-  "rodina": 2,
-  "rodion": 1,
-  "rodney": 1,
-  "rodolf": 1,
-  "rodolfo": 1,
-  "rodolph": 1,
-  "rodolphe": 1,
-  "rodrigo": 1,
-  "rodrigue": 1,
-  "rodya": 1,
-  "roel": 1,
-  "roeland": 1,
-  "rogelio": 1,
-  "roger": 1,
-  "rogerio": 1,
-  "rohan": 2,
-  "rohan": 1,
-  "rohesia": 1,
-  "roi": 1,
-  "roibeard": 1,
-  "róis": 2,
-  "róisín": 2,
-  "roksana": 2,
-  "rokuro": 1,
-  "rolan": 1,
-  "roland": 1,
-  "rolande": 2,
-  "rolando": 1,
-  "roldán": 1,
-  "rolf": 1,
-  "rolland": 1,
-  "rollo": 1,
-  "rolo": 1,
-  "rolph": 1,
-  "roly": 1,
-  "roma": 2,
-  "romain": 1,
-  "romaine": 2,
-  "roman": 1,
-  "romana": 2,
-  "romane": 2,
-  "romano": 1,
-  "romayne": 2,
-  "romeo": 1,
-  "romey": 2,
-  "romilda": 2,
-  "romina": 2,
-  "romola": 2,
-  "romolo": 1,
-  "romulus": 1,
-  "romy": 2,
-  "ron": None,
-  "ron": 1,
-  "rona": 2,
-  "ronald": 1,
-  "ronalda": 2,
-  "ronaldo": 1,
-  "rónán": 1,
-  "ronda": 2,
-  "ronen": 1,
-  "rong": None,
-  "roni": 2,
-  "ronit": 2,
-  "ronnette": 2,
-  "ronnie": None,
-  "ronny": 1,
-  "roope": 1,
-  "roopertti": 1,
-  "roosevelt": 1,
-  "roque": 1,
-  "rórdán": 1,
-  "rorie": 1,
-  "rory": 1,
-  "ros": 2,
-  "rosa": 2,
-  "rosabel": 2,
-  "rosabella": 2,
-  "rosalba": 2,
-  "rosaleen": 2,
-  "rosalia": 2,
-  "rosalie": 2,
-  "rosalin": 2,
-  "rosalina": 2,
-  "rosalind": 2,
-  "rosalinda": 2,
-  "rosaline": 2,
-  "rosalva": 2,
-  "rosalyn": 2,
-  "rosalynne": 2,
-  "rosamond": 2,
-  "rosamund": 2,
-  "rosangela": 2,
-  "rosanna": 2,
-  "rosannah": 2,
-  "rosanne": 2,
-  "rosario": 2,
-  "roscoe": 1,
-  "rose": 2,
-  "roseann": 2,
-  "roseanne": 2,
-  "rosella": 2,
-  "roselle": 2,
-  "roselyn": 2,
-  "rosemarie": 2,
-  "rosemary": 2,
-  "rosemonde": 2,
-  "rosetta": 2,
-  "rosette": 2,
-  "roshan": None,
-  "roshanara": 2,
-  "rosheen": 2,
-  "roshni": 2,
-  "rosie": 2,
-  "rosina": 2,
-  "rosine": 2,
-  "rosita": 2,
-  "roslyn": 2,
-  "ross": 1,
-  "rossella": 2,
-  "rostislav": 1,
-  "roswell": 1,
-  "roswitha": 2,
-  "rosy": 2,
-  "rowan": None,
-  "rowanne": 2,
-  "rowena": 2,
-  "rowina": 2,
-  "rowland": 1,
-  "rowley": 1,
-  "roxana": 2,
-  "roxane": 2,
-  "roxanna": 2,
-  "roxanne": 2,
-  "roxie": 2,
-  "roxy": 2,
-  "roy": 1,
-  "royal": 1,
-  "royale": 1,
-  "royce": 1,
-  "roydon": 1,
-  "royle": 1,
-  "royston": 1,
-  "roz": 2,
-  "róza": 2,
-  "roza": 2,
-  "rozabela": 2,
-  "rozália": 2,
-  "rozalija": 2,
-  "rozanne": 2,
-  "roze": 2,
-  "rózsa": 2,
-  "rózsi": 2,
-  "ru": 1,
-  "ruadhán": 1,
-  "ruaidhrí": 1,
-  "ruaidrí": 1,
-  "ruairí": 1,
-  "ruairi": 1,
-  "ruairidh": 1,
-  "ruaraidh": 1,
-  "ruaridh": 1,
-  "rube": 1,
-  "rubén": 1,
-  "ruben": 1,
-  "rubena": 2,
-  "rubina": 2,
-  "ruby": None,
-  "rubye": 2,
-  "ruchel": 2,
-  "rudi": 1,
-  "rüdiger": 1,
-  "rudo": 1,
-  "rudolf": 1,
-  "rudolph": 1,
-  "rudy": 1,
-  "rudyard": 1,
-  "rue": 2,
-  "rufina": 2,
-  "rufino": 1,
-  "rufus": 1,
-  "ruggero": 1,
-  "ruggiero": 1,
-  "rui": 1,
-  "rukmini": 2,
-  "runa": 2,
-  "rune": 1,
-  "rupert": 1,
-  "ruperta": 2,
-  "rupinder": 2,
-  "ruqayya": 2,
-  "rurik": 1,
-  "ruslan": 1,
-  "russ": 1,
-  "russel": 1,
-  "russell": 1,
-  "rustam": 1,
-  "rusty": 1,
-  "rut": 2,
-  "ruta": 2,
-  "rutger": 1,
-  "ruth": 2,
-  "ruthie": 2,
-  "ruuben": 1,
-  "ruud": 1,
-  "ruxandra": 2,
-  "ruy": 1,
-  "ryan": None,
-  "ryana": 2,
-  "ryanne": 2,
-  "rylan": 1,
-  "rylee": 2,
-  "ryley": 1,
-  "ryo": 1,
-  "ryota": 1,
-  "ryszard": 1,
-  "saara": 2,
-  "sabah": 2,
-  "sabas": 1,
-  "sabeen": 2,
-  "sabella": 2,
-  "sabia": 2,
-  "sabina": 2,
-  "sabine": 2,
-  "sabino": 1,
-  "sabrina": 2,
-  "saburo": 1,
-  "sacha": None,
-  "sachairi": 1,
-  "sacheverell": 1,
-  "sachie": 1,
-  "sachiko": 2,
-  "sachin": 1,
-  "sa'd": 1,
-  "sadaf": 2,
-  "sadb": 2,
-  "saddam": 1,
-  "sadhbh": 2,
-  "sa'dia": 2,
-  "sadie": 2,
-  "saffie": 2,
-  "saffron": 2,
-  "safira": 2,
-  "sage": None,
-  "sahar": 2,
-  "saibh": 2,
-  "sa'id": 1,
-  "sa'ida": 2,
-  "saiful": 1,
-  "saifullah": 1,
-  "sakari": 1,
-  "sakhr": 1,
-  "saki": 2,
-  "saku": 1,
-  "sakura": 2,
-  "sal": None,
-  "salacia": 2,
-  "salah": 1,
-  "salal": None,
-  "salamon": 1,
-  "saleem": 1,
-  "saleh": 1,
-  "salena": 2,
-  "salha": 2,
-  "salih": 1,
-  "salim": 1,
-  "salima": 2,
-  "salina": 2,
-  "salli": 2,
-  "sallie": 2,
-  "sally": 2,
-  "salma": 2,
-  "salman": 1,
-  "salomão": 1,
-  "salomé": 2,
-  "salome": 2,
-  "salomea": 2,
-  "salomon": 1,
-  "salud": 2,
-  "salut": 2,
-  "salvador": 1,
-  "salvalus": 1,
-  "salvatore": 1,
-  "sam": None,
-  "samanta": 2,
-  "samantha": 2,
-  "samara": 2,
-  "sameer": 1,
-  "sameera": 2,
-  "sami": 1,
-  "samina": 2,
-  "samir": 1,
-  "samira": 2,
-  "sammi": 2,
-  "sammie": None,
-  "sammy": None,
-  "samnang": None,
-  "samoyla": 1,
-  "sampson": 1,
-  "samson": 1,
-  "samu": 1,
-  "sámuel": 1,
-  "samuel": 1,
-  "samuela": 2,
-  "samuele": 1,
-  "samuil": 1,
-  "samuli": 1,
-  "san": None,
-  "sana'": 2,
-  "sana": 2,
-  "sanaz": 2,
-  "sancha": 2,
-  "sanchia": 2,
-  "sancho": 1,
-  "sanda": 2,
-  "sandalio": 1,
-  "sandeep": 1,
-  "sandford": 1,
-  "sandhya": 2,
-  "sandie": 2,
-  "sándor": 1,
-  "sandra": 2,
-  "sandrine": 2,
-  "sandro": 1,
-  "sandu": 1,
-  "sandy": None,
-  "sanford": 1,
-  "sango": 2,
-  "sani": 1,
-  "saniyya": 2,
-  "sanjay": 1,
-  "sanjeet": 1,
-  "sanjeev": 1,
-  "sanjit": 1,
-  "sanjiv": 1,
-  "sankar": 1,
-  "sanna": 2,
-  "sanne": 2,
-  "sans": 1,
-  "sansone": 1,
-  "santa": 2,
-  "santeri": 1,
-  "santiago": 1,
-  "santino": 1,
-  "santo": 1,
-  "santos": 1,
-  "santuzza": 2,
-  "sanya": 2,
-  "saoirse": 2,
-  "sapphira": 2,
-  "sapphire": 2,
-  "sappho": 2,
-  "sára": 2,
-  "sara": 2,
-  "sarah": 2,
-  "sarahjeanne": 2,
-  "sarai": 2,
-  "saraid": 2,
-  "saranna": 2,
-  "saraswati": 2,
-  "sarava": 1,
-  "sári": 2,
-  "sari": 2,
-  "sariah": 2,
-  "sárika": 2,
-  "sarina": 2,
-  "sarita": 2,
-  "sarosh": 1,
-  "sarra": 2,
-  "sascha": None,
-  "sasha": None,
-  "sashi": 1,
-  "saskia": 2,
-  "sassa": 2,
-  "satchel": None,
-  "satish": 1,
-  "satu": 2,
-  "saturn": 1,
-  "saturnina": 2,
-  "saturnino": 1,
-  "saturninus": 1,
-  "sauda": 2,
-  "saul": 1,
-  "saule": 2,
-  "saundra": 2,
-  "sava": 1,
-  "savalus": 1,
-  "savanna": 2,
-  "savannah": 2,
-  "savas": 1,
-  "saveli": 1,
-  "saverio": 1,
-  "savino": 1,
-  "savio": 1,
-  "savitri": 2,
-  "sawney": 1,
-  "sawyer": 1,
-  "sawyl": 1,
-  "saxon": 1,
-  "sayuri": 2,
-  "sayyid": 1,
-  "scarlet": 2,
-  "scarlett": 2,
-  "scevola": 1,
-  "scheherazade": 2,
-  "schwanhild": 2,
-  "scilla": 2,
-  "scot": 1,
-  "scott": 1,
-  "scottie": 1,
-  "scotty": 1,
-  "scout": 2,
-  "seachnall": 1,
-  "séafra": 1,
-  "seaghdh": 1,
-  "séaghdha": 1,
-  "séamas": 1,
-  "seamour": 1,
-  "séamus": 1,
-  "seán": 1,
-  "seanán": 1,
-  "séarlait": 2,
-  "séarlas": 1,
-  "sebastiaan": 1,
-  "sebastián": 1,
-  "sebastian": 1,
-  "sebastiana": 2,
-  "sebastiano": 1,
-  "sébastien": 1,
-  "sébastienne": 2,
-  "sebestyén": 1,
-  "sebestyen": 1,
-  "sechnall": 1,
-  "secundinus": 1,
-  "secundus": 1,
-  "seeta": 2,
-  "seetha": 2,
-  "sefton": 1,
-  "sefu": 1,
-  "sekar": 1,
-  "sekel": 1,
-  "sela": 2,
-  "selby": None,
-  "selena": 2,
-  "selene": 2,
-  "selig": 1,
-  "selim": 1,
-  "selima": 2,
-  "selina": 2,
-  "selma": 2,
-  "selvaggia": 2,
-  "selwyn": 1,
-  "semele": 2,
-  "semyon": 1,
-  "senan": 1,
-  "sence": 2,
-  "sender": 1,
-  "seneca": 1,
-  "senga": 2,
-  "sens": 2,
-  "seoc": 1,
-  "seoirse": 1,
-  "seona": 2,
-  "seonag": 2,
-  "seònaid": 2,
-  "seòras": 1,
-  "seòsaidh": 1,
-  "seosamh": 1,
-  "sepp": 1,
-  "seppel": 1,
-  "seppo": 1,
-  "september": None,
-  "septima": 2,
-  "septimus": 1,
-  "sequoia": 2,
-  "sera": 2,
-  "serafima": 2,
-  "serafina": 2,
-  "serafino": 1,
-  "seraphina": 2,
-  "seraphine": 2,
-  "seren": 2,
-  "serena": 2,
-  "serenity": 2,
-  "serge": 1,
-  "sergei": 1,
-  "sergio": 1,
-  "sergius": 1,
-  "serhat": 1,
-  "serina": 2,
-  "serrena": 2,
-  "servius": 1,
-  "sesto": 1,
-  "set": 1,
-  "seth": 1,
-  "sethunya": 2,
-  "seumas": 1,
-  "sevan": None,
-  "sevastian": 1,
-  "sevastyan": 1,
-  "seve": 1,
-  "severiano": 1,
-  "séverin": 1,
-  "severin": 1,
-  "severina": 2,
-  "sévérine": 2,
-  "severino": 1,
-  "severo": 1,
-  "seward": 1,
-  "sextus": 1,
-  "seymour": 1,
-  "shachar": None,
-  "shad": 1,
-  "shadi": 1,
-  "shadi": 2,
-  "shadrach": 1,
-  "shadya": 2,
-  "shae": None,
-  "shaelyn": 2,
-  "shafiq": 1,
-  "shafiqa": 2,
-  "shahar": None,
-  "shahira": 2,
-  "shahjahan": 1,
-  "shahnaz": 2,
-  "shahpur": 1,
-  "shahrazad": 2,
-  "shahriar": 1,
-  "shahrizad": 2,
-  "shahrokh": 1,
-  "shahzad": 1,
-  "shai": 1,
-  "shaina": 2,
-  "shaindel": 2,
-  "shakir": 1,
-  "shakira": 2,
-  "shakti": 2,
-  "shakuntala": 2,
-  "shalom": 1,
-  "shama": 2,
-  "shamgar": 1,
-  "shamira": 2,
-  "shamus": 1,
-  "shan": 2,
-  "shana": 2,
-  "shandar": 1,
-  "shane": 1,
-  "shanelle": 2,
-  "shanene": 2,
-  "shania": 2,
-  "shanice": 2,
-  "shanika": 2,
-  "shankar": 1,
-  "shankara": 1,
-  "shanna": 2,
-  "shannah": 2,
-  "shannon": None,
-  "shanta": 2,
-  "shantae": 2,
-  "shantel": 2,
-  "shantelle": 2,
-  "shanti": 2,
-  "shaquille": 1,
-  "sharalyn": 2,
-  "shareef": 1,
-  "shari": 2,
-  "sharif": 1,
-  "sharifa": 2,
-  "sharise": 2,
-  "sharla": 2,
-  "sharleen": 2,
-  "sharlene": 2,
-  "sharma": 1,
-  "sharmaine": 2,
-  "sharmila": 2,
-  "sharon": None,
-  "sharona": 2,
-  "sharron": 2,
-  "sharyl": 2,
-  "sharyn": 2,
-  "shashi": 1,
-  "shaun": 1,
-  "shauna": 2,
-  "shavonne": 2,
-  "shaw": 1,
-  "shawn": None,
-  "shawna": 2,
-  "shawnda": 2,
-  "shawnee": 2,
-  "shay": 1,
-  "shay": None,
-  "shayla": 2,
-  "shayna": 2,
-  "shaynah": 2,
-  "shea": None,
-  "sheamus": 1,
-  "sheard": 1,
-  "sheba": 1,
-  "sheela": 2,
-  "sheelagh": 2,
-  "sheena": 2,
-  "sheenagh": 2,
-  "sheherazade": 2,
-  "shehrevar": 1,
-  "sheila": 2,
-  "sheine": 2,
-  "shekhar": 1,
-  "shelagh": 2,
-  "shelby": None,
-  "sheldon": 1,
-  "shelena": 2,
-  "shelia": 2,
-  "shell": None,
-  "shelley": 2,
-  "shelly": 2,
-  "shem": 1,
-  "shena": 2,
-  "sheona": 2,
-  "sher": 1,
-  "sherah": 2,
-  "sheree": 2,
-  "shereen": 2,
-  "sheri": 2,
-  "sheridan": 1,
-  "sherie": 2,
-  "sherill": 2,
-  "sherilyn": 2,
-  "sherisse": 2,
-  "sherley": 2,
-  "sherlock": 1,
-  "sherman": 1,
-  "sherri": 2,
-  "sherrie": 2,
-  "sherry": 2,
-  "sheryl": 2,
-  "shevaun": 2,
-  "shevon": 2,
-  "shichiro": 1,
-  "shifra": 2,
-  "shiloh": 1,
-  "shimmel": 1,
-  "shimon": 1,
-  "shimshon": 1,
-  "shin": 1,
-  "shinju": 2,
-  "shiphrah": 2,
-  "shir": 2,
-  "shira": 2,
-  "shireen": 2,
-  "shirin": 2,
-  "shirlee": 2,
-  "shirley": None,
-  "shiro": 1,
-  "shirral": 2,
-  "shiva": 1,
-  "shlomo": 1,
-  "shmuel": 1,
-  "sho": 1,
-  "shobha": 2,
-  "sholto": 1,
-  "shona": 2,
-  "shonda": 2,
-  "shoshana": 2,
-  "shoshannah": 2,
-  "shprintza": 2,
-  "shprintze": 2,
-  "shprintzel": 2,
-  "shripati": 1,
-  "shug": 1,
-  "shui": None,
-  "shukri": 1,
-  "shukriyya": 2,
-  "shulamit": 2,
-  "shulamith": 2,
-  "shulammite": 2,
-  "shun": 2,
-  "shura": None,
-  "shyam": 1,
-  "shyama": 2,
-  "shyla": 2,
-  "sian": 2,
-  "siana": 2,
-  "siani": 2,
-  "siarl": 1,
-  "siavush": 1,
-  "sib": 1,
-  "sibéal": 2,
-  "sibilla": 2,
-  "sibyl": 2,
-  "sibylla": 2,
-  "sibylle": 2,
-  "sid": 1,
-  "siddharta": 1,
-  "siddhartha": 1,
-  "sidney": None,
-  "sidonie": 2,
-  "sidonius": 1,
-  "sidony": 2,
-  "sieffre": 1,
-  "siegbert": 1,
-  "siegfried": 1,
-  "sieghard": 1,
-  "sieghild": 2,
-  "sieglinde": 2,
-  "siegmund": 1,
-  "siemen": 1,
-  "siena": 2,
-  "sienna": 2,
-  "sierra": 2,
-  "sif": 2,
-  "sigeberht": 1,
-  "sigfrid": 1,
-  "sigi": None,
-  "sigismund": 1,
-  "sigiswald": 1,
-  "sigmund": 1,
-  "signe": 2,
-  "signy": 2,
-  "sigrid": 2,
-  "sigrún": 2,
-  "sigrun": 2,
-  "sigurd": 1,
-  "sigvard": 1,
-  "silas": 1,
-  "síle": 2,
-  "sìleas": 2,
-  "silja": 2,
-  "silje": 2,
-  "silke": 2,
-  "silvana": 2,
-  "silvano": 1,
-  "silvanus": 1,
-  "silver": None,
-  "silvester": 1,
-  "silvestra": 2,
-  "silvestre": 1,
-  "silvestro": 1,
-  "silvia": 2,
-  "silvija": 2,
-  "silvio": 1,
-  "silviu": 1,
-  "simão": 1,
-  "simba": 1,
-  "simcha": None,
-  "simeon": 1,
-  "simge": 2,
-  "simin": 2,
-  "simo": 1,
-  "simon": 1,
-  "simona": 2,
-  "simone": 1,
-  "simone": 2,
-  "simonetta": 2,
-  "simonette": 2,
-  "sinclair": 1,
-  "sindre": 1,
-  "sindri": 1,
-  "sindy": 2,
-  "síne": 2,
-  "sìne": 2,
-  "sinéad": 2,
-  "sìneag": 2,
-  "sini": 2,
-  "siobhan": 2,
-  "siofra": 2,
-  "sìoltach": 1,
-  "síomha": 2,
-  "siôn": 1,
-  "sioned": 2,
-  "siôr": 1,
-  "siors": 1,
-  "siorus": 1,
-  "siothrún": 1,
-  "sipho": 1,
-  "siran": 2,
-  "siri": 2,
-  "sirius": 1,
-  "sirvart": 2,
-  "sisel": 2,
-  "sisko": 2,
-  "sissie": 2,
-  "sissy": 2,
-  "sita": 2,
-  "sitara": 2,
-  "síthmaith": 2,
-  "siv": 2,
-  "sive": 2,
-  "siwan": 2,
-  "sjurd": 1,
-  "sky": None,
-  "skye": None,
-  "skylar": None,
-  "skyler": None,
-  "sláine": 2,
-  "slàine": 2,
-  "slavomir": 1,
-  "slawomir": 1,
-  "sloan": None,
-  "sloane": None,
-  "sly": 1,
-  "sobieslaw": 1,
-  "socrates": 1,
-  "sofia": 2,
-  "sofie": 2,
-  "sofija": 2,
-  "sofiya": 2,
-  "sofronio": 1,
-  "sohail": 1,
-  "sohrab": 1,
-  "sol": 1,
-  "sol": 2,
-  "solange": 2,
-  "soledad": 2,
-  "solly": 1,
-  "solomon": 1,
-  "solon": 1,
-  "solveig": 2,
-  "solvej": 2,
-  "solvig": 2,
-  "somerled": 1,
-  "somhairle": 1,
-  "sommer": 2,
-  "sonal": 2,
-  "sondra": 2,
-  "soner": 1,
-  "sonia": 2,
-  "sonja": 2,
-  "sonje": 2,
-  "sonnie": None,
-  "sonny": None,
-  "sonya": 2,
-  "sopheap": None,
-  "sophia": 2,
-  "sophie": 2,
-  "sophocles": 1,
-  "sophronia": 2,
-  "sophronius": 1,
-  "sophus": 1,
-  "sophy": 2,
-  "sora": 2,
-  "sorcha": 2,
-  "søren": 1,
-  "sorin": 1,
-  "sorina": 2,
-  "sorley": 1,
-  "sorrel": 2,
-  "sosigenes": 1,
-  "sosimo": 1,
-  "sostrate": 2,
-  "sotiria": 2,
-  "sotirios": 1,
-  "sotiris": 1,
-  "spartacus": 1,
-  "spencer": 1,
-  "spike": 1,
-  "spiridon": 1,
-  "spiro": 1,
-  "spiros": 1,
-  "spring": 2,
-  "sprita": 2,
-  "spurius": 1,
-  "spyridon": 1,
-  "spyro": 1,
-  "spyros": 1,
-  "sri": 2,
-  "sroel": 1,
-  "ssanyu": 2,
-  "stacee": 2,
-  "stacey": None,
-  "staci": 2,
-  "stacia": 2,
-  "stacie": 2,
-  "stacy": None,
-  "stafford": 1,
-  "stamatia": 2,
-  "stamatios": 1,
-  "stamatis": 1,
-  "stan": 1,
-  "stanford": 1,
-  "stanimir": 1,
-  "stanislas": 1,
-  "stanislav": 1,
-  "stanislava": 2,
-  "stanislaw": 1,
-  "stanislawa": 2,
-  "stanley": 1,
-  "star": 2,
-  "stasya": 2,
-  "stathis": 1,
-  "stavros": 1,
-  "steafan": 1,
-  "steaphan": 1,
-  "steen": 1,
-  "steenie": 1,
-  "stef": None,
-  "stefan": 1,
-  "stefana": 2,
-  "stefania": 2,
-  "stefanie": 2,
-  "stefano": 1,
-  "stefanos": 1,
-  "steffan": 1,
-  "steffen": 1,
-  "steffie": 2,
-  "stein": 1,
-  "stela": 2,
-  "stelara": 2,
-  "stelian": 1,
-  "stelios": 1,
-  "stella": 2,
-  "stellan": 1,
-  "sten": 1,
-  "stepan": 1,
-  "steph": None,
-  "stephan": 1,
-  "stéphane": 1,
-  "stephania": 2,
-  "stéphanie": 2,
-  "stephanie": 2,
-  "stephanos": 1,
-  "stephany": 2,
-  "stephen": 1,
-  "steren": 2,
-  "sterling": 1,
-  "sterre": 2,
-  "steve": 1,
-  "steven": 1,
-  "stevie": None,
-  "stew": 1,
-  "stewart": 1,
-  "stian": 1,
-  "stig": 1,
-  "stígandr": 1,
-  "stijn": 1,
-  "stina": 2,
-  "stiofán": 1,
-  "stirling": 1,
-  "storm": None,
-  "straton": 1,
-  "stribog": 1,
-  "stu": 1,
-  "stuart": 1,
-  "stylianos": 1,
-  "su": 2,
-  "subhash": 1,
-  "subira": 2,
-  "sudarshana": 1,
-  "sudhir": 1,
-  "sue": 2,
-  "suha": 2,
-  "suhail": 1,
-  "suhayl": 1,
-  "suibhne": 1,
-  "suibne": 1,
-  "sukie": 2,
-  "sulabha": 2,
-  "sulaiman": 1,
-  "sülayman": 1,
-  "süleiman": 1,
-  "süleyman": 1,
-  "sulislaw": 1,
-  "sullivan": 1,
-  "sulo": 1,
-  "suman": 1,
-  "sumantra": 1,
-  "sumati": None,
-  "sumayya": 2,
-  "sumiko": 2,
-  "summanus": 1,
-  "summer": 2,
-  "sunan": 1,
-  "sundar": 1,
-  "sundara": 1,
-  "sunday": 2,
-  "sunder": 1,
-  "sunil": 1,
-  "sunita": 2,
-  "sunitha": 2,
-  "suniti": 2,
-  "sunniva": 2,
-  "sunny": None,
-  "sunshine": 2,
-  "suraj": 1,
-  "suraya": 2,
-  "surendra": 1,
-  "suresh": 1,
-  "surinder": 1,
-  "surya": 1,
-  "susan": 2,
-  "susana": 2,
-  "susanita": 2,
-  "susanna": 2,
-  "susannah": 2,
-  "susanne": 2,
-  "suse": 2,
-  "susheela": 2,
-  "sushil": 1,
-  "sushila": 2,
-  "susie": 2,
-  "susumu": 1,
-  "suvi": 2,
-  "suzan": 2,
-  "suzana": 2,
-  "suzanna": 2,
-  "suzanne": 2,
-  "suzette": 2,
-  "suzie": 2,
-  "suzu": 2,
-  "suzume": 2,
-  "suzy": 2,
-  "svajone": 2,
-  "svana": 2,
-  "svanhild": 2,
-  "svanhildur": 2,
-  "svarog": 1,
-  "sven": 1,
-  "sverre": 1,
-  "sveta": 2,
-  "svetlana": 2,
-  "svjetlana": 2,
-  "svyatopolk": 1,
-  "svyatoslav": 1,
-  "swanhild": 2,
-  "swanhilda": 2,
-  "swanhilde": 2,
-  "swaran": 1,
-  "sweeney": 1,
-  "swietomierz": 1,
-  "swietopelk": 1,
-  "swietoslaw": 1,
-  "swithin": 1,
-  "swithun": 1,
-  "sybella": 2,
-  "sybil": 2,
-  "sybilla": 2,
-  "sybille": 2,
-  "syd": 1,
-  "sydne": 2,
-  "sydney": None,
-  "sylvain": 1,
-  "sylvaine": 2,
-  "sylvana": 2,
-  "sylvester": 1,
-  "sylvestre": 1,
-  "sylvia": 2,
-  "sylviane": 2,
-  "sylvianne": 2,
-  "sylvie": 2,
-  "sylwester": 1,
-  "sylwia": 2,
-  "symphony": 2,
-  "syntyche": 2,
-  "szabolcs": 1,
-  "szczepan": 1,
-  "szczesny": 1,
-  "szilárd": 1,
-  "szilveszter": 1,
-  "szilvia": 2,
-  "szymon": 1,
-  "taavetti": 1,
-  "taavi": 1,
-  "tabatha": 2,
-  "tabby": 2,
-  "tabea": 2,
-  "tabitha": 2,
-  "tacey": 2,
-  "tacita": 2,
-  "tacito": 1,
-  "tacitus": 1,
-  "tad": 1,
-  "taddeo": 1,
-  "tadej": 1,
-  "tadeo": 1,
-  "tadeu": 1,
-  "tadeusz": 1,
-  "tadg": 1,
-  "tadhg": 1,
-  "taegan": None,
-  "taffy": 1,
-  "tahnee": 2,
-  "tähti": 2,
-  "tahvo": 1,
-  "tai": None,
-  "taimi": 2,
-  "takako": 2,
-  "takashi": 1,
-  "takehiko": 2,
-  "takeshi": 1,
-  "takouhi": 2,
-  "takumi": 1,
-  "tal": None,
-  "talbot": 1,
-  "taletta": 2,
-  "talfryn": 1,
-  "talia": 2,
-  "taliba": 2,
-  "taliesin": 1,
-  "taline": 2,
-  "talitha": 2,
-  "tallulah": 2,
-  "talulla": 2,
-  "talya": 2,
-  "tam": 1,
-  "tamar": 2,
-  "tamara": 2,
-  "tamás": 1,
-  "tamati": 1,
-  "tameka": 2,
-  "tamera": 2,
-  "tami": 2,
-  "tamia": 2,
-  "tamid": 1,
-  "tamika": 2,
-  "tamiko": 2,
-  "tamir": 1,
-  "tammaro": 1,
-  "tammi": 2,
-  "tammie": 2,
-  "tammy": 2,
-  "tamra": 2,
-  "tamsen": 2,
-  "tamsin": 2,
-  "tamson": 2,
-  "tamzen": 2,
-  "tancred": 1,
-  "tancredo": 1,
-  "taneka": 2,
-  "taneli": 1,
-  "tanesha": 2,
-  "tania": 2,
-  "tanika": 2,
-  "tanis": 2,
-  "tanisha": 2,
-  "tanit": 2,
-  "tanith": 2,
-  "tanja": 2,
-  "tanner": None,
-  "tansy": 2,
-  "tanya": 2,
-  "tanzi": 2,
-  "tapani": 1,
-  "tapio": 1,
-  "tara": 2,
-  "taranis": 1,
-  "taras": 1,
-  "tarek": 1,
-  "tarina": 2,
-  "tariq": 1,
-  "tarmo": 1,
-  "taro": 1,
-  "tarquin": 1,
-  "taryn": 2,
-  "tasgall": 1,
-  "tasha": 2,
-  "taskill": 1,
-  "tate": None,
-  "tatiana": 2,
-  "tatianna": 2,
-  "tatienne": 2,
-  "tatjana": 2,
-  "tatton": 1,
-  "tatu": 1,
-  "tatum": 2,
-  "tatyana": 2,
-  "tatyanna": 2,
-  "tau": 1,
-  "tawfiq": 1,
-  "tawnie": 2,
-  "tawny": 2,
-  "tayler": None,
-  "taylor": None,
-  "teagan": None,
-  "teague": 1,
-  "teal": 2,
-  "teale": 2,
-  "tearach": 1,
-  "teàrlach": 1,
-  "teàrlag": 2,
-  "teasag": 2,
-  "teca": 2,
-  "tecla": 2,
-  "tecumseh": 1,
-  "ted": 1,
-  "teddy": 1,
-  "teemu": 1,
-  "tegan": None,
-  "tegwen": 2,
-  "tehila": 2,
-  "teige": 1,
-  "teigue": 1,
-  "teivel": 1,
-  "tekla": 2,
-  "tel": 1,
-  "telesphore": 1,
-  "telma": 2,
-  "teman": 1,
-  "temani": 1,
-  "temel": 1,
-  "temitope": 2,
-  "temperance": 2,
-  "tempest": 2,
-  "temple": None,
-  "temujin": 1,
-  "tendai": 2,
-  "tennyson": 1,
-  "tenskwatawa": 1,
-  "teodor": 1,
-  "teodora": 2,
-  "teodoro": 1,
-  "teodors": 1,
-  "teodosio": 1,
-  "teofil": 1,
-  "teofilo": 1,
-  "teppo": 1,
-  "tera": 2,
-  "terach": 1,
-  "terah": 1,
-  "terance": 1,
-  "tercero": 1,
-  "tere": 2,
-  "terence": 1,
-  "terenzio": 1,
-  "teresa": 2,
-  "terese": 2,
-  "teresinha": 2,
-  "teréz": 2,
-  "tereza": 2,
-  "terézia": 2,
-  "terezija": 2,
-  "terezinha": 2,
-  "teri": 2,
-  "teris": 1,
-  "terminus": 1,
-  "tero": 1,
-  "terpsichore": 2,
-  "terra": 2,
-  "terrance": 1,
-  "terrell": 1,
-  "terrence": 1,
-  "terri": 2,
-  "terrie": 2,
-  "terry": None,
-  "tertius": 1,
-  "tess": 2,
-  "tessa": 2,
-  "tessie": 2,
-  "tetty": 2,
-  "teunis": 1,
-  "teuvo": 1,
-  "tevye": 1,
-  "tex": 1,
-  "thabo": 1,
-  "thad": 1,
-  "thaddeus": 1,
-  "thais": 2,
-  "thales": 1,
-  "thalia": 2,
-  "than": 1,
-  "thanatos": 1,
-  "thane": 1,
-  "thanh": None,
-  "thea": 2,
-  "thecla": 2,
-  "theda": 2,
-  "theirn": 1,
-  "thekla": 2,
-  "thelma": 2,
-  "thelonius": 1,
-  "themis": 2,
-  "themistocles": 1,
-  "théo": 1,
-  "theo": 1,
-  "theobald": 1,
-  "theocritus": 1,
-  "theodor": 1,
-  "theodora": 2,
-  "théodore": 1,
-  "theodore": 1,
-  "theodoric": 1,
-  "theodoros": 1,
-  "theodosia": 2,
-  "theodosius": 1,
-  "theodotus": 1,
-  "theophania": 2,
-  "theophila": 2,
-  "théophile": 1,
-  "theophilus": 1,
-  "theophylaktos": 1,
-  "therapon": 1,
-  "theresa": 2,
-  "thérèse": 2,
-  "theresia": 2,
-  "theron": 1,
-  "theseus": 1,
-  "theunis": 1,
-  "thi": 2,
-  "thiago": 1,
-  "thibault": 1,
-  "thibaut": 1,
-  "thierry": 1,
-  "thirza": 2,
-  "thom": 1,
-  "thomas": 1,
-  "thomasina": 2,
-  "þór": 1,
-  "thor": 1,
-  "thora": 2,
-  "þórbjörn": 1,
-  "thorbjörn": 1,
-  "thorborg": 2,
-  "thorburn": 1,
-  "þórdís": 2,
-  "þórir": 1,
-  "thorley": 1,
-  "thornton": 1,
-  "þórr": 1,
-  "þórstein": 1,
-  "thorstein": 1,
-  "thorvald": 1,
-  "thoth": 1,
-  "thracius": 1,
-  "thu": 2,
-  "thuán": 1,
-  "thucydides": 1,
-  "thunor": 1,
-  "thurayya": 2,
-  "thurstan": 1,
-  "thutmose": 1,
-  "thuy": 2,
-  "thyra": 2,
-  "thyrza": 2,
-  "tia": 2,
-  "tiago": 1,
-  "tiamat": 2,
-  "tiana": 2,
-  "tianna": 2,
-  "tiara": 2,
-  "tiarnach": 1,
-  "tiarnan": 1,
-  "tibby": 1,
-  "tiberius": 1,
-  "tibor": 1,
-  "tiborc": 1,
-  "tiburcio": 1,
-  "tiede": 1,
-  "tien": 2,
-  "tiernan": 1,
-  "tierney": 1,
-  "tierra": 2,
-  "tiffani": 2,
-  "tiffany": 2,
-  "tiger": 1,
-  "tigernach": 1,
-  "tigernán": 1,
-  "tighearnach": 1,
-  "tighearnán": 1,
-  "tiina": 2,
-  "tikhon": 1,
-  "tilda": 2,
-  "till": 1,
-  "tillie": 2,
-  "tillo": 1,
-  "tilly": 2,
-  "tim": 1,
-  "timaeus": 1,
-  "tímea": 2,
-  "timeus": 1,
-  "timmy": 1,
-  "timo": 2,
-  "timo": 1,
-  "timofei": 1,
-  "timon": 1,
-  "timotei": 1,
-  "timotej": 1,
-  "timoteo": 1,
-  "timoteus": 1,
-  "timotha": 2,
-  "timothea": 2,
-  "timothée": 1,
-  "timothy": 1,
-  "timoti": 1,
-  "tina": 2,
-  "tinek": 1,
-  "tinuviel": 2,
-  "tipene": 1,
-  "tiphanie": 2,
-  "tiras": 1,
-  "tirzah": 2,
-  "tisha": 2,
-  "titania": 2,
-  "titilayo": 2,
-  "tito": 1,
-  "titty": 2,
-  "titus": 1,
-  "tivadar": 1,
-  "tivoli": None,
-  "tiw": 1,
-  "tiwlip": 2,
-  "tiziana": 2,
-  "tiziano": 1,
-  "tlaloc": 1,
-  "toal": 1,
-  "tobiah": 1,
-  "tobias": 1,
-  "tobin": 1,
-  "toby": None,
-  "tod": 1,
-  "todd": 1,
-  "todor": 1,
-  "toiba": 2,
-  "toinette": 2,
-  "toini": 2,
-  "toirdhealbhach": 1,
-  "toiréasa": 2,
-  "toivo": 1,
-  "tola": 2,
-  "tolly": 1,
-  "tom": 1,
-  "toma": 1,
-  "toma": 2,
-  "tòmas": 1,
-  "tomás": 1,
-  "tomas": 1,
-  "tomasa": 2,
-  "tomasz": 1,
-  "tomaz": 1,
-  "tomer": 1,
-  "tomi": 1,
-  "tomiko": 2,
-  "tomislav": 1,
-  "tomislava": 2,
-  "tommaso": 1,
-  "tommi": 1,
-  "tommie": None,
-  "tommy": 1,
-  "tomos": 1,
-  "tondra": 2,
-  "toni": 2,
-  "toni": 1,
-  "tonia": 2,
-  "tonio": 1,
-  "tonka": 2,
-  "tony": 1,
-  "tonya": 2,
-  "topaz": 2,
-  "topher": 1,
-  "topi": 1,
-  "topsy": 2,
-  "tor": 1,
-  "tora": 2,
-  "torben": 1,
-  "torbjörn": 1,
-  "torborg": 2,
-  "torcall": 1,
-  "tordis": 2,
-  "tore": 1,
-  "torgeir": 1,
-  "torger": 1,
-  "torhild": 2,
-  "tori": 2,
-  "toria": 2,
-  "toribio": 1,
-  "toril": 1,
-  "torin": 1,
-  "torkel": 1,
-  "tormod": 1,
-  "torquil": 1,
-  "torsten": 1,
-  "torvald": 1,
-  "totty": 2,
-  "toussaint": 1,
-  "tova": 2,
-  "tovah": 2,
-  "tovia": 2,
-  "toya": 2,
-  "trace": None,
-  "tracee": 2,
-  "tracey": None,
-  "traci": 2,
-  "tracie": 2,
-  "tracy": None,
-  "trafford": None,
-  "trahaearn": 1,
-  "traherne": 1,
-  "trai": 1,
-  "traian": 1,
-  "trajan": 1,
-  "tranter": 1,
-  "travers": 1,
-  "travis": 1,
-  "treasa": 2,
-  "trecia": 2,
-  "trefor": 1,
-  "trent": 1,
-  "trenton": 1,
-  "tresha": 2,
-  "trev": 1,
-  "trevelyan": 1,
-  "trevor": 1,
-  "trey": 1,
-  "tria": 2,
-  "tricia": 2,
-  "trijntje": 2,
-  "trina": 2,
-  "trine": 2,
-  "trini": 2,
-  "trinidad": None,
-  "trinity": 2,
-  "trish": 2,
-  "trisha": 2,
-  "trista": 2,
-  "tristán": 1,
-  "tristan": 1,
-  "tristand": 1,
-  "tristão": 1,
-  "tristen": 1,
-  "tristin": 1,
-  "triston": 1,
-  "tristram": 1,
-  "trix": 2,
-  "trixie": 2,
-  "troy": 1,
-  "trudi": 2,
-  "trudie": 2,
-  "trudy": 2,
-  "trueman": 1,
-  "truman": 1,
-  "tryggve": 1,
-  "trygve": 1,
-  "tryphena": 2,
-  "tryphon": 1,
-  "tryphosa": 2,
-  "trystan": 1,
-  "tsholofelo": 2,
-  "tu": None,
-  "tuan": 1,
-  "tuathal": 1,
-  "tucker": 1,
-  "tudor": 1,
-  "tudur": 1,
-  "tue": 1,
-  "tuija": 2,
-  "tullia": 2,
-  "tullio": 1,
-  "tully": 1,
-  "tunç": 1,
-  "tünde": 2,
-  "tündér": 2,
-  "tuomas": 1,
-  "tuomo": 1,
-  "tuor": 1,
-  "ture": 1,
-  "turin": 1,
-  "turlough": 1,
-  "tutankhamon": 1,
-  "tuulikki": 2,
-  "tuvya": 1,
-  "tuyên": 2,
-  "tuyet": 2,
-  "twdor": 1,
-  "twila": 2,
-  "twyla": 2,
-  "txomin": 1,
-  "ty": 1,
-  "tybalt": 1,
-  "tycho": 1,
-  "tye": 1,
-  "tyge": 1,
-  "tyko": 1,
-  "tylar": 1,
-  "tyler": None,
-  "tylor": 1,
-  "tymoteusz": 1,
-  "tyr": 1,
-  "tyra": 2,
-  "tyreek": 1,
-  "tyrell": 1,
-  "tyrese": 1,
-  "tyrik": 1,
-  "tyriq": 1,
-  "tyrone": 1,
-  "tyrrell": 1,
-  "tyson": 1,
-  "tzeitel": 2,
-  "tziporah": 2,
-  "tzofiya": 2,
-  "tzufit": 2,
-  "uaithne": 1,
-  "ualan": 1,
-  "uberto": 1,
-  "udo": 1,
-  "ugo": 1,
-  "uilleag": 1,
-  "uilleam": 1,
-  "uilliam": 1,
-  "uinseann": 1,
-  "ùisdean": 1,
-  "ukko": 1,
-  "uland": 1,
-  "ulbrecht": 1,
-  "ulf": 1,
-  "ulick": 1,
-  "ulises": 1,
-  "ulisse": 1,
-  "ulisses": 1,
-  "ulla": 2,
-  "ulric": 1,
-  "ulrica": 2,
-  "ulrich": 1,
-  "ulrik": 1,
-  "ulrika": 2,
-  "ulrike": 2,
-  "ultan": 1,
-  "ulyssa": 2,
-  "ulysses": 1,
-  "uma": 2,
-  "umar": 1,
-  "umberto": 1,
-  "ume": 2,
-  "una": 2,
-  "undine": 2,
-  "unice": 2,
-  "unique": 2,
-  "unity": 2,
-  "upton": 1,
-  "urania": 2,
-  "uranus": 1,
-  "urbain": 1,
-  "urban": 1,
-  "urbana": 2,
-  "urbano": 1,
-  "uri": 1,
-  "uriah": 1,
-  "urias": 1,
-  "uriel": 1,
-  "urien": 1,
-  "urjasz": 1,
-  "urs": 1,
-  "ursel": 2,
-  "ursella": 2,
-  "ursula": 2,
-  "urszula": 2,
-  "urvakhsha": 1,
-  "usagi": 2,
-  "usama": 1,
-  "uschi": 2,
-  "usha": 2,
-  "usko": 1,
-  "usman": 1,
-  "usoa": 2,
-  "ustinya": 2,
-  "ute": 2,
-  "uthman": 1,
-  "utz": 1,
-  "uwe": 1,
-  "uzi": 1,
-  "uzma": 2,
-  "uzziah": 1,
-  "uzziel": 1,
-  "václav": 1,
-  "václava": 2,
-  "vadim": 1,
-  "vahan": 1,
-  "val": None,
-  "valarie": 2,
-  "valary": 2,
-  "valda": 2,
-  "valdemar": 1,
-  "valdis": 2,
-  "valencia": 2,
-  "valentín": 1,
-  "valentin": 1,
-  "valentina": 2,
-  "valentine": 1,
-  "valentine": 2,
-  "valentino": 1,
-  "valère": 1,
-  "valéria": 2,
-  "valeria": 2,
-  "valerian": 1,
-  "valeriana": 2,
-  "valérie": 2,
-  "valerie": 2,
-  "valerija": 2,
-  "valerio": 1,
-  "valeriu": 1,
-  "valerius": 1,
-  "valeriya": 2,
-  "valéry": 1,
-  "valeska": 2,
-  "vali": 1,
-  "valkyrie": 2,
-  "valora": 2,
-  "valorie": 2,
-  "valter": 1,
-  "valtteri": 1,
-  "van": 1,
-  "vanamo": 2,
-  "vance": 1,
-  "vanda": 2,
-  "vanessa": 2,
-  "vangelis": 1,
-  "vanja": 2,
-  "vanna": None,
-  "vanya": 1,
-  "varda": 2,
-  "vardah": 2,
-  "varfolomei": 1,
-  "varg": 1,
-  "varinia": 2,
-  "varinius": 1,
-  "varius": 1,
-  "varlam": 1,
-  "vartouhi": 2,
-  "varvara": 2,
-  "varya": 2,
-  "vasant": 1,
-  "vasanta": 2,
-  "vasco": 1,
-  "vashti": 2,
-  "vasil": 1,
-  "vasile": 1,
-  "vasili": 1,
-  "vasilica": 1,
-  "vasilios": 1,
-  "vasilisa": 2,
-  "vasilka": 2,
-  "vasily": 1,
-  "vassily": 1,
-  "vasu": 1,
-  "vasya": 1,
-  "vaughan": 1,
-  "vaughn": 1,
-  "vavrinec": 1,
-  "veasna": 1,
-  "veca": 2,
-  "veera": 2,
-  "velda": 2,
-  "veli": 1,
-  "velia": 2,
-  "velma": 2,
-  "velvel": 1,
-  "velvela": 2,
-  "vena": 2,
-  "vencel": 1,
-  "venceslao": 1,
-  "venceslás": 1,
-  "venceslav": 1,
-  "venetia": 2,
-  "veniamin": 1,
-  "venka": 2,
-  "venkat": 1,
-  "venus": 2,
-  "venyamin": 1,
-  "vera": 2,
-  "vercingetorix": 1,
-  "vere": 1,
-  "vered": 2,
-  "verena": 2,
-  "vergil": 1,
-  "verity": 2,
-  "vern": 1,
-  "verna": 2,
-  "verner": 1,
-  "vernon": 1,
-  "verona": 2,
-  "verónica": 2,
-  "verônica": 2,
-  "veronica": 2,
-  "veronika": 2,
-  "véronique": 2,
-  "vesa": 1,
-  "vesna": 2,
-  "vespasian": 1,
-  "vespasiano": 1,
-  "vespasien": 1,
-  "vespera": 2,
-  "vesta": 2,
-  "vester": 1,
-  "veva": 2,
-  "vi": 2,
-  "vibeke": 2,
-  "vibol": 1,
-  "vic": None,
-  "vicente": 1,
-  "vicki": 2,
-  "vickie": 2,
-  "vicky": 2,
-  "vico": 1,
-  "victoire": 2,
-  "víctor": 1,
-  "victor": 1,
-  "victoria": 2,
-  "victorine": 2,
-  "victorino": 1,
-  "victorius": 1,
-  "vid": 1,
-  "vida": 1,
-  "vidal": 1,
-  "vidar": 1,
-  "vidya": 2,
-  "vien": 1,
-  "vienne": 2,
-  "viggo": 1,
-  "vijay": 1,
-  "vijaya": 2,
-  "vikki": 2,
-  "vikram": 1,
-  "viktor": 1,
-  "viktória": 2,
-  "viktoria": 2,
-  "vilchjo": 1,
-  "vilem": 1,
-  "vilfred": 1,
-  "vilhelm": 1,
-  "vilhelmi": 1,
-  "vilhelmiina": 2,
-  "vilhelmo": 1,
-  "vilhelms": 1,
-  "vilhjálmur": 1,
-  "vili": 1,
-  "viljami": 1,
-  "viljem": 1,
-  "vilko": 1,
-  "ville": 1,
-  "vilma": 2,
-  "vilmar": 1,
-  "vilmos": 1,
-  "vilppu": 1,
-  "vin": 1,
-  "vina": 2,
-  "vinal": 1,
-  "vinay": 1,
-  "vince": 1,
-  "vincenc": 1,
-  "vincent": 1,
-  "vincentas": 1,
-  "vincente": 1,
-  "vincenza": 2,
-  "vincenzo": 1,
-  "vinh": 2,
-  "vinko": 1,
-  "vinnie": 1,
-  "vinzenz": 1,
-  "viola": 2,
-  "violet": 2,
-  "violeta": 2,
-  "violetta": 2,
-  "violette": 2,
-  "viorel": 1,
-  "viorica": 2,
-  "vipul": 1,
-  "virgee": 2,
-  "virgie": 2,
-  "virgil": 1,
-  "virgilio": 1,
-  "virginia": 2,
-  "virginie": 2,
-  "vishal": 1,
-  "vishnu": 1,
-  "visitacíon": 2,
-  "visnja": 2,
-  "vít": 1,
-  "vita": 2,
-  "vitale": 1,
-  "vitali": 1,
-  "vitalia": 2,
-  "vito": 1,
-  "vitor": 1,
-  "vittore": 1,
-  "vittoria": 2,
-  "vittorino": 1,
-  "vittorio": 1,
-  "vitus": 1,
-  "vitya": 1,
-  "viveka": 2,
-  "vivian": None,
-  "viviana": 2,
-  "viviane": 2,
-  "vivien": None,
-  "vivienne": 2,
-  "viviette": 2,
-  "vivyan": 2,
-  "vjeko": 1,
-  "vjekoslav": 1,
-  "vjekoslava": 2,
-  "vlad": 1,
-  "vladilen": 1,
-  "vladimir": 1,
-  "vladimír": 1,
-  "vladimira": 2,
-  "vladislav": 1,
-  "vladislava": 2,
-  "vlaho": 1,
-  "vlasi": 1,
-  "voirrey": 2,
-  "voitto": 1,
-  "vojtech": 1,
-  "volkan": 1,
-  "volker": 1,
-  "volodya": 1,
-  "volodymyr": 1,
-  "volos": 1,
-  "völund": 1,
-  "volya": 1,
-  "vonda": 2,
-  "vortigern": 1,
-  "vosgi": 2,
-  "vreni": 2,
-  "vsevolod": 1,
-  "vulcan": 1,
-  "vyacheslav": 1,
-  "vytautas": 1,
-  "waclaw": 1,
-  "wade": 1,
-  "waheed": 1,
-  "waheeda": 2,
-  "wahid": 1,
-  "wahida": 2,
-  "walburga": 2,
-  "waldemar": 1,
-  "waldo": 1,
-  "walenty": 1,
-  "walid": 1,
-  "walker": 1,
-  "wallace": 1,
-  "wallis": None,
-  "wally": None,
-  "walt": 1,
-  "walter": 1,
-  "walther": 1,
-  "walton": 1,
-  "waltraud": 2,
-  "wanda": 2,
-  "wapasha": 1,
-  "ward": 1,
-  "wardell": 1,
-  "warner": 1,
-  "warren": 1,
-  "warwick": 1,
-  "washington": 1,
-  "wasim": 1,
-  "wassim": 1,
-  "wasswa": 1,
-  "wat": 1,
-  "wawrzyniec": 1,
-  "wayland": 1,
-  "waylon": 1,
-  "wayne": 1,
-  "webster": 1,
-  "wei": 1,
-  "wekesa": 1,
-  "weldon": 1,
-  "wen": 2,
-  "wenceslas": 1,
-  "wenda": 2,
-  "wendel": 1,
-  "wendell": 1,
-  "wendi": 2,
-  "wendy": 2,
-  "wenona": 2,
-  "wenonah": 2,
-  "wenzel": 1,
-  "wenzeslaus": 1,
-  "wera": 2,
-  "werner": 1,
-  "werther": 1,
-  "wesley": 1,
-  "weston": 1,
-  "whitaker": 1,
-  "whitney": None,
-  "wibeke": 2,
-  "wickaninnish": 1,
-  "widad": 2,
-  "wiebe": 1,
-  "wiebke": 2,
-  "wieland": 1,
-  "wielislaw": 1,
-  "wieslaw": 1,
-  "wieslawa": 2,
-  "wigburg": 2,
-  "wikolia": 2,
-  "wiktor": 1,
-  "wiktoria": 2,
-  "wil": 1,
-  "wilbert": 1,
-  "wilbur": 1,
-  "wilburn": 1,
-  "wilda": 2,
-  "wiley": 1,
-  "wilf": 1,
-  "wilford": 1,
-  "wilfred": 1,
-  "wilfreda": 2,
-  "wilfredo": 1,
-  "wilfrid": 1,
-  "wilfried": 1,
-  "wilhelm": 1,
-  "wilhelmina": 2,
-  "wilkie": 1,
-  "will": 1,
-  "willa": 2,
-  "willard": 1,
-  "willem": 1,
-  "william": 1,
-  "willie": None,
-  "willis": 1,
-  "willoughby": 1,
-  "willow": 2,
-  "willy": 1,
-  "wilma": 2,
-  "wilmer": 1,
-  "wilmot": 1,
-  "wilson": 1,
-  "wilton": 1,
-  "wim": 1,
-  "wincenty": 1,
-  "windsor": 1,
-  "winfred": 1,
-  "winfried": 1,
-  "winifred": 2,
-  "winnie": 2,
-  "winnifred": 2,
-  "winona": 2,
-  "winston": 1,
-  "winter": 2,
-  "winthrop": 1,
-  "winton": 1,
-  "wiremu": 1,
-  "wisdom": None,
-  "wislaw": 1,
-  "witold": 1,
-  "wladyslaw": 1,
-  "wlodek": 1,
-  "wlodzimierz": 1,
-  "wlodzislaw": 1,
-  "woden": 1,
-  "wojciech": 1,
-  "wojtek": 1,
-  "wolf": 1,
-  "wolfgang": 1,
-  "wolfram": 1,
-  "wolodymyr": 1,
-  "woodrow": 1,
-  "woody": 1,
-  "wotan": 1,
-  "wouter": 1,
-  "wren": 2,
-  "wright": 1,
-  "wu": 1,
-  "wyatt": 1,
-  "wybert": 1,
-  "wymond": 1,
-  "wyn": 1,
-  "wynfor": 1,
-  "wynn": 1,
-  "wynne": None,
-  "wynonna": 2,
-  "wynter": 2,
-  "wystan": 1,
-  "xabier": 1,
-  "xander": 1,
-  "xandra": 2,
-  "xanthe": 2,
-  "xanthia": 2,
-  "xanthippe": 2,
-  "xara": 2,
-  "xaver": 1,
-  "xavia": 2,
-  "xaviar": 1,
-  "xavier": 1,
-  "xaviera": 2,
-  "xavior": 1,
-  "xena": 2,
-  "xene": 2,
-  "xenia": 2,
-  "xenocrates": 1,
-  "xenon": 1,
-  "xenophon": 1,
-  "xerxes": 1,
-  "xiang": None,
-  "ximena": 2,
-  "ximun": 1,
-  "xiomara": 2,
-  "xoán": 1,
-  "xochilt": 2,
-  "xochipilli": 1,
-  "xochiquetzal": 2,
-  "xochitl": 2,
-  "xosé": 1,
-  "xuan": None,
-  "xue": None,
-  "xun": 1,
-  "xyleena": 2,
-  "xylia": 2,
-  "xylina": 2,
-  "xzavier": 1,
-  "yaa": 2,
-  "yachin": 1,
-  "yachna": 2,
-  "yadira": 2,
-  "yael": 2,
-  "yaffa": 2,
-  "yahveh": 1,
-  "yahweh": 1,
-  "yahya": 1,
-  "yakim": 1,
-  "yakov": 1,
-  "yale": 1,
-  "yan": 1,
-  "yanick": None,
-  "yankel": 1,
-  "yann": 1,
-  "yannic": None,
-  "yannick": None,
-  "yannis": 1,
-  "yarden": 1,
-  "yardena": 2,
-  "yaromira": 2,
-  "yaron": None,
-  "yaropolk": 1,
-  "yaroslav": 1,
-  "yaroslava": 2,
-  "yasamin": 2,
-  "yasha": 1,
-  "yashmine": 2,
-  "yasir": 1,
-  "yasmin": 2,
-  "yasmina": 2,
-  "yasmine": 2,
-  "yasser": 1,
-  "yasu": 2,
-  "yavuz": 1,
-  "yaw": 1,
-  "yazmin": 2,
-  "yechezkel": 1,
-  "yehiel": 1,
-  "yehudah": 1,
-  "yehudi": 1,
-  "yehudit": 2,
-  "yejide": 2,
-  "yelena": 2,
-  "yelizaveta": 2,
-  "yen": 2,
-  "yente": 2,
-  "yentl": None,
-  "yered": 1,
-  "yermolai": 1,
-  "yesenia": 2,
-  "yessenia": 2,
-  "yeva": 2,
-  "yevgeni": 1,
-  "yevgeniya": 2,
-  "yevgeny": 1,
-  "yewande": 2,
-  "yidel": 2,
-  "yildiz": 2,
-  "yin": 2,
-  "yitzhak": 1,
-  "ylva": 2,
-  "yngvar": 1,
-  "yngve": 1,
-  "yoav": 1,
-  "yochanan": 1,
-  "yoel": 1,
-  "yoko": 2,
-  "yolanda": 2,
-  "yolande": 2,
-  "yolonda": 2,
-  "yonah": 1,
-  "yonatan": 1,
-  "yonca": 2,
-  "yong": None,
-  "yorath": 1,
-  "yori": 1,
-  "yorick": 1,
-  "york": 1,
-  "yosef": 1,
-  "yoshi": None,
-  "yoshiko": 2,
-  "yoshiro": 1,
-  "young": None,
-  "yousef": 1,
-  "youssef": 1,
-  "yrjänä": 1,
-  "yrjö": 1,
-  "ysabel": 2,
-  "yseult": 2,
-  "yu": None,
-  "yudel": 1,
-  "yuki": 1,
-  "yukiko": 2,
-  "yuko": 2,
-  "yulia": 2,
-  "yuliana": 2,
-  "yuliya": 2,
-  "yumi": 2,
-  "yun": 2,
-  "yuri": 2,
-  "yuri": 1,
-  "yuriy": 1,
-  "yusef": 1,
-  "yushua": 1,
-  "yusra": 2,
-  "yussel": 1,
-  "yusuf": 1,
-  "yutke": 2,
-  "yuval": 1,
-  "yvain": 1,
-  "yvan": 1,
-  "yves": 1,
-  "yvette": 2,
-  "yvo": 1,
-  "yvon": 1,
-  "yvonne": 2,
-  "zabel": 2,
-  "zacarías": 1,
-  "zacchaeus": 1,
-  "zach": 1,
-  "zachariah": 1,
-  "zacharias": 1,
-  "zacharie": 1,
-  "zacharjasz": 1,
-  "zachary": 1,
-  "zachery": 1,
-  "zack": 1,
-  "zackary": 1,
-  "zackery": 1,
-  "zahir": 1,
-  "zahira": 2,
-  "zahra": 2,
-  "zahrah": 2,
-  "zaid": 1,
-  "zaida": 2,
-  "zain": 1,
-  "zaina": 2,
-  "zainab": 2,
-  "zaira": 2,
-  "zak": 1,
-  "zakhar": 1,
-  "zaki": 1,
-  "zakiah": 2,
-  "zakiyya": 2,
-  "zalman": 1,
-  "zalmon": 1,
-  "zan": 2,
-  "zander": 1,
-  "zandra": 2,
-  "zane": 1,
-  "zara": 2,
-  "zaramama": 2,
-  "zarathustra": 1,
-  "zaray": 2,
-  "zareen": 2,
-  "zaria": 2,
-  "zarita": 2,
-  "zavanna": 2,
-  "zavia": 2,
-  "zavier": 1,
-  "zayd": 1,
-  "zayn": 1,
-  "zayna": 2,
-  "zaynab": 2,
-  "zbigniew": 1,
-  "zdenek": 1,
-  "zdenka": 2,
-  "zdislav": 1,
-  "zdzislaw": 1,
-  "zé": 1,
-  "zebadiah": 1,
-  "zebedee": 1,
-  "zebulon": 1,
-  "zebulun": 1,
-  "zechariah": 1,
-  "zed": 1,
-  "zedekiah": 1,
-  "zeev": 1,
-  "zeke": 1,
-  "zeki": 1,
-  "zelda": 2,
-  "zelde": 2,
-  "zelig": 1,
-  "zella": 2,
-  "zelma": 2,
-  "zelpah": 2,
-  "zelpha": 2,
-  "zena": 2,
-  "zenia": 2,
-  "zeno": 1,
-  "zenobia": 2,
-  "zenon": 1,
-  "zenovia": 2,
-  "zenzi": 2,
-  "zeph": 1,
-  "zephania": 1,
-  "zephaniah": 1,
-  "zephyr": 1,
-  "zephyra": 2,
-  "zephyrine": 2,
-  "zerachiel": 1,
-  "zeta": 2,
-  "zeus": 1,
-  "zev": 1,
-  "zhen": 2,
-  "zhenya": 2,
-  "zhou": 1,
-  "zia": 1,
-  "ziba": 2,
-  "zilla": 2,
-  "zillah": 2,
-  "zilpah": 2,
-  "zimri": 1,
-  "zina": 2,
-  "zinaida": 2,
-  "zinnia": 2,
-  "zinovia": 2,
-  "zion": 1,
-  "zipporah": 2,
-  "zisel": 2,
-  "zita": 2,
-  "ziv": None,
-  "ziva": 2,
-  "zivit": 2,
-  "ziya": 1,
-  "ziyad": 1,
-  "zlata": 2,
-  "zlatan": 1,
-  "zlatko": 1,
-  "zlota": 2,
-  "zoé": 2,
-  "zoë": 2,
-  "zoey": 2,
-  "zofia": 2,
-  "zohar": None,
-  "zoie": 2,
-  "zola": 2,
-  "zoltán": 1,
-  "zona": 2,
-  "zopyros": 1,
-  "zora": 2,
-  "zoraida": 2,
-  "zoran": 1,
-  "zoroaster": 1,
-  "zosia": 2,
-  "zosime": 2,
-  "zosimos": 1,
-  "zosimus": 1,
-  "zoticus": 1,
-  "zowie": 2,
-  "zsanett": 2,
-  "zsa zsa": 2,
-  "zsiga": 1,
-  "zsigmond": 1,
-  "zsófia": 2,
-  "zsófika": 2,
-  "zsolt": 1,
-  "zsuzsa": 2,
-  "zsuzsanna": 2,
-  "zsuzsi": 2,
-  "zuberi": 1,
-  "zubin": 1,
-  "zula": 2,
-  "zuleika": 2,
-  "zulekha": 2,
-  "zuri": 2,
-  "zusa": 2,
-  "zusman": 1,
-  "zuzana": 2,
-  "zuzanna": 2,
-  "zvi": 1,
-  "zvonimir": 1,
-  "zvonimira": 2,
-  "zvonko": 1,
-  "zygmunt": 1,
-}
+
+""" Gender of given names, 1 = male, 2 = female, None = both.
+The lexicon is givens.tsv (given casefolded, gender), loaded on first use.
+"""
+import functools
+import os
+import re
+
+tsv_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'givens.tsv')
+# given -> gender, None before load()
+dic = None
+# given names kept by gender()
+cache_size = 100000
+
+
+def load():
+    """Get the lexicon, read it the first time"""
+    global dic
+    if dic is not None:
+        return dic
+    dic = {}
+    with open(tsv_file, 'r', encoding='utf-8') as handle:
+        next(handle) # header
+        for line in handle:
+            given, gender = line.rstrip('\n').split('\t')
+            dic[given] = int(gender) if gender else None
+    return dic
+
+
+@functools.lru_cache(maxsize=cache_size)
+def gender(given):
+    """Get a gender from a given name, the whole name, ex: Abd-al-Aziz,
+    or its first known part, ex: Marie-Anne, Jean Baptiste, M. Jean"""
+    given = given.casefold().strip()
+    lexicon = load()
+    if given in lexicon:
+        return lexicon[given]
+    for part in re.split(r'[ \-]+', given):
+        if part in lexicon:
+            return lexicon[part]
+    return None
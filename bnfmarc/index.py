@@ -0,0 +1,221 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Byte offset index of MARC files, to seek a record by ARK id
+For each P*.UTF8 file, a sidecar P*.UTF8.idx, a header with size and mtime
+of the file, then a sorted array of (id, offset, length). For the folder,
+index.idx, sorted array of (id, file number, offset, length), with file
+names, size and mtime in index.lst, to find a record by id only, with one
+lookup. An index older than its file is not used, the file is scanned.
+"""
+import argparse
+import glob
+import mmap
+import os
+import re
+import struct
+import sys
+
+# local
+import iso2709
+
+# magic, size and mtime of the indexed file
+file_header = struct.Struct('<4sQd')
+file_magic = b'BMI1'
+# id, offset, length
+file_entry = struct.Struct('<IQI')
+# id, file number (line in index.lst), offset, length
+dir_entry = struct.Struct('<IHQI')
+idx_ext = '.idx'
+dir_idx = 'index.idx'
+dir_lst = 'index.lst'
+# records not indexed by the last entries(), bad or without id
+skipped = 0
+
+
+def ark_id(ark):
+    """Get the int id from an ark, ex: cb30047888b, 30047888,
+    http://catalogue.bnf.fr/ark:/12148/cb30047888b"""
+    found = re.search(r'(?:cb)?(\d{8})[0-9a-z]?$', ark.strip())
+    if found is None:
+        raise ValueError("Not an ark id: " + ark)
+    return int(found.group(1))
+
+
+def record_id(marc):
+    """Id of a record from its ark in 003, None if missing or malformed"""
+    try:
+        url = iso2709.control(marc, '003')
+        if url is None:
+            return None
+        return ark_id(url)
+    except ValueError:
+        return None
+
+
+def entries(marc_file):
+    """Generate (id, offset, length) of records in a file,
+    records bad or without id are skipped, counted in skipped"""
+    global skipped
+    offset = 0
+    with open(marc_file, 'rb') as handle:
+        for marc in iso2709.chunks(handle):
+            if marc is None: # bad record, not indexed
+                offset = handle.tell()
+                skipped += 1
+                continue
+            length = len(marc)
+            id = record_id(marc)
+            if id is None:
+                skipped += 1
+            else:
+                yield id, offset, length
+            offset += length
+
+
+def build(marc_file):
+    """Write the sidecar of a file, return its sorted entries"""
+    global skipped
+    print("index < " + marc_file)
+    skipped = 0
+    rows = sorted(entries(marc_file))
+    if skipped:
+        print("%s  %d records without id skipped" % (os.path.basename(marc_file), skipped))
+    with open(marc_file + idx_ext, 'wb') as handle:
+        handle.write(stamp(marc_file))
+        for row in rows:
+            handle.write(file_entry.pack(*row))
+    return rows
+
+
+def build_dir(marc_files):
+    """Write sidecars of files, and the index of the folder"""
+    marc_dir = os.path.dirname(marc_files[0])
+    rows = []
+    with open(os.path.join(marc_dir, dir_lst), 'w', encoding='utf-8') as handle:
+        for file_no, marc_file in enumerate(marc_files):
+            stat = os.stat(marc_file)
+            handle.write("%s\t%d\t%r\n" % (os.path.basename(marc_file), stat.st_size, stat.st_mtime))
+            for id, offset, length in build(marc_file):
+                rows.append((id, file_no, offset, length))
+    rows.sort()
+    with open(os.path.join(marc_dir, dir_idx), 'wb') as handle:
+        for row in rows:
+            handle.write(dir_entry.pack(*row))
+
+
+def stamp(marc_file):
+    """Header of a sidecar, size and mtime of its file"""
+    stat = os.stat(marc_file)
+    return file_header.pack(file_magic, stat.st_size, stat.st_mtime)
+
+
+def fresh(marc_file):
+    """True if the sidecar of a file is as new as the file"""
+    idx_file = marc_file + idx_ext
+    if not os.path.isfile(idx_file):
+        return False
+    with open(idx_file, 'rb') as handle:
+        return handle.read(file_header.size) == stamp(marc_file)
+
+
+def search(idx_file, id, entry, start=0):
+    """Binary search of id in a sorted array of entries after start bytes,
+    tuple or None"""
+    if not os.path.isfile(idx_file) or os.path.getsize(idx_file) <= start:
+        return None
+    with open(idx_file, 'rb') as handle, \
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lo = 0
+        hi = (len(mm) - start) // entry.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = entry.unpack_from(mm, start + mid * entry.size)
+            if row[0] < id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if start + lo * entry.size >= len(mm):
+            return None
+        row = entry.unpack_from(mm, start + lo * entry.size)
+        if row[0] != id:
+            return None
+        return row
+
+
+def read(marc_file, offset, length):
+    """Get bytes of a record"""
+    with open(marc_file, 'rb') as handle, \
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[offset:offset + length]
+
+
+def find(id, marc_file=None, marc_dir=None):
+    """Get bytes of record by id, from a file or from the folder index,
+    sequential scan of the file if no sidecar or a stale one, of each file
+    if the folder index is stale. None if not found."""
+    if marc_file is not None:
+        if fresh(marc_file):
+            row = search(marc_file + idx_ext, id, file_entry, file_header.size)
+            if row is None:
+                return None
+            return read(marc_file, row[1], row[2])
+        with open(marc_file, 'rb') as handle:
+            for marc in iso2709.chunks(handle):
+                if marc is None:
+                    continue
+                if record_id(marc) == id:
+                    return marc
+        return None
+    lst_file = os.path.join(marc_dir, dir_lst)
+    if not os.path.isfile(lst_file):
+        return None
+    files = []
+    stale = False
+    with open(lst_file, 'r', encoding='utf-8') as handle:
+        for line in handle.read().splitlines():
+            name, size, mtime = (line.split('\t') + [None, None])[0:3]
+            path = os.path.join(marc_dir, name)
+            files.append(path)
+            if not os.path.isfile(path):
+                stale = True
+                continue
+            stat = os.stat(path)
+            if size is None or (int(size), float(mtime)) != (stat.st_size, stat.st_mtime):
+                stale = True
+    if stale:
+        for path in files:
+            if not os.path.isfile(path):
+                continue
+            marc = find(id, path)
+            if marc is not None:
+                return marc
+        return None
+    row = search(os.path.join(marc_dir, dir_idx), id, dir_entry)
+    if row is None:
+        return None
+    return read(files[row[1]], row[2], row[3])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Index MARC files, ARK id -> (offset, length)',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('marc_dir', nargs='?',
+    default=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data/'),
+    help='Folder of MARC files P*.UTF8')
+    args = parser.parse_args()
+    marc_files = sorted(glob.glob(os.path.join(args.marc_dir, "P*.UTF8")))
+    if not marc_files:
+        print("No MARC files in " + args.marc_dir)
+        return 1
+    build_dir(marc_files)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Lean reader of ISO 2709 records (UniMARC BnF, UTF-8)
+Leader and directory are parsed from bytes, only fields of requested tags
+are decoded and built as pymarc.Field, in a pymarc.Record, so that loaders
+keep their r['200']['a'] code. encode() writes records, for synth.py.
+"""
+import argparse
+import pymarc
+import sys
+import time
+
+LEADER_LEN = 24
+DIRECTORY_ENTRY_LEN = 12
+SUBFIELD_INDICATOR = '\x1f'
+END_OF_FIELD = b'\x1e'
+END_OF_RECORD = 0x1d
+# bytes read at once to find the end of a bad record
+block_size = 1 << 16
+
+# tags read by doc.py
+doc_tags = {
+    '003', '100', '101', '102', '181', '200', '210', '214', '215', '500',
+    '600', '601', '620', '700', '701', '702', '710', '711', '712', '856',
+    '930',
+}
+# tags read by auth.py, authority records
+auth_tags = {'003', '103', '120', '200', '210', '300', '301'}
+# tags read by auth.byline(), authors in doc records
+byline_tags = {
+    '600', '601', '700', '701', '702', '703', '710', '711', '712', '713',
+}
+
+
+def chunks(handle):
+    """Generate the bytes of records from a file handle, as pymarc.MARCReader.
+    A bad record (length, truncated, no terminator) is None, reading goes on
+    after the next record terminator."""
+    offset = handle.tell()
+    while True:
+        first5 = handle.read(5)
+        if not first5:
+            return
+        try:
+            length = int(first5)
+        except ValueError:
+            length = 0
+        chunk = first5
+        if length > 5:
+            chunk += handle.read(length - 5)
+        if length > 5 and len(chunk) == length and chunk[-1] == END_OF_RECORD:
+            offset += length
+            yield chunk
+            continue
+        offset = resync(handle, offset)
+        yield None
+        if offset is None:
+            return
+
+
+def resync(handle, offset):
+    """Seek after the next record terminator from offset, the start of a bad
+    record, return the new offset, None if no terminator until end of file"""
+    handle.seek(offset)
+    while True:
+        block = handle.read(block_size)
+        if not block:
+            return None
+        end = block.find(END_OF_RECORD)
+        if end >= 0:
+            offset += end + 1
+            handle.seek(offset)
+            return offset
+        offset += len(block)
+
+
+def entries(marc):
+    """Generate (tag, start, end) of fields from directory, tag as bytes,
+    data is marc[start:end], without field terminator"""
+    base = int(marc[12:17])
+    if base <= 0 or base >= len(marc):
+        raise pymarc.exceptions.BaseAddressInvalid()
+    end = base - 1
+    if (end - LEADER_LEN) % DIRECTORY_ENTRY_LEN != 0:
+        raise pymarc.exceptions.RecordDirectoryInvalid()
+    for i in range(LEADER_LEN, end, DIRECTORY_ENTRY_LEN):
+        start = base + int(marc[i + 7:i + 12])
+        yield marc[i:i + 3], start, start + int(marc[i + 3:i + 7]) - 1
+
+
+def control(marc, tag):
+    """Get the decoded data of first field with this tag, or None,
+    ex: control(marc, '003') for the ark url"""
+    tag = tag.encode('ascii')
+    for entry_tag, start, end in entries(marc):
+        if entry_tag == tag:
+            return marc[start:end].decode('utf-8')
+    return None
+
+
+def field(tag, data):
+    """Build a pymarc.Field from decoded data, as pymarc.Record.decode_marc()"""
+    if tag < '010' and tag.isdigit():
+        return pymarc.Field(tag=tag, data=data)
+    subs = data.split(SUBFIELD_INDICATOR)
+    # missing indicators recorded as blank, more than 2 dropped
+    indicators = (subs[0] + '  ')[0:2]
+    subfields = []
+    for sub in subs[1:]:
+        if not sub:
+            continue
+        subfields.append(sub[0])
+        subfields.append(sub[1:])
+    return pymarc.Field(
+        tag=tag,
+        indicators=[indicators[0], indicators[1]],
+        subfields=subfields
+    )
+
+
+def record(marc, tags=None):
+    """Build a pymarc.Record with only the fields of tags (all if None)"""
+    if tags is not None:
+        tags = {tag.encode('ascii') for tag in tags}
+    return _record(marc, tags)
+
+
+def _record(marc, tags):
+    """record() with tags already encoded"""
+    r = pymarc.Record()
+    r.leader = marc[0:LEADER_LEN].decode('ascii')
+    fields = r.fields
+    for tag, start, end in entries(marc):
+        if tags is not None and tag not in tags:
+            continue
+        fields.append(field(tag.decode('ascii'), marc[start:end].decode('utf-8')))
+    if len(fields) == 0 and tags is None:
+        raise pymarc.exceptions.NoFieldsFound()
+    return r
+
+
+def reader(handle, tags=None):
+    """Generate records with only the fields of tags (all if None).
+    A record impossible to decode is None, like pymarc.MARCReader."""
+    for r, offset in positions(handle, tags):
+        yield r
+
+
+def positions(handle, tags=None):
+    """Generate (record, offset after record), as reader(), from the current
+    position of handle, to checkpoint a load"""
+    tags = tags_bytes(tags)
+    offset = handle.tell()
+    for marc in chunks(handle):
+        if marc is None:
+            offset = handle.tell()
+            yield None, offset
+            continue
+        offset += len(marc)
+        yield decode(marc, tags), offset
+
+
+def tags_bytes(tags):
+    """Encode tags for decode(), None for all"""
+    if tags is None:
+        return None
+    return {tag.encode('ascii') for tag in tags}
+
+
+def decode(marc, tags=None):
+    """Build a record as record(), tags from tags_bytes(),
+    None if impossible to decode, like pymarc.MARCReader"""
+    if marc is None:
+        return None
+    try:
+        return _record(marc, tags)
+    except (pymarc.exceptions.PymarcException, UnicodeDecodeError, ValueError):
+        return None
+
+
+def encode(leader, fields):
+    """Get the bytes of a record, leader as a string of 24 chars, fields as
+    (tag, data), data of a data field with indicators and subfields, see subfields().
+    Record length and base address of the leader are computed."""
+    directory = []
+    body = []
+    pos = 0
+    for tag, data in fields:
+        data = data.encode('utf-8') + END_OF_FIELD
+        directory.append(b'%s%04d%05d' % (tag.encode('ascii'), len(data), pos))
+        body.append(data)
+        pos += len(data)
+    directory.append(END_OF_FIELD)
+    directory = b''.join(directory)
+    base = LEADER_LEN + len(directory)
+    length = base + pos + 1
+    return b''.join((
+        b'%05d' % length,
+        leader[5:12].encode('ascii'),
+        b'%05d' % base,
+        leader[17:LEADER_LEN].encode('ascii'),
+        directory,
+        *body,
+        bytes([END_OF_RECORD]),
+    ))
+
+
+def subfields(indicators, *pairs):
+    """Data of a data field, ex: subfields('1 ', 'a', 'Title', 'e', 'subtitle'),
+    subfields with a None value are skipped"""
+    data = [indicators]
+    for i in range(0, len(pairs), 2):
+        if pairs[i + 1] is None:
+            continue
+        data.append(SUBFIELD_INDICATOR + pairs[i] + pairs[i + 1])
+    return ''.join(data)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Compare records/second of pymarc and the lean reader, check same fields',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('marc_file', nargs=1,
+    help='A file of MARC records')
+    parser.add_argument('--tags', choices=['doc', 'auth', 'byline'], default='doc',
+    help='Tag set requested to the lean reader')
+    args = parser.parse_args()
+    marc_file = args.marc_file[0]
+    tags = {'doc': doc_tags, 'auth': auth_tags, 'byline': byline_tags}[args.tags]
+
+    # read only, time
+    start = time.perf_counter()
+    with open(marc_file, 'rb') as handle:
+        count = sum(1 for r in pymarc.MARCReader(handle, to_unicode=True, force_utf8=True))
+    pymarc_time = time.perf_counter() - start
+    start = time.perf_counter()
+    with open(marc_file, 'rb') as handle:
+        sum(1 for r in reader(handle, tags))
+    lean_time = time.perf_counter() - start
+
+    # check same fields, record by record
+    diff = 0
+    with open(marc_file, 'rb') as h1, open(marc_file, 'rb') as h2:
+        for expected, found in zip(
+            pymarc.MARCReader(h1, to_unicode=True, force_utf8=True),
+            reader(h2, tags)
+        ):
+            if expected is None or found is None:
+                diff += (expected is None) != (found is None)
+                continue
+            if [str(f) for f in expected.fields if f.tag in tags] != [str(f) for f in found.fields]:
+                diff += 1
+    print("%d records, %d different" % (count, diff))
+    print("pymarc  %8.0f rec/s" % (count / pymarc_time))
+    print("iso2709 %8.0f rec/s  x%.1f" % (count / lean_time, pymarc_time / lean_time))
+    return 1 if diff else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Load authority and document records in one command,
+each document file is read once for doc, contrib, about,
+and auth rows of authors without authority record
+(same base as auth.py then doc.py).
+Files loaded are recorded in load_manifest, --incremental reloads
+only new or changed files, and records touched ids and years for update.py.
+Full-text tables of fts.py are dropped when doc or auth change, run fts.py again.
+"""
+import argparse
+import glob
+import os
+import sys
+
+# local
+import auth
+import bnfmarc
+import doc
+import fts
+import index
+import pipeline
+import places
+import stats
+
+# start of file names, by table
+prefixes = {'auth': ('P1486_',), 'doc': ('P1187_', 'P174_')}
+
+def changes(con, marc_files, table):
+    """Filter new or changed files, delete their rows and rows of files
+    not found, record touched ids in changed_auth and changed_doc.
+    Returns [(marc_file, manifest values)]"""
+    changed = []
+    for marc_file in marc_files:
+        values = bnfmarc.manifest(con, marc_file)
+        if values is None:
+            print("%s unchanged" % os.path.basename(marc_file))
+            continue
+        changed.append((marc_file, values))
+    names = [os.path.basename(marc_file) for marc_file, values in changed]
+    # files gone
+    found = {os.path.basename(marc_file) for marc_file in marc_files}
+    for row in con.execute("SELECT file FROM load_manifest").fetchall():
+        if row[0] in found or not row[0].startswith(prefixes[table]):
+            continue
+        names.append(row[0])
+        con.execute("DELETE FROM load_manifest WHERE file = ?", (row[0],))
+    for name in names:
+        print("%s unload" % name)
+        unload(con, name, table)
+        con.execute("DELETE FROM load_checkpoint WHERE file = ?", (name,))
+    if table == 'doc':
+        moved(con, [marc_file for marc_file, values in changed])
+    con.commit()
+    return changed
+
+
+def unload(con, name, table):
+    """Delete rows from a file, record ids touched"""
+    if table == 'auth':
+        con.execute("INSERT OR IGNORE INTO changed_auth (id) SELECT id FROM auth WHERE file = ?", (name,))
+        con.execute("DELETE FROM auth WHERE file = ?", (name,))
+        return
+    unload_docs(con, "SELECT id FROM doc WHERE file = ?", (name,))
+
+
+def unload_docs(con, docs, params=()):
+    """Delete docs of an sql query of ids, with their contribs and abouts,
+    record ids touched"""
+    con.execute("INSERT OR IGNORE INTO changed_auth (id) SELECT auth FROM contrib WHERE doc IN (" + docs + ")", params)
+    con.execute("INSERT OR IGNORE INTO changed_year (year) SELECT DISTINCT year FROM doc WHERE id IN (" + docs + ") AND year IS NOT NULL", params)
+    con.execute("DELETE FROM contrib WHERE doc IN (" + docs + ")", params)
+    con.execute("DELETE FROM about WHERE doc IN (" + docs + ")", params)
+    con.execute("DELETE FROM doc WHERE id IN (" + docs + ")", params)
+
+
+def moved(con, marc_files):
+    """Unload docs of unchanged files with an id of a file to load,
+    a record moved from a file to another would be inserted twice"""
+    con.execute("CREATE TEMP TABLE IF NOT EXISTS reload (id INTEGER PRIMARY KEY)")
+    con.execute("DELETE FROM temp.reload")
+    for marc_file in marc_files:
+        con.executemany(
+            "INSERT OR IGNORE INTO temp.reload (id) VALUES (?)",
+            ((id,) for id, offset, length in index.entries(marc_file))
+        )
+    docs = "SELECT doc.id FROM doc JOIN temp.reload ON temp.reload.id = doc.id"
+    count = con.execute("SELECT count(*) FROM (" + docs + ")").fetchone()[0]
+    if count:
+        print("%d docs moved from unchanged files, unload" % count)
+        # files not as loaded, reloaded by next --incremental
+        con.execute("DELETE FROM load_manifest WHERE file IN (SELECT DISTINCT doc.file FROM doc JOIN temp.reload ON temp.reload.id = doc.id)")
+        unload_docs(con, docs)
+    con.execute("DROP TABLE temp.reload")
+
+
+def touched(con, marc_file, table):
+    """Record ids of rows loaded from a file"""
+    name = os.path.basename(marc_file)
+    if table == 'auth':
+        con.execute("INSERT OR IGNORE INTO changed_auth (id) SELECT id FROM auth WHERE file = ?", (name,))
+        return
+    docs = "SELECT id FROM doc WHERE file = ?"
+    con.execute("INSERT OR IGNORE INTO changed_doc (id) " + docs, (name,))
+    con.execute("INSERT OR IGNORE INTO changed_auth (id) SELECT auth FROM contrib WHERE doc IN (" + docs + ")", (name,))
+    con.execute("INSERT OR IGNORE INTO changed_year (year) SELECT DISTINCT year FROM doc WHERE file = ? AND year IS NOT NULL", (name,))
+    con.commit()
+
+
+def loaded(con, marc_file, values):
+    """Record a file in load_manifest, not if only a sample was read,
+    so that --incremental loads it again"""
+    if stats.sample is not None:
+        return
+    bnfmarc.manifest_loaded(con, marc_file, values)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Load authority and document records to generate an sqlite base',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('cataviz_db', nargs=1,
+    help='Sqlite database to generate')
+    parser.add_argument('-j', '--jobs', type=int, default=doc.jobs,
+    help='Record extraction, 0 = in the writer thread, 1 = a thread, > 1 = number of worker processes')
+    parser.add_argument('--batch', type=int, default=doc.batch_size,
+    help='Number of rows written by executemany in one transaction')
+    parser.add_argument('--bulk', action='store_true',
+    help='Bulk load profile, no journal, no sync (indexes by finalize.py)')
+    parser.add_argument('--incremental', action='store_true',
+    help='Keep the base, reload only new or changed files (then update.py --incremental)')
+    parser.add_argument('--resume', action='store_true',
+    help='Continue an interrupted load from load_checkpoint (not safe after a crash with --bulk)')
+    parser.add_argument('--stats', action='store_true',
+    help='Print time by stage and by extractor, records/s by file')
+    parser.add_argument('--stats-json', metavar='FILE',
+    help='Write the stats as json in FILE')
+    parser.add_argument('--profile', metavar='DIR',
+    help='Write a cProfile .pstats and a tracemalloc .mem.txt by file in DIR (no workers)')
+    parser.add_argument('--sample', type=int, metavar='N',
+    help='Read only the first N records of each file')
+    args = parser.parse_args()
+    if args.stats or args.stats_json:
+        doc.instrument()
+    stats.profile_dir = args.profile
+    stats.sample = args.sample
+    con = bnfmarc.connect(args.cataviz_db[0], not (args.incremental or args.resume), bulk=args.bulk)
+    auth.con = doc.con = con
+    auth.batch_size = doc.batch_size = args.batch
+    auth.resume = doc.resume = args.resume
+    # profile in the thread of the records
+    auth.jobs = doc.jobs = 0 if args.profile else args.jobs
+    marc_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data/')
+    auth_files = sorted(glob.glob(os.path.join(marc_dir, "P1486_*.UTF8")))
+    marc_files = sorted(glob.glob(os.path.join(marc_dir, "P1187_*.UTF8")))
+    marc_files += sorted(glob.glob(os.path.join(marc_dir, "P174_*.UTF8")))
+
+    if args.incremental:
+        auth_changes = changes(con, auth_files, 'auth')
+        doc_changes = changes(con, marc_files, 'doc')
+    else:
+        # no hash, a full load reads files once
+        auth_changes = [(f, bnfmarc.manifest(con, f, hashing=False)) for f in auth_files]
+        doc_changes = [(f, bnfmarc.manifest(con, f, hashing=False)) for f in marc_files]
+
+    if args.incremental or args.resume:
+        # ids of authors kept
+        auth.cache_load(con)
+        if auth_changes or doc_changes:
+            # not updatable, texts of rows deleted are lost
+            dropped = fts.drop(con)
+            if dropped:
+                print("%s dropped, run fts.py again" % ", ".join(dropped))
+    # authority records first, auth_cache knows their ids
+    auth.pool = pipeline.pool(auth.jobs)
+    for auth_file, values in auth_changes:
+        auth.auths(auth_file)
+        auth.flush()
+        if args.incremental:
+            touched(con, auth_file, 'auth')
+        loaded(con, auth_file, values)
+    pipeline.close(auth.pool)
+    # one pass on doc records
+    doc.with_auths = True
+    marc_files = [marc_file for marc_file, values in doc_changes]
+    # compiled before workers, inherited
+    places.load()
+    # new workers, auth_cache with ids of authority records
+    doc.pool = pipeline.pool(doc.jobs)
+    for marc_file in marc_files:
+        doc.docs(marc_file)
+    pipeline.close(doc.pool)
+    doc.flush()
+    for marc_file, values in doc_changes:
+        if args.incremental:
+            touched(con, marc_file, 'doc')
+        loaded(con, marc_file, values)
+    auth.cache_report()
+    if args.incremental and doc_changes:
+        # only docs of this load
+        places.report(con, "SELECT id FROM changed_doc")
+    elif not args.incremental:
+        places.report(con)
+    if stats.enabled:
+        stats.summary(args.stats_json)
+
+if __name__ == '__main__':
+    sys.exit(main())
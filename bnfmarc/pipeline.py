@@ -0,0 +1,212 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Streaming pipeline of a loader: a reader thread of raw records, an
+extraction stage, the writer in the calling thread, connected by bounded
+queues, so that file reads, extraction and SQLite writes overlap.
+Extraction is one thread (loaders reuse module dicts, not thread safe),
+or a pool of processes, results are written in the order of the file.
+Busy and wait seconds of stages, and depths of queues, are measured,
+to show the slow stage.
+"""
+import multiprocessing
+import queue
+import threading
+import time
+
+# local
+import iso2709
+
+# records by batch, between stages
+batch_size = 1000
+# batches in a queue, backpressure
+queue_size = 16
+# seconds between checks of a stop, when a queue is blocked
+poll = 0.1
+
+
+def pool(jobs):
+    """Pool of jobs worker processes, shared by the files of a loader,
+    None if jobs < 2. Workers inherit the state of the loader when created
+    (auth_cache, gazetteer)."""
+    if jobs < 2:
+        return None
+    return multiprocessing.Pool(jobs)
+
+
+def close(pool):
+    """Stop a pool from pool(), None accepted"""
+    if pool is None:
+        return
+    pool.terminate()
+    pool.join()
+
+
+def run(marc_file, extract, write, args=(), offset=0, jobs=0, limit=None, pool=None):
+    """Read records of marc_file from offset, extract(batch, *args) -> result,
+    write(result) in the calling thread, batch as [(marc bytes, offset after)].
+    jobs: 0, all in the calling thread; 1, reader and extraction threads;
+    > 1, reader thread and a pool of jobs processes for extraction
+    (extract and args picklable), pool from pool(), or created for this file.
+    limit: max records read. Return metrics of the stages, see report()."""
+    metrics = {
+        'jobs': jobs, 'seconds': 0.0, 'batches': 0,
+        'reader_busy': 0.0, 'extract_busy': 0.0, 'writer_busy': 0.0,
+        'reader_wait': 0.0, 'extract_wait': 0.0, 'writer_wait': 0.0,
+        'raw_depth': 0, 'rows_depth': 0,
+    }
+    start = time.perf_counter()
+    if jobs < 1:
+        for batch in batches(marc_file, offset, limit):
+            write(extract(batch, *args))
+            metrics['batches'] += 1
+        metrics['seconds'] = time.perf_counter() - start
+        return metrics
+    raw = queue.Queue(queue_size)
+    rows = queue.Queue(queue_size)
+    stop = threading.Event()
+    # pool of this file only, closed at the end
+    own = None
+    if jobs < 2:
+        pool = None
+    elif pool is None:
+        pool = own = multiprocessing.Pool(jobs)
+    threads = [
+        threading.Thread(target=reader, args=(marc_file, offset, limit, raw, stop, metrics), daemon=True),
+        threading.Thread(target=extractor, args=(extract, args, pool, raw, rows, stop, metrics), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            metrics['raw_depth'] += raw.qsize()
+            metrics['rows_depth'] += rows.qsize()
+            wait = time.perf_counter()
+            item = rows.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            if pool is not None:
+                # AsyncResult, in order of the file, raise worker exception
+                item = item.get()
+            busy = time.perf_counter()
+            metrics['writer_wait'] += busy - wait
+            write(item)
+            metrics['writer_busy'] += time.perf_counter() - busy
+            metrics['batches'] += 1
+    finally:
+        # release stages blocked on a queue, if writer failed
+        stop.set()
+        for thread in threads:
+            thread.join()
+        close(own)
+    metrics['seconds'] = time.perf_counter() - start
+    return metrics
+
+
+def batches(marc_file, offset, limit=None):
+    """Generate batches of (marc bytes or None, offset after record)"""
+    count = 0
+    with open(marc_file, 'rb') as handle:
+        handle.seek(offset)
+        batch = []
+        for marc in iso2709.chunks(handle):
+            # bad record, None, decoded as None by extract
+            offset = handle.tell() if marc is None else offset + len(marc)
+            batch.append((marc, offset))
+            count += 1
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+            if limit is not None and count >= limit:
+                break
+        if batch:
+            yield batch
+
+
+def put(q, item, stop):
+    """Put in a bounded queue, False if stopped"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=poll)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def reader(marc_file, offset, limit, raw, stop, metrics):
+    """Reader thread, batches of raw records, None at the end"""
+    try:
+        busy = time.perf_counter()
+        for batch in batches(marc_file, offset, limit):
+            wait = time.perf_counter()
+            metrics['reader_busy'] += wait - busy
+            if not put(raw, batch, stop):
+                return
+            busy = time.perf_counter()
+            metrics['reader_wait'] += busy - wait
+    except Exception as e:
+        put(raw, e, stop)
+        return
+    put(raw, None, stop)
+
+
+def extractor(extract, args, pool, raw, rows, stop, metrics):
+    """Extraction thread, results, or async results of the pool, None at the end"""
+    while not stop.is_set():
+        wait = time.perf_counter()
+        try:
+            batch = raw.get(timeout=poll)
+        except queue.Empty:
+            metrics['extract_wait'] += time.perf_counter() - wait
+            continue
+        metrics['extract_wait'] += time.perf_counter() - wait
+        if batch is None or isinstance(batch, BaseException):
+            put(rows, batch, stop)
+            return
+        busy = time.perf_counter()
+        try:
+            if pool is None:
+                result = extract(batch, *args)
+            else:
+                result = pool.apply_async(extract, (batch, *args))
+        except Exception as e:
+            put(rows, e, stop)
+            return
+        wait = time.perf_counter()
+        metrics['extract_busy'] += wait - busy
+        if not put(rows, result, stop):
+            return
+        metrics['extract_wait'] += time.perf_counter() - wait
+
+
+def report(metrics):
+    """Print busy and wait seconds of stages, and mean depths of queues.
+    The slow stage is the busiest, with processes, extraction
+    is busy when the writer waits for results."""
+    if metrics['jobs'] < 1 or metrics['batches'] == 0:
+        return
+    busy = {
+        'reader': metrics['reader_busy'],
+        'extract': metrics['extract_busy'],
+        'writer': metrics['writer_busy'],
+    }
+    if metrics['jobs'] > 1:
+        busy['extract'] = metrics['writer_wait']
+    print("pipeline  %d batches, busy/wait reader %.1f/%.1f s, extract %.1f/%.1f s, writer %.1f/%.1f s, depths raw %.1f, rows %.1f /%d, %s bound" % (
+        metrics['batches'],
+        metrics['reader_busy'], metrics['reader_wait'],
+        metrics['extract_busy'], metrics['extract_wait'],
+        metrics['writer_busy'], metrics['writer_wait'],
+        metrics['raw_depth'] / metrics['batches'],
+        metrics['rows_depth'] / metrics['batches'],
+        queue_size,
+        max(busy, key=busy.get),
+    ))
@@ -0,0 +1,89 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Gazetteer of publication places, deform() of a variant -> canonical place,
+ex: Londini, London -> Londres. Compiled on first use from places.tsv
+(variant, place, Latin and foreign names) and lieux_tout.tsv (place strings
+of the catalogue with counts, the most frequent spelling of a deform() key
+is its canonical place).
+"""
+import os
+
+# local
+import bnfmarc
+
+tsv_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'places.tsv')
+counts_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lieux_tout.tsv')
+# deform(variant) -> place, None before load()
+dic = None
+
+
+def load():
+    """Get the gazetteer, compile it the first time"""
+    global dic
+    if dic is not None:
+        return dic
+    dic = {}
+    # key -> (count, spelling) of the most frequent spelling
+    best = {}
+    if os.path.isfile(counts_file):
+        with open(counts_file, 'r', encoding='utf-8') as handle:
+            next(handle) # header
+            for line in handle:
+                name, count = line.rstrip('\n').split('\t')
+                key = bnfmarc.deform(name)
+                if not key:
+                    continue
+                count = int(count)
+                if key not in best or count > best[key][0]:
+                    best[key] = (count, name)
+    for key, (count, name) in best.items():
+        dic[key] = name
+    with open(tsv_file, 'r', encoding='utf-8') as handle:
+        next(handle) # header
+        for line in handle:
+            variant, place = line.rstrip('\n').split('\t')
+            dic[bnfmarc.deform(variant)] = place
+            dic[bnfmarc.deform(place)] = place
+    return dic
+
+
+def canonical(place_like):
+    """Canonical place of a deformed place (doc.place_like), or None"""
+    if not place_like:
+        return None
+    return load().get(place_like)
+
+
+def report(con, docs=None):
+    """Print the share of docs with a place found in the gazetteer,
+    and the most frequent places not found, for the docs of an sql query
+    of ids (ex: docs of an incremental load), all docs if None"""
+    where = ""
+    if docs is not None:
+        where = " AND id IN (" + docs + ")"
+    places, found = con.execute(
+        "SELECT count(place_like), count(place_canon) FROM doc WHERE 1" + where
+    ).fetchone()
+    groups, canons = con.execute(
+        "SELECT count(DISTINCT place_group), count(DISTINCT place_canon) FROM doc WHERE 1" + where
+    ).fetchone()
+    print("places  %d docs with a place, %d found (%.1f%%), %d place_group -> %d place_canon" % (
+        places,
+        found,
+        found / places * 100 if places else 0,
+        groups,
+        canons,
+    ))
+    missed = con.execute(
+        """SELECT place_like, count(*) AS docs FROM doc
+        WHERE place_like IS NOT NULL AND place_canon IS NULL""" + where + """
+        GROUP BY place_like ORDER BY docs DESC LIMIT 10"""
+    ).fetchall()
+    if missed:
+        print("not found  " + ", ".join("%s (%d)" % row for row in missed))
@@ -6,30 +6,33 @@ Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
 """
 
 import argparse
-import pymarc
+import os
 import re
 import sys
 
+# local
+import index
+import iso2709
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description='Scan a marc file',
         formatter_class=argparse.RawTextHelpFormatter
     )
-    parser.add_argument('marc_file', nargs=1,
-    help='A file of MARC records')
+    parser.add_argument('marc_file', nargs='?',
+    help='A file of MARC records, seek with its sidecar .idx if any, or scan it')
+    parser.add_argument('--id', default='cb30047888b',
+    help='Ark id of the record to find')
+    parser.add_argument('--dir',
+    default=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data/'),
+    help='Folder of indexed MARC files, to find --id without marc_file')
 
     args = parser.parse_args()
-    with open(args.marc_file[0], 'rb') as handle:
-        reader = pymarc.MARCReader(
-            handle, 
-            to_unicode=True,
-            force_utf8=True
-        )
-        for r in reader:
-            url = r['003'].value()
-            if (url != 'http://catalogue.bnf.fr/ark:/12148/cb30047888b'):
-                continue
-            print(r)
+    marc = index.find(index.ark_id(args.id), args.marc_file, args.dir)
+    if marc is None:
+        print("Record not found: " + args.id)
+        return 1
+    print(iso2709.record(marc))
 
 
 if __name__ == '__main__':
@@ -6,19 +6,38 @@ Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
 """
 
 import argparse
+import os
 import pymarc
 import sys
 
+# local
+import index
+import iso2709
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description='Show records from a Marc file',
         formatter_class=argparse.RawTextHelpFormatter
     )
-    parser.add_argument('marc_file', nargs=1,
-    help='A file of MARC records')
+    parser.add_argument('marc_file', nargs='?',
+    help='A file of MARC records, optional with --id if folder is indexed')
+    parser.add_argument('--id',
+    help='Show only the record with this ark id, ex: cb30047888b')
+    parser.add_argument('--dir',
+    default=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data/'),
+    help='Folder of indexed MARC files, to find --id without marc_file')
 
     args = parser.parse_args()
-    with open(args.marc_file[0], 'rb') as handle:
+    if args.id is not None:
+        marc = index.find(index.ark_id(args.id), args.marc_file, args.dir)
+        if marc is None:
+            print("Record not found: " + args.id)
+            return 1
+        print(iso2709.record(marc))
+        return
+    if args.marc_file is None:
+        parser.error('marc_file required without --id')
+    with open(args.marc_file, 'rb') as handle:
         reader = pymarc.MARCReader(
             handle, 
             to_unicode=True,
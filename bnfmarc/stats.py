@@ -0,0 +1,185 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Timing of a load, cumulative seconds and calls by function, records/s by file.
+Functions are wrapped in their module only when stats are on,
+so that a load without --stats runs the plain functions.
+Profiling, a cProfile .pstats and a tracemalloc report by file or stage,
+optionally on a sample of the first records of each file.
+"""
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+enabled = False
+# name -> [calls, seconds]
+times = {}
+# [file, records, seconds]
+files = []
+# stages of a record, name of wrapped function
+stages = ['decode', 'extract', 'write']
+# --profile, folder for .pstats and .mem.txt, None = no profile
+profile_dir = None
+# --sample, max records read by file, None = all
+sample = None
+# count of allocation sites in .mem.txt
+top = 20
+# cProfile.Profile running
+profiler = None
+
+
+def add(name, seconds):
+    """Add a call and its seconds to name"""
+    entry = times.get(name)
+    if entry is None:
+        entry = times[name] = [0, 0.0]
+    entry[0] += 1
+    entry[1] += seconds
+
+
+def timed(name, fn):
+    """Wrap fn, to add its calls and seconds to name"""
+    if hasattr(fn, '__wrapped__'): # already timed
+        return fn
+    perf_counter = time.perf_counter
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            add(name, perf_counter() - start)
+    wrapper.__wrapped__ = fn
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+
+def instrument(module, names):
+    """Replace functions of a module by timed ones, names as
+    {function name: stat name}, module calls are resolved at runtime"""
+    global enabled
+    enabled = True
+    for fn_name, name in names.items():
+        setattr(module, fn_name, timed(name, getattr(module, fn_name)))
+
+
+def file_done(name, records, seconds):
+    """Record throughput of a file"""
+    files.append([name, records, seconds])
+
+
+def reset():
+    """Forget times, ex: in a worker, before a file"""
+    times.clear()
+    files.clear()
+
+
+def snapshot():
+    """Times as a dict to send from a worker"""
+    return {name: list(entry) for name, entry in times.items()}
+
+
+def merge(other):
+    """Add times of a snapshot(), ex: from a worker process"""
+    for name, (calls, seconds) in other.items():
+        entry = times.get(name)
+        if entry is None:
+            entry = times[name] = [0, 0.0]
+        entry[0] += calls
+        entry[1] += seconds
+
+
+def report():
+    """All stats as a dict, for json"""
+    entry = lambda name: {'calls': times[name][0], 'seconds': times[name][1]}
+    return {
+        'stages': {name: entry(name) for name in stages if name in times},
+        'functions': {name: entry(name) for name in times if name not in stages},
+        'files': [
+            {
+                'file': name,
+                'records': records,
+                'seconds': seconds,
+                'records/s': records / seconds if seconds else 0,
+            }
+            for name, records, seconds in files
+        ],
+    }
+
+
+def summary(json_file=None):
+    """Print a table of times, or write them as json"""
+    if json_file is not None:
+        with open(json_file, 'w', encoding='utf-8') as handle:
+            json.dump(report(), handle, indent=2)
+        print("stats > " + json_file)
+        return
+    extract = times.get('extract', [0, 0.0])[1]
+    print("%-16s %10s %10s %10s %7s" % ('', 'calls', 'seconds', 'µs/call', '%'))
+    for name in stages:
+        if name in times:
+            row(name, times[name], sum(times[stage][1] for stage in stages if stage in times))
+    print("extract by function")
+    functions = sorted(
+        (name for name in times if name not in stages),
+        key=lambda name: -times[name][1]
+    )
+    for name in functions:
+        row(name, times[name], extract)
+    # time in extract, not in a timed function
+    other = extract - sum(times[name][1] for name in functions)
+    if extract:
+        row('(other)', [times['extract'][0], other], extract)
+    for name, records, seconds in files:
+        print("%-16s %10d records %7.1f s %8.0f records/s" % (
+            name, records, seconds, records / seconds if seconds else 0
+        ))
+
+
+def row(name, entry, total):
+    """Print a line of the table, % of total"""
+    calls, seconds = entry
+    print("%-16s %10d %10.3f %10.1f %6.1f%%" % (
+        name,
+        calls,
+        seconds,
+        seconds / calls * 1e6 if calls else 0,
+        seconds / total * 100 if total else 0,
+    ))
+
+
+def profile_start():
+    """Start cProfile and tracemalloc for a file or a stage, if profile_dir"""
+    global profiler
+    if profile_dir is None:
+        return
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+
+def profile_stop(name):
+    """Write <name>.pstats, and <name>.mem.txt with peak memory
+    and top allocation sites, if profile_dir"""
+    global profiler
+    if profile_dir is None:
+        return
+    profiler.disable()
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, name)
+    profiler.dump_stats(path + '.pstats')
+    profiler = None
+    with open(path + '.mem.txt', 'w', encoding='utf-8') as handle:
+        handle.write("peak %.1f MB, current %.1f MB\n" % (peak / 1e6, current / 1e6))
+        for stat in snapshot.statistics('lineno')[:top]:
+            handle.write("%s\n" % stat)
+    print("profile > %s.pstats  peak %.1f MB" % (path, peak / 1e6))
@@ -0,0 +1,307 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Synthetic UniMARC corpus, to test and benchmark without the BnF dumps.
+Writes P1486_*.UTF8 authority records and P1187_*.UTF8, P174_*.UTF8
+doc records, with the variants of fields handled by doc.py and auth.py
+(dates, places, physical descriptions, Clément shelfmarks, links to authors).
+Same seed, same files. Streamed, from a few records to 10M.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# local
+import givens
+import iso2709
+
+doc_leader = '00000cam0 2200000   450 '
+auth_leader = '00000cx  j2200000   45  '
+ark = 'http://catalogue.bnf.fr/ark:/12148/cb%08d%s'
+# ark check char
+ark_chars = '0123456789bcdfghjkmnpqrstvwxz'
+# first ids, persons, corporates, persons without authority record, docs
+pers_first = 11000000
+corp_first = 12000000
+orphan_first = 13000000
+doc_first = 30000000
+
+surnames = [
+    'Hugo', 'Sand', 'Dupont', 'Zola', 'Staël', 'Voltaire', 'Diderot',
+    'La Fontaine', 'Du Bellay', "D'Alembert", 'Lenoir', 'Müller', 'Smith',
+    'Martin', 'Bernard', 'Lefèvre', 'Œttingen', 'Saint-Simon', 'Ægidius',
+    'Ruiz de Alarcón', 'Van der Meer', 'Ó Briain', 'Nguyễn', 'Aḥmad',
+]
+# given names of the gender lexicon, and others
+given_names = sorted(name.capitalize() for name in givens.load())
+given_names += ['J.-B.', 'M.', 'Marie-Anne', 'Jean Baptiste', 'Germaine de']
+corps = [
+    'Académie française', 'Imprimerie royale', 'Société des gens de lettres',
+    'Compagnie des Indes', 'Parlement de Paris', 'Université de Paris',
+    'Bibliothèque nationale (France)', 'Église catholique',
+]
+titles = [
+    ('Le ', 'diable boiteux'), ("L'", 'esprit des lois'), ('', 'Mémoires'),
+    ('Les ', 'aventures de Télémaque'), ('', "Apologie des ceremonies de l'Eglise"),
+    ('La ', 'nouvelle Héloïse'), ('Den ', 'Briefwechsel'), ('', 'Œuvres complètes'),
+    ('', 'Recueil de pièces'), ('Un ', 'voyage en Orient'),
+]
+subtitles = [None, None, 'roman', 'comédie en trois actes', 'poëme', 'par M***']
+doc_types = [('txt', 'Texte imprimé'), ('sti', 'Image fixe'), ('ntm', 'Musique imprimée')]
+langs = ['fre', 'fre', 'fre', 'lat', 'eng', 'ger', 'ita', 'spa']
+places = [
+    'Paris', 'Paris', 'Paris', '[Paris]', 'Paris,', 'A Paris', 'À Paris',
+    'Lyon', 'A Lyon', 'Rouen', 'London', 'A Londres', 'Londres et Paris',
+    'Amsterdam ; et Paris', 'Amsterdam', 'Lugduni Batavorum', 'Leipzig',
+    'Dresden und Leipzig', 'In the Hague', 'Genève', 'S. l.', '[S. l.]',
+    'Madrid, impr. de A. Sanz', 'Bruxelles', 'Venezia', '[s.l.]',
+]
+publishers = [
+    '[s.n.]', '[s.n.?]', 'S. n.,', 'chez Didot', 'Hachette', 'Firmin-Didot',
+    'impr. de Ballard', 'Michel Lévy frères', 'Garnier frères',
+    'Marc-Michel Rey', 'typis Orphanotrophei', 'Louis Sevestre',
+]
+addresses = [
+    'Halae Magdeburgicae : typis Orphanotrophei, {year}',
+    '[Paris, Louis Sevestre, {year}]',
+    'A Paris, chez la veuve Duchesne, {year}',
+    '(Rouen : impr. de J. Dumesnil)',
+]
+# physical descriptions, for doc.phys()
+physs = [
+    'In-8°, 234 p.', '2 vol. in-fol.', '1 pièce', '24 cm', '12°',
+    'In-4, XII-345 p.', '1 placard', 'gr. fol.', '1 vol. (VIII-120 p.) ; 18 cm',
+    '1 f. ; in-fol.', '12 juin 1782, in-fol.', 'In 12, 96 p.', '8 cm',
+    '15 cm', '28 cm', '40 p. ; in-16', '99999 p.', 'XVI p.',
+]
+# date of the 100 field, a year, or unknown
+years100 = ['{year}'] * 8 + ['    ', '18..', '17uu', '1420', '2019']
+dates210 = ['{year}', '[{year}]', '{year}?', 'an VII [1799]', '17..', 's.d.', '[ca {year}]', None]
+# Clément shelfmarks, 930$5
+shelfmarks = [
+    '8-Y2-{n}', 'RES FOL-T29-{n}', 'EL 8-Z-{n} (7)', '4-LB39-{n}',
+    '8-CNLJD-{n}', 'FOL-THETA-{n}', '16-Z-{n} PIECE', 'YE-{n}', '8-TH-{n}',
+]
+# roles of contribs, see doc.contrib_roles
+roles = [None, '070', '070', '070', '440', '730', '340', '651', '080']
+roles2 = ['070', '440', '730', '340', '020', '651']
+
+
+def person(id):
+    """(surname, given, dateline) of a person, same id, same person"""
+    i = id - pers_first
+    surname = surnames[i * 7 % len(surnames)]
+    given = given_names[i * 104729 % len(given_names)]
+    birth = 1450 + i * 37 % 450
+    death = birth + 20 + i * 13 % 70
+    variant = i % 12
+    if variant == 8:
+        dateline = '%d?-%d' % (birth, death)
+    elif variant == 9:
+        dateline = '17..-%d' % death
+    elif variant == 10:
+        dateline = '0%d-0%d av. J.-C.' % (death % 500, birth % 500)
+    elif variant == 11:
+        dateline = None
+    else:
+        dateline = '%d-%d' % (birth, death)
+    return surname, given, dateline
+
+
+def corp(id):
+    """Name of a corporate"""
+    return corps[(id - corp_first) % len(corps)]
+
+
+def check(id):
+    """Check char of an ark"""
+    return ark_chars[id % len(ark_chars)]
+
+
+def auth_pers(id):
+    """Fields of a person authority record"""
+    surname, given, dateline = person(id)
+    i = id - pers_first
+    fields = [('003', ark % (id, check(id)))]
+    if dateline is None:
+        # dates only in 103
+        birth = 1450 + i * 37 % 450
+        fields.append(('103', iso2709.subfields('  ', 'a', '%5d     %5d' % (birth, birth + 50))))
+    if i % 3 == 0:
+        fields.append(('120', iso2709.subfields('  ', 'a', 'ab'[i % 2])))
+    fields.append(('200', iso2709.subfields(' 1', 'a', surname, 'b', given, 'f', dateline)))
+    if i % 4 == 0:
+        fields.append(('300', iso2709.subfields('0 ', 'a', 'Romancier. - Auteur dramatique ')))
+    if i % 5 == 0:
+        fields.append(('301', iso2709.subfields('  ', 'a', 'Paris', 'b', 'Rouen')))
+    return fields
+
+
+def auth_corp(id):
+    """Fields of a corporate authority record"""
+    return [
+        ('003', ark % (id, check(id))),
+        ('210', iso2709.subfields('02', 'a', corp(id))),
+    ]
+
+
+def author(rng, pers_count):
+    """Id of a person, with an authority record, or not (~10%)"""
+    if rng.random() < 0.1:
+        return orphan_first + rng.randrange(max(1, pers_count // 10))
+    return pers_first + rng.randrange(pers_count)
+
+
+def pers_link(tag, id, role):
+    """Field of a link to a person, $3 id, $4 role"""
+    surname, given, dateline = person(id if id < orphan_first else pers_first + id - orphan_first)
+    return (tag, iso2709.subfields(' 1', '3', '%08d' % id, 'a', surname, 'b', given, 'f', dateline, '4', role))
+
+
+def doc(rng, n, pers_count, corp_count):
+    """Fields of a doc record"""
+    id = doc_first + n
+    year = rng.randint(1450, 1950)
+    fields = [('003', ark % (id, check(id)))]
+    fields.append(('100', iso2709.subfields(
+        '  ', 'a', '19970101d' + rng.choice(years100).format(year=year)[0:4].ljust(4) + '    m  y0frey50      ba'
+    )))
+    lang = rng.choice(langs)
+    if rng.random() < 0.1:
+        fields.append(('101', iso2709.subfields('1 ', 'a', 'fre', 'c', lang)))
+    else:
+        fields.append(('101', iso2709.subfields('0 ', 'a', lang)))
+    fields.append(('102', iso2709.subfields('  ', 'a', 'FR')))
+    code, label = doc_types[0] if rng.random() < 0.9 else rng.choice(doc_types)
+    if rng.random() < 0.95:
+        fields.append(('181', iso2709.subfields(' 0', '6', 'z01', 'c', code, '2', 'rdacontent')))
+    article, words = rng.choice(titles)
+    title = words
+    if article:
+        title = '\x98' + article + '\x9c' + words
+    fields.append(('200', iso2709.subfields(
+        '1 ', 'a', title, 'b', label, 'e', rng.choice(subtitles),
+        'h', 'Tome %d' % rng.randint(1, 12) if rng.random() < 0.1 else None,
+    )))
+    # publication, address line of old records, 210 or 214
+    date = rng.choice(dates210)
+    if date is not None:
+        date = date.format(year=year)
+    dice = rng.random()
+    if dice < 0.1:
+        fields.append(('210', iso2709.subfields('  ', 'r', rng.choice(addresses).format(year=year))))
+    elif dice < 0.2:
+        fields.append(('214', iso2709.subfields(' 0', 'a', rng.choice(places), 'c', rng.choice(publishers), 'd', date)))
+    else:
+        fields.append(('210', iso2709.subfields(
+            '  ', 'a', rng.choice(places), 'c', rng.choice(publishers) if rng.random() < 0.8 else None, 'd', date
+        )))
+    if rng.random() < 0.95:
+        fields.append(('215', iso2709.subfields('  ', 'a', rng.choice(physs))))
+    if rng.random() < 0.05:
+        fields.append(('500', iso2709.subfields('10', 'a', words)))
+    # authors as subject
+    if rng.random() < 0.1:
+        fields.append(pers_link('600', author(rng, pers_count), None))
+    if rng.random() < 0.05:
+        fields.append(('601', iso2709.subfields('02', '3', '%08d' % (corp_first + rng.randrange(corp_count)), 'a', 'Sujet collectif')))
+    if rng.random() < 0.05:
+        fields.append(('620', iso2709.subfields('  ', 'a', 'France', 'd', rng.choice(places))))
+    # authors
+    dice = rng.random()
+    if dice < 0.75:
+        fields.append(pers_link('700', author(rng, pers_count), rng.choice(roles)))
+        for i in range(rng.choice([0, 0, 0, 1, 1, 2, 5])):
+            fields.append(pers_link('701', author(rng, pers_count), rng.choice(roles2)))
+    elif dice < 0.85:
+        fields.append(('710', iso2709.subfields(
+            '02', '3', '%08d' % (corp_first + rng.randrange(corp_count)), 'a', corps[rng.randrange(len(corps))], '4', '070'
+        )))
+    if rng.random() < 0.15:
+        fields.append(pers_link('702', author(rng, pers_count), rng.choice(['440', '730', '340'])))
+    if rng.random() < 0.05:
+        fields.append(('712', iso2709.subfields('02', '3', '%08d' % (corp_first + rng.randrange(corp_count)), 'a', 'Imprimerie royale', '4', '610')))
+    # link without id, or without name
+    if rng.random() < 0.01:
+        fields.append(('701', iso2709.subfields(' 1', 'a', 'Anonyme', '4', '070')))
+    if rng.random() < 0.01:
+        fields.append(('701', iso2709.subfields(' 1', '3', '%08d' % author(rng, pers_count), '4', '070')))
+    if rng.random() < 0.2:
+        fields.append(('856', iso2709.subfields('4 ', 'u', 'https://gallica.bnf.fr/ark:/12148/bpt6k%d' % id)))
+    fields.append(('930', iso2709.subfields('  ', '5', 'FR-751131010:' + rng.choice(shelfmarks).format(n=rng.randint(1, 99999)))))
+    # tags in order, as in BnF records
+    fields.sort(key=lambda field: field[0])
+    return fields
+
+
+def write(path, records):
+    """Write records (leader, fields) in a file, return the count"""
+    count = 0
+    with open(path, 'wb') as handle:
+        for leader, fields in records:
+            handle.write(iso2709.encode(leader, fields))
+            count += 1
+    return count
+
+
+def generate(out_dir, docs=10000, auths=None, per_file=100000, seed=1):
+    """Write the corpus in out_dir, auths default to docs / 10"""
+    if auths is None:
+        auths = max(10, docs // 10)
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    # 9 persons for 1 corporate
+    corp_count = max(1, auths // 10)
+    pers_count = auths - corp_count
+    ids = [pers_first + i for i in range(pers_count)] + [corp_first + i for i in range(corp_count)]
+    files = []
+    for no, first in enumerate(range(0, auths, per_file), 1):
+        name = os.path.join(out_dir, 'P1486_%d.UTF8' % no)
+        write(name, (
+            (auth_leader, auth_pers(id) if id < corp_first else auth_corp(id))
+            for id in ids[first:first + per_file]
+        ))
+        files.append(name)
+    # docs, first half in P1187, last in P174
+    half = (docs + 1) // 2
+    for prefix, start, end in (('P1187', 0, half), ('P174', half, docs)):
+        for no, first in enumerate(range(start, end, per_file), 1):
+            name = os.path.join(out_dir, '%s_%d.UTF8' % (prefix, no))
+            write(name, (
+                (doc_leader, doc(rng, n, pers_count, corp_count))
+                for n in range(first, min(end, first + per_file))
+            ))
+            files.append(name)
+    return files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Write a synthetic UniMARC corpus of doc and authority records',
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('out_dir', nargs=1,
+    help='Folder of the MARC files to write')
+    parser.add_argument('--docs', type=int, default=10000,
+    help='Number of doc records (up to 10M)')
+    parser.add_argument('--auths', type=int,
+    help='Number of authority records, default docs / 10')
+    parser.add_argument('--per-file', type=int, default=100000,
+    help='Number of records by file')
+    parser.add_argument('--seed', type=int, default=1,
+    help='Seed of random, same seed, same files')
+    args = parser.parse_args()
+    start = time.perf_counter()
+    for marc_file in generate(args.out_dir[0], args.docs, args.auths, args.per_file, args.seed):
+        print("synth > " + marc_file)
+    print("%.1f s" % (time.perf_counter() - start))
+
+if __name__ == '__main__':
+    sys.exit(main())
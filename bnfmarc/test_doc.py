@@ -0,0 +1,55 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" Bad doc records are skipped and counted, not stopping a load
+(python -m pytest, or python -m unittest, from this folder)
+"""
+import os
+import tempfile
+import unittest
+
+# local
+import bnfmarc
+import doc
+import iso2709
+
+
+def record(id, date=True, shelfmark=('5', 'FR-751131010:8-Y2-5')):
+    """Bytes of a small doc record, without 100 if not date,
+    shelfmark as a subfield of 930"""
+    fields = [('003', 'http://catalogue.bnf.fr/ark:/12148/cb%08dq' % id)]
+    if date:
+        fields.append(('100', iso2709.subfields('  ', 'a', '20001010d1850    m  y0frey50      ba')))
+    fields.append(('200', iso2709.subfields('1 ', 'a', 'Titre %d' % id)))
+    fields.append(('930', iso2709.subfields('  ', *shelfmark)))
+    return iso2709.encode(' ' * 24, fields)
+
+
+class TestSkip(unittest.TestCase):
+
+    def test_load(self):
+        """No 100, record skipped; a 930 without $5, record loaded"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            marc_file = os.path.join(tmp_dir, 'P174_1.UTF8')
+            with open(marc_file, 'wb') as handle:
+                handle.write(record(10000001))
+                handle.write(record(10000002, date=False))
+                handle.write(record(10000003, shelfmark=('a', '8-Z-123')))
+            doc.con = bnfmarc.connect(os.path.join(tmp_dir, 'test.db'), True)
+            before = doc.skipped
+            doc.docs(marc_file)
+            doc.flush()
+            ids = [row[0] for row in doc.con.execute("SELECT id FROM doc ORDER BY id")]
+            doc.con.close()
+            doc.con = None
+        self.assertEqual(doc.skipped - before, 1)
+        self.assertEqual(ids, [10000001, 10000003])
+
+
+if __name__ == '__main__':
+    unittest.main()
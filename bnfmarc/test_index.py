@@ -0,0 +1,48 @@
+"""
+Part of bnfmarc https://github.com/bnfhack/bnfmarc
+Copyright (c) 2022 frederic.glorieux@fictif.org
+MIT License https://opensource.org/licenses/mit-license.php
+Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
+"""
+
+
+""" A record with a malformed ark is not indexed, and does not stop
+the build of a sidecar, nor a lookup by scan
+(python -m pytest, or python -m unittest, from this folder)
+"""
+import os
+import tempfile
+import unittest
+
+# local
+import index
+import iso2709
+
+
+def record(ark):
+    """Bytes of a small record with an ark url in 003"""
+    return iso2709.encode(' ' * 24, [
+        ('003', 'http://catalogue.bnf.fr/ark:/12148/' + ark),
+        ('200', iso2709.subfields('1 ', 'a', 'Titre')),
+    ])
+
+
+class TestBadArk(unittest.TestCase):
+
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            marc_file = os.path.join(tmp_dir, 'P174_1.UTF8')
+            with open(marc_file, 'wb') as handle:
+                handle.write(record('cb10000001q'))
+                handle.write(record('not an ark'))
+                handle.write(record('cb10000003q'))
+            # scan, no sidecar
+            self.assertIsNotNone(index.find(10000003, marc_file))
+            rows = index.build(marc_file)
+            self.assertEqual(index.skipped, 1)
+            self.assertEqual([row[0] for row in rows], [10000001, 10000003])
+            self.assertIsNotNone(index.find(10000003, marc_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
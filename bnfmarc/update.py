@@ -6,44 +6,152 @@ Code policy PEP8 https://www.python.org/dev/peps/pep-0008/
 """
 
 
-""" Update fields for more efficient queries
+""" Update fields for more efficient queries, derived columns with joins,
+rollup tables of counts by year for charts
 """
 import argparse
 import sqlite3
 import sys
+import time
 
 # local
 import bnfmarc
+import stats
 
 # shared sqlite3 connexion
 con = None
+# filters of derivations, to update only rows touched by an incremental load
+scopes = {
+    'contrib_and': " AND (contrib.auth IN (SELECT id FROM changed_auth) OR contrib.doc IN (SELECT id FROM changed_doc))",
+    'contrib_auth_and': " AND auth IN (SELECT id FROM changed_auth)",
+    'auth_where': " WHERE id IN (SELECT id FROM changed_auth)",
+    'doc_and': " AND (doc.id IN (SELECT id FROM changed_doc) OR doc.auth1 IN (SELECT id FROM changed_auth))",
+}
+# derived columns, (name, statements), in order of dependency
+# (doc.year, doc.place, contrib.type, contrib.year, about.year set by doc.py)
+derivations = [
+    ('contrib.birthyear', [
+        # birthyear for checks, delete date before birth of author
+        """UPDATE contrib SET
+            birthyear = auth.birthyear,
+            year = CASE
+                WHEN auth.birthyear IS NOT NULL AND contrib.year < auth.birthyear THEN NULL
+                ELSE contrib.year
+            END
+        FROM auth WHERE contrib.auth = auth.id{contrib_and}""",
+    ]),
+    ('auth.docs', [
+        # docs count as an author, first doc published as author, one GROUP BY
+        "DROP TABLE IF EXISTS temp.auth_docs",
+        """CREATE TEMP TABLE auth_docs AS
+            SELECT auth AS id, count(*) AS docs, min(year) AS doc1
+            FROM contrib WHERE type = 1{contrib_auth_and} GROUP BY auth""",
+        # ensure a date to select authors by date
+        """UPDATE auth SET
+            docs = 0,
+            doc1 = NULL,
+            generation = coalesce(birthyear, deathyear - 50){auth_where}""",
+        """UPDATE auth SET
+            docs = auth_docs.docs,
+            doc1 = auth_docs.doc1,
+            generation = coalesce(auth.generation, auth_docs.doc1)
+        FROM auth_docs WHERE auth.id = auth_docs.id""",
+        "DROP TABLE temp.auth_docs",
+    ]),
+    ('doc.type1', [
+        # type and gender of first author
+        """UPDATE doc SET type1 = auth.type, gender1 = auth.gender
+        FROM auth WHERE doc.auth1 = auth.id{doc_and}""",
+    ]),
+]
 
 
-def doc_order():
-    """Loop on all docs to 
+# rollup tables for charts, (table, source table, dimension columns, count column)
+rollups = [
+    ('rollup_lang', 'doc', 'lang', 'docs'),
+    ('rollup_place', 'doc', 'place_group', 'docs'),
+    ('rollup_canon', 'doc', 'place_canon', 'docs'),
+    ('rollup_publisher', 'doc', 'publisher_group', 'docs'),
+    ('rollup_format', 'doc', 'format', 'docs'),
+    ('rollup_gender', 'doc', 'gender1, type1', 'docs'),
+    ('rollup_clement', 'doc', 'clement', 'docs'),
+    ('rollup_contrib', 'contrib', 'type', 'contribs'),
+]
+
+
+def changed_years():
+    """Record years of docs and contribs in the scope of an incremental update,
+    before derivations move them (contrib.year before birth set to NULL)"""
+    global con
+    con.execute("""INSERT OR IGNORE INTO changed_year (year)
+        SELECT DISTINCT year FROM doc WHERE year IS NOT NULL{doc_and}""".format(**scopes))
+    con.execute("""INSERT OR IGNORE INTO changed_year (year)
+        SELECT DISTINCT year FROM contrib WHERE year IS NOT NULL{contrib_and}""".format(**scopes))
+    con.commit()
+
+
+def rollup(incremental=False):
+    """Count rows by year and dimensions in rollup tables, report time of each.
+    incremental: only for years in changed_year, and null year"""
+    global con
+    filter = ""
+    if incremental:
+        filter = " WHERE year IN (SELECT year FROM changed_year) OR year IS NULL"
+    for table, source, columns, count in rollups:
+        stats.profile_start()
+        start = time.perf_counter()
+        con.execute("DELETE FROM %s%s" % (table, filter))
+        cur = con.execute(
+            "INSERT INTO %s (year, %s, %s) SELECT year, %s, count(*) FROM %s%s GROUP BY year, %s" % (
+                table, columns, count, columns, source, filter, columns
+            )
+        )
+        con.commit()
+        print("%s  %d rows, %.1f s" % (table, cur.rowcount, time.perf_counter() - start))
+        stats.profile_stop('update_' + table)
+
+
+def derive(incremental=False):
+    """Compute derived columns with joins, report time of each derivation.
+    incremental: only for ids in changed_auth, changed_doc"""
+    global con
+    if incremental:
+        filters = scopes
+    else:
+        filters = {key: "" for key in scopes}
+    for name, statements in derivations:
+        stats.profile_start()
+        start = time.perf_counter()
+        rows = 0
+        for sql in statements:
+            cur = con.execute(sql.format(**filters))
+            if sql.startswith("UPDATE"):
+                rows += cur.rowcount
+        con.commit()
+        print("%s  %d rows, %.1f s" % (name, rows, time.perf_counter() - start))
+        stats.profile_stop('update_' + name)
+
+
+def doc_order(incremental=False):
+    """Set rank of docs by author, ordered by year, null dates at the end,
+    in one statement. incremental: only for authors in changed_auth.
     """
     global con
-    # a cursor for updates
-    cur_up = con.cursor()
-    sql_up = "UPDATE doc SET order1 = ? WHERE id = ?"
-    cur_sel = con.cursor()
-    auth_last = -1
-    order = 0
-    # null date at the end
-    sql = "SELECT id, auth1, year FROM doc WHERE auth1 IS NOT NULL ORDER BY auth1, year NULLS LAST;"
-    nrows = cur_sel.execute(sql)
-    while True:
-        row = cur_sel.fetchone()
-        if row == None:
-            break
-        doc_id = row[0]
-        if auth_last != row[1]:
-            order = 1
-            auth_last = row[1]
-        else:
-            order = order + 1
-        cur_up.execute(sql_up, [order, doc_id])
-    
+    filter = ""
+    if incremental:
+        filter = "AND auth1 IN (SELECT id FROM changed_auth)"
+    # same order as the former loop on the doc_auth index (auth1, year, rowid)
+    sql = """
+    UPDATE doc SET order1 = ranked.n FROM (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY auth1 ORDER BY year NULLS LAST, id) AS n
+        FROM doc WHERE auth1 IS NOT NULL %s
+    ) AS ranked WHERE doc.id = ranked.id
+    """ % filter
+    stats.profile_start()
+    start = time.perf_counter()
+    cur = con.execute(sql)
+    print("doc.order1  %d rows, %.1f s" % (cur.rowcount, time.perf_counter() - start))
+    stats.profile_stop('update_doc.order1')
 
 
 def main() -> int:
@@ -54,10 +162,31 @@ def main() -> int:
     )
     parser.add_argument('cataviz_db', nargs=1,
     help='Sqlite database to generate')
+    parser.add_argument('--incremental', action='store_true',
+    help='Update only rows of authors and docs changed by load.py --incremental')
+    parser.add_argument('--auths', type=int, nargs='+',
+    help='Ids of authors with changed docs, to update only them (implies --incremental)')
+    parser.add_argument('--profile', metavar='DIR',
+    help='Write a cProfile .pstats and a tracemalloc .mem.txt by derivation in DIR')
     args = parser.parse_args()
+    stats.profile_dir = args.profile
     con = bnfmarc.connect(args.cataviz_db[0])
-    doc_order()
+    incremental = args.incremental
+    if args.auths is not None:
+        con.executemany("INSERT OR IGNORE INTO changed_auth (id) VALUES (?)", ((id,) for id in args.auths))
+        incremental = True
+    if incremental:
+        changed_years()
+    derive(incremental)
+    doc_order(incremental)
+    rollup(incremental)
+    # changes done
+    con.execute("DELETE FROM changed_auth")
+    con.execute("DELETE FROM changed_doc")
+    con.execute("DELETE FROM changed_year")
     con.commit()
+    if not incremental:
+        con.execute("VACUUM")
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -1,3 +1,3 @@
-python bnfmarc\pers.py cataviz_new.db
-python bnfmarc\doc.py cataviz_new.db
-sqlite3 cataviz_new.db < bnfmarc\update.sql
+python bnfmarc\load.py --bulk cataviz_new.db
+python bnfmarc\update.py cataviz_new.db
+python bnfmarc\finalize.py cataviz_new.db